@@ -0,0 +1,61 @@
+"""Собирает кадры анимаций в атласы: одно изображение на последовательность и JSON-индекс прямоугольников кадров.
+
+Запуск из корня репозитория: python animations/pack_atlases.py
+Игра подхватывает атласы из animations/atlases сама, а при их отсутствии загружает кадры по отдельности."""
+
+import json
+import math
+import os
+import sys
+from pathlib import Path
+
+from PyQt5.QtGui import QImage, QPainter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # скрипт запускается из корня репозитория
+
+from core.constants import ATLASES_DIR  # noqa: E402
+
+SEQUENCES = ('sum', 'question field', 'timer', 'chosen answers')
+
+
+def frame_sort_key(name: str) -> tuple[int, int | str]:
+    """Сортирует кадры по номеру, а кадры без номера (chosen_A...) — по имени"""
+    stem = os.path.splitext(name)[0]
+    return (0, int(stem)) if stem.isdigit() else (1, stem)
+
+
+def pack(sequence: str) -> int:
+    """Упаковывает кадры animations/{sequence} в атлас и возвращает количество кадров"""
+    folder = f'animations/{sequence}'
+    names = sorted((name for name in os.listdir(folder) if name.endswith('.png')), key=frame_sort_key)
+    images = [QImage(f'{folder}/{name}') for name in names]
+
+    # кадры раскладываются по сетке, близкой к квадрату, с ячейкой по размеру самого большого кадра
+    cell_width = max(image.width() for image in images)
+    cell_height = max(image.height() for image in images)
+    columns = math.ceil(math.sqrt(len(images)))
+    rows = math.ceil(len(images) / columns)
+
+    atlas = QImage(cell_width * columns, cell_height * rows, QImage.Format_ARGB32_Premultiplied)
+    atlas.fill(0)
+    painter = QPainter(atlas)
+    painter.setCompositionMode(QPainter.CompositionMode_Source)
+    frames = {}
+    for i, (name, image) in enumerate(zip(names, images)):
+        x, y = i % columns * cell_width, i // columns * cell_height
+        painter.drawImage(x, y, image)
+        frames[f'{folder}/{name}'] = [x, y, image.width(), image.height()]
+    painter.end()
+
+    atlas_name = sequence.replace(' ', '_')
+    image_path = f'{ATLASES_DIR}/{atlas_name}.png'
+    atlas.save(image_path)
+    with open(f'{ATLASES_DIR}/{atlas_name}.json', 'w', encoding='utf-8') as file:
+        json.dump({'image': image_path, 'frames': frames}, file, ensure_ascii=False, indent=1)
+    return len(frames)
+
+
+if __name__ == '__main__':
+    os.makedirs(ATLASES_DIR, exist_ok=True)
+    for sequence in SEQUENCES:
+        print(f'{sequence}: в атлас упаковано кадров — {pack(sequence)}')
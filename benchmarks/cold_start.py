@@ -0,0 +1,65 @@
+"""Замер холодного запуска: время от старта интерпретатора до первой отрисовки стартового окна.
+
+Каждый замер — отдельный процесс, чтобы модули и кэши не переживали запуск. Запуск из корня репозитория:
+    python benchmarks/cold_start.py [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# модули, которые не нужны для показа стартового окна
+HEAVY_MODULES = (
+    'PyQt5.QtMultimedia',
+    'requests',
+    'urllib3',
+    'openpyxl',
+    'core.game',
+    'core.dialogs',
+    'core.widgets',
+    'core.tools',
+)
+
+# тело замеряемого процесса: то же, что делает main.py до app.exec()
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from core import StartWindow, app, create_database_if_not_exists
+create_database_if_not_exists()
+window = StartWindow()
+window.show()
+app.processEvents()
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({'ms': elapsed, 'modules': [name for name in %r if name in sys.modules]}))
+"""
+
+
+def measure() -> dict:
+    """Запускает приложение в отдельном процессе без экрана и возвращает время до первой отрисовки"""
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE % (HEAVY_MODULES,)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Время холодного запуска до показа стартового окна')
+    parser.add_argument('--runs', type=int, default=5, help='число запусков')
+    args = parser.parse_args()
+
+    samples = [measure() for _ in range(args.runs)]
+    times = [sample['ms'] for sample in samples]
+    print(f'Первая отрисовка: медиана {statistics.median(times):.0f} мс, мин. {min(times):.0f}, макс. {max(times):.0f}')
+    print('Загружены лишние модули:', ', '.join(samples[-1]['modules']) or 'нет')
@@ -0,0 +1,27 @@
+"""Симуляция игр без интерфейса: скорость движка и статистика для настройки баланса.
+
+Запуск из корня репозитория:
+    python benchmarks/simulate_games.py [--games N] [--mode classic|clock]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.engine import simulate  # noqa: E402
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Симуляция игр на движке без Qt')
+    parser.add_argument('--games', type=int, default=10_000, help='число игр')
+    parser.add_argument('--mode', choices=('classic', 'clock'), default='classic', help='режим игры')
+    args = parser.parse_args()
+
+    started = perf_counter()
+    stats = simulate(args.games, args.mode)
+    elapsed = perf_counter() - started
+    print(json.dumps(stats, ensure_ascii=False, indent=2))
+    print(f'{args.games} игр за {elapsed:.2f} с: {args.games / elapsed:.0f} игр в секунду')
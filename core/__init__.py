@@ -1,3 +1,18 @@
-from .application import app
-from .dialogs import StartWindow
-from .tools import except_hook, create_database_if_not_exists
\ No newline at end of file
+from importlib import import_module
+
+# Модули пакета загружаются при первом обращении к их объектам: так до показа стартового окна не импортируются
+# игровое окно, диалоги и их зависимости (PEP 562)
+_EXPORTS = {
+    'app': 'core.application',
+    'except_hook': 'core.application',
+    'create_database_if_not_exists': 'core.database',
+    'StartWindow': 'core.start_window',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(import_module(_EXPORTS[name]), name)
@@ -1,4 +1,8 @@
+import logging
 import sys
+import traceback
+from types import TracebackType
+from typing import Type
 
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QApplication, QMessageBox
@@ -18,3 +22,13 @@ msg.setText(
     '<a href="https://t.me/snowlue"><span style="text-decoration: underline; color:#3454D1; font-weight:600;">'
     'разработчику</span></a>.</p></body></html>'
 )
+
+
+def except_hook(exc_type: Type[BaseException], exc_value: BaseException, exc_tb: TracebackType):
+    """Обработчик исключений
+
+    При вызове исключения логирует ошибку в логи и показывает окно, предлагающее отправить ошибку разработчику."""
+
+    logging.error(str(exc_value) + '\n' + ''.join(traceback.format_exception(exc_type, exc_value, exc_tb)))
+    msg.show()
+    msg.buttonClicked.connect(sys.exit)
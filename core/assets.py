@@ -0,0 +1,406 @@
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from threading import Event, Lock, get_ident
+from time import perf_counter_ns
+from typing import Iterable
+
+from PyQt5.QtCore import QRect, QRunnable, QSize, QThreadPool
+from PyQt5.QtGui import QImage, QImageReader, QPixmap
+
+from core.constants import ATLASES_DIR, BACKGROUND_SIZE, BACKGROUNDS_CACHE_DIR, PIXMAP_CACHE_LIMIT
+
+
+def _file_digest(path: str) -> str:
+    """Считает хеш содержимого файла"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BackgroundVariants:
+    """Уменьшенные под размер окна копии фонов из images/backgrounds в дисковом кэше
+
+    Фоны хранятся в 4K и 8K, а показываются в окне 1100×703, поэтому каждый фон один раз уменьшается до размера
+    окна с учётом devicePixelRatio экрана. Имя копии — хеш исходного файла и целевой размер, а индекс в кэше
+    позволяет находить готовые копии при следующих запусках без повторного хеширования."""
+
+    def __init__(self, cache_dir: str = BACKGROUNDS_CACHE_DIR):
+        self._cache_dir = cache_dir
+        self._index_path = os.path.join(cache_dir, 'index.json')
+        self._lock = Lock()
+        self._size: QSize | None = None
+        self._index: dict[str, str] = {}  # ключ исходного файла -> имя уменьшенной копии в кэше
+
+    @staticmethod
+    def is_background(path: str) -> bool:
+        return path.startswith('images/backgrounds/')
+
+    def set_device_pixel_ratio(self, ratio: float):
+        """Задаёт целевой размер копий по devicePixelRatio экрана, на котором показывается окно"""
+        width, height = BACKGROUND_SIZE
+        self._size = QSize(round(width * ratio), round(height * ratio))
+        if not self._index:
+            try:
+                with open(self._index_path, encoding='utf-8') as file:
+                    self._index = json.load(file)
+            except (OSError, ValueError):
+                self._index = {}
+
+    def _key(self, path: str) -> str | None:
+        """Ключ исходного файла в индексе: путь, время изменения, размер файла и целевой размер копии"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return f'{path}|{stat.st_mtime_ns}|{stat.st_size}|{self._size.width()}x{self._size.height()}'
+
+    def resolve(self, path: str) -> str:
+        """Возвращает путь к готовой уменьшенной копии фона или сам path, если копии ещё нет"""
+        if self._size is None or not self.is_background(path):
+            return path
+        key = self._key(path)
+        with self._lock:
+            variant = self._index.get(key)
+        if variant is None:
+            return path
+        variant_path = os.path.join(self._cache_dir, variant)
+        return variant_path if os.path.exists(variant_path) else path
+
+    def ensure(self, path: str) -> str:
+        """Создаёт уменьшенную копию фона, если её ещё нет, и возвращает путь к ней (вызывается в рабочем потоке)"""
+        size = self._size
+        resolved = self.resolve(path)
+        if resolved != path or size is None or not self.is_background(path):
+            return resolved
+
+        key = self._key(path)
+        reader = QImageReader(path)
+        if key is None or not reader.canRead():
+            return path
+        source_size = reader.size()
+        if source_size.width() <= size.width() and source_size.height() <= size.height():
+            return path  # фон и так не больше окна
+
+        variant = f'{_file_digest(path)}_{size.width()}x{size.height()}.jpg'
+        variant_path = os.path.join(self._cache_dir, variant)
+        if not os.path.exists(variant_path):
+            reader.setScaledSize(size)  # JPEG декодируется сразу в уменьшенном виде
+            image = reader.read()
+            if image.isNull():
+                logging.warning('Background %s not scaled: %s', path, reader.errorString())
+                return path
+            os.makedirs(self._cache_dir, exist_ok=True)
+            temp_path = f'{variant_path}.{get_ident()}.tmp'  # один фон могут уменьшать сразу два потока
+            if not image.save(temp_path, 'JPG', 92):
+                return path
+            os.replace(temp_path, variant_path)
+
+        with self._lock:
+            self._index[key] = variant
+            with open(self._index_path + '.tmp', 'w', encoding='utf-8') as file:
+                json.dump(self._index, file, ensure_ascii=False, indent=1)
+            os.replace(self._index_path + '.tmp', self._index_path)
+        return variant_path
+
+
+background_variants = BackgroundVariants()
+
+
+class SpriteAtlases:
+    """Индекс атласов кадров анимаций, которые собирает animations/pack_atlases.py
+
+    Атлас — одно изображение на всю последовательность кадров и JSON-индекс с прямоугольником каждого кадра.
+    Если атласа для кадра нет, кадр загружается из отдельного файла, как раньше."""
+
+    def __init__(self, atlas_dir: str = ATLASES_DIR):
+        self._atlas_dir = atlas_dir
+        self._frames: dict[str, tuple[str, QRect]] | None = None  # путь кадра -> (путь атласа, прямоугольник)
+        self._atlases: dict[str, list[tuple[str, QRect]]] = {}  # путь атласа -> кадры атласа
+
+    def _load_index(self):
+        self._frames = {}
+        self._atlases = {}
+        if not os.path.isdir(self._atlas_dir):
+            return
+        for name in sorted(os.listdir(self._atlas_dir)):
+            if not name.endswith('.json'):
+                continue
+            with open(os.path.join(self._atlas_dir, name), encoding='utf-8') as file:
+                index = json.load(file)
+            if not os.path.exists(index['image']):
+                continue
+            frames = [(frame, QRect(*rect)) for frame, rect in index['frames'].items()]
+            self._atlases[index['image']] = frames
+            for frame, rect in frames:
+                self._frames[frame] = (index['image'], rect)
+
+    def locate(self, path: str) -> tuple[str, QRect] | None:
+        """Возвращает атлас и прямоугольник кадра path или None, если кадр не упакован в атлас"""
+        if self._frames is None:
+            self._load_index()
+        return self._frames.get(path)
+
+    def frames(self, atlas_path: str) -> list[tuple[str, QRect]]:
+        """Возвращает пути и прямоугольники всех кадров атласа"""
+        return self._atlases.get(atlas_path, [])
+
+    def discard(self, atlas_path: str):
+        """Убирает атлас из индекса, после чего его кадры загружаются из отдельных файлов"""
+        for frame, _ in self._atlases.pop(atlas_path, []):
+            self._frames.pop(frame, None)
+
+
+sprite_atlases = SpriteAtlases()
+
+
+class _DecodeTask(QRunnable):
+    """Задача фонового потока: декодирует изображение в QImage или прогревает файл звука в кэше ОС"""
+
+    def __init__(self, preloader: 'AssetPreloader', path: str):
+        super().__init__()
+        self.setAutoDelete(False)  # задачу держит AssetPreloader, чтобы её можно было отозвать из очереди
+        self.preloader = preloader
+        self.path = path
+        self.done = Event()
+
+    def run(self):
+        image = None
+        try:
+            if self.path.endswith('.mp3'):
+                # звук декодирует сам QMediaPlayer, поэтому достаточно, чтобы файл уже лежал в кэше ОС
+                with open(self.path, 'rb') as file:
+                    while file.read(1 << 20):
+                        pass
+            else:
+                image = QImage(background_variants.ensure(self.path))
+        except OSError:
+            logging.warning('Asset %s not preloaded', self.path)
+        self.preloader.finish(self, image)
+
+
+class AssetPreloader:
+    """Фоновый загрузчик ассетов следующего этапа игры
+
+    Изображения декодируются в рабочем потоке в QImage, а потоку интерфейса остаётся только дешёвый
+    QPixmap.fromImage при первом обращении к изображению через кэш."""
+
+    def __init__(self, max_threads: int = 2):
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_threads)
+        self._lock = Lock()
+        self._tasks: dict[str, _DecodeTask] = {}  # задачи в очереди и в работе
+        self._images: dict[str, QImage] = {}  # готовые, но ещё не востребованные изображения
+        self._warmed_sounds: set[str] = set()  # звуки, которые уже прочитаны в кэш ОС
+
+    def preload(self, paths: Iterable[str], cache: 'PixmapCache | None' = None):
+        """Ставит в очередь декодирование ассетов paths; неактуальные заготовки от прошлого этапа выбрасываются"""
+        cache = cache if cache is not None else pixmap_cache
+        # кадры из атласов декодируются целым атласом
+        paths = [path for path in paths if path not in cache]
+        paths = [path for path in dict.fromkeys(self._source(path) for path in paths) if path not in cache]
+        with self._lock:
+            wanted = set(paths)
+            for path in [path for path in self._images if path not in wanted]:
+                del self._images[path]
+            skipped = self._tasks.keys() | self._images.keys() | self._warmed_sounds
+            new_tasks = [_DecodeTask(self, path) for path in paths if path not in skipped]
+            for task in new_tasks:
+                self._tasks[task.path] = task
+        for task in new_tasks:
+            self._pool.start(task)
+
+    @staticmethod
+    def _source(path: str) -> str:
+        frame = sprite_atlases.locate(path)
+        return frame[0] if frame is not None else path
+
+    def finish(self, task: _DecodeTask, image: QImage | None):
+        """Принимает результат задачи из рабочего потока"""
+        with self._lock:
+            if self._tasks.get(task.path) is task:
+                del self._tasks[task.path]
+                if image is not None and not image.isNull():
+                    self._images[task.path] = image
+                elif task.path.endswith('.mp3'):
+                    self._warmed_sounds.add(task.path)
+        task.done.set()
+
+    def take(self, path: str) -> QImage | None:
+        """Забирает заранее декодированное изображение; None — если его нужно декодировать на месте"""
+        with self._lock:
+            task = self._tasks.get(path)
+        if task is not None:
+            if self._pool.tryTake(task):  # задача ещё не начата — быстрее декодировать сразу
+                with self._lock:
+                    self._tasks.pop(path, None)
+                return None
+            task.done.wait()  # задача уже в работе — дожидаемся её, это быстрее повторного декодирования
+        with self._lock:
+            return self._images.pop(path, None)
+
+    def prepare_backgrounds(self, bg_num: int):
+        """Готовит в фоне уменьшенные копии всех фонов набора bg_num"""
+        folder = f'images/backgrounds/{bg_num}'
+        for name in sorted(os.listdir(folder)) if os.path.isdir(folder) else []:
+            if name.endswith('.jpg') and name != 'original.jpg':
+                path = f'{folder}/{name}'
+                self._pool.start(lambda path=path: background_variants.ensure(path))
+
+    def stop(self):
+        """Отменяет задачи в очереди и дожидается завершения начатых"""
+        self._pool.clear()
+        self._pool.waitForDone()
+        with self._lock:
+            self._tasks.clear()
+            self._images.clear()
+
+
+class PixmapCache:
+    """LRU-кэш декодированных изображений, общий для всего процесса
+
+    Ключ — путь к файлу. Объём кэша ограничен бюджетом в байтах: при его превышении вытесняются изображения,
+    к которым дольше всего не обращались."""
+
+    def __init__(self, limit: int = PIXMAP_CACHE_LIMIT, preloader: AssetPreloader | None = None):
+        self._pixmaps: OrderedDict[str, QPixmap] = OrderedDict()
+        self._preloader = preloader
+        self._limit = limit  # бюджет памяти в байтах
+        self._size = 0  # текущий объём декодированных изображений в байтах
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_ns = 0  # суммарное время декодирования при промахах
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._pixmaps
+
+    @staticmethod
+    def _pixmap_size(pixmap: QPixmap) -> int:
+        """Оценивает объём, который занимает декодированное изображение"""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def get(self, path: str) -> QPixmap:
+        """Возвращает изображение по пути path, декодируя его только при первом обращении"""
+        pixmap = self._pixmaps.get(path)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(path)
+            self.hits += 1
+            return pixmap
+
+        self.misses += 1
+        started = perf_counter_ns()
+        try:
+            frame = sprite_atlases.locate(path)
+            if frame is not None and (pixmap := self._unpack_atlas(frame[0], path)) is not None:
+                return pixmap
+
+            image = self._take_preloaded(path)
+            pixmap = QPixmap.fromImage(image) if image is not None else QPixmap(background_variants.resolve(path))
+            if pixmap.isNull():
+                logging.warning('Pixmap %s not loaded', path)
+            self._put(path, pixmap)
+            return pixmap
+        finally:
+            self.load_ns += perf_counter_ns() - started
+
+    def _take_preloaded(self, path: str) -> QImage | None:
+        return self._preloader.take(path) if self._preloader is not None else None
+
+    def _unpack_atlas(self, atlas_path: str, path: str) -> QPixmap | None:
+        """Декодирует атлас один раз и раскладывает в кэш все его кадры, возвращая кадр path; None — если атлас
+        не декодировался и кадры нужно загружать из отдельных файлов"""
+        atlas = self._take_preloaded(atlas_path)
+        if atlas is None:
+            atlas = QImage(atlas_path)
+        if atlas.isNull():
+            logging.warning('Atlas %s not loaded, its frames are loaded from separate files', atlas_path)
+            sprite_atlases.discard(atlas_path)
+            return None
+        for frame, rect in sprite_atlases.frames(atlas_path):
+            if frame != path and frame not in self._pixmaps:
+                self._put(frame, QPixmap.fromImage(atlas.copy(rect)))
+        # запрошенный кадр кладём последним, чтобы вытеснение не выбросило его сразу
+        rect = sprite_atlases.locate(path)[1]
+        pixmap = QPixmap.fromImage(atlas.copy(rect))
+        self._put(path, pixmap)
+        return pixmap
+
+    def _put(self, path: str, pixmap: QPixmap):
+        self._pixmaps[path] = pixmap
+        self._size += self._pixmap_size(pixmap)
+        self._evict()
+
+    def set_limit(self, limit: int):
+        """Меняет бюджет памяти кэша и вытесняет лишние изображения"""
+        self._limit = limit
+        self._evict()
+
+    def _evict(self):
+        """Вытесняет давно не использованные изображения, пока кэш не уложится в бюджет"""
+        # последнее добавленное изображение не вытесняем, даже если оно одно больше бюджета
+        while self._size > self._limit and len(self._pixmaps) > 1:
+            _, pixmap = self._pixmaps.popitem(last=False)
+            self._size -= self._pixmap_size(pixmap)
+            self.evictions += 1
+
+    def clear(self):
+        """Очищает кэш, не сбрасывая счётчики"""
+        self._pixmaps.clear()
+        self._size = 0
+
+    def stats(self) -> dict[str, int]:
+        """Возвращает счётчики попаданий и промахов для настройки бюджета"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'pixmaps': len(self._pixmaps),
+            'size': self._size,
+            'limit': self._limit,
+            'load_ms': self.load_ns // 1_000_000,
+        }
+
+
+asset_preloader = AssetPreloader()
+pixmap_cache = PixmapCache(preloader=asset_preloader)
+
+
+def load_pixmap(path: str) -> QPixmap:
+    """Загружает изображение через общий кэш (аналог QPixmap(path))"""
+    return pixmap_cache.get(path)
+
+
+def next_stage_assets(question_num: int, bg_num: int, mode: str) -> list[str]:
+    """Возвращает ассеты, которые понадобятся после ответа на вопрос question_num
+
+    Повторяет переходы GameWindow.check_answer: неправильный ответ, правильный ответ, смена этапа на 5, 10 и 14
+    вопросах, победа на 15 вопросе, а также «Забрать деньги»."""
+
+    n = '1-4' if question_num in range(1, 5) else question_num
+    logos, backgrounds = ['wrong', 'intro'], ['wrong', '1-5']  # неправильный ответ и «Забрать деньги»
+    if question_num == 15:
+        logos.append('millionaire')
+    if question_num in (5, 10, 14):
+        new_stage = {5: '6-10', 10: '11-14', 14: '15'}[question_num]
+        logos.append(new_stage)
+        backgrounds.append(new_stage)
+
+    paths = [f'images/logo/{logo}.png' for logo in logos]
+    paths += [f'images/backgrounds/{bg_num}/{bg}.jpg' for bg in backgrounds]
+    if question_num < 15:
+        paths.append(f'images/money tree/{question_num + 1}.png')
+    paths += [f'animations/sum/{i}.png' for i in range(1, 38)]
+    if mode == 'clock':
+        paths += [f'animations/timer/{i}.png' for i in range(1, 19)]
+
+    paths += [f'sounds/{n}/correct.mp3', f'sounds/{n}/lose.mp3']
+    if question_num not in range(1, 6):
+        paths.append(f'sounds/{question_num}/final_answer.mp3')
+    if question_num in range(5, 15):  # с 6 вопроса у каждого вопроса свой фоновый трек
+        paths.append(f'sounds/{question_num + 1}/{"bed" if mode == "classic" else "before_clock"}.mp3')
+    return paths
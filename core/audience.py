@@ -0,0 +1,118 @@
+"""Массовая генерация опросов «Помощи зала» и проверка диапазонов AUDIENCE_CORRECT_RANGES.
+
+Модуль нужен только для настройки баланса и требует NumPy, который не входит в зависимости игры:
+    pip install numpy
+    python -m core.audience [--polls N] [--target 5:0.95 10:0.8 15:0.6]
+"""
+
+import argparse
+
+import numpy as np
+
+from core.constants import AUDIENCE_CORRECT_RANGES, AUDIENCE_DEFAULT_RANGE
+
+
+def poll_batch(
+    question_number: int,
+    size: int,
+    available_count: int = 4,
+    correct_range: tuple[int, int] | None = None,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Генерирует size опросов так же, как ask_audience, одним вызовом.
+
+    Возвращает массив (size, available_count) процентов: столбец 0 — правильный ответ, остальные — неправильные в
+    случайном порядке. correct_range заменяет диапазон из AUDIENCE_CORRECT_RANGES"""
+    rng = rng if rng is not None else np.random.default_rng()
+    if available_count == 1:
+        return np.full((size, 1), 100, dtype=np.int64)
+
+    correct_min, correct_max = correct_range or AUDIENCE_CORRECT_RANGES.get(question_number, AUDIENCE_DEFAULT_RANGE)
+    correct = rng.integers(correct_min, correct_max, size=size, endpoint=True)
+    remaining = 100 - correct
+
+    votes = rng.random((size, available_count - 1))
+    # np.rint, как и round, округляет половины к чётному
+    others = np.rint(votes / votes.sum(axis=1, keepdims=True) * remaining[:, None]).astype(np.int64)
+    others[:, 0] += remaining - others.sum(axis=1)
+    others = rng.permuted(others, axis=1)
+    return np.column_stack((correct, others))
+
+
+def calibration_report(polls: np.ndarray) -> dict[str, float]:
+    """Статистика опросов из poll_batch: как часто зал подсказывает верно и с каким отрывом"""
+    correct = polls[:, 0]
+    best_wrong = polls[:, 1:].max(axis=1) if polls.shape[1] > 1 else np.zeros_like(correct)
+    margin = correct - best_wrong  # отрыв правильного ответа от самого популярного неправильного
+    return {
+        'accuracy': float((margin > 0).mean()),  # правильный ответ набрал больше всех
+        'wrong_leads': float((margin < 0).mean()),
+        'ties': float((margin == 0).mean()),
+        'margin_mean': float(margin.mean()),
+        'margin_p5': float(np.percentile(margin, 5)),
+        'margin_p50': float(np.percentile(margin, 50)),
+        'margin_p95': float(np.percentile(margin, 95)),
+    }
+
+
+def calibrate(polls: int = 1_000_000, available_count: int = 4, seed: int | None = None) -> dict[int, dict]:
+    """Отчёт по текущим диапазонам для каждого из 15 вопросов"""
+    rng = np.random.default_rng(seed)
+    report = {}
+    for question_number in range(1, 16):
+        batch = poll_batch(question_number, polls, available_count, rng=rng)
+        report[question_number] = calibration_report(batch)
+    return report
+
+
+def fit_range(
+    question_number: int, target_accuracy: float, polls: int = 200_000, available_count: int = 4, seed: int = 0
+) -> tuple[int, int]:
+    """Подбирает диапазон той же ширины, что и текущий, при котором правильный ответ лидирует с долей
+    target_accuracy. Доля растёт с нижней границей, поэтому граница ищется двоичным поиском"""
+    correct_min, correct_max = AUDIENCE_CORRECT_RANGES.get(question_number, AUDIENCE_DEFAULT_RANGE)
+    width = correct_max - correct_min
+
+    def accuracy(low: int) -> float:
+        # одно и то же зерно для всех кандидатов, чтобы сравнение не зависело от шума
+        batch = poll_batch(question_number, polls, available_count, (low, low + width), np.random.default_rng(seed))
+        return calibration_report(batch)['accuracy']
+
+    low, high = 0, 100 - width
+    while low < high:
+        middle = (low + high) // 2
+        if accuracy(middle) < target_accuracy:
+            low = middle + 1
+        else:
+            high = middle
+    return low, low + width
+
+
+def fit_ranges(target: dict[int, float], **kwargs) -> dict[int, tuple[int, int]]:
+    """Подбирает диапазоны под кривую точности зала; вопросы между заданными точками интерполируются линейно"""
+    levels = sorted(target)
+    curve = np.interp(range(1, 16), levels, [target[level] for level in levels])
+    return {number: fit_range(number, curve[number - 1], **kwargs) for number in range(1, 16)}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Проверка и подбор диапазонов «Помощи зала»')
+    parser.add_argument('--polls', type=int, default=1_000_000, help='число опросов на каждый вопрос')
+    parser.add_argument('--available', type=int, default=4, help='число оставшихся ответов (2 после 50:50)')
+    parser.add_argument(
+        '--target', nargs='+', metavar='ВОПРОС:ТОЧНОСТЬ', help='подобрать диапазоны под точность зала, например 1:0.95'
+    )
+    args = parser.parse_args()
+
+    print('Вопрос  диапазон   точность  неверный лидирует  ничьи   отрыв p5/p50/p95')
+    for number, stats in calibrate(args.polls, args.available).items():
+        correct_range = AUDIENCE_CORRECT_RANGES[number]
+        print(
+            f'{number:>6}  {correct_range[0]:>3}–{correct_range[1]:<3}  {stats["accuracy"]:>9.4f}  '
+            f'{stats["wrong_leads"]:>17.4f}  {stats["ties"]:.4f}  '
+            f'{stats["margin_p5"]:.0f}/{stats["margin_p50"]:.0f}/{stats["margin_p95"]:.0f}'
+        )
+
+    if args.target:
+        target = {int(level): float(value) for level, value in (point.split(':') for point in args.target)}
+        print('Подобранные диапазоны:', fit_ranges(target, available_count=args.available))
@@ -1,19 +1,185 @@
-import requests
+import json
+import logging
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import Future
+from hashlib import sha1
+from time import perf_counter
+from typing import TYPE_CHECKING
 
-from pyarmor_runtime_000000 import __pyarmor__
+from core.constants import CLOUD_FUNCTION_URL, CLOUD_PACK_TTL, CLOUD_PACKS_LIMIT, CLOUD_RETRIES, CLOUD_TIMEOUT
+from core.database import mark_question_pack_served, store_question_pack, take_question_pack
 
+if TYPE_CHECKING:
+    import requests
 
-def get_questions(token: str) -> list[list[tuple[int, str, list[str]]]]:
-    """Получает из базы данных подготовленные к игре вопросы"""
-    return requests.get(
-        'https://functions.yandexcloud.net/d4ehjo1qt9mtaqbaltt8',
-        {'task': 'get_questions'},
-        headers={'Authorization': f'Api-Key {token}'},
-    ).json()['questions']
+_prefetched: Future | None = None  # набор вопросов для следующей игры, загружается в фоне
+_session: 'requests.Session | None' = None
+_token: str | None = None  # токен облака, расшифровывается не больше одного раза за процесс
+_token_lock = threading.Lock()
+_session_lock = threading.Lock()
+
+
+class RequestMetrics:
+    """Задержки последних запросов к облаку и число неудачных запросов"""
+
+    def __init__(self, size: int = 100):
+        self._samples: deque[float] = deque(maxlen=size)  # длительность запросов в мс, включая повторы
+        self.requests = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def record(self, duration: float, is_ok: bool):
+        with self._lock:
+            self._samples.append(duration)
+            self.requests += 1
+            self.failures += not is_ok
+
+    def report(self) -> dict[str, float]:
+        """Возвращает число запросов и неудач, а также p50, p95 и максимум задержки в мс"""
+        with self._lock:
+            samples = sorted(self._samples)
+            report = {'requests': self.requests, 'failures': self.failures}
+        if samples:
+            for percent in (50, 95):
+                report[f'latency_p{percent}'] = round(samples[max(0, -(-len(samples) * percent // 100) - 1)], 1)
+            report['latency_max'] = round(samples[-1], 1)
+        return report
+
+
+cloud_metrics = RequestMetrics()
+
+
+def _get_session() -> 'requests.Session':
+    """Общая сессия с пулом соединений: DNS, TCP и TLS не повторяются на каждый запрос.
+
+    requests импортируется здесь, при первом запросе, а не при запуске приложения"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=CLOUD_RETRIES,
+                backoff_factor=0.5,  # 0.5, 1, 2 с между повторами
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({'GET'}),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=2)
+            _session = requests.Session()
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+            _session.headers['Accept-Encoding'] = 'gzip, deflate'
+        return _session
+
+
+def get_questions(token: str, url: str = CLOUD_FUNCTION_URL) -> list[list[tuple[int, str, list[str]]]]:
+    """Получает из базы данных подготовленные к игре вопросы; url можно заменить адресом локальной заглушки"""
+    started = perf_counter()
+    is_ok = False
+    try:
+        response = _get_session().get(
+            url,
+            params={'task': 'get_questions'},
+            headers={'Authorization': f'Api-Key {token}'},
+            timeout=CLOUD_TIMEOUT,
+        )
+        response.raise_for_status()
+        questions = response.json()['questions']
+        is_ok = True
+        return questions
+    finally:
+        cloud_metrics.record((perf_counter() - started) * 1000, is_ok)
+
+
+def _run_in_background(func) -> Future:
+    """Выполняет func в фоновом потоке-демоне, который не задерживает выход из игры"""
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func())
+        except BaseException as ex:
+            future.set_exception(ex)
+
+    threading.Thread(target=run, name='cloud-questions', daemon=True).start()
+    return future
+
+
+def _download_pack() -> tuple[str, list]:
+    """Загружает набор вопросов из облака и сохраняет его в кэш; ключ набора — хэш его содержимого"""
+    questions = get_questions(cloud_token())
+    data = json.dumps(questions, ensure_ascii=False, sort_keys=True).encode()
+    key = sha1(data).hexdigest()
+    store_question_pack(key, zlib.compress(data), CLOUD_PACKS_LIMIT)
+    return key, questions
+
+
+def _refresh_packs():
+    """Пополняет кэш свежим набором вопросов для следующих игр"""
+    try:
+        _download_pack()
+    except Exception as ex:
+        logging.warning('Cloud Qs pack is not refreshed: %r', ex)
+
+
+def _next_pack() -> list:
+    """Набор вопросов для новой игры: свежий из кэша, иначе из облака, а без сети — любой сохранённый.
+
+    Набор, показанный в прошлой игре, не выдаётся повторно"""
+    data = take_question_pack(CLOUD_PACK_TTL)
+    if data is not None:
+        _run_in_background(_refresh_packs)
+        return json.loads(zlib.decompress(data))
+    try:
+        key, questions = _download_pack()
+    except Exception:
+        data = take_question_pack()
+        if data is None:
+            raise
+        logging.warning('Cloud is unavailable, cached Qs pack is used')
+        return json.loads(zlib.decompress(data))
+    mark_question_pack_served(key)
+    return questions
+
+
+def prefetch_questions() -> Future:
+    """Начинает подготовку вопросов для следующей игры, если она ещё не начата"""
+    global _prefetched
+    if _prefetched is None:
+        _prefetched = _run_in_background(_next_pack)
+    return _prefetched
+
+
+def take_questions() -> Future:
+    """Забирает загружаемый набор вопросов для начинающейся игры и сразу начинает загрузку следующего"""
+    global _prefetched
+    future = prefetch_questions()
+    _prefetched = None
+    prefetch_questions()
+    return future
+
+
+def cloud_token() -> str:
+    """Возвращает токен облака. Защищённый pyarmor код выполняется один раз за процесс, при первой фоновой загрузке
+    вопросов из облака"""
+    global _token
+    with _token_lock:
+        if _token is None:
+            _token = get_token()
+        return _token
 
 
 def get_token():
     """Sorry, but I need to hide the realisation of this function. However, if you cheat it and use the token for nasty things, I will change the token"""
+    from pyarmor_runtime_000000 import __pyarmor__  # среда pyarmor загружается, только когда нужен токен
+
     __pyarmor__(
         __name__,
         __file__,
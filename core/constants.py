@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from PyQt5.QtGui import QIcon
+if TYPE_CHECKING:
+    from PyQt5.QtGui import QIcon
 
 MONEY_TREE_AMOUNTS = [
     0,
@@ -27,6 +28,12 @@ SECONDS_FOR_QUESTION = {'1-4': 15, 5: 15} | {i: 30 for i in range(6, 11)} | {i:
 
 SECONDS_PRICE = {'1-4': 30, 5: 30} | {i: 308 for i in range(6, 11)} | {i: 1650 for i in range(11, 15)} | {15: 3945}
 
+# диапазоны процента голосов зала за правильный ответ по номерам вопросов, проверяются core/audience.py
+AUDIENCE_CORRECT_RANGES = (
+    {i: (70, 100) for i in range(1, 6)} | {i: (50, 80) for i in range(6, 11)} | {i: (30, 60) for i in range(11, 16)}
+)
+AUDIENCE_DEFAULT_RANGE = (10, 60)  # для номеров вне денежного дерева
+
 LOOP_POINTS = (
     {f'sounds/{i}/before_clock.mp3': 15975 for i in range(6, 16)}
     | {f'sounds/{i}/bed.mp3': 0 for i in range(5, 16)}
@@ -34,86 +41,55 @@ LOOP_POINTS = (
     | {'sounds/double/first_wrong.mp3': 17017}
 )
 
-# noinspection PyTypeChecker
-APP_ICON: QIcon = None  # Will be set in application.py
-
-
-@dataclass
-class COORDS:
-    l_1col = lambda x: 831 <= x <= 878  # noqa: E731
-    l_2col = lambda x: 892 <= x <= 939  # noqa: E731
-    l_3col = lambda x: 955 <= x <= 1002  # noqa: E731
-    l_4col = lambda x: 1017 <= x <= 1064  # noqa: E731
-    l_1row = lambda y: 43 <= y <= 73  # noqa: E731
-    l_2row = lambda y: 77 <= y <= 107  # noqa: E731
-
-    q_1col = lambda x: 200 <= x <= 538  # noqa: E731
-    q_2col = lambda x: 568 <= x <= 915  # noqa: E731
-    q_1row = lambda y: 601 <= y <= 642  # noqa: E731
-    q_2row = lambda y: 653 <= y <= 693  # noqa: E731
+PIXMAP_CACHE_LIMIT = 256 * 1024 * 1024  # бюджет памяти кэша декодированных изображений, в байтах
+SCENE_SCALED_LIMIT = 64  # сколько копий изображений, уменьшенных под размер слоёв, хранит сцена игрового окна
 
-    r_1col = lambda x: 12 <= x <= 100  # noqa: E731
-    r_2col = lambda x: 140 <= x <= 228  # noqa: E731
-    r_3col = lambda x: 268 <= x <= 354  # noqa: E731
-    r_4col = lambda x: 395 <= x <= 483  # noqa: E731
-    r_5col = lambda x: 523 <= x <= 612  # noqa: E731
-    r_1row = lambda y: 703 <= y <= 759  # noqa: E731
-    r_2row = lambda y: 767 <= y <= 823  # noqa: E731
+BACKGROUND_SIZE = (1100, 703)  # размер окна игры, под который уменьшаются фоны
+BACKGROUNDS_CACHE_DIR = 'cache/backgrounds'
+ATLASES_DIR = 'animations/atlases'  # атласы кадров анимаций, собираются animations/pack_atlases.py
+GAME_FONT = 'fonts/itc_conduit.ttf'  # шрифт игрового окна, регистрируется при первом показе игры
 
-    show_btn = lambda x, y: 521 <= x <= 584 and 627 <= y <= 665  # noqa: E731
-    ans_A = lambda x, y: COORDS.q_1col(x) and COORDS.q_1row(y)  # noqa: E731
-    ans_B = lambda x, y: COORDS.q_2col(x) and COORDS.q_1row(y)  # noqa: E731
-    ans_C = lambda x, y: COORDS.q_1col(x) and COORDS.q_2row(y)  # noqa: E731
-    ans_D = lambda x, y: COORDS.q_2col(x) and COORDS.q_2row(y)  # noqa: E731
-    l_5050 = lambda x, y: COORDS.l_1col(x) and COORDS.l_1row(y)  # noqa: E731
-    l_ata = lambda x, y: COORDS.l_2col(x) and COORDS.l_1row(y)  # noqa: E731
-    l_x2 = lambda x, y: COORDS.l_3col(x) and COORDS.l_1row(y)  # noqa: E731
-    l_change = lambda x, y: COORDS.l_4col(x) and COORDS.l_1row(y)  # noqa: E731
-    l_revival = lambda x, y: COORDS.l_1col(x) and COORDS.l_2row(y)  # noqa: E731
-    l_immunity = lambda x, y: COORDS.l_2col(x) and COORDS.l_2row(y)  # noqa: E731
-    l_ftc = lambda x, y: COORDS.l_3col(x) and COORDS.l_2row(y)  # noqa: E731
-    home = lambda x, y: COORDS.l_4col(x) and COORDS.l_2row(y)  # noqa: E731
-    safety_net = lambda x, y: 441 <= x <= 611 and 46 <= y <= 313  # noqa: E731
-    ping1 = lambda x, y: COORDS.r_1col(x) and COORDS.r_1row(y)  # noqa: E731
-    ping2 = lambda x, y: COORDS.r_2col(x) and COORDS.r_1row(y)  # noqa: E731
-    ping3 = lambda x, y: COORDS.r_3col(x) and COORDS.r_1row(y)  # noqa: E731
-    ping4 = lambda x, y: COORDS.r_4col(x) and COORDS.r_1row(y)  # noqa: E731
-    ping5 = lambda x, y: COORDS.r_2col(x) and COORDS.r_2row(y)  # noqa: E731
-    ping6 = lambda x, y: COORDS.r_3col(x) and COORDS.r_2row(y)  # noqa: E731
-    ping7 = lambda x, y: COORDS.r_4col(x) and COORDS.r_2row(y)  # noqa: E731
-    ping8 = lambda x, y: COORDS.r_5col(x) and COORDS.r_2row(y)  # noqa: E731
+DATABASE_PATH = 'database.sqlite3'
 
+CLOUD_FUNCTION_URL = 'https://functions.yandexcloud.net/d4ehjo1qt9mtaqbaltt8'
+CLOUD_TIMEOUT = (3.05, 10)  # таймауты подключения и чтения ответа облака, в секундах
+CLOUD_RETRIES = 3  # повторы запроса к облаку при сетевых ошибках и ответах 429/5xx
+CLOUD_QUESTIONS_WAIT = 1  # сколько секунд ждать вопросы из облака, прежде чем играть на локальных
+CLOUD_PACK_TTL = 24 * 60 * 60  # сколько секунд набор вопросов из облака считается свежим
+CLOUD_PACKS_LIMIT = 20  # сколько последних наборов вопросов хранится в кэше
 
-def lifelines_regions_generator(x, y, mode):
-    return {
-        '5050': COORDS.l_5050(x, y),
-        'ata': COORDS.l_ata(x, y),
-        'x2': COORDS.l_x2(x, y),
-        'change': COORDS.l_change(x, y),
-        'revival': COORDS.l_revival(x, y),
-        'immunity': COORDS.l_immunity(x, y),
-        'ftc': COORDS.l_ftc(x, y) and mode == 'clock',
-    }
-
-
-def answers_regions_generator(x, y):
-    return {
-        'A': COORDS.ans_A(x, y),
-        'B': COORDS.ans_B(x, y),
-        'C': COORDS.ans_C(x, y),
-        'D': COORDS.ans_D(x, y),
-    }
-
-
-def rules_regions_generator(x, y):
-    return {
-        'safety_net': COORDS.safety_net(x, y),
-        'ping1': COORDS.ping1(x, y),
-        'ping2': COORDS.ping2(x, y),
-        'ping3': COORDS.ping3(x, y),
-        'ping4': COORDS.ping4(x, y),
-        'ping5': COORDS.ping5(x, y),
-        'ping6': COORDS.ping6(x, y),
-        'ping7': COORDS.ping7(x, y),
-        'ping8': COORDS.ping8(x, y),
-    }
+# noinspection PyTypeChecker
+APP_ICON: 'QIcon' = None  # Will be set in application.py
+
+
+# области окон для мыши в виде (левый, верхний, правый, нижний) края, включительно; по ним строятся карты
+# попаданий в core/hit_test.py
+ANSWERS_REGIONS = {
+    'A': (200, 601, 538, 642),
+    'B': (568, 601, 915, 642),
+    'C': (200, 653, 538, 693),
+    'D': (568, 653, 915, 693),
+}
+LIFELINES_REGIONS = {
+    '5050': (831, 43, 878, 73),
+    'ata': (892, 43, 939, 73),
+    'x2': (955, 43, 1002, 73),
+    'change': (1017, 43, 1064, 73),
+    'revival': (831, 77, 878, 107),
+    'immunity': (892, 77, 939, 107),
+    'ftc': (955, 77, 1002, 107),  # только в режиме на время
+    'home': (1017, 77, 1064, 107),  # «Забрать деньги»
+}
+SHOW_BUTTON_REGION = (521, 627, 584, 665)  # кнопка показа ответов в режиме на время
+MOUSE_MOVE_INTERVAL = 16  # движения мыши обрабатываются не чаще раза в столько мс — одного кадра при 60 Гц
+RULES_REGIONS = {
+    'safety_net': (441, 46, 611, 313),
+    'ping1': (12, 703, 100, 759),
+    'ping2': (140, 703, 228, 759),
+    'ping3': (268, 703, 354, 759),
+    'ping4': (395, 703, 483, 759),
+    'ping5': (140, 767, 228, 823),
+    'ping6': (268, 767, 354, 823),
+    'ping7': (395, 767, 483, 823),
+    'ping8': (523, 767, 612, 823),
+}
@@ -0,0 +1,349 @@
+import logging
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from random import random
+from time import time
+
+from core.constants import DATABASE_PATH
+
+
+class ConnectionManager:
+    """Долгоживущие соединения с базой данных: по одному на поток вместо нового соединения на каждый запрос.
+
+    Соединения открываются в режиме WAL, поэтому чтение из фоновых потоков не блокирует запись результатов,
+    а скомпилированные запросы переиспользуются через кэш выражений sqlite3"""
+
+    PRAGMAS = (
+        'PRAGMA journal_mode = WAL',
+        'PRAGMA synchronous = NORMAL',  # в режиме WAL это безопасно и избавляет от fsync на каждую запись
+        'PRAGMA temp_store = MEMORY',
+        'PRAGMA cache_size = -8000',  # 8 МБ страничного кэша
+        'PRAGMA foreign_keys = ON',
+    )
+
+    def __init__(self, path: str, cached_statements: int = 128):
+        self._path = path
+        self._cached_statements = cached_statements
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """Возвращает соединение текущего потока, открывая его при первом обращении"""
+        con = getattr(self._local, 'connection', None)
+        if con is None:
+            # соединение закрывается из главного потока в close_all, поэтому проверка потока отключена
+            con = sqlite3.connect(self._path, cached_statements=self._cached_statements, check_same_thread=False)
+            for pragma in self.PRAGMAS:
+                con.execute(pragma)
+            self._local.connection = con
+            self._local.cursor = con.cursor()
+            with self._lock:
+                self._connections.append(con)
+        return con
+
+    def execute(self, request: str, params=()) -> sqlite3.Cursor:
+        """Выполняет запрос на переиспользуемом курсоре текущего потока; результат нужно забрать сразу"""
+        self.connection()
+        return self._local.cursor.execute(request, params)
+
+    @contextmanager
+    def transaction(self, immediate: bool = False):
+        """Транзакция на соединении текущего потока: фиксируется при успехе и откатывается при исключении.
+
+        При immediate блокировка на запись берётся сразу, и параллельные транзакции других потоков ждут её конца"""
+        con = self.connection()
+        with con:
+            if immediate:
+                con.execute('BEGIN IMMEDIATE')
+            yield con
+
+    def close_all(self):
+        """Закрывает соединения всех потоков; повторное обращение откроет новое соединение"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for con in connections:
+            try:
+                con.close()
+            except sqlite3.Error as ex:
+                logging.warning('Database connection is not closed: %s', ex)
+
+
+database = ConnectionManager(DATABASE_PATH)
+
+
+# Схема базы. Версия хранится в таблице schema_version, а каждая миграция переводит базу на следующую версию
+
+_SPACES = re.compile(r'\s+')
+_PUNCTUATION = re.compile(r'[^\w\s]')
+
+
+def normalize_question_text(text: str) -> str:
+    """Нормализует текст вопроса для поиска повторов: регистр, «ё», пунктуация и пробелы не учитываются"""
+    text = _PUNCTUATION.sub(' ', text.lower().replace('ё', 'е'))
+    return _SPACES.sub(' ', text).strip()
+
+
+# вопрос считается повтором, только если совпадают и текст, и правильный ответ: под одной формулировкой
+# («Как правильно написать?») в базе бывают разные вопросы
+_QUESTIONS_TABLE = (
+    'CREATE TABLE {name} (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+    'level INTEGER NOT NULL CHECK (level BETWEEN 1 AND 15), text TEXT NOT NULL, norm_text TEXT NOT NULL, '
+    'norm_answer TEXT NOT NULL, answer_c TEXT NOT NULL, answer_2 TEXT NOT NULL, answer_3 TEXT NOT NULL, '
+    'answer_4 TEXT NOT NULL, UNIQUE (norm_text, norm_answer))'
+)
+
+
+def _migrate_to_1(con: sqlite3.Connection):
+    """Переносит вопросы из 15 таблиц "N_questions" в единую таблицу questions и добавляет индексы"""
+    con.execute('CREATE TABLE IF NOT EXISTS results '
+                '(id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, result TEXT, date TEXT)')
+    con.execute('CREATE INDEX IF NOT EXISTS results_date ON results (date)')
+    con.execute(_QUESTIONS_TABLE.format(name='questions'))
+    # по индексу выбираются вопросы уровня
+    con.execute('CREATE INDEX questions_level_id ON questions (level, id)')
+
+    for level in range(1, 16):
+        table = f'{level}_questions'
+        if not con.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone():
+            continue
+        rows = con.execute(f'SELECT text, answer_c, answer_2, answer_3, answer_4 FROM "{table}" ORDER BY id').fetchall()
+        before = con.total_changes
+        con.executemany(
+            'INSERT OR IGNORE INTO questions '
+            '(level, text, norm_text, norm_answer, answer_c, answer_2, answer_3, answer_4) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                (level, row[0], normalize_question_text(row[0]), normalize_question_text(str(row[1])), *row[1:])
+                for row in rows
+                if row[0]
+            ),
+        )
+        migrated = con.total_changes - before
+        logging.info('Migrated %d questions of level %d', migrated, level)
+        if migrated < len(rows):
+            # пропущенные строки (пустые или повторы) остаются в старой таблице, чтобы их можно было разобрать
+            logging.warning('Skipped %d rows of "%s", the table is kept', len(rows) - migrated, table)
+        else:
+            con.execute(f'DROP TABLE "{table}"')
+
+
+def _migrate_to_2(con: sqlite3.Connection):
+    """Добавляет кэш наборов вопросов из облака"""
+    con.execute(
+        'CREATE TABLE question_packs '
+        '(key TEXT PRIMARY KEY, data BLOB NOT NULL, fetched_at REAL NOT NULL, served_at REAL)'
+    )
+
+
+def _migrate_to_3(con: sqlite3.Connection):
+    """Добавляет состояние импорта вопросов для повторного импорта только новых строк"""
+    con.execute(
+        'CREATE TABLE import_state (source TEXT PRIMARY KEY, last_row INTEGER NOT NULL, imported_at REAL NOT NULL)'
+    )
+
+
+def _migrate_to_4(con: sqlite3.Connection):
+    """Пересоздаёт таблицу questions с уникальностью по тексту и правильному ответу вместо одного текста"""
+    if 'norm_answer' in [column[1] for column in con.execute('PRAGMA table_info(questions)')]:
+        return  # таблица создана исправленной миграцией _migrate_to_1
+    con.create_function('normalize_question_text', 1, normalize_question_text, deterministic=True)
+    con.execute(_QUESTIONS_TABLE.format(name='questions_new'))
+    con.execute(
+        'INSERT INTO questions_new (id, level, text, norm_text, norm_answer, answer_c, answer_2, answer_3, answer_4) '
+        'SELECT id, level, text, norm_text, normalize_question_text(CAST(answer_c AS TEXT)), '
+        'answer_c, answer_2, answer_3, answer_4 '
+        'FROM questions ORDER BY id'
+    )
+    con.execute('DROP TABLE questions')
+    con.execute('ALTER TABLE questions_new RENAME TO questions')
+    con.execute('CREATE INDEX questions_level_id ON questions (level, id)')
+
+
+def _migrate_to_5(con: sqlite3.Connection):
+    """Нумерует вопросы внутри уровня подряд с нуля: по номеру случайный вопрос находится одним поиском по индексу,
+    а количество вопросов уровня — это наибольший номер плюс один"""
+    con.execute('ALTER TABLE questions ADD COLUMN level_pos INTEGER')
+    positions: dict[int, int] = {}
+    updates = []
+    for question_id, level in con.execute('SELECT id, level FROM questions ORDER BY level, id').fetchall():
+        positions[level] = positions.get(level, -1) + 1
+        updates.append((positions[level], question_id))
+    con.executemany('UPDATE questions SET level_pos = ? WHERE id = ?', updates)
+    con.execute('DROP INDEX questions_level_id')  # выборку по уровню обслуживает и новый индекс
+    con.execute('CREATE UNIQUE INDEX questions_level_pos ON questions (level, level_pos)')
+
+
+# MIGRATIONS[i] переводит базу с версии i на версию i + 1
+MIGRATIONS = (_migrate_to_1, _migrate_to_2, _migrate_to_3, _migrate_to_4, _migrate_to_5)
+
+
+def create_database_if_not_exists():
+    """Создаёт базу данных или обновляет её схему до последней версии"""
+    with database.transaction(immediate=True) as con:  # миграция выполняется целиком или не выполняется вовсе
+        con.execute('CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)')
+        row = con.execute('SELECT version FROM schema_version').fetchone()
+        version = row[0] if row else 0
+        for migration in MIGRATIONS[version:]:
+            migration(con)
+        if version < len(MIGRATIONS):
+            con.execute('DELETE FROM schema_version')
+            con.execute('INSERT INTO schema_version (version) VALUES (?)', (len(MIGRATIONS),))
+            logging.info('Database schema: version %d -> %d', version, len(MIGRATIONS))
+
+
+# Запросы к базе. Значения передаются только через параметры, поэтому кавычки в именах игроков ничего не ломают,
+# а текст запроса неизменен и берётся из кэша скомпилированных выражений
+
+QuestionRow = tuple[str, str, str, str, str]  # текст, правильный ответ и три неправильных
+
+
+def record_result(name: str, result: str, date: str) -> None:
+    """Сохраняет результат игры"""
+    with database.transaction():
+        database.execute('INSERT INTO results (name, result, date) VALUES (?, ?, ?)', (name, result, date))
+
+
+def list_results() -> list[tuple[str, str, str]]:
+    """Возвращает результаты (имя, выигрыш, дата) по убыванию выигрыша"""
+    return database.execute(
+        "SELECT name, result, date FROM results ORDER BY CAST(REPLACE(result, ' ', '') AS INTEGER) DESC, id"
+    ).fetchall()
+
+
+def delete_result(date: str) -> int:
+    """Удаляет результат по дате и времени игры и возвращает количество удалённых записей"""
+    with database.transaction():
+        return database.execute('DELETE FROM results WHERE date = ?', (date,)).rowcount
+
+
+def clear_results() -> None:
+    """Очищает таблицу результатов"""
+    with database.transaction():
+        database.execute('DELETE FROM results')
+
+
+# вопросы не удаляются, а номера внутри уровня идут подряд, поэтому количество — наибольший номер плюс один;
+# он находится по индексу (level, level_pos) без прохода по вопросам уровня
+_COUNTS_REQUEST = (
+    'WITH levels (level) AS (VALUES ' + ', '.join(f'({level})' for level in range(1, 16)) + ') '
+    'SELECT level, (SELECT max(level_pos) + 1 FROM questions WHERE questions.level = levels.level) FROM levels'
+)
+
+
+def question_counts() -> dict[int, int]:
+    """Возвращает количество вопросов каждого уровня, уровни без вопросов не попадают в словарь"""
+    return {level: count for level, count in database.execute(_COUNTS_REQUEST).fetchall() if count}
+
+
+def fetch_questions(level: int, n: int) -> list[QuestionRow]:
+    """Возвращает n случайных вопросов уровня level"""
+    return database.execute(
+        'SELECT text, answer_c, answer_2, answer_3, answer_4 FROM questions WHERE level = ? ORDER BY random() LIMIT ?',
+        (level, n),
+    ).fetchall()
+
+
+def insert_questions(rows: list[tuple[int, str, str, str, str, str]]) -> int:
+    """Добавляет вопросы (уровень, текст, правильный ответ, три неправильных) в открытой транзакции и возвращает,
+    сколько добавлено; повторы (тот же текст и правильный ответ) пропускаются"""
+    con = database.connection()
+    before = con.total_changes
+    con.executemany(
+        'INSERT OR IGNORE INTO questions '
+        '(level, text, norm_text, norm_answer, answer_c, answer_2, answer_3, answer_4, level_pos) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?, (SELECT coalesce(max(level_pos), -1) + 1 FROM questions WHERE level = ?))',
+        [
+            (level, text, normalize_question_text(text), normalize_question_text(answers[0]), *answers, level)
+            for level, text, *answers in rows
+        ],
+    )
+    return con.total_changes - before
+
+
+def get_import_state(source: str) -> int:
+    """Возвращает номер последней импортированной строки источника или 0"""
+    row = database.execute('SELECT last_row FROM import_state WHERE source = ?', (source,)).fetchone()
+    return row[0] if row else 0
+
+
+def set_import_state(source: str, last_row: int) -> None:
+    """Запоминает номер последней импортированной строки источника в открытой транзакции"""
+    database.execute(
+        'INSERT INTO import_state (source, last_row, imported_at) VALUES (?, ?, ?) '
+        'ON CONFLICT (source) DO UPDATE SET last_row = excluded.last_row, imported_at = excluded.imported_at',
+        (source, last_row, time()),
+    )
+
+
+@lru_cache(maxsize=None)
+def _sample_request(n: int) -> str:
+    """Запрос, выбирающий за один проход по n вопросов каждого уровня по случайным номерам внутри уровня.
+
+    Номер — это доля, переданная параметром, от количества вопросов уровня; и количество, и вопрос с этим номером
+    находятся поиском по индексу (level, level_pos), так что время не зависит от размера базы"""
+    pick = (
+        'SELECT * FROM (SELECT level, level_pos, text, answer_c, answer_2, answer_3, answer_4 FROM questions '
+        'WHERE level = ? AND level_pos = (SELECT CAST(? * (max(level_pos) + 1) AS INTEGER) FROM questions '
+        'WHERE level = ?))'
+    )
+    return ' UNION ALL '.join([pick] * (15 * n))
+
+
+def sample_questions(n: int) -> dict[int, list[QuestionRow]]:
+    """Возвращает по n случайных вопросов каждого уровня одним запросом.
+
+    Если номера внутри уровня совпали или вопросов уровня меньше n, вопросы этого уровня выбираются заново
+    через fetch_questions: совпадения редки, а на маленьком уровне полная выборка дешёва"""
+    params = []
+    for level in range(1, 16):
+        for _ in range(n):
+            params.extend((level, random(), level))
+
+    picked: dict[int, dict[int, QuestionRow]] = {level: {} for level in range(1, 16)}
+    for level, level_pos, *question in database.execute(_sample_request(n), params).fetchall():
+        picked[level][level_pos] = tuple(question)
+    return {
+        level: list(questions.values()) if len(questions) == n else fetch_questions(level, n)
+        for level, questions in picked.items()
+    }
+
+
+def store_question_pack(key: str, data: bytes, limit: int) -> None:
+    """Сохраняет набор вопросов из облака, оставляя в кэше не больше limit последних загруженных наборов"""
+    with database.transaction():
+        database.execute(
+            'INSERT OR IGNORE INTO question_packs (key, data, fetched_at) VALUES (?, ?, ?)', (key, data, time())
+        )
+        database.execute(
+            'DELETE FROM question_packs WHERE key NOT IN '
+            '(SELECT key FROM question_packs ORDER BY fetched_at DESC LIMIT ?)',
+            (limit,),
+        )
+
+
+def take_question_pack(max_age: float | None = None) -> bytes | None:
+    """Выбирает набор вопросов, который дольше всех не показывался, и отмечает его показанным.
+
+    Набор, показанный последним, не выбирается никогда, а при max_age — и наборы старше max_age секунд"""
+    with database.transaction(immediate=True):  # два потока не должны выбрать один и тот же набор
+        row = database.execute(
+            'SELECT key, data FROM question_packs WHERE fetched_at >= ? AND key IS NOT '
+            '(SELECT key FROM question_packs WHERE served_at IS NOT NULL ORDER BY served_at DESC LIMIT 1) '
+            'ORDER BY served_at IS NOT NULL, served_at, fetched_at DESC LIMIT 1',
+            (time() - max_age if max_age is not None else 0,),
+        ).fetchone()
+        if row is None:
+            return None
+        database.execute('UPDATE question_packs SET served_at = ? WHERE key = ?', (time(), row[0]))
+    return row[1]
+
+
+def mark_question_pack_served(key: str) -> None:
+    """Отмечает набор вопросов показанным"""
+    with database.transaction():
+        database.execute('UPDATE question_packs SET served_at = ? WHERE key = ?', (time(), key))
@@ -3,111 +3,35 @@ import sys
 from typing import TYPE_CHECKING
 
 from PyQt5.QtCore import QTimer
-from PyQt5.QtGui import QPixmap
 from PyQt5.QtMultimedia import QMediaPlayer
-from PyQt5.QtWidgets import QDesktopWidget, QDialog, QMessageBox
+from PyQt5.QtWidgets import QDialog
 
 if TYPE_CHECKING:
     from core.game import GameWindow
 
+from core.assets import load_pixmap
 from core.constants import APP_ICON, MONEY_TREE_AMOUNTS
+from core.database import clear_results, record_result
+from core.formatting import convert_amount_to_str
 from core.tools import (
     AnimationScheduler,
-    LoopingMediaPlayer,
-    convert_amount_to_str,
     decorate_audio,
     empty_timer,
     hide_timer,
     show_prize,
-    sql_request,
 )
-from core.widgets import GameRules, ResultsTableWindow
+from core.widgets import ResultsTableWindow
 from ui import (
     Ui_ConfirmAgain,
     Ui_ConfirmClearAll,
     Ui_ConfirmExit,
     Ui_ConfirmLeave,
     Ui_GameOver,
-    Ui_StartDialog,
     Ui_Win,
     Ui_WinLeave,
 )
 
 
-class StartWindow(QDialog, Ui_StartDialog):
-    """Стартовое окно для ввода имени игрока и показа правил игр"""
-
-    def __init__(self):
-        super().__init__()
-        self.setupUi(self)
-
-        qr = self.frameGeometry()
-        cp = QDesktopWidget().availableGeometry().center()
-        qr.moveCenter(cp)
-        self.move(qr.topLeft())
-
-        self.setWindowIcon(APP_ICON)
-        self.radioButton_4.toggled.connect(self.check_db_is_ok)
-        self.ok_button.clicked.connect(self.get_name)
-        self.exit_button.clicked.connect(sys.exit)
-        self.rulebook_button.clicked.connect(self.show_rules)
-        self.msg = QMessageBox()
-        self.msg.setWindowIcon(APP_ICON)
-        self.msg.setIcon(QMessageBox.Warning)
-
-    def check_db_is_ok(self):
-        """Проверяет, готова ли локальная база вопросов к игре"""
-        for i in range(1, 16):
-            _, question_data = sql_request(f'SELECT * FROM "{i}_questions"')
-            if question_data:
-                continue
-            self.msg.setWindowTitle('Локальная база не наполнена вопросами')
-            self.msg.setText(
-                f'В локальной базе вопросов нет вопросов для {i}-го шага денежного дерева. Пожалуйста, добавьте '
-                'вопросы для игры или воспользуйтесь удалённой базой вопросов.'
-            )
-            self.msg.show()
-            self.radioButton_3.setChecked(True)
-            break
-
-    def get_name(self) -> None:
-        """Получает имя игрока"""
-        name = self.lineEdit.text()
-        if not name:
-            self.msg.setText('Введите имя, чтобы учитываться в таблице рекордов.\nНе оставляйте поле пустым.')
-            self.msg.show()
-        elif any([(le in name) for le in '`~!@#$%^&*()_+{}|:"<>?[]\\;\',./№0123456789']):
-            self.msg.setWindowTitle('Некорректное имя')
-            self.msg.setText(
-                'Введите корректное имя, состоящее только из букв и пробелов. Не используйте цифры или спецсимволы.'
-            )
-            self.msg.show()
-            self.lineEdit.setText('')
-        else:
-            self.start_game(name.capitalize())
-
-    def show_rules(self):
-        """Показывает правила игры"""
-        self.player1 = LoopingMediaPlayer(self)  # для фоновой музыки
-        self.player2 = QMediaPlayer(self)  # для звука остановки
-        self.rules_window = GameRules((self.player1, self.player2))
-        self.player1.set_media(decorate_audio('sounds/rules/bed.mp3'))
-        self.player1.play()
-        self.rules_window.show()
-
-    def start_game(self, name: str) -> None:
-        """Начинает игру с заданным именем игрока name и режимом игры"""
-        from core.game import GameWindow
-
-        mode = self.buttonGroup.checkedButton().text()
-        mode = 'classic' if mode == 'Обычный режим' else 'clock'
-        question_sources = self.buttonGroup_2.checkedButton().text()
-        question_sources = 'cloud' if question_sources == 'Удалённая база вопросов' else 'local'
-        self.game = GameWindow(name, mode, question_sources)
-        self.game.show()
-        self.close()
-
-
 class EndGameWindow(QDialog):
     def __init__(self):
         super().__init__()
@@ -195,9 +119,7 @@ class ConfirmLeaveWindow(QDialog, Ui_ConfirmLeave):
         self.correct_answer = letter if self.parent_.has_shown else ''
         self.is_sound = is_sound
 
-        self.prize = convert_amount_to_str(
-            self.parent_.got_amount + self.parent_.saved_seconds_prize + self.parent_.seconds_prize
-        )
+        self.prize = convert_amount_to_str(self.parent_.engine.leave_prize)
         self.label.setText(self.label.text().replace('{}', self.prize))
         self.buttonBox.accepted.connect(self.leave)
         self.buttonBox.rejected.connect(self.close_window)
@@ -206,9 +128,7 @@ class ConfirmLeaveWindow(QDialog, Ui_ConfirmLeave):
         """Покидает игру, забирает деньги и предлагает сыграть ещё раз"""
 
         parent_ = self.parent_
-        sql_request(
-            f'INSERT INTO results (name, result, date) VALUES ("{parent_.name}", "{self.prize}", "{parent_.date}")'
-        )
+        record_result(parent_.name, self.prize, parent_.date)
 
         self.windialog = WinLeaveWindow(parent_, (self.correct_answer, self.prize, self.is_sound))
         self.windialog.move(201 + parent_.x(), 210 + parent_.y())
@@ -224,7 +144,7 @@ class ConfirmLeaveWindow(QDialog, Ui_ConfirmLeave):
         if parent_.has_shown:
             if parent_.mode == 'clock':
                 parent_.qt_timer.stop()
-            parent_.state_q_2.setPixmap(QPixmap(f'images/question field/correct_{self.correct_answer}.png'))
+            parent_.state_q_2.setPixmap(load_pixmap(f'images/question field/correct_{self.correct_answer}.png'))
             parent_.state_q_2.startFadeInImage()
             parent_.state_q_2.show()
 
@@ -306,7 +226,7 @@ class ConfirmClearAll(QDialog, Ui_ConfirmClearAll):
     def delete_all_data(self):
         """Очищает всю таблицу результатов"""
 
-        sql_request('DELETE FROM results')
+        clear_results()
         self.results_table = ResultsTableWindow()
         self.results_table.move(self.x(), self.y() - 117)
         self.results_table.show()
@@ -0,0 +1,377 @@
+import random
+from dataclasses import dataclass, field
+from typing import Callable
+
+from core.constants import (
+    AUDIENCE_CORRECT_RANGES,
+    AUDIENCE_DEFAULT_RANGE,
+    MONEY_TREE_AMOUNTS,
+    SAFETY_NETS,
+    SECONDS_FOR_QUESTION,
+    SECONDS_PRICE,
+)
+
+# Правила игры без Qt: окно игры только отображает переходы движка, поэтому игры можно симулировать без экрана
+
+LETTERS = ('A', 'B', 'C', 'D')
+LIFELINES = ('change', '5050', 'x2', 'ata', 'revival', 'ftc', 'immunity')
+
+
+def stage(question_num: int) -> int | str:
+    """Ключ вопроса в SECONDS_FOR_QUESTION и SECONDS_PRICE и в путях к звукам: 1–4 вопросы звучат одинаково"""
+    return '1-4' if question_num in range(1, 5) else question_num
+
+
+def ask_audience(question_number: int, available_count: int) -> tuple[int, list[int]]:
+    """Симулирует помощь зала; для массовой генерации опросов — core.audience.poll_batch"""
+
+    correct_min, correct_max = AUDIENCE_CORRECT_RANGES.get(question_number, AUDIENCE_DEFAULT_RANGE)
+    correct_percentage = random.randint(correct_min, correct_max)
+    remaining = 100 - correct_percentage
+
+    other_votes = [random.random() for _ in range(available_count - 1)]
+    total = sum(other_votes)
+    other_percentages = [round(x / total * remaining) for x in other_votes]
+
+    if not other_percentages:
+        return 100, []
+    diff = remaining - sum(other_percentages)
+    other_percentages[0] += diff
+    random.shuffle(other_percentages)
+
+    return correct_percentage, other_percentages
+
+
+@dataclass
+class Event:
+    """Переход состояния игры: вид перехода и данные, нужные для его отображения"""
+
+    kind: str
+    data: dict = field(default_factory=dict)
+
+
+class GameEngine:
+    """Состояние и правила одной игры: ответы, подсказки, несгораемые суммы, приз за секунды в режиме на время.
+
+    Каждый переход возвращает `Event` и передаёт его подписчикам из listeners. Вопросы — список из 15 уровней,
+    в каждом варианты [текст, правильный ответ, ответы в порядке показа]; в облачном режиме они задаются позже."""
+
+    def __init__(self, mode: str, questions: list | None = None):
+        self.mode = mode
+        self.questions = questions
+        self.listeners: list[Callable[[Event], None]] = []
+        self.reset()
+
+    def reset(self):
+        """Возвращает все значения в начальное состояние"""
+        self.current_question_num = 1
+        self.has_shown = self.mode == 'classic'  # показаны ли ответы; в режиме на время — по кнопке
+        self.seconds_left = 0
+        self.seconds_prize = 0  # приз за сэкономленные секунды в режиме игры на время
+        self.saved_seconds_prize = 0  # приз за секунды сохраняется из seconds_prize после 5 и 10 вопросов
+
+        self.is_x2_now = False
+        self.is_ata_now = False
+        self.is_revival_now = False
+        self.revival_activated = False
+        self.is_immunity_now = False
+        self.non_active_answers: list[str] = []
+        self.lifelines = {
+            'change': True,
+            '5050': True,
+            'x2': True,
+            'ata': True,
+            'revival': True,
+            'ftc': self.mode == 'clock',
+            'immunity': True,
+        }
+        self.available_to_choose = ['change', '5050', 'x2', 'ata', 'ftc', 'immunity']
+        self.used_lifelines_count = 0
+
+        self.correct_answer = ''
+        self.answers: list[str] = []
+        self.got_amount = 0
+
+    def _emit(self, kind: str, **data) -> Event:
+        event = Event(kind, data)
+        for listener in self.listeners:
+            listener(event)
+        return event
+
+    @property
+    def correct_letter(self) -> str:
+        return LETTERS[self.answers.index(self.correct_answer)]
+
+    @property
+    def leave_prize(self) -> int:
+        """Сумма, которую игрок получит, забрав деньги"""
+        return self.got_amount + self.saved_seconds_prize + self.seconds_prize
+
+    def can_leave(self) -> bool:
+        """Можно ли забрать деньги: после четырёх подсказок кнопка недоступна"""
+        return self.used_lifelines_count < 4
+
+    def set_question(self, changer: int = 0) -> Event:
+        """Задаёт текущий вопрос; changer — номер запасного вопроса после замены"""
+        text, correct_answer, answers = self.questions[self.current_question_num - 1][changer]
+        self.non_active_answers = []
+        self.correct_answer = str(correct_answer)
+        self.answers = list(map(str, answers))
+        self.got_amount = MONEY_TREE_AMOUNTS[self.current_question_num - 1]
+        return self._emit('question', number=self.current_question_num, text=text, answers=self.answers)
+
+    def show_answers(self) -> Event:
+        """Показывает ответы; в режиме на время запускает отсчёт"""
+        if self.mode == 'clock':
+            self.has_shown = True
+            self.seconds_left = SECONDS_FOR_QUESTION[stage(self.current_question_num)]
+        return self._emit('answers_shown', seconds=self.seconds_left)
+
+    def tick(self) -> Event:
+        """Отсчитывает секунду в режиме на время; на нуле время вышло и действует как неправильный ответ"""
+        seconds = self.seconds_left
+        if seconds == 0 and self.is_immunity_now:  # с иммунитетом игрок уходит с суммой, отсчёт останавливается
+            return self._emit('time_up', seconds=0, immunity=True, correct=self.correct_letter)
+        self.seconds_left -= 1
+        if seconds != 0:
+            return self._emit('tick', seconds=seconds)
+        self.has_shown = False
+        prize = SAFETY_NETS[self.current_question_num - 1] + self.saved_seconds_prize
+        return self._emit('time_up', seconds=0, immunity=False, correct=self.correct_letter, prize=prize)
+
+    def answer(self, letter: str) -> Event:
+        """Проверяет ответ. Виды событий: second_chance (ошибка с «правом на ошибку»), wrong, correct, won"""
+        correct = self.correct_letter
+        n = stage(self.current_question_num)
+
+        self.available_to_choose = list(self.lifelines.keys())
+        if not self.revival_activated or self.is_x2_now:
+            self.available_to_choose.remove('revival')
+
+        if self.is_x2_now and letter != correct:  # неправильный ответ с «правом на ошибку»
+            self.non_active_answers.append(letter)
+            self.is_x2_now = False
+            ftc_returned = self.mode == 'clock' and self.used_lifelines_count < 4
+            if ftc_returned:
+                self.available_to_choose.append('ftc')
+            return self._emit('second_chance', letter=letter, immunity=self.is_immunity_now, ftc=ftc_returned)
+
+        if letter != correct:  # неправильный ответ без «права на ошибку»
+            if self.is_immunity_now:
+                return self._emit('wrong', letter=letter, correct=correct, immunity=True)
+            if self.mode == 'clock':
+                self.has_shown = False
+            prize = SAFETY_NETS[self.current_question_num - 1] + self.saved_seconds_prize
+            return self._emit('wrong', letter=letter, correct=correct, immunity=False, prize=prize)
+
+        # правильный ответ без или с «правом на ошибку»: после него возвращаются заблокированные подсказки
+        returned = []
+        if (len(self.non_active_answers) in (1, 3) or self.is_x2_now) and self.used_lifelines_count < 4:
+            returned = ['ftc', 'revival'] if self.mode == 'clock' else ['revival']
+            self.available_to_choose += returned
+        was_protected = self.is_x2_now or self.is_immunity_now
+        self.is_x2_now = False
+        self.is_immunity_now = False
+        self.seconds_prize += SECONDS_PRICE[n] * self.seconds_left
+        if self.mode == 'clock':
+            self.has_shown = False
+
+        question_num = self.current_question_num
+        if question_num in (5, 10, 15) and self.mode == 'clock':
+            self.saved_seconds_prize += self.seconds_prize
+        prize = MONEY_TREE_AMOUNTS[question_num] + self.saved_seconds_prize
+        return self._emit(
+            'won' if question_num == 15 else 'correct',
+            correct=correct,
+            returned=returned,
+            protected=was_protected,
+            milestone=question_num in (5, 10),
+            prize=prize,
+        )
+
+    def next_question(self) -> Event:
+        """Переходит к следующему вопросу после правильного ответа"""
+        self.current_question_num += 1
+        return self._emit('next_question', number=self.current_question_num)
+
+    def hide_audience(self) -> bool:
+        """Убирает результаты «Помощи зала»; возвращает, были ли они показаны"""
+        shown, self.is_ata_now = self.is_ata_now, False
+        return shown
+
+    def activate_revival(self) -> bool:
+        """Делает доступным «Возрождение», если уже использована хотя бы одна подсказка"""
+        if 1 <= self.used_lifelines_count < 4 and not self.revival_activated:
+            self.available_to_choose.append('revival')
+            self.revival_activated = True
+            return True
+        return False
+
+    def use_lifeline(self, name: str) -> Event | None:
+        """Использует подсказку; возвращает None, если она уже использована"""
+        if not self.lifelines[name] and not self.is_revival_now:
+            return None
+
+        if not self.is_revival_now:
+            self.used_lifelines_count += 1
+
+        data = {}
+        keeps_revival_locked = False  # подсказки, после которых «Возрождение» не открывается до ответа
+
+        if name == 'change':  # замена вопроса
+            # при «Возрождении» вопрос меняется на второй запасной
+            data = {
+                'changer': 1 + int(self.is_revival_now),
+                'x2': self.is_x2_now,
+                'ata': self.is_ata_now,
+                'restore_bed': self.is_x2_now or len(self.non_active_answers) in (1, 3),
+            }
+            if self.mode == 'clock':
+                self.has_shown = False
+            self.is_x2_now = False
+            self.is_ata_now = False
+            self.is_immunity_now = False
+
+        elif name == 'x2':  # право на ошибку
+            self.is_x2_now = True
+            data['revival_locked'] = 'revival' in self.available_to_choose
+            if data['revival_locked']:
+                self.available_to_choose.remove('revival')
+            if self.mode == 'clock' and 'ftc' in self.available_to_choose:  # при «Возрождении» её может не быть
+                self.available_to_choose.remove('ftc')
+            keeps_revival_locked = True
+
+        elif name == '5050':  # 50:50
+            indexes = {0, 1, 2, 3}
+            if self.non_active_answers:  # неактивные ответы от «права на ошибку»
+                indexes -= {LETTERS.index(self.non_active_answers[0])}
+            indexes = list(indexes - {self.answers.index(self.correct_answer)})  # вырезаем правильный ответ
+            random.shuffle(indexes)  # убрать два неверных ответа СЛУЧАЙНО
+            data['removed'] = [LETTERS[indexes[0]], LETTERS[indexes[1]]]
+            self.non_active_answers += data['removed']
+            keeps_revival_locked = True
+
+        elif name == 'ata':  # помощь зала
+            correct_percent, other_percents = ask_audience(self.current_question_num, 4 - len(self.non_active_answers))
+            data = {'correct': correct_percent, 'others': other_percents}
+            self.is_ata_now = True
+
+        elif name == 'revival':  # возрождение: позволяет использовать одну из потраченных подсказок ещё раз
+            self.is_revival_now = True
+            self.available_to_choose = list(self.lifelines.keys())
+            data['lock_5050'] = len(self.non_active_answers) >= 2
+            if data['lock_5050']:
+                self.available_to_choose.remove('5050')
+            for lifeline in self.lifelines:
+                if self.lifelines[lifeline]:
+                    self.available_to_choose.remove(lifeline)
+            data['x2'] = self.is_x2_now
+            if self.is_x2_now:
+                self.available_to_choose.remove('x2')
+            data['immunity'] = self.is_immunity_now
+            if self.is_immunity_now:
+                self.available_to_choose.remove('immunity')
+            self.lifelines['revival'] = False
+            return self._emit('lifeline', name=name, **data)
+
+        elif name == 'immunity':  # иммунитет
+            data['x2'] = self.is_x2_now
+            self.is_immunity_now = True
+            keeps_revival_locked = True
+
+        elif name == 'ftc':  # заморозка времени
+            keeps_revival_locked = True
+
+        if self.is_revival_now:  # подсказка использована повторно, остальные потраченные снова недоступны
+            data['revived'] = [ll for ll in self.lifelines if not self.lifelines[ll] and ll != 'revival']
+            data['keep_central'] = self.is_x2_now or self.is_immunity_now
+            self.available_to_choose = list(self.lifelines.keys())
+            self.is_revival_now = False
+
+        self.lifelines[name] = False
+        data['exhausted'] = self.used_lifelines_count >= 4
+        data['revival_activated'] = False
+        if self.used_lifelines_count >= 1 and not keeps_revival_locked and not self.revival_activated:
+            self.available_to_choose.append('revival')
+            self.revival_activated = True
+            data['revival_activated'] = True
+        return self._emit('lifeline', name=name, **data)
+
+
+def _synthetic_questions() -> list:
+    """Вопросы-заглушки для симуляции: по три варианта на каждый из 15 уровней, правильный ответ на случайном месте"""
+    questions = []
+    for level in range(1, 16):
+        variants = []
+        for variant in range(3):
+            answers = [f'{level}.{variant}.{letter}' for letter in LETTERS]
+            variants.append([f'Вопрос {level}.{variant}', random.choice(answers), answers])
+        questions.append(variants)
+    return questions
+
+
+def random_strategy(engine: GameEngine, skill: float = 0.85) -> tuple[str, str]:
+    """Стратегия симулируемого игрока: иногда берёт подсказку, иначе отвечает правильно с вероятностью,
+    убывающей к 15 вопросу. Возвращает действие ('lifeline', имя) или ('answer', буква)"""
+    available = [
+        ll
+        for ll in engine.available_to_choose
+        if (engine.lifelines[ll] or engine.is_revival_now) and (ll != 'ftc' or engine.mode == 'clock')
+    ]
+    # во время «Возрождения» отвечать нельзя, пока не выбрана подсказка
+    if available and (engine.is_revival_now or engine.used_lifelines_count < 4 and random.random() < 0.15):
+        return 'lifeline', random.choice(available)
+    accuracy = skill ** (engine.current_question_num / 3)
+    letters = [letter for letter in LETTERS if letter not in engine.non_active_answers]
+    if random.random() < accuracy or len(letters) == 1:
+        return 'answer', engine.correct_letter
+    return 'answer', random.choice([letter for letter in letters if letter != engine.correct_letter])
+
+
+def simulate(
+    games: int, mode: str = 'classic', strategy: Callable[[GameEngine], tuple[str, str]] = random_strategy
+) -> dict:
+    """Играет games игр без интерфейса и возвращает статистику: долю побед, средний выигрыш, распределение
+    вопросов, на которых игра закончилась, и частоту использования подсказок"""
+    finished_on = [0] * 16
+    lifelines_used = dict.fromkeys(LIFELINES, 0)
+    total_prize = wins = 0
+    for _ in range(games):
+        engine = GameEngine(mode, _synthetic_questions())
+        engine.set_question()
+        engine.show_answers()
+        while True:
+            action, value = strategy(engine)
+            if action == 'lifeline':
+                event = engine.use_lifeline(value)
+                if event is not None:
+                    lifelines_used[value] += 1
+                    if value == 'change':
+                        engine.set_question(event.data['changer'])
+                        engine.show_answers()
+                continue
+            if mode == 'clock':  # игрок тратит на ответ случайную часть отведённого времени
+                for _ in range(random.randint(0, engine.seconds_left)):
+                    engine.tick()
+            event = engine.answer(value)
+            if event.kind == 'second_chance':
+                continue
+            if event.kind == 'correct':
+                engine.next_question()
+                engine.activate_revival()
+                engine.set_question()
+                engine.show_answers()
+                continue
+            # иммунитет после ошибки означает, что игрок забирает деньги
+            prize = engine.leave_prize if event.data.get('immunity') else event.data['prize']
+            total_prize += prize
+            wins += event.kind == 'won'
+            finished_on[engine.current_question_num] += 1
+            break
+    return {
+        'games': games,
+        'win_rate': wins / games,
+        'mean_prize': total_prize / games,
+        'finished_on': finished_on[1:],
+        'lifelines_used': lifelines_used,
+    }
@@ -0,0 +1,6 @@
+# Модуль без зависимостей от Qt: суммы форматируются и в окне правил, которое открывается до загрузки игры
+
+
+def convert_amount_to_str(amount: int) -> str:
+    """Преобразует сумму в строку с разделителями разрядов"""
+    return '{:,}'.format(amount).replace(',', ' ')
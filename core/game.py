@@ -2,23 +2,16 @@ import logging
 import sys
 from bisect import bisect_right
 from datetime import datetime
-from random import shuffle
 
 from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtGui import QKeyEvent, QMouseEvent, QMovie, QPixmap
 from PyQt5.QtWidgets import QMainWindow
 
-from core.cloud_integration import get_questions, get_token
-from core.constants import (
-    APP_ICON,
-    COORDS,
-    MONEY_TREE_AMOUNTS,
-    SAFETY_NETS,
-    SECONDS_FOR_QUESTION,
-    SECONDS_PRICE,
-    answers_regions_generator,
-    lifelines_regions_generator,
-)
+from core import profiling, timelines
+from core.assets import asset_preloader, background_variants, load_pixmap, next_stage_assets
+from core.cloud_integration import take_questions
+from core.constants import APP_ICON, CLOUD_QUESTIONS_WAIT, MOUSE_MOVE_INTERVAL
+from core.database import question_counts, record_result
 from core.dialogs import (
     ConfirmAgainWindow,
     ConfirmClearAll,
@@ -27,11 +20,12 @@ from core.dialogs import (
     GameOverWindow,
     WinWindow,
 )
+from core.engine import GameEngine, stage
+from core.formatting import convert_amount_to_str
+from core.hit_test import answers_map, lifelines_map, show_button_map
 from core.tools import (
     AnimationScheduler,
     LoopingMediaPlayer,
-    ask_audience,
-    convert_amount_to_str,
     decorate_audio,
     empty_timer,
     get_local_questions,
@@ -39,27 +33,65 @@ from core.tools import (
     refill_timer,
     show_prize,
     show_timer,
-    sql_request,
 )
 from core.widgets import AboutWindow, DeleteResultWindow, ResultsTableWindow
-from ui import AnimationLabel, Ui_MainWindow
+from ui import Ui_MainWindow
+
+
+class _EngineState:
+    """Атрибут окна, доступный только для чтения: состояние игры хранит и меняет движок"""
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, window: 'GameWindow | None', owner=None):
+        return self if window is None else getattr(window.engine, self.name)
 
 
 class GameWindow(QMainWindow, Ui_MainWindow):
-    """Окно, отображающее основной игровой контент"""
+    """Окно, отображающее основной игровой контент. Правила игры — в `GameEngine`, окно показывает его переходы"""
+
+    mode = _EngineState()
+    current_question_num = _EngineState()
+    has_shown = _EngineState()
+    seconds_left = _EngineState()
+    seconds_prize = _EngineState()
+    saved_seconds_prize = _EngineState()
+    is_x2_now = _EngineState()
+    is_ata_now = _EngineState()
+    is_revival_now = _EngineState()
+    revival_activated = _EngineState()
+    is_immunity_now = _EngineState()
+    non_active_answers = _EngineState()
+    lifelines = _EngineState()
+    available_to_choose = _EngineState()
+    used_lifelines_count = _EngineState()
+    correct_answer = _EngineState()
+    answers = _EngineState()
+    got_amount = _EngineState()
 
     def __init__(self, name: str, mode: str, question_sources: str):
         super().__init__()
+        background_variants.set_device_pixel_ratio(self.devicePixelRatioF())
         self.setupUi(self)
         self.setWindowIcon(APP_ICON)
+        asset_preloader.prepare_backgrounds(self.bg_num)  # при первом запуске уменьшаем фоны под размер окна
         self.user_control = False  # реагирует ли игра на действия игрока
         self.name = name
-        self.mode = mode
-        self.token = get_token()
+        self.engine = GameEngine(mode)
         self.question_sources = question_sources
+        self.questions_future = None  # загрузка вопросов из облака, начатая в фоне
 
         self.hovered_answer = ''
         self.hovered_lifeline = ''
+        # движения мыши копятся до срабатывания таймера, обрабатывается только последнее положение
+        self.pending_move = (0, 0)
+        self.move_timer = QTimer(self)
+        self.move_timer.setSingleShot(True)
+        self.move_timer.setInterval(MOUSE_MOVE_INTERVAL)
+        # noinspection PyUnresolvedReferences
+        self.move_timer.timeout.connect(lambda: self.response_to_move(*self.pending_move))
+        self.hover_key = None  # области под курсором и состояние игры при последней обработке движения
 
         self.is_sound = True
 
@@ -90,8 +122,12 @@ class GameWindow(QMainWindow, Ui_MainWindow):
     def start_game(self, is_repeat: bool = False, is_restarted: bool = False):
         """Запускает анимацию начала игры и показывает первый вопрос"""
 
-        self.questions = get_questions(self.token) if self.question_sources == 'cloud' else get_local_questions()
-        self.current_question_num = 1  # HACK God mode
+        if self.question_sources == 'cloud':
+            # вопросы загружаются в фоне с момента показа стартового окна и забираются в update_question_field
+            self.engine.questions, self.questions_future = None, take_questions()
+        else:
+            self.engine.questions = get_local_questions()
+        self.engine.current_question_num = 1  # HACK God mode
 
         logo_and_bg_selector = {i: '1-5' for i in range(1, 6)}
         logo_and_bg_selector.update({i: '6-10' for i in range(6, 11)})
@@ -101,23 +137,10 @@ class GameWindow(QMainWindow, Ui_MainWindow):
 
         current_background = f'images/backgrounds/{self.bg_num}/{current_logo_and_bg}.jpg'
 
-        if not is_repeat:
-            self.scheduler1.schedule(0, self.background_1.setPixmap, QPixmap(current_background))
-
         date_raw = datetime.today()
         self.date = date_raw.strftime('%d.%m.%Y %H:%M')
         if date_raw.month == 12 and date_raw.day >= 10 or date_raw.month == 1 and date_raw.day <= 20:
-            self.layout_t.setPixmap(QPixmap('images/money tree/layout_christmas.png'))
-
-        self.scheduler1.schedule(800, lambda: True)
-
-        if is_repeat:
-            self.scheduler1.schedule(0, self.big_logo_1.setPixmap, QPixmap('images/logo/intro.png'))
-            self.scheduler1.schedule(0, self.big_logo_2.startFadeOutImage, 200)
-            self.scheduler1.schedule(0, self.background_1.setPixmap, QPixmap(current_background))
-            self.scheduler1.schedule(0, self.background_2.startFadeOutImage, 200)
-        self.scheduler1.schedule(200, self.big_logo_2.setPixmap, QPixmap(f'images/logo/{current_logo_and_bg}.png'))
-        self.scheduler1.schedule(200, self.background_2.setPixmap, QPixmap(current_background))
+            self.layout_t.setPixmap(load_pixmap('images/money tree/layout_christmas.png'))
 
         if self.mode == 'classic':
             self.player2.set_media(decorate_audio('sounds/' + ('new_start.mp3' if is_repeat else 'intro.mp3')))
@@ -128,79 +151,18 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             if is_repeat:
                 self.timer_view.setPixmap(QPixmap())
                 self.timer_text.setText('')
-                self.central_q.setPixmap(QPixmap('images/question field/double-dip.png'))
+                self.central_q.setPixmap(load_pixmap('images/question field/double-dip.png'))
         if is_repeat:
             self.central_q.hide()
 
-        if not is_repeat:
-            self.scheduler1.schedule(0, self.big_logo_1.show)
-            self.scheduler1.schedule(0, self.big_logo_1.startFadeInImage, 1000)
-        self.scheduler1.schedule(0, self.player2.play)
-
-        # анимация показа блока с вопросом и ответами
-        if is_repeat and not is_restarted:
-            self.scheduler1.schedule(0, self.amount_q.setText, '')
-            for i in range(37, 0, -1):
-                self.scheduler1.schedule(30, self.layout_q.setPixmap, QPixmap(f'animations/sum/{i}.png'))
-        elif not is_restarted:
-            for i in range(1, 24):
-                self.scheduler1.schedule(30, self.layout_q.setPixmap, QPixmap(f'animations/question field/{i}.png'))
-        else:
-            self.scheduler1.schedule(1000, lambda: True)
-        self.scheduler1.schedule(0, self.layout_q.setPixmap, QPixmap('images/question field/layout_noletters.png'))
-        self.scheduler1.schedule(600 - 150 * (self.mode == 'clock'), lambda: True)
-
-        for i in range(1, 16):  # анимация денежного дерева
-            self.scheduler1.schedule(
-                220 + 32 * (self.mode == 'clock') - 27 * is_repeat,
-                self.state_t.setPixmap,
-                QPixmap(f'images/money tree/{i}.png'),
-            )
-        if self.mode == 'clock':
-            self.scheduler1.schedule(500 * (not is_repeat), lambda: True)
-        self.scheduler1.schedule(0, self.state_q_1.startFadeInImage)
-        for i in ('A', 'B', 'C', 'D'):  # анимация 4 ответов
-            self.scheduler1.schedule(
-                450 - 80 * (is_repeat and self.mode == 'clock'),
-                self.state_q_1.setPixmap,
-                QPixmap(f'animations/chosen answers/chosen_{i}.png'),
-            )
-            self.scheduler1.schedule(0, self.state_q_1.startFadeInImage)
-
-        self.scheduler1.schedule(450 - 80 * (is_repeat and self.mode == 'clock'), self.state_q_1.setPixmap, QPixmap())
-        self.scheduler1.schedule(
-            1000 + 600 * (self.mode == 'clock') - 600 * (self.mode == 'clock' and is_repeat),
-            self.state_t.setPixmap,
-            QPixmap(f'images/money tree/{self.current_question_num}.png'),
-        )
-
-        if self.mode == 'classic':
-            self.scheduler1.schedule(500, self.update_question_field)
-            self.scheduler1.schedule(0, self.question.startFadeIn)
-            self.scheduler1.schedule(100, self.show_answers)
-            self.scheduler1.schedule(0, self.big_logo_2.show)
-            self.scheduler1.schedule(0, self.big_logo_2.startFadeInImage, 1000)
-
-        n = '1-4' if self.current_question_num in range(1, 5) else self.current_question_num
-        self.player1.set_media(decorate_audio(f'sounds/{n}/bed.mp3'))
-        self.scheduler1.schedule(500 if self.mode != 'clock' else 0, self.player1.play)
-        if not self.is_sound:
-            self.scheduler1.schedule(0, self.player1.setVolume, 30 if self.mode == 'clock' else 100)
-
+        self.player1.set_media(decorate_audio(f'sounds/{stage(self.current_question_num)}/bed.mp3'))
         if self.mode == 'clock':
             self.player3.set_media(decorate_audio('sounds/question_show_clock.mp3'))
-            self.scheduler1.schedule(500, self.player3.play)
-            self.scheduler1.schedule(300, self.update_question_field)
-            self.scheduler1.schedule(0, self.question.startFadeIn)
-            self.scheduler1.schedule(0, self.big_logo_2.show)
-            self.scheduler1.schedule(0, self.big_logo_2.startFadeInImage, 1000)
-            self.scheduler1.schedule(300, lambda: True)
-            show_timer(self)
-            refill_timer(self, self.current_question_num)
-            self.scheduler1.schedule(0, self.central_q.setPixmap, QPixmap('images/question field/show-button.png'))
-            self.scheduler1.schedule(0, self.central_q.show)
-            self.scheduler1.schedule(0, self.central_q.startFadeInImage)
 
+        timeline = timelines.start_game(
+            self.mode, is_repeat, is_restarted, self.current_question_num, current_logo_and_bg, self.is_sound
+        )
+        self.scheduler1.play(timeline, self, background=load_pixmap(current_background))
         self.scheduler1.start()
 
         logging.info('Game is OK. Mode: %s. Username: %s', self.mode, self.name)
@@ -208,22 +170,13 @@ class GameWindow(QMainWindow, Ui_MainWindow):
     def show_answers(self):
         """Анимирует показ возможных ответов на вопрос и запускает таймер в режиме на время"""
 
-        for i, answer_text_field in enumerate((self.answer_A, self.answer_B, self.answer_C, self.answer_D), 1):
-            self.scheduler2.schedule(100, answer_text_field.show)
-            self.scheduler2.schedule(0, answer_text_field.startFadeIn)
-            state_q = self.__getattribute__(f'state_q_{i}')
-            self.scheduler2.schedule(0, state_q.setPixmap, QPixmap(f'images/question field/answer{i}.png'))
-            self.scheduler2.schedule(-0, state_q.startFadeInImage)
-        self.scheduler2.schedule(200, self.layout_q.setPixmap, QPixmap('images/question field/layout.png'))
-        for i in range(1, 5):
-            state_q = self.__getattribute__(f'state_q_{i}')
-            self.scheduler2.schedule(0, state_q.setPixmap, QPixmap())
+        self.engine.show_answers()
+        self.scheduler2.play(timelines.show_answers(), self)
 
         if self.mode == 'clock':
-            self.has_shown = True
-            n = '1-4' if self.current_question_num in range(1, 5) else self.current_question_num
+            n = stage(self.current_question_num)
             self.scheduler2.schedule(0, self.central_q.startFadeOutImage)
-            self.scheduler2.schedule(200, self.central_q.setPixmap, QPixmap('images/question field/double-dip.png'))
+            self.scheduler2.schedule(200, self.central_q.setPixmap, load_pixmap('images/question field/double-dip.png'))
             self.scheduler2.schedule(0, self.central_q.hide)
 
             self.qt_timer = QTimer(self)
@@ -231,8 +184,6 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             self.qt_timer.timeout.connect(self.merge_timer)
             self.qt_timer.start(1000)
 
-            self.seconds_left = SECONDS_FOR_QUESTION[n]
-
             if n in ('1-4', 5):
                 self.player2.set_media(decorate_audio(f'sounds/{n}/clock.mp3'))
                 self.scheduler2.schedule(500, self.player2.play)
@@ -245,19 +196,20 @@ class GameWindow(QMainWindow, Ui_MainWindow):
     def merge_timer(self):
         """Отсчитывает секунду от таймера в режиме на время"""
 
-        n = '1-4' if self.current_question_num in range(1, 5) else self.current_question_num
+        event = self.engine.tick()
+        seconds = event.data['seconds']
+        n = stage(self.current_question_num)
         dial = 1 if n in ('1-4', 5) else (2 if n in range(6, 11) else (3 if n in range(11, 15) else 6))
-        dial = self.seconds_left // dial + 1 * (self.seconds_left % dial in range(1, dial))
+        dial = seconds // dial + 1 * (seconds % dial in range(1, dial))
 
-        self.scheduler1.schedule(0, self.timer_view.setPixmap, QPixmap(f'images/timer/{dial}.png'))
-        self.scheduler1.schedule(0, self.timer_text.setText, str(self.seconds_left))
+        self.scheduler1.schedule(0, self.timer_view.setPixmap, load_pixmap(f'images/timer/{dial}.png'))
+        self.scheduler1.schedule(0, self.timer_text.setText, str(seconds))
         self.scheduler1.start()
 
-        if self.seconds_left == 0:
+        if event.kind == 'time_up':
             self.qt_timer.stop()
 
-            num_to_let = {0: 'A', 1: 'B', 2: 'C', 3: 'D'}
-            correct_answer_letter = num_to_let[self.answers.index(self.correct_answer)]
+            correct_answer_letter = event.data['correct']
 
             self.scheduler1.schedule(2000 + 1000 * (n == 15), lambda: True)
 
@@ -266,7 +218,7 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             self.scheduler1.schedule(0, self.player1.stop)
             self.scheduler1.schedule(0, self.player2.stop)
 
-            if self.is_immunity_now:
+            if event.data['immunity']:
                 self.scheduler1.schedule(0, self.open_confirm_leave, True)
                 self.scheduler1.start()
                 logging.info("Time's up - leave game, immunity used")
@@ -278,7 +230,7 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             # мигалка правильного ответа
             self.show_correct_answer(correct_answer_letter)
 
-            result_amount = convert_amount_to_str(SAFETY_NETS[self.current_question_num - 1] + self.saved_seconds_prize)
+            result_amount = convert_amount_to_str(event.data['prize'])
             self.scheduler1.schedule(3000, lambda: True)
             self.scheduler1.schedule(0, self.timer_text.setText, '')
             self.clear_all_labels()
@@ -286,11 +238,8 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             show_prize(self, result_amount)
             self.scheduler1.schedule(750, self.show_game_over, [correct_answer_letter, result_amount, self.is_sound])
 
-            sql_request(
-                f'INSERT INTO results (name, result, date) VALUES ("{self.name}", "{result_amount}", "{self.date}")'
-            )
+            record_result(self.name, result_amount, self.date)
             self.scheduler1.start()
-        self.seconds_left -= 1
 
     def keyPressEvent(self, event: QKeyEvent):
         """Обрабатывает события от клавиатуры"""
@@ -333,39 +282,50 @@ class GameWindow(QMainWindow, Ui_MainWindow):
         """Обрабатывает события от движения мыши"""
 
         # print(event.x(), event.y(), self.user_control, self.has_shown)  # HACK God mode
-        self.response_to_move(event.x(), event.y())  # делегируем обработку события на response_to_move
+        self.pending_move = (event.x(), event.y())  # обработку берёт на себя response_to_move раз в кадр
+        if not self.move_timer.isActive():
+            self.move_timer.start()
         return super().mouseMoveEvent(event)
 
     def response_to_move(self, x: int, y: int):
+        answer, lifeline = answers_map.at(x, y), lifelines_map.at(x, y)
+        # подсветка зависит только от областей под курсором и состояния игры: пока они не меняются, делать нечего
+        hover_key = (
+            answer,
+            lifeline,
+            self.user_control,
+            self.has_shown,
+            self.is_revival_now,
+            self.used_lifelines_count,
+            tuple(self.available_to_choose),
+            tuple(self.non_active_answers),
+        )
+        if hover_key == self.hover_key:
+            return
+        self.hover_key = hover_key
+
         if not self.user_control:
             return
 
-        if (1017 <= x <= 1064 and 77 <= y <= 107) and self.used_lifelines_count < 4:
+        if lifeline == 'home' and self.used_lifelines_count < 4:
             self.show_selecting_lifeline('home')
             return
         elif not self.has_shown:
             self.show_selecting_lifeline('')
             return
 
-        # Маппинг ответов
-        answers_regions = answers_regions_generator(x, y)
-        for answer, region in answers_regions.items():
-            if region and not self.is_revival_now:
-                self.show_selecting_answer(answer)
-                break
-        else:
-            self.show_selecting_answer('')
+        self.show_selecting_answer('' if self.is_revival_now else answer)
 
         if self.used_lifelines_count >= 4 and not self.is_revival_now:
             return
 
-        lifeline_regions = lifelines_regions_generator(x, y, self.mode)
-        for lifeline, region in lifeline_regions.items():
-            if region and lifeline in self.available_to_choose:
-                self.show_selecting_lifeline(lifeline)
-                break
-        else:
-            self.show_selecting_lifeline('')
+        self.show_selecting_lifeline(lifeline if self.is_lifeline_selectable(lifeline) else '')
+
+    def is_lifeline_selectable(self, lifeline: str) -> bool:
+        """Можно ли выбрать подсказку lifeline (имя области из карты подсказок)"""
+        if lifeline == 'ftc' and self.mode != 'clock':
+            return False
+        return lifeline in self.available_to_choose
 
     def show_selecting_lifeline(self, ll_type: str):
         if not ll_type and self.hovered_lifeline:
@@ -374,7 +334,7 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             return
 
         if ll_type != self.hovered_lifeline:
-            self.state_ll.setPixmap(QPixmap(f'images/money tree/{ll_type}/hover.png'))
+            self.state_ll.setPixmap(load_pixmap(f'images/money tree/{ll_type}/hover.png'))
             self.state_ll.startFadeInImage()
             self.hovered_lifeline = ll_type
 
@@ -385,7 +345,7 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             return
 
         if letter != self.hovered_answer and letter not in self.non_active_answers:
-            self.state_q_1.setPixmap(QPixmap(f'images/question field/chosen_{letter}.png'))
+            self.state_q_1.setPixmap(load_pixmap(f'images/question field/chosen_{letter}.png'))
             self.state_q_1.startFadeInImage()
             self.hovered_answer = letter
 
@@ -400,10 +360,12 @@ class GameWindow(QMainWindow, Ui_MainWindow):
 
         logging.info('MP (%d, %d)', x, y)
 
-        if all((COORDS.show_btn(x, y), self.user_control, self.mode == 'clock')):
+        lifeline = lifelines_map.at(x, y)
+
+        if all((show_button_map.at(x, y), self.user_control, self.mode == 'clock')):
             self.show_answers()
 
-        if all((COORDS.home(x, y), self.user_control, self.used_lifelines_count < 4)):
+        if all((lifeline == 'home', self.user_control, self.used_lifelines_count < 4)):
             self.open_confirm_leave()
 
         if not self.user_control or not self.has_shown and self.mode == 'clock':
@@ -419,38 +381,49 @@ class GameWindow(QMainWindow, Ui_MainWindow):
         elif self.is_x2_now:
             self.player4.set_media(decorate_audio('sounds/double/first_final.mp3'))
 
-        if not self.is_revival_now:
-            answers_regions = answers_regions_generator(x, y)
-            for answer, is_selected in answers_regions.items():
-                if is_selected:
-                    self.choose_answer(answer)
-                    self.scheduler1.start()
-                    break
+        answer = answers_map.at(x, y)
+        if answer and not self.is_revival_now:
+            self.choose_answer(answer)
+            self.scheduler1.start()
 
         if self.used_lifelines_count >= 4 and not self.is_revival_now:
             return
 
-        lifeline_regions = lifelines_regions_generator(x, y, self.mode)
-        for lifeline, is_selected in lifeline_regions.items():
-            if is_selected and lifeline in self.available_to_choose:
-                self.use_lifeline(lifeline)
-                break
+        if self.is_lifeline_selectable(lifeline):
+            self.use_lifeline(lifeline)
 
     def update_question_field(self, changer: int = 0):
         """Обновляет текстовые поля вопроса и ответов"""
 
-        self.non_active_answers = []
-        text = self.questions[self.current_question_num - 1][changer][0]
-        self.correct_answer = str(self.questions[self.current_question_num - 1][changer][1])
-        self.answers = list(map(str, self.questions[self.current_question_num - 1][changer][2]))
+        if self.engine.questions is None:
+            self.engine.questions = self.resolve_cloud_questions()
+        event = self.engine.set_question(changer)
         # print(self.correct_answer)  # HACK God mode
-        self.got_amount = MONEY_TREE_AMOUNTS[self.current_question_num - 1]
 
-        self.question.setText(text)
+        self.question.setText(event.data['text'])
         for i, answer_text_field in enumerate((self.answer_A, self.answer_B, self.answer_C, self.answer_D)):
             answer_text_field.hide()
             answer_text_field.setText(self.answers[i])
         logging.info('Q%d set', self.current_question_num)
+        profiling.mark('first_question')
+
+        # пока игрок думает над вопросом, заранее декодируем ассеты для любого исхода ответа
+        asset_preloader.preload(next_stage_assets(self.current_question_num, self.bg_num, self.mode))
+
+    def resolve_cloud_questions(self) -> list:
+        """Возвращает загруженные в фоне вопросы из облака или, если они не успели загрузиться, локальные"""
+        counts = question_counts()
+        local_is_ready = all(counts.get(level, 0) >= 3 for level in range(1, 16))
+        try:
+            # без полной локальной базы играть не на чем, поэтому ждём облако сколько потребуется
+            questions = self.questions_future.result(CLOUD_QUESTIONS_WAIT if local_is_ready else None)
+        except Exception as ex:
+            if not local_is_ready:
+                raise
+            logging.warning('Cloud Qs are not ready, local Qs are used: %r', ex)
+            return get_local_questions()
+        logging.info('Cloud Qs are gotten')
+        return questions
 
     def clear_question_field(self, is_for_question: bool = True):
         """Задаёт пустые pixmap'ы и делает фейд-аут текстовых блоков"""
@@ -461,11 +434,15 @@ class GameWindow(QMainWindow, Ui_MainWindow):
         for label in (self.answer_A, self.answer_B, self.answer_C, self.answer_D):
             self.scheduler1.schedule(0, label.startFadeOut)
         if is_for_question:
-            self.scheduler1.schedule(0, self.state_q_1.setPixmap, QPixmap('images/question field/layout_noletters.png'))
+            self.scheduler1.schedule(
+                0, self.state_q_1.setPixmap, load_pixmap('images/question field/layout_noletters.png')
+            )
         self.scheduler1.schedule(0, self.state_q_1.startFadeInImage, 100)
         self.scheduler1.schedule(100, self.state_q_1.setPixmap, QPixmap())
         if is_for_question:
-            self.scheduler1.schedule(0, self.layout_q.setPixmap, QPixmap('images/question field/layout_noletters.png'))
+            self.scheduler1.schedule(
+                0, self.layout_q.setPixmap, load_pixmap('images/question field/layout_noletters.png')
+            )
 
     def clear_ata_field(self):
         for ata_label in (self.ata_a_percents, self.ata_b_percents, self.ata_c_percents, self.ata_d_percents):
@@ -480,9 +457,8 @@ class GameWindow(QMainWindow, Ui_MainWindow):
         for state_label in (self.state_q_1, self.state_q_2, self.state_q_3):
             self.scheduler1.schedule(0, state_label.startFadeOutImage)
 
-        if self.is_ata_now:
+        if self.engine.hide_audience():
             self.clear_ata_field()
-            self.is_ata_now = False
 
         self.scheduler1.schedule(100, lambda: True)
         self.clear_question_field(is_for_question)
@@ -503,40 +479,40 @@ class GameWindow(QMainWindow, Ui_MainWindow):
         """Обновляет фон и логотип с анимацией"""
         # обновляем логотип
         if prev_logo:
-            self.scheduler1.schedule(0, self.big_logo_1.setPixmap, QPixmap(f'images/logo/{prev_logo}.png'))
+            self.scheduler1.schedule(0, self.big_logo_1.setPixmap, load_pixmap(f'images/logo/{prev_logo}.png'))
         else:
             self.scheduler1.schedule(0, self.big_logo_1.setPixmap, self.big_logo_2.pixmap().copy())
-        self.scheduler1.schedule(0, self.big_logo_2.setPixmap, QPixmap(f'images/logo/{logo}.png'))
+        self.scheduler1.schedule(0, self.big_logo_2.setPixmap, load_pixmap(f'images/logo/{logo}.png'))
         self.scheduler1.schedule(0, self.big_logo_2.show)
         self.scheduler1.schedule(0, self.big_logo_2.startFadeInImage, 1000 + 4000 * slow_mode)
         # обновляем фон
 
         if prev_bg:
             self.scheduler1.schedule(
-                0, self.background_1.setPixmap, QPixmap(f'images/backgrounds/{self.bg_num}/{prev_bg}.jpg')
+                0, self.background_1.setPixmap, load_pixmap(f'images/backgrounds/{self.bg_num}/{prev_bg}.jpg')
             )
         else:
             self.scheduler1.schedule(0, self.background_1.setPixmap, self.background_2.pixmap().copy())
-        self.scheduler1.schedule(0, self.background_2.setPixmap, QPixmap(f'images/backgrounds/{self.bg_num}/{bg}.jpg'))
+        self.scheduler1.schedule(
+            0, self.background_2.setPixmap, load_pixmap(f'images/backgrounds/{self.bg_num}/{bg}.jpg')
+        )
         self.scheduler1.schedule(0, self.background_2.show)
         self.scheduler1.schedule(0, self.background_2.startFadeInImage, 1000 + 4000 * slow_mode)
 
-    def hide_timer_and_show_prize(self):
+    def hide_timer_and_show_prize(self, prize: int):
         """Опустошает и скрывает таймер, а затем показывает текущий выигрыш"""
         self.clear_all_labels()
         if self.mode == 'clock':
-            self.saved_seconds_prize += self.seconds_prize
             empty_timer(self)
             hide_timer(self)
-        prize = convert_amount_to_str(MONEY_TREE_AMOUNTS[self.current_question_num] + self.saved_seconds_prize)
-        show_prize(self, prize)
+        show_prize(self, convert_amount_to_str(prize))
 
     def choose_answer(self, letter: str):
         """Обрабатывает выбор ответа игроком и запрашивает проверку ответа"""
         if letter in self.non_active_answers:
             return
 
-        self.state_q_1.setPixmap(QPixmap(f'images/question field/chosen_{letter}.png'))
+        self.state_q_1.setPixmap(load_pixmap(f'images/question field/chosen_{letter}.png'))
         self.state_q_1.startFadeInImage()
         if self.mode == 'clock':
             self.player2.pause()
@@ -546,7 +522,6 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             if len(self.non_active_answers) != 3:
                 self.scheduler1.schedule(0, self.player4.play)
         logging.info(f'Ans[{letter}]')
-        letter_to_button = {'A': self.answer_A, 'B': self.answer_B, 'C': self.answer_C, 'D': self.answer_D}
 
         # для каждого из номеров вопроса выставляем паузу (задаёт интригу)
         delays = (2000 * self.is_x2_now + 400, 2000, 2500, 3000, 3500, 4500, 5500)
@@ -559,42 +534,33 @@ class GameWindow(QMainWindow, Ui_MainWindow):
         if self.current_question_num == 5:
             self.scheduler1.schedule(0, self.player1.setVolume, 100)
 
-        self.scheduler1.schedule(0, self.check_answer, letter_to_button[letter], letter)
+        self.scheduler1.schedule(0, self.check_answer, letter)
         self.scheduler1.start()
 
-    def check_answer(self, label: AnimationLabel, user_selected_letter: str):
+    def check_answer(self, user_selected_letter: str):
         """Проверяет правильность ответа и запускает соответствующие анимации и звуки"""
 
-        user_answer = label.text()
-
-        num_to_let = {0: 'A', 1: 'B', 2: 'C', 3: 'D'}
-        correct_answer_letter = num_to_let[self.answers.index(self.correct_answer)]
+        event = self.engine.answer(user_selected_letter)
+        correct_answer_letter = event.data.get('correct')
 
-        self.available_to_choose = list(self.lifelines.keys())
-        if not self.revival_activated or self.is_x2_now:
-            self.available_to_choose.remove('revival')
-
-        n = '1-4' if self.current_question_num in range(1, 5) else self.current_question_num
-        if self.is_x2_now and user_answer != self.correct_answer:  # неправильный ответ с «правом на ошибку»
+        n = stage(self.current_question_num)
+        if event.kind == 'second_chance':  # неправильный ответ с «правом на ошибку»
             self.scheduler1.schedule(
                 1500,
                 self.state_q_3.setPixmap,
-                QPixmap(f'images/question field/wrong_{user_selected_letter}.png'),
+                load_pixmap(f'images/question field/wrong_{user_selected_letter}.png'),
             )
             self.scheduler1.schedule(0, self.central_q.startFadeOutImage)
             self.scheduler1.schedule(0, self.state_q_3.startFadeInImage)
 
-            if self.is_immunity_now:
-                self.scheduler1.schedule(0, self.central_q.setPixmap, QPixmap('images/question field/immunity.png'))
+            if event.data['immunity']:
+                self.scheduler1.schedule(0, self.central_q.setPixmap, load_pixmap('images/question field/immunity.png'))
                 self.scheduler1.schedule(0, self.central_q.startFadeInImage)
 
             self.scheduler1.schedule(0, self.player1.set_media, decorate_audio('sounds/double/first_wrong.mp3'))
             self.scheduler1.schedule(0, self.player1.play)
             self.scheduler1.schedule(0, self.player4.stop)
 
-            self.non_active_answers.append(user_selected_letter)
-            self.is_x2_now = False
-
             if self.mode == 'clock':
                 self.scheduler1.schedule(3000, self.player3.set_media, decorate_audio('sounds/timer_unfreeze.mp3'))
                 self.scheduler1.schedule(0, self.player3.play)
@@ -607,21 +573,20 @@ class GameWindow(QMainWindow, Ui_MainWindow):
                     self.scheduler1.schedule(0, self.player1.setPosition, self.player_seconds_position)
                     self.scheduler1.schedule(0, self.player1.play)
                 self.scheduler1.schedule(0, self.qt_timer.start)
-                if self.used_lifelines_count < 4:
+                if event.data['ftc']:
                     self.scheduler1.schedule(0, self.gray_ftc.startFadeOutImage)
-                    self.available_to_choose.append('ftc')
 
             logging.info('Ans incorrect (dd used)')
             self.scheduler1.start()
             return
 
-        elif user_answer != self.correct_answer:  # неправильный ответ без «права на ошибку»
+        elif event.kind == 'wrong':  # неправильный ответ без «права на ошибку»
             self.scheduler1.schedule(0, self.player1.set_media, decorate_audio(f'sounds/{n}/lose.mp3'))
             self.scheduler1.schedule(0, self.player1.play)
             self.scheduler1.schedule(0, self.player2.stop)
             self.scheduler1.schedule(0, self.player4.stop)
 
-            if self.is_immunity_now:
+            if event.data['immunity']:
                 self.scheduler1.schedule(0, self.open_confirm_leave, True)
                 self.scheduler1.start()
                 logging.info('Ans incorrect - leave game, immunity used')
@@ -630,7 +595,7 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             self.update_and_animate_logo_and_background(None, 'wrong', None, 'wrong')
             self.show_correct_answer(correct_answer_letter)
 
-            result_amount = convert_amount_to_str(SAFETY_NETS[self.current_question_num - 1] + self.saved_seconds_prize)
+            result_amount = convert_amount_to_str(event.data['prize'])
 
             self.scheduler1.schedule(1000, lambda: True)
             self.clear_all_labels()
@@ -640,45 +605,35 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             show_prize(self, result_amount)
             self.scheduler1.schedule(750, self.show_game_over, (correct_answer_letter, result_amount, self.is_sound))
 
-            sql_request(
-                f'INSERT INTO results (name, result, date) VALUES ("{self.name}", "{result_amount}", "{self.date}")'
-            )
+            record_result(self.name, result_amount, self.date)
 
             logging.info('Ans incorrect')
             self.scheduler1.start()
             return
 
         # правильный ответ без или с «правом на ошибку»
-        if (len(self.non_active_answers) in (1, 3) or self.is_x2_now) and self.used_lifelines_count < 4:
-            if self.mode == 'clock':
-                self.scheduler1.schedule(0, self.gray_ftc.startFadeOutImage)
-                self.available_to_choose.append('ftc')
+        if 'ftc' in event.data['returned']:
+            self.scheduler1.schedule(0, self.gray_ftc.startFadeOutImage)
+        if 'revival' in event.data['returned']:
             self.scheduler1.schedule(0, self.gray_revival.startFadeOutImage)
-            self.available_to_choose.append('revival')
 
-        if self.is_x2_now or self.is_immunity_now:
+        if event.data['protected']:
             self.scheduler1.schedule(0, self.central_q.startFadeOutImage)
         self.scheduler1.schedule(0, self.player2.set_media, decorate_audio(f'sounds/{n}/correct.mp3'))
         self.scheduler1.schedule(0, self.player2.play)
         self.scheduler1.schedule(0, self.player4.stop)
         logging.info('Ans correct')
 
-        self.is_x2_now = False
-        self.is_immunity_now = False
-
-        self.seconds_prize += SECONDS_PRICE[n] * self.seconds_left
-
         self.show_correct_answer(correct_answer_letter)
 
-        if self.current_question_num == 15:  # если ответ на последний вопрос был правильным
+        if event.kind == 'won':  # если ответ на последний вопрос был правильным
             self.update_and_animate_logo_and_background('15', 'millionaire', '15', '1-5')
 
             self.scheduler1.schedule(1000, lambda: True)
-            self.hide_timer_and_show_prize()
+            self.hide_timer_and_show_prize(event.data['prize'])
             self.scheduler1.schedule(1000, self.show_win)
 
-            prize = convert_amount_to_str(MONEY_TREE_AMOUNTS[self.current_question_num] + self.saved_seconds_prize)
-            sql_request(f'INSERT INTO results (name, result, date) VALUES ("{self.name}", "{prize}", "{self.date}")')
+            record_result(self.name, convert_amount_to_str(event.data['prize']), self.date)
 
             self.scheduler1.start()
             return
@@ -689,16 +644,15 @@ class GameWindow(QMainWindow, Ui_MainWindow):
                 self.update_and_animate_logo_and_background(prev, 'intro', prev, '1-5')
 
             self.scheduler1.schedule(0, self.player1.stop)
-            self.hide_timer_and_show_prize()
-            self.scheduler1.schedule(0, self.layout_q.setPixmap, QPixmap('images/sum/amount.png'))
+            self.hide_timer_and_show_prize(event.data['prize'])
+            self.scheduler1.schedule(0, self.layout_q.setPixmap, load_pixmap('images/sum/amount.png'))
             self.scheduler1.schedule(3700, lambda: True)
             self.scheduler1.schedule(750 + 1000 * (self.current_question_num == 10), self.amount_q.startFadeOut)
             self.player3.set_media(decorate_audio('sounds/lights_down.mp3'))
             self.scheduler1.schedule(0, self.player3.play)
 
-            for i in range(37, 0, -1):  # анимация показа блока с вопросом и ответами
-                self.scheduler1.schedule(30, self.layout_q.setPixmap, QPixmap(f'animations/sum/{i}.png'))
-            self.scheduler1.schedule(0, self.layout_q.setPixmap, QPixmap('images/question field/layout.png'))
+            self.scheduler1.play(timelines.hide_prize(), self)  # анимация показа блока с вопросом и ответами
+            self.scheduler1.schedule(0, self.layout_q.setPixmap, load_pixmap('images/question field/layout.png'))
 
             logging.info('%d got', self.current_question_num)
 
@@ -745,29 +699,23 @@ class GameWindow(QMainWindow, Ui_MainWindow):
         self.scheduler1.schedule(
             400 * (self.current_question_num not in (5, 10)),
             self.state_t.setPixmap,
-            QPixmap(f'images/money tree/{self.current_question_num + 1}.png'),
+            load_pixmap(f'images/money tree/{self.current_question_num + 1}.png'),
         )
         self.scheduler1.schedule(0, self.clear_all_labels)
         self.scheduler1.schedule(0, self.show_next_question)
-
-        def increase_current_question_number():
-            self.current_question_num += 1
-
-        self.scheduler1.schedule(0, increase_current_question_number)
+        self.scheduler1.schedule(0, self.engine.next_question)
 
         self.scheduler1.start()
 
     def show_correct_answer(self, correct_answer_letter: str):
         self.scheduler1.schedule(
-            0, self.state_q_2.setPixmap, QPixmap(f'images/question field/correct_{correct_answer_letter}.png')
+            0, self.state_q_2.setPixmap, load_pixmap(f'images/question field/correct_{correct_answer_letter}.png')
         )
         self.scheduler1.schedule(0, self.state_q_2.startFadeInImage)
         self.scheduler1.schedule(0, self.state_q_2.show)
         for _ in range(2):
             self.scheduler1.schedule(400, self.state_q_2.startFadeOutImage)
             self.scheduler1.schedule(400, self.state_q_2.startFadeInImage)
-        if self.mode == 'clock':
-            self.has_shown = False
 
     def show_next_question(self):
         """Показывает следующий вопрос"""
@@ -786,7 +734,7 @@ class GameWindow(QMainWindow, Ui_MainWindow):
                 self.current_question_num + 1,
                 0 if self.current_question_num in (5, 10, 14) else self.seconds_left,
             )
-            self.scheduler1.schedule(0, self.central_q.setPixmap, QPixmap('images/question field/show-button.png'))
+            self.scheduler1.schedule(0, self.central_q.setPixmap, load_pixmap('images/question field/show-button.png'))
             self.scheduler1.schedule(0, self.central_q.show)
             self.scheduler1.schedule(0, self.central_q.startFadeInImage)
             return
@@ -805,21 +753,16 @@ class GameWindow(QMainWindow, Ui_MainWindow):
         self.scheduler1.schedule(0, self.show_answers)
         self.scheduler1.schedule(1000, self.player2.stop)
 
-        if 1 <= self.used_lifelines_count < 4 and not self.revival_activated:
+        if self.engine.activate_revival():
             self.gray_revival.startFadeOutImage()
-            self.available_to_choose.append('revival')
-            self.revival_activated = True
 
     def use_lifeline(self, type_ll: str):
         """Активирует подсказку и запускает соответствующие анимации и звуки"""
 
-        if not self.lifelines[type_ll] and not self.is_revival_now:
+        event = self.engine.use_lifeline(type_ll)
+        if event is None:
             return
-
-        if not self.is_revival_now:
-            self.used_lifelines_count += 1
-
-        state_lifelines = False
+        data = event.data
 
         if type_ll == 'change':  # замена вопроса
             self.show_lost_lifeline(self.lost_change)
@@ -835,34 +778,30 @@ class GameWindow(QMainWindow, Ui_MainWindow):
                 self.qt_timer.stop()
             self.scheduler1.schedule(820 + 1200 * (self.mode == 'clock'), lambda: True)
             self.clear_question_field()
-            if self.is_x2_now:  # на смене вопроса отменяем «право на ошибку»
+            if data['x2']:  # на смене вопроса отменяем «право на ошибку»
                 self.scheduler1.schedule(0, self.central_q.startFadeOutImage)
-            if self.is_ata_now:
+            if data['ata']:
                 self.clear_ata_field()
-            self.scheduler1.schedule(200, self.update_question_field, 1 + int(self.is_revival_now))
-            if self.is_x2_now or len(self.non_active_answers) in (1, 3):
-                n = '1-4' if self.current_question_num in range(1, 5) else self.current_question_num
+            self.scheduler1.schedule(200, self.update_question_field, data['changer'])
+            if data['restore_bed']:
+                n = stage(self.current_question_num)
                 self.scheduler1.schedule(0, self.player1.set_media, decorate_audio(f'sounds/{n}/bed.mp3'))
                 self.scheduler1.schedule(8, self.player1.play)
             self.scheduler1.schedule(100, self.question.startFadeIn)
             if self.mode == 'classic':
                 self.scheduler1.schedule(0, self.show_answers)
             else:
-                self.scheduler1.schedule(0, self.central_q.setPixmap, QPixmap('images/question field/show-button.png'))
+                self.scheduler1.schedule(
+                    0, self.central_q.setPixmap, load_pixmap('images/question field/show-button.png')
+                )
                 self.scheduler1.schedule(0, self.central_q.show)  # подменяем кнопку по центру на кнопку показа ответа
                 self.scheduler1.schedule(0, self.central_q.startFadeInImage)
-                if self.mode == 'clock':
-                    self.has_shown = False
-            self.is_x2_now = False
-            self.is_ata_now = False
-            self.is_immunity_now = False
 
         elif type_ll == 'x2':  # право на ошибку
             self.show_lost_lifeline(self.lost_x2)
-            self.central_q.setPixmap(QPixmap('images/question field/double-dip.png'))
+            self.central_q.setPixmap(load_pixmap('images/question field/double-dip.png'))
             self.central_q.show()
             self.central_q.startFadeInImage()
-            self.is_x2_now = True
             if self.mode == 'clock' and self.current_question_num not in range(1, 6):
                 self.player_seconds_position = self.player1.position()
             self.player1.set_media(decorate_audio(f'sounds/double/start{"_clock" * (self.mode == "clock")}.mp3'))
@@ -871,32 +810,21 @@ class GameWindow(QMainWindow, Ui_MainWindow):
                 self.qt_timer.stop()
             self.player1.play()
 
-            if 'revival' in self.available_to_choose:
-                self.available_to_choose.remove('revival')
+            if data['revival_locked']:
                 self.gray_revival.show()
                 self.gray_revival.startFadeInImage()
             if self.mode == 'clock':
-                self.available_to_choose.remove('ftc')
                 self.gray_ftc.show()
                 self.gray_ftc.startFadeInImage()
-            state_lifelines = True
 
         elif type_ll == '5050':  # 50:50
             self.show_lost_lifeline(self.lost_5050)
             self.player3.set_media(decorate_audio('sounds/50_50.mp3'))
             self.scheduler1.schedule(0, self.player3.play)
-            answers = [self.answer_A, self.answer_B, self.answer_C, self.answer_D]
-            answers_letters = ['A', 'B', 'C', 'D']
-            if self.non_active_answers:  # неактивные ответы от «права на ошибку»
-                indexes = {0, 1, 2, 3} - {answers_letters.index(self.non_active_answers[0])}
-            else:
-                indexes = {0, 1, 2, 3}
-            indexes = list(indexes - {self.answers.index(self.correct_answer)})  # вырезаем правильный ответ
-            shuffle(indexes)  # убрать два неверных ответа СЛУЧАЙНО
-            self.scheduler1.schedule(250, answers[indexes[0]].setText, '')
-            self.scheduler1.schedule(0, answers[indexes[1]].setText, '')
-            self.non_active_answers += [answers_letters[indexes[0]], answers_letters[indexes[1]]]
-            state_lifelines = True
+            answers = {'A': self.answer_A, 'B': self.answer_B, 'C': self.answer_C, 'D': self.answer_D}
+            first, second = data['removed']  # движок убирает два неверных ответа случайно
+            self.scheduler1.schedule(250, answers[first].setText, '')
+            self.scheduler1.schedule(0, answers[second].setText, '')
 
         elif type_ll == 'ata':  # помощь зала
             self.show_lost_lifeline(self.lost_ata)
@@ -912,16 +840,16 @@ class GameWindow(QMainWindow, Ui_MainWindow):
                 self.scheduler1.schedule(0, self.qt_timer.stop)
             self.scheduler1.schedule(0, self.player1.pause)
             self.player3.set_media(decorate_audio(f'sounds/ata{"_clock" * (self.mode == "clock")}.mp3'))
-            correct_percent, other_percents = ask_audience(self.current_question_num, 4 - len(self.non_active_answers))
+            correct_percent, other_percents = data['correct'], data['others']
             self.scheduler1.schedule(0, self.player3.play)
             self.scheduler1.schedule(0, self.ata_layout.show)
             self.scheduler1.schedule(0, self.ata_layout.startFadeInImage)
             gif = QMovie('images/ata.gif')
             self.scheduler1.schedule(4200, self.ata_layout.setMovie, gif)
             self.scheduler1.schedule(0, gif.start)
-            self.scheduler1.schedule(8000, self.ata_layout.setPixmap, QPixmap('images/ata.png'))
+            self.scheduler1.schedule(8000, self.ata_layout.setPixmap, load_pixmap('images/ata.png'))
 
-            correct_answer_letter = ['A', 'B', 'C', 'D'][self.answers.index(self.correct_answer)]
+            correct_answer_letter = self.engine.correct_letter
             other_score_labels = []
             other_percents_labels = []
             for score_label, percents_label in zip(
@@ -962,42 +890,30 @@ class GameWindow(QMainWindow, Ui_MainWindow):
                 if self.current_question_num in range(1, 6):
                     self.scheduler1.schedule(0, self.player2.play)
                 self.scheduler1.schedule(0, self.qt_timer.start)
-            self.is_ata_now = True
 
         elif type_ll == 'revival':  # возрождение
             self.show_lost_lifeline(self.lost_revival)
             self.player3.setMedia(decorate_audio('sounds/revival.mp3'))
             self.player3.play()
 
-            self.central_q.setPixmap(QPixmap('images/question field/revival.png'))
+            self.central_q.setPixmap(load_pixmap('images/question field/revival.png'))
             self.central_q.show()
             self.central_q.startFadeInImage()
 
-            self.state_q_1.setPixmap(QPixmap('images/question field/all_wrong.png'))
+            self.state_q_1.setPixmap(load_pixmap('images/question field/all_wrong.png'))
             self.state_q_1.startFadeInImage()
 
             for lost_label in (self.lost_5050, self.lost_ata, self.lost_change, self.lost_ftc):
                 lost_label.startFadeOutImage()
-            self.is_revival_now = True
-            self.available_to_choose = list(self.lifelines.keys())
 
-            if len(self.non_active_answers) >= 2:
-                self.available_to_choose.remove('5050')
+            if data['lock_5050']:
                 self.gray_5050.show()
                 self.gray_5050.startFadeInImage()
-            for ll in self.lifelines:
-                if self.lifelines[ll]:
-                    self.available_to_choose.remove(ll)
-            if self.is_x2_now:
-                self.available_to_choose.remove('x2')
-            else:
+            if not data['x2']:
                 self.lost_x2.startFadeOutImage()
-            if self.is_immunity_now:
-                self.available_to_choose.remove('immunity')
-            else:
+            if not data['immunity']:
                 self.lost_immunity.startFadeOutImage()
 
-            self.lifelines['revival'] = False
             self.scheduler1.start()
             logging.info(f'- {type_ll}-ll')
             return
@@ -1011,12 +927,12 @@ class GameWindow(QMainWindow, Ui_MainWindow):
             self.show_lost_lifeline(self.lost_immunity)
             self.player3.setMedia(decorate_audio('sounds/immunity.mp3'))
             self.player3.play()
-            self.scheduler1.schedule(1700, self.central_q.setPixmap, QPixmap('images/question field/immunity.png'))
+            self.scheduler1.schedule(1700, self.central_q.setPixmap, load_pixmap('images/question field/immunity.png'))
             self.scheduler1.schedule(0, self.central_q.show)
             self.scheduler1.schedule(0, self.central_q.startFadeInImage)
-            if self.is_x2_now:
+            if data['x2']:
                 self.scheduler1.schedule(
-                    2000, self.central_q.setPixmap, QPixmap('images/question field/double-dip.png')
+                    2000, self.central_q.setPixmap, load_pixmap('images/question field/double-dip.png')
                 )
                 self.scheduler1.schedule(0, self.central_q.startFadeInImage)
 
@@ -1025,34 +941,24 @@ class GameWindow(QMainWindow, Ui_MainWindow):
                 self.scheduler1.schedule(0, player.play)
                 self.scheduler1.schedule(0, self.qt_timer.start)
 
-            self.is_immunity_now = True
-            state_lifelines = True
-
         elif type_ll == 'ftc':  # заморозка времени
             self.show_lost_lifeline(self.lost_ftc)
             self.player3.setMedia(decorate_audio('sounds/timer_freeze.mp3'))
             self.player3.play()
             self.qt_timer.stop()
             self.player2.stop()
-            n = '1-4' if self.current_question_num in range(1, 5) else self.current_question_num
-            self.player1.setMedia(decorate_audio(f'sounds/{n}/bed.mp3'))
+            self.player1.setMedia(decorate_audio(f'sounds/{stage(self.current_question_num)}/bed.mp3'))
             self.player1.play()
-            state_lifelines = True
-
-        if self.is_revival_now:
-            for ll in self.lifelines:
-                lifeline = ll.replace(':', '')
-                if not self.lifelines[ll] and ll != 'revival':
-                    self.__getattribute__(f'lost_{lifeline}').startFadeInImage()
 
-            self.available_to_choose = list(self.lifelines.keys())
+        if 'revived' in data:  # подсказка взята повторно через «Возрождение»
+            for lifeline in data['revived']:
+                getattr(self, f'lost_{lifeline}').startFadeInImage()
 
-            if not self.is_x2_now and not self.is_immunity_now:
+            if not data['keep_central']:
                 self.central_q.startFadeOutImage()
             self.state_q_1.startFadeOutImage()
-            self.is_revival_now = False
 
-        if self.used_lifelines_count >= 4:
+        if data['exhausted']:
             for label in (
                 self.gray_5050,
                 self.gray_ata,
@@ -1066,12 +972,8 @@ class GameWindow(QMainWindow, Ui_MainWindow):
                 label.show()
                 label.startFadeInImage()
 
-        self.lifelines[type_ll] = False
-
-        if self.used_lifelines_count >= 1 and not state_lifelines and not self.revival_activated:
+        if data['revival_activated']:
             self.gray_revival.startFadeOutImage()
-            self.available_to_choose.append('revival')
-            self.revival_activated = True
 
         self.scheduler1.start()
         logging.info(f'- {type_ll}-ll')
@@ -1079,28 +981,7 @@ class GameWindow(QMainWindow, Ui_MainWindow):
     def restart_game(self, is_repeat: bool = False, is_restarted: bool = False):
         """Перезапускает игру и возвращает все значения в начальное состояние"""
 
-        self.has_shown = True if self.mode == 'classic' else False
-        self.seconds_left = 0
-        self.seconds_prize = 0  # приз за сэкономленные секунды в режиме игры на время
-        self.saved_seconds_prize = 0  # приз за секунды сохраняется из seconds_prize после 5 и 10 вопросов
-
-        self.is_x2_now = False
-        self.is_ata_now = False
-        self.is_revival_now = False
-        self.revival_activated = False
-        self.is_immunity_now = False
-        self.non_active_answers = []
-        self.lifelines = {
-            'change': True,
-            '5050': True,
-            'x2': True,
-            'ata': True,
-            'revival': True,
-            'ftc': self.mode == 'clock',
-            'immunity': True,
-        }
-        self.available_to_choose = ['change', '5050', 'x2', 'ata', 'ftc', 'immunity']
-        self.used_lifelines_count = 0
+        self.engine.reset()
 
         for player in (self.player1, self.player2, self.player3, self.player4):
             player.stop()
@@ -1153,8 +1034,7 @@ class GameWindow(QMainWindow, Ui_MainWindow):
         """Показывает форму для подтверждения кнопки «Забрать деньги»"""
 
         self.user_control = False
-        num_to_let = {0: 'A', 1: 'B', 2: 'C', 3: 'D'}
-        letter = num_to_let[self.answers.index(self.correct_answer)]
+        letter = self.engine.correct_letter
         self.confirm_window = ConfirmLeaveWindow(self, letter, self.is_sound)
         # и передаём правильный ответ, чтобы показать его после взятия денег
         self.confirm_window.move(200 + self.x(), 216 + self.y())
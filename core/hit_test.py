@@ -0,0 +1,38 @@
+from core.constants import ANSWERS_REGIONS, LIFELINES_REGIONS, RULES_REGIONS, SHOW_BUTTON_REGION
+
+
+class HitTestMap:
+    """Карта попаданий: номер области для каждой точки прямоугольника, охватывающего все области.
+
+    Строится один раз; поиск области по координатам — одно обращение к bytearray. Области одной карты не должны
+    пересекаться (пересекающиеся области, как кнопка показа ответов и ответы, хранятся в разных картах)."""
+
+    def __init__(self, regions: dict[str, tuple[int, int, int, int]]):
+        self._names = ('', *regions)  # 0 — точка вне областей
+        self._left = min(rect[0] for rect in regions.values())
+        self._top = min(rect[1] for rect in regions.values())
+        self._width = max(rect[2] for rect in regions.values()) - self._left + 1
+        self._height = max(rect[3] for rect in regions.values()) - self._top + 1
+        self._grid = bytearray(self._width * self._height)
+
+        for index, (left, top, right, bottom) in enumerate(regions.values(), 1):
+            row = bytes([index]) * (right - left + 1)
+            for y in range(top - self._top, bottom - self._top + 1):
+                start = y * self._width + left - self._left
+                if any(self._grid[start : start + len(row)]):
+                    raise ValueError(f'Region {self._names[index]!r} overlaps another region')
+                self._grid[start : start + len(row)] = row
+
+    def at(self, x: int, y: int) -> str:
+        """Возвращает имя области, в которую попадает точка, или пустую строку"""
+        x -= self._left
+        y -= self._top
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return self._names[self._grid[y * self._width + x]]
+        return ''
+
+
+answers_map = HitTestMap(ANSWERS_REGIONS)
+lifelines_map = HitTestMap(LIFELINES_REGIONS)
+show_button_map = HitTestMap({'show': SHOW_BUTTON_REGION})
+rules_map = HitTestMap(RULES_REGIONS)
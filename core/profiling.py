@@ -0,0 +1,188 @@
+import cProfile
+import json
+import logging
+import sys
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Callable
+
+# Модуль не импортирует Qt и игровые модули: профилировщик включается до их импорта, чтобы замерить и его
+
+
+class _TimedLoader:
+    """Обёртка загрузчика модуля, замеряющая создание модуля (для расширений на C это инициализация) и
+    выполнение его кода"""
+
+    def __init__(self, loader, profiler: 'StartupProfiler'):
+        self._loader = loader
+        self._profiler = profiler
+        self._begun = False
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        self._profiler._begin_import()
+        self._begun = True
+        try:
+            return self._loader.create_module(spec)
+        except BaseException:
+            self._profiler._end_import(spec.name)
+            self._begun = False
+            raise
+
+    def exec_module(self, module):
+        if not self._begun:
+            self._profiler._begin_import()
+        self._begun = False
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._end_import(module.__name__)
+
+
+class _ImportTimer:
+    """Искатель модулей в начале sys.meta_path: находит модуль остальными искателями и оборачивает загрузчик"""
+
+    def __init__(self, profiler: 'StartupProfiler'):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+
+
+class StartupProfiler:
+    """Замеры запуска: время импорта каждого модуля, длительность этапов (создание окон, инициализация базы) и
+    моменты событий (первая отрисовка стартового окна, первый вопрос) от старта профилировщика"""
+
+    def __init__(self, cprofile: bool = False):
+        self._started = perf_counter()
+        self.marks: dict[str, float] = {}  # событие → мс от старта, фиксируется первое наступление
+        self.phases: dict[str, float] = {}  # этап → длительность в мс
+        self.imports: dict[str, tuple[float, float]] = {}  # модуль → (собственное время, с вложенными), мс
+        self.sections: dict[str, dict] = {}  # дополнительные данные отчёта, например статистика кэша изображений
+        self._import_stack: list[list[float]] = []  # [начало, время вложенных импортов] для текущих импортов
+        self._callbacks: dict[str, list[Callable[[], None]]] = {}
+        self._cprofile = cProfile.Profile() if cprofile else None
+
+    def _elapsed(self) -> float:
+        return (perf_counter() - self._started) * 1000
+
+    def start(self):
+        """Начинает замер импортов и, если нужно, профилирование cProfile"""
+        sys.meta_path.insert(0, _ImportTimer(self))
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def stop(self):
+        """Прекращает замеры; повторный вызов ничего не делает"""
+        sys.meta_path[:] = [finder for finder in sys.meta_path if not isinstance(finder, _ImportTimer)]
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+    def _begin_import(self):
+        self._import_stack.append([perf_counter(), 0.0])
+
+    def _end_import(self, module: str):
+        started, nested = self._import_stack.pop()
+        total = (perf_counter() - started) * 1000
+        self.imports[module] = (total - nested, total)
+        if self._import_stack:
+            self._import_stack[-1][1] += total
+
+    def mark(self, name: str):
+        """Отмечает наступление события name и вызывает подписанные на него функции"""
+        if name in self.marks:
+            return
+        self.marks[name] = self._elapsed()
+        for callback in self._callbacks.pop(name, ()):
+            callback()
+
+    def on_mark(self, name: str, callback: Callable[[], None]):
+        """Вызывает callback при первом наступлении события name"""
+        self._callbacks.setdefault(name, []).append(callback)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Замеряет длительность этапа"""
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0) + (perf_counter() - started) * 1000
+
+    def watch_first_paint(self, widget, name: str):
+        """Отмечает событие name при первой отрисовке виджета"""
+        from PyQt5.QtCore import QEvent, QObject
+
+        profiler = self
+
+        class FirstPaintWatcher(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint:
+                    obj.removeEventFilter(self)
+                    profiler.mark(name)
+                return False
+
+        widget._first_paint_watcher = FirstPaintWatcher(widget)
+        widget.installEventFilter(widget._first_paint_watcher)
+
+    def report(self, top_imports: int = 50) -> dict:
+        """Возвращает отчёт: события, этапы, самые долгие по собственному времени импорты и доп. данные"""
+        imports = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+        return {
+            'marks_ms': {name: round(value, 3) for name, value in self.marks.items()},
+            'phases_ms': {name: round(value, 3) for name, value in self.phases.items()},
+            'imports_total_ms': round(sum(times[0] for times in self.imports.values()), 3),
+            'imports_ms': [
+                {'module': module, 'self': round(own, 3), 'cumulative': round(total, 3)}
+                for module, (own, total) in imports[:top_imports]
+            ],
+        } | self.sections
+
+    def log(self):
+        """Выводит события и этапы в лог"""
+        report = self.report()
+        logging.info('Startup marks: %s', report['marks_ms'])
+        logging.info('Startup phases: %s', report['phases_ms'])
+
+    def dump(self, path: str, cprofile_path: str | None = None):
+        """Сохраняет отчёт в JSON-файл, а статистику cProfile — в файл для pstats/snakeviz"""
+        self.stop()
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.report(), file, ensure_ascii=False, indent=2)
+        if self._cprofile is not None and cprofile_path:
+            self._cprofile.dump_stats(cprofile_path)
+
+
+startup_profiler: StartupProfiler | None = None  # включается через --profile-startup
+
+
+def enable_startup_profiler(cprofile: bool = False) -> StartupProfiler:
+    """Включает профилировщик запуска; вызывать до импорта модулей приложения"""
+    global startup_profiler
+    if startup_profiler is None:
+        startup_profiler = StartupProfiler(cprofile)
+        startup_profiler.start()
+    return startup_profiler
+
+
+def mark(name: str):
+    """Отмечает событие, если профилировщик включён"""
+    if startup_profiler is not None:
+        startup_profiler.mark(name)
+
+
+def phase(name: str):
+    """Замеряет этап, если профилировщик включён"""
+    return startup_profiler.phase(name) if startup_profiler is not None else nullcontext()
@@ -0,0 +1,103 @@
+import sys
+
+from PyQt5.QtWidgets import QDesktopWidget, QDialog, QMessageBox
+
+from core import constants, profiling
+from core.cloud_integration import prefetch_questions
+from core.database import question_counts
+from ui import Ui_StartDialog
+
+# Стартовое окно загружается отдельно от остальных окон: игра, правила и таблицы результатов импортируются
+# при первом обращении к ним, чтобы не задерживать первую отрисовку
+
+
+class StartWindow(QDialog, Ui_StartDialog):
+    """Стартовое окно для ввода имени игрока и показа правил игр"""
+
+    def __init__(self):
+        super().__init__()
+        self.setupUi(self)
+
+        qr = self.frameGeometry()
+        cp = QDesktopWidget().availableGeometry().center()
+        qr.moveCenter(cp)
+        self.move(qr.topLeft())
+
+        self.setWindowIcon(constants.APP_ICON)
+        self.radioButton_3.toggled.connect(self.prefetch_cloud_questions)
+        self.radioButton_4.toggled.connect(self.check_db_is_ok)
+        self.ok_button.clicked.connect(self.get_name)
+        self.exit_button.clicked.connect(sys.exit)
+        self.rulebook_button.clicked.connect(self.show_rules)
+        self.msg = QMessageBox()
+        self.msg.setWindowIcon(constants.APP_ICON)
+        self.msg.setIcon(QMessageBox.Warning)
+
+    def showEvent(self, event):
+        self.prefetch_cloud_questions()
+        return super().showEvent(event)
+
+    def prefetch_cloud_questions(self):
+        """Начинает загрузку вопросов из облака, пока игрок вводит имя и смотрит вступление; в игре на локальных
+        вопросах ни облако, ни токен не нужны"""
+        if self.radioButton_3.isChecked():
+            prefetch_questions()
+
+    def check_db_is_ok(self):
+        """Проверяет, готова ли локальная база вопросов к игре"""
+        counts = question_counts()
+        for i in range(1, 16):
+            if counts.get(i):
+                continue
+            self.msg.setWindowTitle('Локальная база не наполнена вопросами')
+            self.msg.setText(
+                f'В локальной базе вопросов нет вопросов для {i}-го шага денежного дерева. Пожалуйста, добавьте '
+                'вопросы для игры или воспользуйтесь удалённой базой вопросов.'
+            )
+            self.msg.show()
+            self.radioButton_3.setChecked(True)
+            break
+
+    def get_name(self) -> None:
+        """Получает имя игрока"""
+        name = self.lineEdit.text()
+        if not name:
+            self.msg.setText('Введите имя, чтобы учитываться в таблице рекордов.\nНе оставляйте поле пустым.')
+            self.msg.show()
+        elif any([(le in name) for le in '`~!@#$%^&*()_+{}|:"<>?[]\\;\',./№0123456789']):
+            self.msg.setWindowTitle('Некорректное имя')
+            self.msg.setText(
+                'Введите корректное имя, состоящее только из букв и пробелов. Не используйте цифры или спецсимволы.'
+            )
+            self.msg.show()
+            self.lineEdit.setText('')
+        else:
+            self.start_game(name.capitalize())
+
+    def show_rules(self):
+        """Показывает правила игры"""
+        from PyQt5.QtMultimedia import QMediaPlayer
+
+        from core.tools import LoopingMediaPlayer, decorate_audio
+        from core.widgets import GameRules
+
+        self.player1 = LoopingMediaPlayer(self)  # для фоновой музыки
+        self.player2 = QMediaPlayer(self)  # для звука остановки
+        self.rules_window = GameRules((self.player1, self.player2))
+        self.player1.set_media(decorate_audio('sounds/rules/bed.mp3'))
+        self.player1.play()
+        self.rules_window.show()
+
+    def start_game(self, name: str) -> None:
+        """Начинает игру с заданным именем игрока name и режимом игры"""
+        with profiling.phase('game_modules_import'):
+            from core.game import GameWindow
+
+        mode = self.buttonGroup.checkedButton().text()
+        mode = 'classic' if mode == 'Обычный режим' else 'clock'
+        question_sources = self.buttonGroup_2.checkedButton().text()
+        question_sources = 'cloud' if question_sources == 'Удалённая база вопросов' else 'local'
+        with profiling.phase('game_window_construction'):
+            self.game = GameWindow(name, mode, question_sources)
+        self.game.show()
+        self.close()
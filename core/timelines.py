@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+from PyQt5.QtGui import QPixmap
+
+
+@dataclass(frozen=True)
+class Param:
+    """Параметр таймлайна, значение которого передаётся при каждом запуске"""
+
+    name: str
+
+
+@dataclass(frozen=True)
+class Asset:
+    """Изображение, загружаемое через кэш изображений при запуске таймлайна, а не при каждом вызове setPixmap"""
+
+    path: str
+
+
+class Timeline:
+    """Анимация, описанная данными: список шагов (смещение, атрибут окна, метод, аргументы).
+
+    Таймлайн собирается один раз, кэшируется и проигрывается через `AnimationScheduler.play`; объекты окна,
+    параметры `Param` и изображения `Asset` подставляются только при проигрывании."""
+
+    def __init__(self):
+        self.steps: list[tuple[int, str, str, tuple]] = []
+        self.assets: set[Asset] = set()
+        self.duration = 0  # смещение последнего шага, как _current_delay у планировщика
+
+    def add(self, delay: int, target: str, method: str, *args) -> 'Timeline':
+        """Добавляет шаг `window.<target>.<method>(*args)` через delay мс после предыдущего.
+
+        Пустой target означает само окно, пустой method — паузу"""
+        self.duration += delay
+        self.steps.append((self.duration, target, method, args))
+        self.assets.update(arg for arg in args if isinstance(arg, Asset))
+        return self
+
+    def wait(self, delay: int) -> 'Timeline':
+        """Добавляет паузу; пустой шаг держит планировщик занятым до своего срабатывания"""
+        return self.add(delay, '', '')
+
+    def extend(self, other: 'Timeline') -> 'Timeline':
+        """Добавляет шаги другого таймлайна после текущего"""
+        for offset, target, method, args in other.steps:
+            self.steps.append((self.duration + offset, target, method, args))
+        self.duration += other.duration
+        self.assets |= other.assets
+        return self
+
+
+def _dial(question_num: int) -> int:
+    """Цена деления таймера для вопроса"""
+    n = '1-4' if question_num in range(1, 5) else question_num
+    return 1 if n in ('1-4', 5) else (2 if n in range(6, 11) else (3 if n in range(11, 15) else 6))
+
+
+@lru_cache(maxsize=None)
+def show_timer() -> Timeline:
+    timeline = Timeline()
+    for i in range(1, 19):
+        timeline.add(30, 'timer_view', 'setPixmap', Asset(f'animations/timer/{i}.png'))
+    return timeline
+
+
+@lru_cache(maxsize=None)
+def hide_timer() -> Timeline:
+    timeline = Timeline()
+    for i in range(18, 0, -1):
+        timeline.add(30, 'timer_view', 'setPixmap', Asset(f'animations/timer/{i}.png'))
+    return timeline.add(30, 'timer_view', 'setPixmap', QPixmap())
+
+
+@lru_cache(maxsize=None)
+def empty_timer(seconds_left: int, dial: int) -> Timeline:
+    timeline = Timeline()
+    for i in range(seconds_left // dial, -1, -1):
+        timeline.add(0, 'timer_text', 'setText', str(i * dial))
+        timeline.add(20, 'timer_view', 'setPixmap', Asset(f'images/timer/{i}.png'))
+    return timeline.add(0, 'timer_text', 'setText', '')
+
+
+@lru_cache(maxsize=None)
+def refill_timer(question_num: int, seconds_left: int = 0) -> Timeline:
+    dial = _dial(question_num)
+    timeline = Timeline()
+    for i in range(seconds_left // dial + 1, 16):
+        timeline.add(0, 'timer_text', 'setText', str(i * dial))
+        timeline.add(50, 'timer_view', 'setPixmap', Asset(f'images/timer/{i}.png'))
+    return timeline
+
+
+@lru_cache(maxsize=None)
+def show_prize() -> Timeline:
+    """Показ суммы выигрыша; сумма передаётся параметром amount"""
+    timeline = Timeline()
+    for i in range(1, 38):
+        timeline.add(30, 'layout_q', 'setPixmap', Asset(f'animations/sum/{i}.png'))
+    return timeline.add(0, 'amount_q', 'setText', Param('amount')).add(0, 'amount_q', 'startFadeIn')
+
+
+@lru_cache(maxsize=None)
+def hide_prize() -> Timeline:
+    """Обратная анимация блока с суммой — возвращение блока с вопросом и ответами"""
+    timeline = Timeline()
+    for i in range(37, 0, -1):
+        timeline.add(30, 'layout_q', 'setPixmap', Asset(f'animations/sum/{i}.png'))
+    return timeline
+
+
+@lru_cache(maxsize=None)
+def start_game(
+    mode: str, is_repeat: bool, is_restarted: bool, question_num: int, logo: str, is_sound: bool
+) -> Timeline:
+    """Анимация начала игры; фон передаётся параметром background"""
+    clock = mode == 'clock'
+
+    timeline = Timeline()
+    if not is_repeat:
+        timeline.add(0, 'background_1', 'setPixmap', Param('background'))
+    timeline.wait(800)
+    if is_repeat:
+        timeline.add(0, 'big_logo_1', 'setPixmap', Asset('images/logo/intro.png'))
+        timeline.add(0, 'big_logo_2', 'startFadeOutImage', 200)
+        timeline.add(0, 'background_1', 'setPixmap', Param('background'))
+        timeline.add(0, 'background_2', 'startFadeOutImage', 200)
+    timeline.add(200, 'big_logo_2', 'setPixmap', Asset(f'images/logo/{logo}.png'))
+    timeline.add(200, 'background_2', 'setPixmap', Param('background'))
+
+    if not is_repeat:
+        timeline.add(0, 'big_logo_1', 'show')
+        timeline.add(0, 'big_logo_1', 'startFadeInImage', 1000)
+    timeline.add(0, 'player2', 'play')
+
+    # анимация показа блока с вопросом и ответами
+    if is_repeat and not is_restarted:
+        timeline.add(0, 'amount_q', 'setText', '')
+        timeline.extend(hide_prize())
+    elif not is_restarted:
+        for i in range(1, 24):
+            timeline.add(30, 'layout_q', 'setPixmap', Asset(f'animations/question field/{i}.png'))
+    else:
+        timeline.wait(1000)
+    timeline.add(0, 'layout_q', 'setPixmap', Asset('images/question field/layout_noletters.png'))
+    timeline.wait(600 - 150 * clock)
+
+    for i in range(1, 16):  # анимация денежного дерева
+        timeline.add(220 + 32 * clock - 27 * is_repeat, 'state_t', 'setPixmap', Asset(f'images/money tree/{i}.png'))
+    if clock:
+        timeline.wait(500 * (not is_repeat))
+    timeline.add(0, 'state_q_1', 'startFadeInImage')
+    for i in ('A', 'B', 'C', 'D'):  # анимация 4 ответов
+        timeline.add(
+            450 - 80 * (is_repeat and clock),
+            'state_q_1',
+            'setPixmap',
+            Asset(f'animations/chosen answers/chosen_{i}.png'),
+        )
+        timeline.add(0, 'state_q_1', 'startFadeInImage')
+    timeline.add(450 - 80 * (is_repeat and clock), 'state_q_1', 'setPixmap', QPixmap())
+    timeline.add(
+        1000 + 600 * clock - 600 * (clock and is_repeat),
+        'state_t',
+        'setPixmap',
+        Asset(f'images/money tree/{question_num}.png'),
+    )
+
+    if not clock:
+        timeline.add(500, '', 'update_question_field')
+        timeline.add(0, 'question', 'startFadeIn')
+        timeline.add(100, '', 'show_answers')
+        timeline.add(0, 'big_logo_2', 'show')
+        timeline.add(0, 'big_logo_2', 'startFadeInImage', 1000)
+
+    timeline.add(500 if not clock else 0, 'player1', 'play')
+    if not is_sound:
+        timeline.add(0, 'player1', 'setVolume', 30 if clock else 100)
+
+    if clock:
+        timeline.add(500, 'player3', 'play')
+        timeline.add(300, '', 'update_question_field')
+        timeline.add(0, 'question', 'startFadeIn')
+        timeline.add(0, 'big_logo_2', 'show')
+        timeline.add(0, 'big_logo_2', 'startFadeInImage', 1000)
+        timeline.wait(300)
+        timeline.extend(show_timer())
+        timeline.extend(refill_timer(question_num))
+        timeline.add(0, 'central_q', 'setPixmap', Asset('images/question field/show-button.png'))
+        timeline.add(0, 'central_q', 'show')
+        timeline.add(0, 'central_q', 'startFadeInImage')
+    return timeline
+
+
+@lru_cache(maxsize=None)
+def show_answers() -> Timeline:
+    """Показ возможных ответов на вопрос"""
+    timeline = Timeline()
+    for i, letter in enumerate('ABCD', 1):
+        timeline.add(100, f'answer_{letter}', 'show')
+        timeline.add(0, f'answer_{letter}', 'startFadeIn')
+        timeline.add(0, f'state_q_{i}', 'setPixmap', Asset(f'images/question field/answer{i}.png'))
+        timeline.add(0, f'state_q_{i}', 'startFadeInImage')
+    timeline.add(200, 'layout_q', 'setPixmap', Asset('images/question field/layout.png'))
+    for i in range(1, 5):
+        timeline.add(0, f'state_q_{i}', 'setPixmap', QPixmap())
+    return timeline
+
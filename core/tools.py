@@ -1,69 +1,191 @@
+import json
 import logging
 import os
-import random
-import sqlite3
 import sys
-import traceback
+from collections import defaultdict
+from heapq import heappop, heappush
+from itertools import count
 from random import shuffle
-from types import TracebackType
-from typing import TYPE_CHECKING, Type
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
 
-from PyQt5.QtCore import QObject, QTime, QTimer, QUrl
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import QElapsedTimer, QObject, QTimer, QUrl, Qt
 from PyQt5.QtMultimedia import QMediaContent, QMediaPlayer
 from PyQt5.QtWidgets import QHeaderView, QTableWidget, QTableWidgetItem
 
-from core.application import msg
+from core import timelines
+from core.assets import load_pixmap
 from core.constants import LOOP_POINTS, SECONDS_FOR_QUESTION
+from core.database import sample_questions
 
 if TYPE_CHECKING:
     from core.game import GameWindow
 
 
+class SchedulerTimings:
+    """Замеры точности AnimationScheduler: опоздание каждого события относительно запланированного времени и
+    длительность его обработчика, сгруппированные по таймлайнам (функциям, запустившим анимацию)"""
+
+    def __init__(self):
+        self._samples: defaultdict[str, list[tuple[float, float]]] = defaultdict(list)  # (опоздание, длительность)
+
+    def record(self, timeline: str, lateness: float, duration: float):
+        """Сохраняет замер события: опоздание и длительность обработчика в мс"""
+        self._samples[timeline].append((lateness, duration))
+
+    @staticmethod
+    def _percentile(values: list[float], percent: int) -> float:
+        """Перцентиль по методу ближайшего ранга для отсортированного списка values"""
+        index = max(0, -(-len(values) * percent // 100) - 1)
+        return values[index]
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """Возвращает p50, p95 и максимум опоздания, а также длительность обработчиков для каждого таймлайна"""
+        report = {}
+        for timeline, samples in sorted(self._samples.items()):
+            lateness = sorted(sample[0] for sample in samples)
+            durations = sorted(sample[1] for sample in samples)
+            report[timeline] = {
+                'events': len(samples),
+                'lateness_p50': round(self._percentile(lateness, 50), 3),
+                'lateness_p95': round(self._percentile(lateness, 95), 3),
+                'lateness_max': round(lateness[-1], 3),
+                'callback_p95': round(self._percentile(durations, 95), 3),
+                'callback_max': round(durations[-1], 3),
+            }
+        return report
+
+    def log(self):
+        """Выводит отчёт в лог"""
+        for timeline, stats in self.report().items():
+            logging.info('Timeline %s: %s', timeline, stats)
+
+    def dump(self, path: str):
+        """Сохраняет отчёт в JSON-файл"""
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.report(), file, ensure_ascii=False, indent=2)
+
+
+class _TimelineRun:
+    """Проигрывание таймлайна: занимает в куче планировщика одно место и переставляет себя на следующий шаг"""
+
+    def __init__(
+        self, scheduler: 'AnimationScheduler', timeline: timelines.Timeline, window, origin: int, params: dict
+    ):
+        self._scheduler = scheduler
+        self._steps = timeline.steps
+        self._window = window
+        self._origin = origin
+        # изображения берутся из кэша один раз при запуске, как раньше при планировании
+        self._values = {asset: load_pixmap(asset.path) for asset in timeline.assets}
+        self._values.update((timelines.Param(name), value) for name, value in params.items())
+        self._index = 0
+        self._sequence = next(scheduler._sequence)
+
+    def push(self):
+        """Ставит в очередь планировщика ближайший шаг"""
+        heappush(self._scheduler._events, (self._origin + self._steps[self._index][0], self._sequence, self, (), {}))
+
+    def __call__(self):
+        """Выполняет все шаги с текущим смещением"""
+        steps, values = self._steps, self._values
+        offset = steps[self._index][0]
+        while self._index < len(steps) and steps[self._index][0] == offset:
+            _, target, method, args = steps[self._index]
+            self._index += 1
+            if not method:
+                continue
+            obj = getattr(self._window, target) if target else self._window
+            resolved = (values[arg] if isinstance(arg, (timelines.Asset, timelines.Param)) else arg for arg in args)
+            getattr(obj, method)(*resolved)
+        if self._index < len(steps):
+            self.push()
+
+
 class AnimationScheduler(QObject):
-    """Планировщик анимаций, необходим для своевременного проигрывания анимаций."""
+    """Планировщик анимаций, необходим для своевременного проигрывания анимаций.
+
+    События хранятся в куче по относительному времени, а однократный таймер взводится ровно на ближайшее событие,
+    поэтому без запланированных событий планировщик не просыпается."""
+
+    timings: SchedulerTimings | None = None  # замеры точности, включаются через enable_timings
 
     def __init__(self, parent: 'GameWindow', restore_user_control: bool = True):
         super().__init__(parent)
         self._timer = QTimer(self)
-        self._timer.setInterval(10)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
         # noinspection PyUnresolvedReferences
-        self._timer.timeout.connect(self._update)  # в случае истечения интервала в 10 мс вызывает _update
-        self._start_time = None  # будет хранить QTime запуска анимации
-        self._events = []  # список запланированных событий в виде (относительное время, функция, args, kwargs)
+        self._timer.timeout.connect(self._update)  # срабатывает к моменту ближайшего события
+        self._clock = QElapsedTimer()  # монотонные часы, запускаются при старте анимации
+        # куча запланированных событий в виде (относительное время, порядковый номер, функция, args, kwargs);
+        # порядковый номер сохраняет порядок планирования событий с одинаковым временем
+        self._events = []
+        self._sequence = count()
         self._current_delay = 0  # текущее относительное время; сбрасывается, когда кончается список событий
         self._restore_user_control = restore_user_control
         self._parent = parent
+        self._timeline = ''  # имя функции, запустившей анимацию, — для замеров точности
+        self._origin_ns = 0  # момент старта анимации по perf_counter_ns — для замеров точности
+
+    @classmethod
+    def enable_timings(cls) -> SchedulerTimings:
+        """Включает замеры точности срабатывания событий для всех планировщиков"""
+        if cls.timings is None:
+            cls.timings = SchedulerTimings()
+        return cls.timings
 
     def schedule(self, delay: int, func, *args, **kwargs):
         """Планирует выполнение функции func(*args, **kwargs) через delay мс после старта анимации"""
         self._current_delay += delay
-        self._events.append((self._current_delay, func, args, kwargs))
+        heappush(self._events, (self._current_delay, next(self._sequence), func, args, kwargs))
+
+    def play(self, timeline: timelines.Timeline, window, **params):
+        """Планирует скомпилированный таймлайн так же, как если бы его шаги были добавлены через schedule.
+
+        Объекты берутся из window по именам атрибутов, значения `Param` — из params"""
+        if timeline.steps:
+            _TimelineRun(self, timeline, window, self._current_delay, params).push()
+        self._current_delay += timeline.duration
 
     def start(self):
         """Запускает анимацию, высвобождая запланированные события"""
         if not self._events:
             return
-        self._events.sort(key=lambda event: event[0])
-        self._start_time = QTime.currentTime()
-        self._timer.start()
+        self._clock.start()
+        if self.timings is not None:
+            self._timeline = sys._getframe(1).f_code.co_name
+            self._origin_ns = perf_counter_ns()
+        self._arm()
         self._parent.user_control = False
 
+    def _arm(self):
+        """Взводит таймер на время ближайшего события"""
+        self._timer.start(max(0, self._events[0][0] - self._clock.elapsed()))
+
     def _update(self):
-        """Проверяет, какие события пора выполнить (периодически вызывается таймером)"""
-        if self._start_time is None:
+        """Выполняет события, время которых наступило, и взводит таймер на следующее"""
+        if not self._clock.isValid():
             return
 
-        elapsed = self._start_time.msecsTo(QTime.currentTime())
-        # Найдём все события, время которых наступило
-        due_events = [event for event in self._events if event[0] <= elapsed]
-        for event in due_events:
-            _, func, args, kwargs = event
+        elapsed = self._clock.elapsed()
+        # события, запланированные самими обработчиками, ждут следующего срабатывания таймера, как и раньше
+        last_sequence = next(self._sequence)
+        timings = self.timings
+        while self._events and self._events[0][0] <= elapsed and self._events[0][1] < last_sequence:
+            delay, _, func, args, kwargs = heappop(self._events)
+            if timings is None:
+                func(*args, **kwargs)
+                continue
+            fired_ns = perf_counter_ns()
+            timeline, lateness = self._timeline, (fired_ns - self._origin_ns) / 1e6 - delay
             func(*args, **kwargs)
-            self._events.remove(event)
+            timings.record(timeline, lateness, (perf_counter_ns() - fired_ns) / 1e6)
 
-        # Если все события выполнены, останавливаем таймер
-        if not self._events:
+        if self._events:
+            self._arm()
+        else:
+            # Если все события выполнены, останавливаем таймер
             self._timer.stop()
             self._parent.user_control = self._restore_user_control
             self._current_delay = 0
@@ -104,112 +226,37 @@ def empty_timer(window: 'GameWindow'):
         seconds_left = window.seconds_left
     else:
         seconds_left = SECONDS_FOR_QUESTION[n]
-    for i in range(seconds_left // dial, -1, -1):
-        window.scheduler1.schedule(0, window.timer_text.setText, str(i * dial))
-        window.scheduler1.schedule(20, window.timer_view.setPixmap, QPixmap(f'images/timer/{i}.png'))
-    window.scheduler1.schedule(0, window.timer_text.setText, '')
+    window.scheduler1.play(timelines.empty_timer(seconds_left, dial), window)
 
 
 def refill_timer(window: 'GameWindow', question_num: int, seconds_left: int = 0):
     """Пополняет таймер"""
-    n = '1-4' if question_num in range(1, 5) else question_num
-    dial = 1 if n in ('1-4', 5) else (2 if n in range(6, 11) else (3 if n in range(11, 15) else 6))
-    animation_start = seconds_left // dial + 1
-    for i in range(animation_start, 16):
-        window.scheduler1.schedule(0, window.timer_text.setText, str(i * dial))
-        window.scheduler1.schedule(50, window.timer_view.setPixmap, QPixmap(f'images/timer/{i}.png'))
+    window.scheduler1.play(timelines.refill_timer(question_num, seconds_left), window)
 
 
 def hide_timer(window: 'GameWindow'):
     """Скрывает таймер"""
-    for i in range(18, 0, -1):
-        window.scheduler1.schedule(30, window.timer_view.setPixmap, QPixmap(f'animations/timer/{i}.png'))
-    window.scheduler1.schedule(30, window.timer_view.setPixmap, QPixmap())
+    window.scheduler1.play(timelines.hide_timer(), window)
 
 
 def show_timer(window: 'GameWindow'):
-    for i in range(1, 19):
-        window.scheduler1.schedule(30, window.timer_view.setPixmap, QPixmap(f'animations/timer/{i}.png'))
+    window.scheduler1.play(timelines.show_timer(), window)
 
 
 def show_prize(window: 'GameWindow', amount: str):
-    for i in range(1, 38):
-        window.scheduler1.schedule(30, window.layout_q.setPixmap, QPixmap(f'animations/sum/{i}.png'))
-    window.scheduler1.schedule(0, window.amount_q.setText, amount)
-    window.scheduler1.schedule(0, window.amount_q.startFadeIn)
-
-
-def convert_amount_to_str(amount: int) -> str:
-    """Преобразует сумму в строку с разделителями разрядов"""
-    return '{:,}'.format(amount).replace(',', ' ')
-
-
-def ask_audience(question_number: int, available_count: int) -> tuple[int, list[int]]:
-    """Симулирует помощь зала"""
-
-    if question_number in range(1, 6):
-        correct_min, correct_max = 70, 100
-    elif question_number in range(6, 11):
-        correct_min, correct_max = 50, 80
-    elif question_number in range(11, 16):
-        correct_min, correct_max = 30, 60
-    else:
-        correct_min, correct_max = 10, 60
-
-    correct_percentage = random.randint(correct_min, correct_max)
-    remaining = 100 - correct_percentage
-
-    other_votes = [random.random() for _ in range(available_count - 1)]
-    total = sum(other_votes)
-    other_percentages = [round(x / total * remaining) for x in other_votes]
-
-    if not other_percentages:
-        return 100, []
-    diff = remaining - sum(other_percentages)
-    other_percentages[0] += diff
-    random.shuffle(other_percentages)
-
-    return correct_percentage, other_percentages
-
-
-def create_database_if_not_exists():
-    with sqlite3.connect('database.sqlite3') as con:
-        cur = con.cursor()
-        cur.execute('CREATE TABLE IF NOT EXISTS results '
-                    '(id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, result TEXT, date TEXT);')
-        for i in range(1, 16):
-            cur.execute(f'CREATE TABLE IF NOT EXISTS "{i}_questions" (id INTEGER PRIMARY KEY AUTOINCREMENT, text TEXT, '
-                        'answer_c TEXT, answer_2 TEXT, answer_3 TEXT, answer_4 TEXT);')
-
-
-def sql_request(request: str) -> tuple[str, list]:
-    """Отправляет запрос к базе данных database.sqlite3 и возвращает "OK" или "ERROR" с описанием ошибки"""
-    with sqlite3.connect('database.sqlite3') as con:
-        cur = con.cursor()
-        try:
-            if 'select' in request.lower():
-                return 'OK', cur.execute(request).fetchall()
-            else:
-                cur.execute(request)
-                con.commit()
-                return 'OK', []
-        except Exception as ex:
-            return 'ERROR: ' + str(ex), []
+    window.scheduler1.play(timelines.show_prize(), window, amount=amount)
 
 
 def get_local_questions():
     """Получает из базы данных database.sqlite3 вопросы и подготавливает их для игры"""
 
-    questions_data = [sql_request(f'SELECT * FROM "{i}_questions"')[1] for i in range(1, 16)]
     questions = []
 
-    for q_unmixed in questions_data:
+    for level_questions in sample_questions(3).values():
         questions_set = []
 
-        q_shuffled = q_unmixed.copy()
-        shuffle(q_shuffled)
-        for q in q_shuffled[:3]:
-            text, correct_answer, answers = q[1], q[2], list(q[2:])
+        for q in level_questions:
+            text, correct_answer, answers = q[0], q[1], list(q[1:])
             shuffle(answers)
             questions_set.append([text, correct_answer, answers])
 
@@ -242,13 +289,3 @@ def decorate_audio(file: str) -> QMediaContent:
 
     url = QUrl.fromLocalFile(os.path.abspath(file))  # необходим QUrl, т.к. он будет понятен QMediaContent
     return QMediaContent(url)
-
-
-def except_hook(exc_type: Type[BaseException], exc_value: BaseException, exc_tb: TracebackType):
-    """Обработчик исключений
-
-    При вызове исключения логирует ошибку в логи и показывает окно, предлагающее отправить ошибку разработчику."""
-
-    logging.error(str(exc_value) + '\n' + ''.join(traceback.format_exception(exc_type, exc_value, exc_tb)))
-    msg.show()
-    msg.buttonClicked.connect(sys.exit)
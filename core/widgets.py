@@ -7,8 +7,10 @@ from PyQt5.QtGui import QCloseEvent, QMouseEvent
 from PyQt5.QtMultimedia import QMediaPlayer
 from PyQt5.QtWidgets import QDesktopWidget, QWidget
 
-from core.constants import APP_ICON, rules_regions_generator
-from core.tools import decorate_audio, make_table, sql_request
+from core.constants import APP_ICON
+from core.database import delete_result, list_results
+from core.hit_test import rules_map
+from core.tools import decorate_audio, make_table
 from ui import Ui_About, Ui_DeleteResult, Ui_ResultsTable, Ui_Rules
 
 if TYPE_CHECKING:
@@ -40,13 +42,9 @@ class GameRules(QWidget, Ui_Rules):
         return super().mouseMoveEvent(event)
 
     def response_to_event(self, x: int, y: int):
-        rules_regions = rules_regions_generator(x, y)
-        for ping, region in rules_regions.items():
-            if region:
-                state = ping
-                break
-        else:
-            state = self.state = ''
+        state = rules_map.at(x, y)
+        if not state:
+            self.state = ''
 
         if state != self.state:
             self.state = state
@@ -68,9 +66,7 @@ class ResultsTableWindow(QWidget, Ui_ResultsTable):
         self.setupUi(self)
         self.setWindowIcon(APP_ICON)
 
-        results = sql_request('SELECT * from results')[1]
-        results = sorted(results, key=lambda x: int(str(x[2]).replace(' ', '')), reverse=True)  # сортируем по выигрышу
-        results = [list(map(str, i[1:])) for i in results]
+        results = [list(map(str, i)) for i in list_results()]  # отсортированы по выигрышу
 
         make_table(self.tableWidget, ['Имя', 'Результат', 'Дата и время'], results)
         if close_the_game:
@@ -91,9 +87,7 @@ class DeleteResultWindow(QWidget, Ui_DeleteResult):
     def refresh_table(self):
         """Обновляет таблицу результатов после удаления одного результата"""
 
-        results = sql_request('SELECT * from results')[1]
-        results = sorted(results, key=lambda x: int(str(x[2]).replace(' ', '')), reverse=True)
-        results = [list(map(str, i[1:])) for i in results]
+        results = [list(map(str, i)) for i in list_results()]
         self.results = [list(map(str, [i + 1, results[i][2]])) for i in range(len(results))]
 
         self.deleteButton.setEnabled(bool(results))
@@ -108,11 +102,8 @@ class DeleteResultWindow(QWidget, Ui_DeleteResult):
 
         id_result = self.spinBox.text()
         result_date = list(filter(lambda x: x[0] == id_result, self.results))[0][1]
-        result = sql_request(f'DELETE FROM results WHERE date = "{result_date}"')[0]
-        if 'ERROR' in result:
-            raise IndexError(result)
-        else:
-            logging.info('R%d delete', id_result)
+        delete_result(result_date)
+        logging.info('R%s delete', id_result)
         self.refresh_table()
 
 
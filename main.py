@@ -1,18 +1,87 @@
+import argparse
+import atexit
 import logging
 import sys
 from datetime import datetime
 from os.path import realpath
 
-from core import StartWindow, app, except_hook, create_database_if_not_exists
+from core import profiling
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Кто хочет стать Миллионером?')
+    parser.add_argument(
+        '--animation-timings', metavar='FILE', help='замерять точность анимаций и сохранить отчёт в JSON-файл'
+    )
+    parser.add_argument(
+        '--profile-startup',
+        metavar='FILE',
+        help='замерить импорты, создание окон, инициализацию базы и загрузку изображений и сохранить отчёт в JSON',
+    )
+    parser.add_argument('--profile-cprofile', metavar='FILE', help='вместе с --profile-startup сохранить дамп cProfile')
+    parser.add_argument(
+        '--profile-exit',
+        choices=('paint', 'question'),
+        help='завершиться после первой отрисовки стартового окна или, начав игру, после показа первого вопроса',
+    )
+    args, _ = parser.parse_known_args()  # остальные аргументы предназначены для Qt
+
+    # профилировщик включается до импорта модулей приложения, иначе время их импорта не попадёт в отчёт
+    profiler = profiling.enable_startup_profiler(bool(args.profile_cprofile)) if args.profile_startup else None
+
+    with profiling.phase('qt_application'):
+        from core import app
+    from PyQt5.QtCore import QTimer
+
+    from core import StartWindow, create_database_if_not_exists, except_hook
+    from core.assets import asset_preloader, pixmap_cache
+    from core.cloud_integration import cloud_metrics
+    from core.database import database
+    from ui import AnimationLabel
+
     logging.basicConfig(filename=realpath('logs.txt'), level=logging.INFO, format='%(levelname)s: %(message)s')
     sys.excepthook = except_hook
 
+    # игра завершается через sys.exit из окон, поэтому соединения с базой и отчёты о замерах закрываются и
+    # сохраняются при выходе из интерпретатора
+    atexit.register(database.close_all)
+    atexit.register(lambda: logging.info('Pixmap cache: %s', pixmap_cache.stats()))
+    atexit.register(asset_preloader.stop)  # обработчики atexit выполняются в обратном порядке: сначала остановка
+    atexit.register(lambda: logging.info('Cloud requests: %s', cloud_metrics.report()))
+    atexit.register(lambda: logging.info('Opacity effects: %s', AnimationLabel.opacity_effects))
+
+    if args.animation_timings:
+        from core.tools import AnimationScheduler  # модуль игры, при обычном запуске загружается вместе с ней
+
+        timings = AnimationScheduler.enable_timings()
+        atexit.register(timings.dump, args.animation_timings)
+        atexit.register(timings.log)
+
+    if profiler is not None:
+        atexit.register(profiler.dump, args.profile_startup, args.profile_cprofile)
+        atexit.register(profiler.log)
+        atexit.register(lambda: profiler.sections.update(assets=pixmap_cache.stats()))
+
     logging.info(datetime.today().strftime('%Y-%m-%d %H:%M:%S') + ': Session start')
-    main_window = StartWindow()
+    with profiling.phase('database_init'):
+        create_database_if_not_exists()  # до показа стартового окна: оно сразу начинает заполнять кэш вопросов
+    with profiling.phase('start_window_construction'):
+        main_window = StartWindow()
+
+    if profiler is not None:
+        profiler.watch_first_paint(main_window, 'start_window_painted')
+        if args.profile_exit == 'paint':
+            profiler.on_mark('start_window_painted', app.quit)
+        elif args.profile_exit == 'question':
+            # замер повторяем на локальных вопросах: облаку нужны сеть и токен; режим игры — по умолчанию
+            main_window.radioButton_4.setChecked(True)
+            if not main_window.radioButton_4.isChecked():
+                parser.error('--profile-exit question requires the local question database to be filled')
+            # игра начинается после отрисовки стартового окна, а не внутри неё
+            profiler.on_mark(
+                'start_window_painted', lambda: QTimer.singleShot(0, lambda: main_window.start_game('Профилировщик'))
+            )
+            profiler.on_mark('first_question', app.quit)
     main_window.show()
 
-    create_database_if_not_exists()
     app.exec()
     logging.info('Session finish\n\n')
@@ -1,53 +1,104 @@
-from contextlib import suppress
-import sqlite3
-import pandas as pd  # type: ignore
+import argparse
+import csv
 import re
+import sys
+from itertools import islice
+from pathlib import Path
+from time import perf_counter
 
-data_file = 'База КХСМ.xlsx'
-start_row = 4
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # скрипт запускается из корня репозитория
 
-data = pd.read_excel(
-    data_file,
-    header=start_row,
-    usecols='A:G',
-    names=['level', 'question', 'option_a', 'option_b', 'option_c', 'option_d', 'answer'],
+from core.database import (  # noqa: E402
+    create_database_if_not_exists,
+    database,
+    get_import_state,
+    insert_questions,
+    set_import_state,
 )
 
+DATA_FILE = Path(__file__).with_name('База КХСМ.xlsx')
+FIRST_ROW = 6  # первые строки листа — шапка таблицы
+BATCH_SIZE = 5000
 
-def replace_quotes_and_dots(text):
-    def replacement(match):
-        nonlocal count
-        quote = '«' if count % 2 == 0 else '»'
-        count += 1
-        return quote
+QUOTED = re.compile(r'"([^"]*)"')
 
-    count = 0
+
+def normalize_quotes(text):
+    """Заменяет парные кавычки на «ёлочки», а оставшуюся непарную — на открывающую, и многоточие — на три точки"""
     if not isinstance(text, str):
         return text
-    return re.sub(r'"', replacement, text.replace('…', '...'))
+    return QUOTED.sub(r'«\1»', text.replace('…', '...')).replace('"', '«')
+
+
+def parse_row(row: tuple) -> tuple[int, str, str, str, str, str] | None:
+    """Преобразует строку листа (уровень, вопрос, ответы A–D, буква правильного ответа) в строку для базы
+    или возвращает None, если строка некорректна"""
+    level, question, *options, letter = (normalize_quotes(value) for value in (tuple(row) + (None,) * 7)[:7])
+    answers = dict(zip('ABCD', options))
+    letter = str(letter).strip().upper()
+    if not isinstance(question, str) or not question.strip() or letter not in answers:
+        return None
+    if any(answer is None or str(answer).strip() == '' for answer in options):
+        return None
+    try:
+        level = int(float(level))
+    except (TypeError, ValueError):
+        return None
+    if not 1 <= level <= 15:
+        return None
+    other_answers = [str(answers[option]) for option in 'ABCD' if option != letter]
+    return level, question, str(answers[letter]), *other_answers
+
 
+def read_rows(path: Path, first_row: int):
+    """Построчно читает лист Excel в режиме только для чтения или, что намного быстрее, выгрузку листа в CSV"""
+    if path.suffix.lower() == '.csv':
+        with open(path, newline='', encoding='utf-8-sig') as file:
+            yield from islice(csv.reader(file), first_row - 1, None)
+        return
+    from openpyxl import load_workbook  # type: ignore  # нужен только для .xlsx и не входит в requirements.txt
 
-data = data.map(replace_quotes_and_dots)
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(min_row=first_row, max_col=7, values_only=True)
+    finally:
+        workbook.close()
 
-conn = sqlite3.connect('database.sqlite3')
-cursor = conn.cursor()
 
-count = 0
-for _, row in data.iterrows():
-    table_name = f'{row["level"]}_questions'
+def transfer(path: Path, full: bool = False) -> dict[str, int]:
+    """Импортирует вопросы пакетами; без full пропускает строки, импортированные в прошлый раз"""
+    create_database_if_not_exists()
+    source = path.name
+    first_row = FIRST_ROW if full else max(FIRST_ROW, get_import_state(source) + 1)
 
-    answers = {'A': row['option_a'], 'B': row['option_b'], 'C': row['option_c'], 'D': row['option_d']}
+    rows = enumerate(read_rows(path, first_row), first_row)
+    stats = {'inserted': 0, 'duplicate': 0, 'rejected': 0}
+    while batch := list(islice(rows, BATCH_SIZE)):
+        # пустые строки не считаются отклонёнными и не сдвигают состояние: в них могут дописать новые вопросы
+        batch = [(row_num, row) for row_num, row in batch if any(value not in (None, '') for value in row)]
+        if not batch:
+            continue
+        questions = [question for question in (parse_row(row) for _, row in batch) if question is not None]
+        stats['rejected'] += len(batch) - len(questions)
+        # пакет и номер последней строки фиксируются вместе, поэтому прерванный импорт продолжится с места
+        with database.transaction():
+            inserted = insert_questions(questions)
+            set_import_state(source, batch[-1][0])
+        stats['inserted'] += inserted
+        stats['duplicate'] += len(questions) - inserted
+    return stats
 
-    correct_answer = answers[row['answer']]
-    other_answers = [answers[option] for option in answers if option != row['answer']]
 
-    with suppress(Exception):
-        cursor.execute(
-            f'INSERT INTO "{table_name}" (text, answer_c, answer_2, answer_3, answer_4) VALUES (?, ?, ?, ?, ?)',
-            (row['question'], correct_answer, *other_answers),
-        )
-        count += 1
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Импорт вопросов из таблицы Excel в локальную базу')
+    parser.add_argument('path', nargs='?', type=Path, default=DATA_FILE, help='файл .xlsx или .csv с вопросами')
+    parser.add_argument('--full', action='store_true', help='просмотреть все строки, а не только новые')
+    args = parser.parse_args()
 
-conn.commit()
-conn.close()
-print(f'В базу данных добавлено {count} новых вопросов.')
+    started = perf_counter()
+    result = transfer(args.path, args.full)
+    database.close_all()
+    print(
+        f'В базу данных добавлено {result["inserted"]} новых вопросов, повторов: {result["duplicate"]}, '
+        f'отклонено строк: {result["rejected"]}. Время: {perf_counter() - started:.1f} с.'
+    )
@@ -1,5 +1,7 @@
 from .ui_classes import (
     AnimationLabel,
+    SceneCompositor,
+    SceneLayer,
     Ui_About,
     Ui_ConfirmAgain,
     Ui_ConfirmClearAll,
@@ -1,2871 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b'\
-\x00\x00\xb0\x28\
-\x00\
-\x01\x00\x00\x00\x0b\x00\x80\x00\x03\x00\x30\x4f\x53\x2f\x32\xbb\
-\x42\x87\xbd\x00\x00\x01\x38\x00\x00\x00\x56\x63\x6d\x61\x70\x9e\
-\x44\xdb\x52\x00\x00\x06\x74\x00\x00\x03\x78\x67\x61\x73\x70\xff\
-\xff\x00\x03\x00\x00\xb0\x20\x00\x00\x00\x08\x67\x6c\x79\x66\xf3\
-\x41\x81\xb5\x00\x00\x0c\x60\x00\x00\x99\x14\x68\x65\x61\x64\x01\
-\xec\x6e\xd5\x00\x00\x00\xbc\x00\x00\x00\x36\x68\x68\x65\x61\x0e\
-\x51\x06\x74\x00\x00\x00\xf4\x00\x00\x00\x24\x68\x6d\x74\x78\xb7\
-\x62\x71\x2e\x00\x00\x01\x90\x00\x00\x04\xe4\x6c\x6f\x63\x61\x16\
-\xcd\x3d\x46\x00\x00\x09\xec\x00\x00\x02\x74\x6d\x61\x78\x70\x05\
-\x9f\x00\xc1\x00\x00\x01\x18\x00\x00\x00\x20\x6e\x61\x6d\x65\x07\
-\xbd\x4a\x1e\x00\x00\xa5\x74\x00\x00\x05\x24\x70\x6f\x73\x74\x6e\
-\x4e\xb9\xfe\x00\x00\xaa\x98\x00\x00\x05\x85\x00\x01\x00\x00\x00\
-\x01\x00\x00\xf0\x73\x4d\x08\x5f\x0f\x3c\xf5\x00\x0b\x08\x00\x00\
-\x00\x00\x00\xce\x00\x5b\x6f\x00\x00\x00\x00\xce\x00\xc9\x1c\xff\
-\x48\xfe\x1f\x07\x85\x07\x2d\x00\x00\x00\x09\x00\x01\x00\x00\x00\
-\x00\x00\x00\x00\x01\x00\x00\x07\x3e\xfe\x4e\x00\x43\x07\xa5\xff\
-\x48\xff\x47\x07\x85\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x01\x39\x00\x01\x00\x00\x01\x39\x00\x90\x00\
-\x07\x00\x00\x00\x00\x00\x02\x00\x10\x00\x2f\x00\x42\x00\x00\x04\
-\x0c\x00\x00\x00\x00\x00\x00\x00\x01\x03\x0a\x01\x90\x00\x05\x00\
-\x08\x05\x9a\x05\x33\x00\x00\x01\x1b\x05\x9a\x05\x33\x00\x00\x03\
-\xd1\x00\x66\x02\x12\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xa0\x00\x02\xaf\x50\x00\x78\xfb\x00\x00\x00\x00\x00\x00\x00\
-\x00\x48\x4c\x20\x20\x00\x40\x00\x20\xfb\x02\x05\xd3\xfe\x51\x01\
-\x33\x07\x3e\x01\xb2\x60\x00\x01\x9f\xdf\xf7\x00\x00\x00\x00\x04\
-\x00\x00\x81\x00\x00\x00\x00\x01\x6a\x00\x00\x01\x6a\x00\x00\x02\
-\x39\x00\xb0\x02\x87\x00\x43\x04\x72\x00\x37\x04\x0e\x00\x5c\x04\
-\x60\x00\x5e\x04\xe5\x00\x6c\x01\x74\x00\x43\x02\xe9\x00\xa7\x02\
-\xe9\x00\xa7\x03\x1e\x00\x28\x04\x0e\x00\x4f\x01\xd7\x00\x45\x02\
-\x39\x00\x4f\x01\xd7\x00\x62\x02\xa3\xff\xf0\x04\x0e\x00\x6c\x04\
-\x0e\x00\xb0\x04\x0e\x00\x62\x04\x0e\x00\x62\x04\x0e\x00\x35\x04\
-\x0e\x00\x85\x04\x0e\x00\x6c\x04\x0e\x00\x9d\x04\x0e\x00\x6c\x04\
-\x0e\x00\x6c\x01\xd7\x00\x62\x01\xd7\x00\x45\x04\x0e\x00\x78\x04\
-\x0e\x00\x4f\x04\x0e\x00\xa3\x04\x0e\x00\x68\x05\xa7\x00\xa7\x03\
-\x99\xff\xf0\x04\x49\x00\x89\x03\xdf\x00\x6c\x04\x53\x00\x89\x03\
-\xd2\x00\x89\x03\xa1\x00\x89\x04\x37\x00\x6c\x04\x8f\x00\x89\x01\
-\xfd\x00\x89\x03\x5e\x00\x06\x04\x2b\x00\x89\x03\xa1\x00\x89\x05\
-\x18\x00\x89\x04\x66\x00\x89\x04\x37\x00\x6c\x03\xdd\x00\x89\x04\
-\x37\x00\x6c\x04\x37\x00\x89\x03\x85\x00\x26\x03\x37\x00\x1e\x04\
-\x37\x00\x6c\x03\x99\xff\xf0\x05\x41\x00\x04\x03\xa9\x00\x02\x03\
-\x99\xff\xec\x03\x85\x00\x14\x02\xe9\x00\xa7\x02\xa3\xff\xf0\x02\
-\xe9\x00\xa7\x06\x0e\x00\x3b\x01\xd7\xff\xee\x04\x00\x00\x91\x03\
-\xc8\x00\x6e\x03\xc8\x00\x76\x03\x6e\x00\x58\x03\xc8\x00\x58\x03\
-\xac\x00\x58\x02\x56\x00\x3b\x03\xac\x00\x58\x03\xdd\x00\x76\x01\
-\xd7\x00\x62\x01\xd7\xff\xc7\x03\x97\x00\x76\x01\xd7\x00\x76\x05\
-\xa7\x00\x76\x03\xe7\x00\x76\x03\xac\x00\x58\x03\xc8\x00\x76\x03\
-\xc8\x00\x58\x02\x7e\x00\x76\x03\xac\x00\x51\x02\x91\x00\x0a\x03\
-\xd2\x00\x62\x03\x70\xff\xee\x04\xca\x00\x04\x03\x45\xff\xec\x03\
-\xd2\x00\x62\x03\x70\x00\x0e\x03\x06\x00\x14\x06\x20\x00\x3b\x03\
-\x06\x00\xa7\x04\x6c\x00\x3b\x03\x99\xff\xf0\x03\x99\xff\xf0\x03\
-\xdf\x00\x6c\x03\xd2\x00\x89\x04\x66\x00\x89\x04\x37\x00\x6c\x04\
-\x37\x00\x6c\x03\xc8\x00\x6e\x03\xc8\x00\x6e\x03\xc8\x00\x6e\x03\
-\xc8\x00\x6e\x03\xc8\x00\x6e\x03\xc8\x00\x6e\x03\x6e\x00\x58\x03\
-\xac\x00\x58\x03\xac\x00\x58\x03\xac\x00\x58\x03\xac\x00\x58\x01\
-\xd7\x00\x70\x01\xd7\xff\x7d\x01\xd7\xff\xcf\x01\xd7\xff\xbf\x03\
-\xe7\x00\x76\x03\xac\x00\x58\x03\xac\x00\x58\x03\xac\x00\x58\x03\
-\xac\x00\x58\x03\xac\x00\x58\x03\xd2\x00\x62\x03\xd2\x00\x62\x03\
-\xd2\x00\x62\x03\xd2\x00\x62\x03\x35\x00\x00\x01\xd7\x00\x1e\x04\
-\x0e\x00\x76\x04\x0e\xff\xf8\x04\x0e\x00\x6c\x03\x85\x00\x7c\x05\
-\x18\x00\x6c\x03\xed\x00\x3b\x03\xae\x00\x62\x05\xa7\x00\xa7\x03\
-\x6c\x00\x51\x04\x00\x01\x85\x04\x00\x00\xd2\x04\x64\x00\x62\x05\
-\x7c\xff\x6d\x04\x37\x00\x6c\x05\xb4\x00\x6c\x06\xa9\x00\xfd\x04\
-\x64\x00\x5e\x04\x64\x00\x5e\x04\x0e\x00\x26\x04\xe1\xff\xc1\x03\
-\xf3\x00\x7e\x05\xb4\x00\x49\x06\x95\x00\x3d\x04\x64\x00\x22\x02\
-\x31\xff\x48\x02\xa5\x00\x43\x02\x91\x00\x33\x06\x24\x00\x66\x05\
-\xbc\x00\x58\x03\xac\x00\x58\x04\x0e\x00\x74\x02\x39\x00\x76\x06\
-\xa9\x00\xfd\x04\x64\xff\xe4\x04\x0e\x00\x4d\x04\x64\x00\x24\x04\
-\xe5\x00\x2b\x04\x97\x00\x62\x04\x97\x00\x78\x03\xa9\x00\x76\x03\
-\x99\xff\xf0\x03\x99\xff\xf0\x04\x37\x00\x6c\x06\x00\x00\x6c\x05\
-\xbc\x00\x58\x04\x0e\x00\x1e\x06\x1e\x00\x1e\x02\xc4\x00\x45\x02\
-\xc4\x00\x2b\x01\x83\x00\x45\x01\x83\x00\x2b\x06\xa9\x00\xfd\x03\
-\xf3\x00\x06\x03\xd2\x00\x62\x03\x99\xff\xec\x02\x89\xff\xec\x04\
-\x73\x00\x00\x02\xbe\x00\x62\x02\xbe\x00\x78\x04\x00\x00\x00\x04\
-\x00\x00\x00\x03\x35\x00\x00\x01\xd7\x00\x62\x01\x83\x00\x2b\x02\
-\xc4\x00\x2b\x06\x4d\x00\x5e\x03\x99\xff\xf0\x03\xd2\x00\x89\x03\
-\x99\xff\xf0\x03\xd2\x00\x89\x03\xd2\x00\x89\x01\xfd\x00\x85\x01\
-\xfd\xff\xe4\x01\xfd\xff\xd3\x01\xfd\xff\x92\x04\x37\x00\x6c\x04\
-\x37\x00\x6c\x04\x37\x00\x6c\x04\x37\x00\x6c\x04\x37\x00\x6c\x04\
-\x37\x00\x6c\x01\xd7\x00\x76\x04\x00\x00\xe3\x04\x00\x00\xbc\x04\
-\x00\x01\x06\x04\x00\x01\x06\x04\x00\x01\x6e\x04\x00\x01\x33\x04\
-\x00\x01\x49\x04\x00\x01\xa1\x04\x00\x00\xe1\x03\xa1\xff\xe0\x01\
-\xd7\xff\xcd\x03\x85\x00\x26\x03\xac\x00\x51\x03\x85\x00\x14\x03\
-\x70\x00\x0e\x04\x00\x01\x99\x04\x2b\x00\x24\x04\x0e\x00\x89\x03\
-\x99\xff\xec\x03\xd2\x00\x62\x03\xdd\x00\x89\x03\xc8\x00\x76\x06\
-\xa9\x00\xfd\x06\xa9\x01\x14\x02\xae\x00\x74\x02\xae\x00\x41\x02\
-\xae\x00\x41\x07\xa5\x00\x6e\x07\xa5\x00\x6e\x07\xa5\x00\x3d\x04\
-\xd9\x00\x43\x03\xd2\x00\x89\x03\x99\xff\xf0\x04\x4c\x00\x89\x04\
-\x49\x00\x89\x03\xa1\x00\x89\x05\x93\x00\x84\x03\xd2\x00\x89\x06\
-\xf2\x00\x89\x03\xe4\x00\x62\x04\x1c\x00\x89\x04\x14\x00\x89\x04\
-\x2b\x00\x89\x04\x74\x00\x77\x05\x18\x00\x89\x04\x8f\x00\x89\x04\
-\x37\x00\x6c\x03\xa1\x00\x89\x03\xdd\x00\x89\x03\xdf\x00\x6c\x03\
-\x37\x00\x1e\x03\x99\xff\xec\x04\xa4\x00\x6c\x03\xa9\x00\x02\x04\
-\x6c\x00\x93\x03\x9d\x00\x62\x05\xcb\x00\x89\x06\x72\x00\x89\x04\
-\x84\x00\x57\x05\x5b\x00\x89\x03\xd4\x00\x89\x03\xe4\x00\x6c\x05\
-\x7b\x00\x7a\x04\x37\x00\x89\x03\xc8\x00\x6e\x03\x95\x00\x89\x03\
-\x85\x00\x89\x03\x1d\x00\x89\x05\x23\x00\x84\x03\xac\x00\x58\x05\
-\xe9\x00\x76\x03\x65\x00\x64\x03\xe4\x00\x89\x03\xe4\x00\x89\x03\
-\xa5\x00\x8b\x04\x1c\x00\x77\x04\xb4\x00\x89\x03\xe4\x00\x89\x03\
-\xac\x00\x58\x03\xa1\x00\x89\x03\xc8\x00\x76\x03\x6e\x00\x58\x03\
-\x37\x00\x1e\x03\xa5\x00\x62\x04\x6c\x00\x58\x03\x45\xff\xec\x04\
-\x0c\x00\x9d\x03\xa5\x00\x62\x04\xfb\x00\x89\x05\xbb\x00\x89\x04\
-\x2c\x00\x4d\x04\xfb\x00\x89\x03\x75\x00\x89\x03\x6d\x00\x58\x04\
-\xf3\x00\x7a\x03\xe4\x00\x89\x03\xac\x00\x58\x03\xe4\x00\x00\x02\
-\xaa\x00\x00\x00\x00\x00\x02\x00\x01\x00\x00\x00\x00\x00\x14\x00\
-\x03\x00\x01\x00\x00\x01\x1a\x00\x00\x01\x06\x00\x00\x01\x00\x00\
-\x00\x00\x00\x00\x00\x01\x02\x00\x00\x00\x02\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x03\x04\x05\
-\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f\x10\x11\x12\x13\x14\x15\
-\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x20\x21\x22\x23\x24\x25\
-\x26\x27\x28\x29\x2a\x2b\x2c\x2d\x2e\x2f\x30\x31\x32\x33\x34\x35\
-\x36\x37\x38\x39\x3a\x3b\x3c\x3d\x3e\x3f\x40\x41\x42\x43\x44\x45\
-\x46\x47\x48\x49\x4a\x4b\x4c\x4d\x4e\x4f\x50\x51\x52\x53\x54\x55\
-\x56\x57\x58\x59\x5a\x5b\x5c\x5d\x5e\x5f\x60\x61\x00\x62\x63\x64\
-\x65\x66\x67\x68\x69\x6a\x6b\x6c\x6d\x6e\x6f\x70\x71\x72\x73\x74\
-\x75\x76\x77\x78\x79\x7a\x7b\x7c\x7d\x7e\x7f\x80\x81\x82\x83\x84\
-\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f\x90\x91\x92\x93\x94\
-\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f\xa0\xa1\xa2\xa3\xa4\
-\xa5\xa6\xa7\xa8\xa9\xaa\xab\x03\xac\xad\xae\xaf\xb0\xb1\xb2\xb3\
-\xb4\xb5\xb6\xb7\xb8\xb9\xba\xbb\xbc\xbd\xbe\xbf\xc0\xc1\xc2\xc3\
-\xc4\xc5\xc6\xc7\xc8\xc9\xca\xcb\xcc\xcd\xce\xcf\xd0\x00\xd1\xd2\
-\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xdb\x00\xdc\xdd\xde\x00\x04\x02\
-\x5e\x00\x00\x00\x5a\x00\x40\x00\x05\x00\x1a\x00\x7e\x00\xae\x00\
-\xb7\x00\xff\x01\x31\x01\x42\x01\x53\x01\x61\x01\x78\x01\x7e\x01\
-\x92\x02\xc7\x02\xc9\x02\xdd\x03\x7e\x04\x01\x04\x4f\x04\x51\x20\
-\x14\x20\x1a\x20\x1e\x20\x22\x20\x26\x20\x30\x20\x3a\x20\x44\x20\
-\xac\x21\x22\x21\x26\x22\x02\x22\x06\x22\x0f\x22\x12\x22\x15\x22\
-\x1a\x22\x1e\x22\x2b\x22\x48\x22\x60\x22\x65\x25\xca\xf0\x02\xf0\
-\x05\xfb\x02\xff\xff\x00\x00\x00\x20\x00\xa0\x00\xb0\x00\xb9\x01\
-\x31\x01\x41\x01\x52\x01\x60\x01\x78\x01\x7d\x01\x92\x02\xc6\x02\
-\xc9\x02\xd8\x03\x7e\x04\x01\x04\x10\x04\x51\x20\x13\x20\x18\x20\
-\x1c\x20\x20\x20\x26\x20\x30\x20\x39\x20\x44\x20\xac\x21\x22\x21\
-\x26\x22\x02\x22\x06\x22\x0f\x22\x11\x22\x15\x22\x19\x22\x1e\x22\
-\x2b\x22\x48\x22\x60\x22\x64\x25\xca\xf0\x01\xf0\x04\xfb\x01\xff\
-\xff\xff\xe3\x00\x00\x00\x00\x00\x00\xff\xa4\xff\x9e\xff\x5d\xff\
-\x81\xff\x42\xff\x66\xff\x14\x00\x00\xfe\x0f\x00\x00\xfc\xa0\xfc\
-\xf4\xfc\xe6\xfc\xe5\xe0\x9e\x00\x00\x00\x00\x00\x00\xe0\x85\xe0\
-\x95\xe0\x84\xe0\x77\xe0\x10\xdf\x6a\xdf\x79\xde\x96\xde\xa2\xde\
-\x8b\x00\x00\xde\xa6\x00\x00\xde\x74\xde\x71\xde\x5f\xde\x2f\xde\
-\x30\xda\xee\x10\xbe\x11\x33\x05\xbe\x00\x01\x00\x00\x00\x58\x00\
-\x74\x00\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x01\x00\x01\x04\x01\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\x00\x00\x00\
-\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x03\x00\xa3\x00\x84\x00\x85\x00\xf4\x00\
-\x96\x00\xe5\x00\x86\x00\x8e\x00\x8b\x00\x9d\x00\xa9\x00\xa4\x00\
-\x10\x00\x8a\x00\x83\x00\x93\x00\xef\x00\xf0\x00\x8d\x00\x97\x00\
-\x88\x00\xc2\x00\xee\x00\x9e\x00\xaa\x00\xf2\x00\xf1\x00\xf3\x00\
-\xa2\x00\xac\x00\xc8\x00\xc6\x00\xad\x00\x62\x00\x63\x00\x90\x00\
-\x64\x00\xca\x00\x65\x00\xc7\x00\xc9\x00\xce\x00\xcb\x00\xcc\x00\
-\xcd\x00\xe6\x00\x66\x00\xd1\x00\xcf\x00\xd0\x00\xae\x00\x67\x00\
-\xed\x00\x91\x00\xd4\x00\xd2\x00\xd3\x00\x68\x00\xe8\x00\xea\x00\
-\x89\x00\x6a\x00\x69\x00\x6b\x00\x6d\x00\x6c\x00\x6e\x00\xa0\x00\
-\x6f\x00\x71\x00\x70\x00\x72\x00\x73\x00\x75\x00\x74\x00\x76\x00\
-\x77\x00\xe7\x00\x78\x00\x7a\x00\x79\x00\x7b\x00\x7d\x00\x7c\x00\
-\xb7\x00\xa1\x00\x7f\x00\x7e\x00\x80\x00\x81\x00\xe9\x00\xeb\x00\
-\xb9\x00\xd6\x00\xde\x00\xd9\x00\xda\x00\xdb\x00\xdd\x00\xd7\x00\
-\xdc\x00\xb5\x00\xb6\x00\xc3\x00\xb3\x00\xb4\x00\xc4\x00\x82\x00\
-\xc1\x00\x87\x00\x99\x00\xec\x00\xc2\x00\xa5\x00\x00\x00\x14\x00\
-\x14\x00\x14\x00\x14\x00\x3e\x00\x6a\x01\x1e\x01\xa4\x02\x00\x02\
-\x7a\x02\x94\x02\xc2\x02\xee\x03\x60\x03\x92\x03\xb8\x03\xce\x03\
-\xe4\x04\x02\x04\x32\x04\x68\x04\xb0\x05\x08\x05\x42\x05\x82\x05\
-\xd0\x06\x06\x06\x5e\x06\xa6\x06\xcc\x07\x02\x07\x34\x07\x58\x07\
-\x8c\x07\xd8\x08\x3c\x08\x82\x08\xc8\x09\x0a\x09\x36\x09\x68\x09\
-\x92\x09\xd8\x0a\x08\x0a\x1e\x0a\x4c\x0a\x8a\x0a\xa6\x0a\xda\x0b\
-\x02\x0b\x32\x0b\x62\x0b\xb0\x0b\xf2\x0c\x46\x0c\x68\x0c\x90\x0c\
-\xbc\x0c\xfc\x0d\x40\x0d\x6c\x0d\x9c\x0d\xc0\x0d\xde\x0e\x00\x0e\
-\x7e\x0e\x94\x0e\xb0\x0e\xf8\x0f\x32\x0f\x6e\x0f\xa8\x0f\xea\x10\
-\x2a\x10\x90\x10\xbe\x10\xe4\x11\x14\x11\x50\x11\x66\x11\xac\x11\
-\xd8\x12\x02\x12\x3c\x12\x78\x12\xa2\x12\xf4\x13\x2a\x13\x56\x13\
-\x80\x13\xbe\x13\xfe\x14\x42\x14\x72\x14\xc6\x15\x30\x15\x7a\x15\
-\xe0\x16\x46\x16\xae\x17\x10\x17\x56\x17\xaa\x17\xfa\x18\x42\x18\
-\xa0\x18\xfc\x19\x64\x19\xcc\x1a\x42\x1a\xac\x1b\x0a\x1b\x60\x1b\
-\xb6\x1c\x16\x1c\x78\x1c\xa2\x1c\xca\x1c\xfe\x1d\x34\x1d\x8e\x1d\
-\xce\x1e\x0c\x1e\x56\x1e\xa0\x1e\xf8\x1f\x38\x1f\x78\x1f\xc2\x20\
-\x0e\x20\x4e\x20\x76\x20\xe2\x21\x38\x21\xae\x21\xca\x21\xf6\x22\
-\x54\x22\xb8\x23\x22\x23\x74\x23\x90\x23\xb8\x23\xdc\x24\x2e\x24\
-\x70\x24\xae\x24\xce\x24\xe8\x25\x02\x25\x64\x25\x8c\x25\xc8\x25\
-\xf2\x26\x12\x26\x5e\x26\x92\x26\xd4\x26\xfe\x27\x46\x27\xc0\x27\
-\xfc\x28\x46\x28\x70\x28\x80\x28\x9c\x28\xee\x29\x28\x29\x3e\x29\
-\x86\x29\xce\x2a\x24\x2a\x7e\x2a\xf0\x2b\x4e\x2b\xa4\x2c\x02\x2c\
-\x18\x2c\x2e\x2c\x72\x2c\xb4\x2c\xd6\x2c\xf8\x2d\x26\x2d\x40\x2d\
-\xa4\x2d\xf0\x2e\x0e\x2e\x0e\x2e\x36\x2e\x5e\x2e\x5e\x2e\x5e\x2e\
-\xc0\x2e\xd8\x2e\xfa\x2f\x3a\x2f\xb4\x30\x18\x30\x68\x30\xc4\x31\
-\x16\x31\x5c\x31\x86\x31\xba\x31\xf0\x32\x18\x32\x5e\x32\xae\x32\
-\xf2\x33\x30\x33\x76\x33\xb2\x33\xc8\x33\xee\x34\x22\x34\x38\x34\
-\x5c\x34\x76\x34\x9e\x34\xd0\x34\xe8\x35\x0e\x35\x50\x35\x8e\x36\
-\x02\x36\x74\x36\xc2\x37\x10\x37\x24\x37\x68\x37\xd8\x38\x1a\x38\
-\x72\x38\xa8\x38\xe4\x38\xf2\x39\x14\x39\x48\x39\x86\x39\xda\x3a\
-\x5e\x3a\xde\x3b\x7c\x3b\xba\x3c\x0c\x3c\x52\x3c\x96\x3c\xdc\x3c\
-\xfa\x3d\x4c\x3d\x7e\x3d\xf2\x3e\x44\x3e\x6c\x3e\xb0\x3e\xee\x3f\
-\x24\x3f\x58\x3f\x88\x3f\xb8\x3f\xea\x40\x1a\x40\x5c\x40\x7e\x40\
-\xac\x40\xee\x41\x32\x41\x7a\x41\xa6\x42\x04\x42\x76\x42\xbc\x42\
-\xfa\x43\x28\x43\x7a\x43\xc6\x44\x0a\x44\x52\x44\x96\x44\xf2\x45\
-\x10\x45\x62\x45\xa4\x46\x16\x46\x64\x46\x8c\x46\xd0\x47\x0c\x47\
-\x42\x47\x76\x47\xa6\x47\xd0\x48\x02\x48\x3c\x48\x78\x48\x9a\x48\
-\xde\x49\x1a\x49\x5a\x49\xa2\x49\xce\x4a\x2c\x4a\x9e\x4a\xe4\x4b\
-\x24\x4b\x54\x4b\xa0\x4b\xe6\x4c\x28\x4c\x8a\x4c\x8a\x4c\x8a\x00\
-\x02\x00\x81\x00\x00\x03\x81\x06\x0a\x00\x03\x00\x07\x00\x00\x33\
-\x11\x21\x11\x25\x21\x11\x21\x81\x03\x00\xfd\x7f\x02\x00\xfe\x00\
-\x06\x0a\xf9\xf6\x81\x05\x0a\x00\x02\x00\xb0\xff\xec\x01\xc2\x05\
-\x0a\x00\x0d\x00\x19\x00\x00\x01\x03\x06\x2b\x01\x22\x27\x03\x11\
-\x34\x3b\x01\x32\x15\x13\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\
-\x16\x01\xae\x2b\x02\x13\x66\x12\x02\x30\x15\xc0\x15\x14\x51\x38\
-\x39\x50\x52\x37\x38\x51\x02\xdf\xfe\x94\x13\x13\x01\x6c\x02\x17\
-\x14\x14\xfb\x7f\x38\x51\x51\x38\x39\x50\x52\x00\x02\x00\x43\x03\
-\x71\x02\x43\x05\x0a\x00\x0c\x00\x19\x00\x00\x01\x03\x06\x2b\x01\
-\x22\x27\x03\x34\x3b\x01\x32\x15\x05\x03\x06\x2b\x01\x22\x27\x03\
-\x34\x3b\x01\x32\x15\x02\x43\x2f\x02\x13\x66\x12\x02\x30\x15\xc5\
-\x14\xfe\xee\x30\x02\x12\x64\x13\x02\x31\x14\xc5\x15\x04\xf4\xfe\
-\x8f\x12\x12\x01\x75\x12\x12\x04\xfe\x8f\x12\x12\x01\x75\x12\x12\
-\x00\x00\x00\x00\x02\x00\x37\x00\x00\x04\x3d\x05\x0a\x00\x7b\x00\
-\x8f\x00\x00\x01\x07\x06\x2b\x01\x22\x0f\x01\x14\x15\x06\x15\x14\
-\x3b\x01\x32\x1d\x01\x07\x06\x2b\x01\x22\x07\x03\x06\x2b\x01\x22\
-\x35\x36\x15\x13\x34\x37\x30\x35\x34\x2b\x01\x22\x07\x03\x06\x2b\
-\x01\x22\x35\x36\x15\x13\x34\x37\x30\x35\x34\x2b\x01\x22\x35\x36\
-\x15\x37\x36\x3b\x01\x32\x3f\x01\x34\x37\x30\x35\x34\x2b\x01\x22\
-\x35\x36\x15\x37\x36\x3b\x01\x32\x37\x13\x36\x3b\x01\x32\x15\x14\
-\x15\x06\x15\x03\x14\x15\x06\x15\x14\x3b\x01\x32\x37\x13\x36\x3b\
-\x01\x32\x15\x14\x15\x06\x15\x03\x34\x07\x14\x3b\x01\x32\x15\x05\
-\x34\x37\x30\x35\x34\x2b\x01\x22\x0f\x01\x14\x15\x06\x15\x14\x3b\
-\x01\x32\x37\x04\x3d\x2f\x06\x15\x85\x10\x04\x21\x02\x17\x85\x10\
-\x2f\x06\x15\x93\x11\x04\x5e\x04\x10\x79\x17\x02\x52\x02\x16\xa0\
-\x10\x04\x5d\x04\x10\x7b\x16\x02\x56\x02\x17\x75\x10\x02\x2f\x02\
-\x17\x83\x10\x04\x21\x02\x16\x84\x10\x02\x2f\x02\x17\x95\x11\x04\
-\x5a\x04\x10\x7b\x17\x02\x54\x02\x16\x9e\x0e\x06\x5f\x02\x12\x7b\
-\x17\x02\x54\x03\x17\x75\x10\xfe\x71\x02\x17\x9d\x11\x04\x21\x02\
-\x17\x9e\x10\x04\x03\x96\xaf\x14\x0c\x75\x02\x02\x02\x02\x13\x10\
-\x04\xae\x15\x0c\xfe\xba\x0e\x12\x0b\x02\x01\x2d\x02\x02\x02\x12\
-\x0c\xfe\xba\x0e\x12\x0b\x02\x01\x2d\x02\x02\x02\x12\x0d\x0a\x02\
-\xae\x14\x11\x72\x02\x02\x03\x12\x0c\x0a\x02\xaf\x14\x10\x01\x42\
-\x0e\x12\x02\x02\x02\x02\xfe\xd5\x02\x02\x03\x02\x12\x10\x01\x42\
-\x0e\x12\x02\x02\x02\x02\xfe\xd5\x04\x0d\x12\x10\xe0\x02\x02\x03\
-\x12\x0c\x75\x02\x02\x02\x02\x13\x11\x00\x00\x00\x03\x00\x5c\xff\
-\x8c\x03\xbe\x05\x7f\x00\x4b\x00\x56\x00\x61\x00\x00\x01\x04\x11\
-\x14\x06\x07\x06\x07\x06\x1d\x01\x14\x2b\x01\x22\x3d\x01\x34\x27\
-\x26\x27\x26\x27\x26\x35\x34\x3f\x01\x36\x33\x32\x17\x16\x33\x32\
-\x35\x11\x26\x27\x26\x27\x26\x35\x34\x37\x36\x37\x36\x3d\x01\x34\
-\x3b\x01\x32\x1d\x01\x14\x17\x16\x17\x16\x17\x16\x15\x14\x0f\x01\
-\x06\x23\x22\x27\x26\x23\x22\x15\x11\x27\x35\x34\x23\x22\x06\x15\
-\x14\x16\x33\x32\x13\x14\x33\x32\x36\x35\x34\x26\x23\x22\x15\x02\
-\x6c\x01\x52\x6e\x54\x23\x4e\x29\x14\x6b\x14\x3e\x56\x35\x42\x33\
-\x2d\x0c\xb1\x04\x06\x08\x3b\x17\x35\x15\x04\x25\x2f\x2f\xec\xcb\
-\x2b\x49\x34\x14\x6b\x14\x1f\x48\x18\x3c\x33\x5a\x0c\xb3\x04\x06\
-\x0a\x15\x2f\x23\x0e\x93\x15\x29\x4c\x50\x2b\x0f\x93\x0e\x23\x42\
-\x44\x21\x0e\x02\xf2\x96\xfe\xf0\x6b\xb0\x1f\x0e\x0e\x08\x14\x3a\
-\x14\x14\x38\x14\x06\x08\x1d\x22\x48\x40\x20\x08\x07\x58\x02\x61\
-\x24\x14\x01\x42\x12\x10\x17\x14\x73\xd9\xe8\x62\x14\x09\x06\x12\
-\x37\x15\x15\x3b\x12\x06\x0f\x08\x14\x36\x60\x29\x0a\x06\x58\x02\
-\x24\x52\x16\xfe\xdf\x4c\xe1\x15\x56\x32\x2f\x54\xfd\xaa\x14\x52\
-\x35\x2f\x52\x16\x00\x00\x00\x00\x05\x00\x5e\x00\x00\x04\x02\x05\
-\x0a\x00\x0d\x00\x1d\x00\x2b\x00\x35\x00\x3f\x00\x00\x01\x14\x06\
-\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x25\x01\x06\x2b\x01\
-\x22\x35\x34\x37\x01\x36\x37\x33\x32\x15\x14\x13\x14\x06\x23\x22\
-\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x01\x35\x34\x23\x22\x1d\x01\
-\x14\x33\x32\x01\x35\x34\x23\x22\x1d\x01\x14\x33\x32\x01\xfa\x71\
-\x5e\x5e\x6f\x71\x5c\x5e\x71\x01\x8b\xfd\xe9\x06\x0c\x6d\x16\x04\
-\x02\x17\x02\x10\x6c\x17\x79\x6f\x5e\x5e\x6f\x6f\x5e\x5e\x6f\xfd\
-\x52\x29\x27\x27\x29\x02\x08\x27\x27\x27\x27\x03\x83\x58\x6a\x6a\
-\x58\xbf\x5a\x6e\x6a\x58\xa6\xfb\x1e\x0c\x10\x02\x0b\x04\xe1\x06\
-\x06\x10\x02\xfb\xcb\x59\x6a\x6a\x59\xc4\x58\x6b\x6b\x58\x01\xfc\
-\xc5\x27\x27\xc5\x27\xfd\x67\xc4\x27\x27\xc4\x27\x00\x00\x00\x00\
-\x03\x00\x6c\xff\xec\x04\xc6\x05\x1f\x00\x3e\x00\x4a\x00\x5a\x00\
-\x00\x21\x14\x23\x22\x27\x26\x33\x22\x07\x06\x2b\x01\x22\x26\x3d\
-\x01\x34\x37\x36\x35\x34\x27\x26\x35\x34\x36\x33\x32\x16\x1d\x01\
-\x14\x07\x0e\x01\x15\x14\x16\x33\x32\x37\x36\x37\x36\x3b\x01\x32\
-\x1d\x01\x14\x2b\x01\x22\x06\x1d\x01\x17\x16\x17\x16\x17\x16\x15\
-\x01\x35\x34\x26\x23\x22\x06\x15\x14\x1f\x01\x36\x13\x36\x35\x34\
-\x27\x26\x27\x23\x06\x1d\x01\x14\x16\x3b\x01\x32\x04\xc6\x2f\x6d\
-\x74\x5e\x02\x02\x6f\x3b\x8a\x3b\xb0\xcd\x29\x50\x58\x21\xcd\xb0\
-\xae\xcf\x46\x12\x48\x40\x0a\x06\x19\x24\x1f\x52\xae\x40\x14\x14\
-\x50\x3e\x54\x06\x30\x41\x0c\x61\x12\xfd\xb6\x56\x3d\x3e\x56\x90\
-\x0e\x89\x32\x04\x40\x4c\x78\x15\x44\x56\x3e\x3b\x50\x14\x47\x3a\
-\x54\x2d\xca\xb0\x32\x51\x38\x6c\x02\x07\x74\x2b\x67\xb4\xcf\xcf\
-\xb0\x27\x62\x61\x18\x23\x0a\x0d\x3d\x21\x33\x23\x5c\x15\xc0\x15\
-\x54\x3f\x1b\x0e\x37\x1f\x04\x21\x06\x0e\x02\xc8\x27\x3c\x58\x56\
-\x3e\x62\x58\x04\x29\xfd\xf5\x05\x02\x1a\x40\x4c\x4b\x33\x48\x3b\
-\x3d\x56\x00\x00\x01\x00\x43\x03\x71\x01\x31\x05\x0a\x00\x0c\x00\
-\x00\x01\x03\x06\x2b\x01\x22\x27\x03\x34\x3b\x01\x32\x15\x01\x31\
-\x30\x02\x12\x64\x13\x02\x31\x14\xc5\x15\x04\xf4\xfe\x8f\x12\x12\
-\x01\x75\x12\x12\x00\x00\x00\x00\x01\x00\xa7\xfe\xa0\x02\x41\x05\
-\xcd\x00\x1d\x00\x00\x01\x14\x23\x22\x26\x27\x26\x35\x11\x34\x37\
-\x36\x33\x32\x1d\x01\x14\x07\x0e\x02\x15\x11\x14\x16\x17\x16\x17\
-\x16\x15\x02\x41\x2d\x42\x98\x31\x62\x62\x73\x98\x2d\x15\x1f\x45\
-\x38\x38\x25\x1e\x21\x15\xfe\xb5\x15\x42\x31\x64\xa6\x04\x33\xa8\
-\x62\x73\x15\xb0\x10\x06\x06\x0f\x4a\x2f\xfb\xa6\x2e\x4c\x08\x06\
-\x07\x06\x10\x00\x01\x00\xa7\xfe\xa0\x02\x41\x05\xcd\x00\x1c\x00\
-\x00\x25\x14\x07\x06\x23\x22\x3d\x01\x34\x37\x36\x37\x3e\x01\x35\
-\x11\x34\x26\x27\x26\x27\x26\x3d\x01\x34\x33\x32\x16\x15\x02\x41\
-\x63\x70\x9e\x29\x12\x1d\x1d\x29\x39\x37\x2b\x1d\x1d\x12\x29\x9a\
-\xd7\x1d\xa6\x64\x73\x15\xb0\x10\x04\x06\x07\x0a\x4a\x30\x04\x5a\
-\x32\x47\x0a\x07\x06\x04\x10\xb0\x15\xd3\xaa\x00\x01\x00\x28\x02\
-\xa6\x02\xfd\x05\x81\x00\x55\x00\x00\x01\x07\x06\x23\x22\x2f\x01\
-\x26\x23\x22\x1d\x01\x17\x14\x2b\x01\x22\x3d\x01\x37\x34\x23\x22\
-\x0f\x01\x06\x23\x22\x2f\x01\x26\x35\x34\x3f\x01\x36\x35\x34\x2f\
-\x01\x26\x35\x34\x3f\x01\x36\x33\x32\x1f\x01\x16\x33\x32\x3d\x01\
-\x27\x34\x3b\x01\x32\x1d\x01\x07\x14\x33\x32\x3f\x01\x36\x33\x32\
-\x1f\x01\x16\x15\x14\x0f\x01\x06\x15\x14\x1f\x01\x16\x15\x14\x02\
-\xf9\x52\x08\x08\x07\x08\x8b\x0c\x06\x0f\x19\x15\xa1\x15\x17\x0f\
-\x08\x0a\x83\x08\x07\x0a\x06\x52\x04\x0e\x9e\x0e\x0e\x9c\x0e\x04\
-\x52\x06\x0a\x07\x08\x81\x06\x0a\x11\x17\x15\xa1\x15\x17\x11\x08\
-\x08\x89\x08\x07\x0a\x06\x50\x04\x0e\xa2\x11\x11\xa4\x0e\x03\xa8\
-\x8b\x0d\x07\x64\x08\x12\x07\xb2\x12\x12\x04\xb3\x12\x08\x67\x06\
-\x0d\x8f\x06\x06\x0a\x07\x3f\x06\x0d\x0c\x06\x44\x06\x0a\x06\x06\
-\x8e\x0c\x06\x6b\x06\x15\x06\xa8\x12\x12\x05\xa9\x17\x06\x6d\x06\
-\x0c\x8c\x06\x06\x0a\x06\x46\x06\x0c\x0d\x06\x3f\x07\x0a\x06\x00\
-\x01\x00\x4f\x00\x3b\x03\xbe\x03\xaa\x00\x23\x00\x00\x01\x14\x23\
-\x21\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x23\x21\x22\x3d\x01\
-\x34\x33\x21\x32\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x33\x21\x32\
-\x15\x03\xbe\x15\xfe\xc9\x15\x14\x87\x15\x14\xfe\xca\x14\x14\x01\
-\x36\x14\x15\x87\x14\x15\x01\x37\x15\x01\xae\x14\x15\xfe\xcb\x15\
-\x15\x01\x35\x15\x14\x87\x15\x14\x01\x38\x14\x14\xfe\xc8\x14\x15\
-\x00\x00\x00\x00\x01\x00\x45\xfe\xfa\x01\x74\x01\x0e\x00\x19\x00\
-\x00\x25\x14\x07\x06\x07\x06\x23\x22\x2f\x01\x26\x35\x30\x36\x35\
-\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x15\x01\x74\x3d\x25\x3c\
-\x31\x14\x0a\x07\x37\x04\x5c\x14\x17\x14\x14\xea\x14\x64\x8c\x5d\
-\x35\x2b\x21\x0b\x6c\x08\x04\x58\x33\x17\x14\xc7\x14\x14\x00\x00\
-\x01\x00\x4f\x01\x60\x01\xe9\x02\x4a\x00\x0b\x00\x00\x01\x14\x23\
-\x21\x22\x3d\x01\x34\x33\x21\x32\x15\x01\xe9\x15\xfe\x8f\x14\x14\
-\x01\x71\x15\x01\x75\x15\x15\xc0\x15\x15\x00\x00\x01\x00\x62\xff\
-\xec\x01\x74\x00\xfe\x00\x0b\x00\x00\x25\x14\x06\x23\x22\x26\x35\
-\x34\x36\x33\x32\x16\x01\x74\x51\x38\x39\x50\x50\x39\x38\x51\x75\
-\x38\x51\x51\x38\x39\x50\x52\x00\x01\xff\xf0\x00\x00\x02\xb5\x05\
-\x0a\x00\x0f\x00\x00\x09\x01\x06\x07\x23\x22\x35\x34\x37\x01\x36\
-\x37\x33\x32\x15\x14\x02\xb1\xfd\xe9\x04\x0e\x81\x17\x05\x02\x16\
-\x02\x10\x81\x17\x04\xee\xfb\x1e\x0a\x02\x10\x02\x0b\x04\xe1\x06\
-\x06\x10\x02\x00\x02\x00\x6c\xff\xec\x03\xa1\x05\x1f\x00\x0f\x00\
-\x1f\x00\x00\x01\x14\x06\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\
-\x32\x16\x15\x03\x11\x34\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\
-\x01\x32\x36\x03\xa1\xd1\xac\x3b\xac\xd1\xd1\xac\x3b\xac\xd1\xeb\
-\x54\x3e\x3b\x3e\x56\x56\x3e\x3b\x3e\x54\x01\x56\xa2\xc8\xc6\xa4\
-\x02\x5e\xa4\xc7\xc7\xa4\xfd\xa2\x02\x5e\x40\x54\x56\x3e\xfd\xa2\
-\x3d\x56\x54\x00\x01\x00\xb0\x00\x00\x03\x89\x05\x0a\x00\x25\x00\
-\x00\x25\x14\x23\x21\x22\x3d\x01\x34\x3b\x01\x32\x35\x11\x34\x23\
-\x22\x0f\x01\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x01\x37\x33\x32\
-\x15\x11\x14\x3b\x01\x32\x15\x03\x89\x14\xfd\x6a\x14\x14\xc1\x14\
-\x12\x09\x08\x3d\x08\x06\x07\x08\x7f\x08\x08\x01\x56\x0f\x6e\x15\
-\x14\xc1\x14\x14\x14\x14\xaf\x14\x15\x02\x58\x16\x08\x40\x08\x08\
-\x7d\x09\x06\x06\x08\x01\x58\x06\x14\xfb\xf6\x15\x14\x00\x00\x00\
-\x01\x00\x62\x00\x00\x03\x93\x05\x1f\x00\x32\x00\x00\x01\x32\x16\
-\x15\x14\x07\x06\x07\x06\x07\x06\x1d\x01\x14\x33\x21\x32\x1d\x01\
-\x14\x23\x21\x22\x3d\x01\x34\x37\x36\x37\x36\x37\x36\x35\x34\x26\
-\x2b\x01\x22\x07\x06\x07\x06\x23\x30\x2f\x01\x26\x35\x34\x36\x33\
-\x02\x16\xac\xd1\x56\x41\xb1\x76\x27\x3a\x15\x01\xe7\x15\x15\xfd\
-\x2d\x14\x5a\x50\xba\x67\x25\x31\x58\x3c\x4a\x47\x2b\x06\x17\x0a\
-\x08\x0d\xb0\x0c\xbc\xae\x05\x1f\xc7\xa4\x91\x67\x4d\x6f\x4a\x29\
-\x3d\x50\x14\x15\x14\xaf\x14\x14\xec\x9c\x72\x67\x6c\x3c\x27\x31\
-\x3f\x3e\x56\x42\x0a\x27\x14\x04\x5a\x06\x08\x31\xc1\x00\x00\x00\
-\x01\x00\x62\xff\xec\x03\x85\x05\x1f\x00\x42\x00\x00\x01\x14\x06\
-\x2b\x01\x22\x26\x35\x34\x3f\x01\x36\x33\x32\x17\x16\x3b\x01\x32\
-\x36\x3d\x01\x34\x26\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x36\x3d\
-\x01\x34\x26\x2b\x01\x22\x07\x06\x07\x06\x23\x30\x2f\x01\x26\x35\
-\x34\x36\x3b\x01\x32\x16\x1d\x01\x14\x07\x06\x35\x34\x17\x16\x15\
-\x03\x85\xcf\xb0\x3a\xae\xba\x0c\xb3\x04\x06\x0a\x1f\x25\x51\x3a\
-\x3b\x58\x54\x3f\xb8\x15\x15\xb8\x3b\x58\x58\x3b\x3a\x47\x2b\x06\
-\x17\x0a\x08\x0d\xb0\x0c\xbc\xae\x3a\xb0\xcf\x31\x46\x42\x35\x01\
-\x66\xae\xcc\xbe\x37\x08\x07\x58\x02\x3e\x49\x56\x3d\x46\x3d\x54\
-\x15\xae\x14\x56\x3e\x1c\x3e\x56\x42\x0a\x27\x14\x04\x5a\x06\x08\
-\x31\xc1\xcf\xb0\x1d\x4e\x41\x5e\x02\x06\x5f\x4b\x52\x00\x00\x00\
-\x02\x00\x35\x00\x00\x03\xdb\x05\x0a\x00\x1c\x00\x29\x00\x00\x01\
-\x14\x2b\x01\x22\x1d\x01\x14\x2b\x01\x22\x3d\x01\x34\x23\x21\x22\
-\x3d\x01\x01\x33\x32\x15\x11\x14\x3b\x01\x32\x15\x25\x11\x34\x23\
-\x22\x07\x03\x06\x15\x14\x3b\x01\x32\x03\xdb\x15\x85\x14\x15\xc2\
-\x15\x14\xfe\x1c\x14\x02\x27\xbc\x15\x14\x85\x15\xfe\x66\x12\x0a\
-\x09\xd3\x06\x17\xd3\x14\x01\x2f\x14\x15\xf2\x14\x14\xf2\x15\x14\
-\xae\x03\x2d\x14\xfd\x10\x14\x15\x29\x01\x3e\x18\x0c\xfe\xc2\x0a\
-\x06\x10\x00\x00\x01\x00\x85\xff\xec\x03\xa4\x05\x0a\x00\x2e\x00\
-\x00\x01\x14\x06\x2b\x01\x22\x26\x35\x34\x3f\x01\x36\x33\x32\x17\
-\x16\x3b\x01\x32\x36\x3d\x01\x34\x26\x23\x21\x22\x35\x11\x34\x33\
-\x21\x32\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x3b\x01\x32\x16\x15\
-\x03\xa4\xcd\xb0\x3c\xb0\xb6\x0c\xb0\x05\x06\x0a\x06\x2f\x60\x3c\
-\x3d\x54\x54\x3d\xfe\xaa\x15\x15\x02\xaa\x14\x14\xfe\x41\x14\x14\
-\x6b\xb0\xcd\x01\x66\xb0\xca\xbe\x37\x08\x07\x58\x02\x0f\x78\x54\
-\x3f\x46\x3d\x54\x15\x02\xb4\x14\x14\xae\x15\x14\xfe\xfa\x15\xcb\
-\xae\x00\x00\x00\x02\x00\x6c\xff\xec\x03\xa5\x05\x1f\x00\x29\x00\
-\x39\x00\x00\x01\x14\x06\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\
-\x32\x17\x16\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\x26\x2b\x01\
-\x22\x06\x1d\x01\x14\x33\x32\x36\x3b\x01\x32\x16\x15\x07\x35\x34\
-\x26\x2b\x01\x22\x06\x1d\x01\x14\x16\x3b\x01\x32\x36\x03\xa5\xd1\
-\xae\x3d\xac\xd1\xd1\xac\x3d\x8c\x5e\x35\x2b\x23\x0c\xb3\x04\x06\
-\x0a\x10\x38\x52\x3d\x3e\x53\x0e\x08\x64\x2b\x3e\x9e\xcc\xeb\x56\
-\x3e\x3d\x3e\x53\x53\x3e\x3d\x3e\x56\x01\x56\xa4\xc6\xc6\xa4\x02\
-\x5e\xa4\xc7\x44\x27\x3d\x33\x17\x0a\x06\x56\x02\x1e\x65\x54\x40\
-\xba\x17\x2b\xcc\x9e\x4e\x4e\x3b\x58\x54\x3f\x4e\x3f\x54\x56\x00\
-\x01\x00\x9d\x00\x00\x03\x97\x05\x0a\x00\x23\x00\x00\x01\x14\x07\
-\x06\x07\x06\x07\x06\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x37\x36\
-\x37\x36\x37\x36\x3d\x01\x34\x23\x21\x22\x3d\x01\x34\x33\x21\x32\
-\x15\x03\x97\x50\x3d\xa4\x67\x20\x32\x14\xc1\x14\x43\x3a\x8b\x81\
-\x21\x3f\x14\xfe\x18\x14\x14\x02\xd1\x15\x04\x0a\x9d\x6f\x56\x71\
-\x45\x25\x35\x42\xfe\xbe\x14\x14\x01\x42\x87\x62\x52\x63\x5a\x23\
-\x41\x58\x15\x14\x15\xae\x14\x14\x00\x00\x00\x00\x03\x00\x6c\xff\
-\xec\x03\xa1\x05\x1f\x00\x21\x00\x31\x00\x41\x00\x00\x01\x14\x06\
-\x2b\x01\x22\x26\x3d\x01\x34\x37\x36\x15\x30\x27\x26\x3d\x01\x34\
-\x36\x3b\x01\x32\x16\x1d\x01\x14\x07\x06\x31\x34\x17\x16\x15\x03\
-\x35\x34\x26\x2b\x01\x22\x06\x1d\x01\x14\x16\x3b\x01\x32\x36\x11\
-\x35\x34\x26\x2b\x01\x22\x06\x1d\x01\x14\x16\x3b\x01\x32\x36\x03\
-\xa1\xcf\xae\x3b\xb0\xcd\x33\x42\x46\x2f\xcd\xb0\x3b\xae\xcf\x2f\
-\x45\x41\x33\xeb\x54\x3e\x3b\x3e\x56\x56\x3e\x3b\x3e\x54\x54\x3e\
-\x3b\x40\x54\x56\x3e\x3b\x3e\x54\x01\x66\xae\xcc\xca\xb0\x32\x51\
-\x4a\x5e\x04\x5f\x3f\x4e\x27\xb0\xcf\xd1\xae\x27\x4e\x3f\x5f\x04\
-\x5e\x4a\x51\x01\xf5\x27\x40\x54\x56\x3e\x27\x3d\x56\x54\xfe\x08\
-\x3b\x3e\x54\x54\x3e\x3b\x3d\x56\x54\x00\x00\x00\x02\x00\x6c\xff\
-\xec\x03\xa5\x05\x1f\x00\x25\x00\x35\x00\x00\x01\x14\x06\x2b\x01\
-\x22\x26\x35\x34\x3f\x01\x36\x33\x32\x16\x3b\x01\x32\x36\x3d\x01\
-\x34\x23\x22\x06\x2b\x01\x22\x26\x3d\x01\x34\x36\x3b\x01\x32\x16\
-\x15\x07\x35\x34\x26\x2b\x01\x22\x06\x1d\x01\x14\x16\x3b\x01\x32\
-\x36\x03\xa5\xd1\xae\x3d\xac\xba\x0c\xb0\x04\x06\x08\x44\x54\x3d\
-\x3e\x56\x0f\x06\x64\x2d\x3e\x9d\xcd\xd1\xac\x3d\xae\xd1\xeb\x56\
-\x3e\x3d\x3e\x53\x51\x40\x3d\x40\x54\x01\x56\xa4\xc6\xbe\x37\x08\
-\x07\x58\x02\x87\x56\x3d\x75\x16\x29\xcb\x9e\x93\xa4\xc7\xc7\xa4\
-\x93\x93\x3e\x56\x54\x40\x93\x40\x52\x54\x00\x00\x02\x00\x62\xff\
-\xec\x01\x74\x03\x0e\x00\x0b\x00\x17\x00\x00\x01\x14\x06\x23\x22\
-\x26\x35\x34\x36\x33\x32\x16\x11\x14\x06\x23\x22\x26\x35\x34\x36\
-\x33\x32\x16\x01\x74\x51\x38\x39\x50\x50\x39\x38\x51\x51\x38\x39\
-\x50\x50\x39\x38\x51\x02\x85\x39\x50\x50\x39\x37\x52\x52\xfd\xb9\
-\x38\x51\x51\x38\x39\x50\x52\x00\x02\x00\x45\xfe\xfa\x01\x74\x03\
-\x0e\x00\x0b\x00\x25\x00\x00\x01\x14\x06\x23\x22\x26\x35\x34\x36\
-\x33\x32\x16\x11\x14\x07\x06\x07\x06\x23\x22\x2f\x01\x26\x35\x30\
-\x36\x35\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x15\x01\x74\x52\
-\x37\x39\x50\x50\x39\x37\x52\x3d\x25\x3c\x31\x14\x0a\x07\x37\x04\
-\x5c\x14\x17\x14\x14\xea\x14\x02\x85\x39\x50\x50\x39\x37\x52\x52\
-\xfd\xa8\x8c\x5d\x35\x2b\x21\x0b\x6c\x08\x04\x58\x33\x17\x14\xc7\
-\x14\x14\x00\x00\x01\x00\x78\x00\x1f\x03\x6e\x03\xcb\x00\x1c\x00\
-\x00\x01\x16\x15\x14\x07\x01\x06\x15\x14\x17\x01\x16\x15\x14\x0f\
-\x01\x06\x23\x22\x27\x01\x27\x35\x37\x01\x36\x33\x32\x17\x03\x6a\
-\x04\x0d\xfe\x05\x0f\x0f\x01\xf9\x0d\x04\x44\x06\x0a\x06\x07\xfd\
-\x7b\x0a\x0a\x02\x85\x07\x04\x0a\x08\x03\x4c\x06\x07\x0a\x06\xfe\
-\xd9\x08\x0a\x0a\x09\xfe\xde\x07\x0a\x04\x08\x79\x0c\x04\x01\x79\
-\x12\x8d\x13\x01\x79\x04\x0d\x00\x02\x00\x4f\x00\xec\x03\xbe\x02\
-\xfa\x00\x0b\x00\x17\x00\x00\x01\x14\x23\x21\x22\x3d\x01\x34\x33\
-\x21\x32\x15\x11\x14\x23\x21\x22\x3d\x01\x34\x33\x21\x32\x15\x03\
-\xbe\x15\xfc\xba\x14\x14\x03\x46\x15\x15\xfc\xba\x14\x14\x03\x46\
-\x15\x02\x5e\x14\x14\x87\x15\x15\xfe\x1b\x14\x14\x85\x15\x15\x00\
-\x01\x00\xa3\x00\x1f\x03\x95\x03\xcb\x00\x1c\x00\x00\x01\x07\x01\
-\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x01\x36\x35\x34\x27\x01\x26\
-\x35\x34\x3f\x01\x36\x33\x32\x17\x01\x17\x03\x95\x0b\xfd\x7f\x06\
-\x06\x0a\x06\x46\x04\x0c\x01\xf8\x0e\x0e\xfe\x08\x0c\x04\x46\x08\
-\x08\x06\x06\x02\x81\x0b\x01\xae\x12\xfe\x87\x04\x0c\x79\x06\x06\
-\x0a\x07\x01\x22\x0b\x08\x08\x0a\x01\x27\x08\x08\x07\x06\x72\x0d\
-\x04\xfe\x87\x13\x00\x00\x00\x00\x02\x00\x68\xff\xec\x03\x99\x05\
-\x1f\x00\x29\x00\x35\x00\x00\x01\x32\x16\x15\x14\x07\x06\x07\x06\
-\x15\x14\x16\x15\x14\x2b\x01\x22\x35\x34\x37\x36\x37\x36\x35\x34\
-\x26\x2b\x01\x22\x07\x06\x07\x06\x23\x30\x2f\x01\x26\x35\x34\x36\
-\x33\x13\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x02\x1c\xac\
-\xd1\xb8\x7b\x10\x36\x0d\x15\xc2\x21\xb8\x77\x14\x36\x54\x3e\x4a\
-\x47\x2b\x06\x17\x0a\x08\x0d\xb0\x0c\xbc\xae\x84\x50\x3a\x39\x50\
-\x52\x37\x38\x52\x05\x1f\xc9\xa2\xe1\x5a\x3c\x0e\x25\x3b\x15\x3b\
-\x0a\x15\x8c\xae\x60\x3d\x11\x29\x43\x40\x54\x42\x0a\x27\x14\x04\
-\x5a\x06\x08\x31\xc1\xfb\x56\x38\x51\x51\x38\x39\x50\x50\x00\x00\
-\x02\x00\xa7\x00\x00\x05\x01\x05\x0a\x00\x3c\x00\x4a\x00\x00\x01\
-\x23\x22\x2f\x01\x06\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x17\x33\
-\x36\x3b\x01\x32\x15\x11\x14\x3b\x01\x32\x35\x11\x34\x26\x23\x21\
-\x22\x06\x15\x11\x14\x16\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x26\
-\x35\x11\x34\x36\x33\x21\x32\x16\x15\x11\x14\x06\x01\x34\x26\x23\
-\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x35\x04\x2c\x18\x50\x48\x0c\
-\x56\x54\x75\x93\x95\x6f\x2b\x49\x0f\x02\x18\x69\x1e\x30\x16\x2f\
-\x77\x64\xfe\xa8\x64\x79\x77\x66\x02\x0e\x1f\x1f\xfd\xf2\xae\xd3\
-\xd3\xae\x01\x58\xae\xd3\x75\xfe\xb9\x44\x2f\x2f\x40\x40\x2f\x2f\
-\x44\x01\x35\x35\x03\x38\x92\x74\x9e\x73\x91\x16\x16\x1c\xfe\x47\
-\x31\x31\x01\x94\x5c\x6c\x6e\x5a\xfd\xd3\x5d\x6c\x1f\x68\x1f\xc9\
-\xa6\x02\x2d\xa6\xc8\xcb\xa3\xfe\x62\x5a\x6f\x01\x94\x2d\x43\x41\
-\x2f\x81\x2f\x42\x44\x2d\x00\x00\x02\xff\xf0\x00\x00\x03\xaa\x05\
-\x0a\x00\x1b\x00\x2f\x00\x00\x25\x34\x17\x14\x2b\x01\x22\x2f\x01\
-\x26\x23\x21\x22\x0f\x01\x06\x2b\x01\x22\x35\x36\x15\x01\x36\x3b\
-\x01\x32\x17\x11\x03\x26\x27\x23\x06\x07\x03\x14\x15\x06\x15\x14\
-\x3b\x01\x32\x35\x34\x35\x26\x03\xa8\x02\x16\xcf\x10\x04\x3e\x04\
-\x10\xfe\xdb\x11\x04\x3d\x04\x11\xcc\x17\x03\x01\x7c\x04\x10\x94\
-\x10\x04\x43\x04\x13\x06\x08\x10\x46\x02\x16\x96\x16\x02\x1b\x04\
-\x0d\x12\x0e\xd7\x0d\x0d\xd7\x0e\x12\x0b\x02\x04\xe1\x0e\x0e\xfc\
-\xe7\x01\x0f\x0c\x64\x25\x4b\xfe\xf1\x02\x02\x02\x02\x12\x12\x02\
-\x02\x02\x00\x00\x03\x00\x89\x00\x00\x03\xe7\x05\x0a\x00\x16\x00\
-\x24\x00\x32\x00\x00\x01\x14\x06\x23\x21\x22\x35\x11\x34\x33\x21\
-\x32\x16\x1d\x01\x14\x07\x06\x31\x34\x17\x16\x15\x03\x35\x34\x26\
-\x2b\x01\x22\x15\x11\x14\x3b\x01\x32\x36\x11\x35\x34\x26\x2b\x01\
-\x22\x15\x11\x14\x3b\x01\x32\x36\x03\xe7\xcd\xb0\xfe\x33\x14\x14\
-\x01\xcd\xb0\xcd\x2d\x48\x44\x31\xe9\x58\x3c\xe1\x14\x14\xe1\x3c\
-\x58\x54\x40\xe1\x14\x14\xe1\x3e\x56\x01\x79\xae\xcb\x14\x04\xe2\
-\x14\xcd\xb0\x14\x4e\x3d\x61\x06\x62\x48\x51\x01\xf5\x13\x3b\x58\
-\x14\xfe\xef\x14\x56\xfe\x1a\x27\x3e\x54\x15\xfe\xde\x15\x56\x00\
-\x01\x00\x6c\xff\xec\x03\xb8\x05\x1f\x00\x2d\x00\x00\x25\x16\x15\
-\x14\x07\x06\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\x32\x17\x16\
-\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\x26\x2b\x01\x22\x06\x15\
-\x11\x14\x16\x3b\x01\x32\x37\x36\x33\x32\x17\x03\xab\x0d\x63\x5c\
-\xac\x64\xac\xd1\xd1\xac\x64\x8c\x5c\x37\x29\x23\x0d\xb2\x04\x06\
-\x0a\x13\x35\x50\x64\x3e\x56\x56\x3e\x64\x50\x33\x15\x0a\x06\x04\
-\xf2\x06\x0b\x31\x66\x5e\xc6\xa4\x02\x5e\xa4\xc7\x44\x29\x3b\x33\
-\x17\x0a\x06\x58\x02\x22\x63\x56\x3e\xfd\xa2\x3d\x56\x62\x27\x02\
-\x00\x00\x00\x00\x02\x00\x89\x00\x00\x03\xe7\x05\x0a\x00\x0d\x00\
-\x1b\x00\x00\x01\x14\x06\x23\x21\x22\x35\x11\x34\x33\x21\x32\x16\
-\x15\x03\x11\x34\x26\x2b\x01\x22\x15\x11\x14\x3b\x01\x32\x36\x03\
-\xe7\xcd\xb0\xfe\x33\x14\x14\x01\xcd\xb0\xcd\xe9\x58\x3c\xe1\x14\
-\x14\xe1\x3e\x56\x01\x7d\xae\xcf\x14\x04\xe2\x14\xcd\xb0\xfd\xdd\
-\x02\x36\x3b\x58\x14\xfc\xcd\x15\x56\x00\x00\x00\x01\x00\x89\x00\
-\x00\x03\x85\x05\x0a\x00\x23\x00\x00\x25\x14\x23\x21\x22\x35\x11\
-\x34\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x33\x21\x32\
-\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x33\x21\x32\x15\x03\x85\x15\
-\xfd\x2d\x14\x14\x02\xd3\x15\x15\xfe\x19\x14\x14\x01\x8f\x15\x15\
-\xfe\x71\x14\x14\x01\xe7\x15\x14\x14\x14\x04\xe2\x14\x14\xae\x15\
-\x14\xfe\xef\x14\x15\xae\x14\x15\xfe\xde\x15\x14\x00\x00\x00\x00\
-\x01\x00\x89\x00\x00\x03\x85\x05\x0a\x00\x1d\x00\x00\x01\x14\x23\
-\x21\x22\x15\x11\x14\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x15\x11\
-\x14\x2b\x01\x22\x35\x11\x34\x33\x21\x32\x15\x03\x85\x15\xfe\x19\
-\x14\x14\x01\x8f\x15\x15\xfe\x71\x14\x15\xc3\x14\x14\x02\xd3\x15\
-\x04\x48\x15\x14\xfe\xef\x14\x15\xae\x14\x15\xfe\x06\x14\x14\x04\
-\xe2\x14\x14\x00\x01\x00\x6c\xff\xec\x03\xdb\x05\x1f\x00\x33\x00\
-\x00\x01\x32\x17\x16\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\x26\
-\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\x01\x32\x36\x3d\x01\x34\x2b\
-\x01\x22\x3d\x01\x34\x33\x21\x32\x15\x11\x14\x06\x2b\x01\x22\x26\
-\x35\x11\x34\x36\x33\x02\x70\x8b\x5f\x35\x29\x23\x0d\xb2\x04\x06\
-\x0a\x13\x35\x50\x87\x3e\x56\x56\x3e\x64\x3e\x54\x15\xc0\x15\x15\
-\x01\xac\x14\xd1\xac\x64\xac\xd1\xd1\xac\x05\x1f\x44\x27\x3b\x35\
-\x17\x0a\x06\x58\x02\x22\x63\x56\x3e\xfd\xa2\x3d\x56\x54\x3f\x60\
-\x15\x14\xae\x15\x15\xfe\xc9\xa4\xc6\xc6\xa4\x02\x5e\xa4\xc7\x00\
-\x01\x00\x89\x00\x00\x04\x04\x05\x0a\x00\x23\x00\x00\x25\x14\x2b\
-\x01\x22\x35\x11\x34\x23\x21\x22\x15\x11\x14\x2b\x01\x22\x35\x11\
-\x34\x3b\x01\x32\x15\x11\x14\x33\x21\x32\x35\x11\x34\x3b\x01\x32\
-\x15\x04\x04\x15\xc0\x15\x14\xfe\x83\x14\x15\xc3\x14\x14\xc3\x15\
-\x14\x01\x7d\x14\x15\xc0\x15\x14\x14\x14\x01\xfa\x15\x15\xfe\x06\
-\x14\x14\x04\xe2\x14\x14\xfe\x18\x14\x14\x01\xe8\x14\x14\x00\x00\
-\x01\x00\x89\x00\x00\x01\x75\x05\x0a\x00\x0b\x00\x00\x25\x14\x2b\
-\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x01\x75\x15\xc3\x14\x14\xc3\
-\x15\x14\x14\x14\x04\xe2\x14\x14\x00\x00\x00\x00\x01\x00\x06\xff\
-\xec\x02\xf2\x05\x0a\x00\x1c\x00\x00\x01\x14\x07\x06\x23\x22\x27\
-\x26\x27\x26\x35\x34\x3f\x01\x36\x37\x32\x17\x16\x33\x32\x36\x35\
-\x11\x34\x3b\x01\x32\x15\x02\xf2\x71\x67\xa5\x44\x68\x59\x37\x33\
-\x0c\xb7\x04\x06\x0a\x12\x32\x54\x3d\x54\x14\xc3\x15\x01\x6a\x97\
-\x79\x6e\x24\x32\x3f\x39\x25\x0d\x06\x56\x02\x02\x27\x62\x56\x3d\
-\x03\xa0\x14\x14\x00\x00\x00\x00\x01\x00\x89\x00\x00\x04\x41\x05\
-\x0a\x00\x29\x00\x00\x25\x16\x15\x14\x2b\x01\x27\x01\x26\x23\x22\
-\x0f\x01\x11\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\
-\x33\x32\x37\x01\x37\x33\x32\x15\x14\x07\x01\x06\x15\x14\x17\x04\
-\x3d\x04\x16\xf0\x10\xfe\xbe\x08\x08\x0c\x07\x51\x15\xc3\x14\x14\
-\xc3\x15\x12\x08\x0a\x01\x6d\x10\xec\x16\x06\xfe\x73\x04\x04\x1f\
-\x08\x07\x10\x0a\x02\x02\x0d\x09\x6c\xfe\x70\x14\x14\x04\xe2\x14\
-\x14\xfe\x39\x18\x0c\x01\xdf\x08\x10\x06\x0b\xfe\x15\x08\x02\x04\
-\x09\x00\x00\x00\x01\x00\x89\x00\x00\x03\x85\x05\x0a\x00\x11\x00\
-\x00\x25\x14\x23\x21\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x33\
-\x21\x32\x15\x03\x85\x15\xfd\x2d\x14\x14\xc3\x15\x14\x01\xe7\x15\
-\x14\x14\x14\x04\xe2\x14\x14\xfb\xf6\x15\x14\x00\x01\x00\x89\x00\
-\x00\x04\x8d\x05\x0a\x00\x20\x00\x00\x25\x14\x2b\x01\x22\x35\x13\
-\x03\x06\x2b\x01\x22\x27\x03\x13\x14\x2b\x01\x22\x35\x11\x34\x3b\
-\x01\x16\x17\x09\x01\x36\x37\x33\x32\x15\x04\x8d\x14\xbd\x14\x12\
-\xe7\x0d\x06\x68\x0c\x07\xe7\x12\x14\xbf\x14\x14\xb1\x0a\x08\x01\
-\x2b\x01\x2b\x0a\x08\xb1\x14\x14\x14\x14\x03\x1f\xfd\x89\x0c\x0c\
-\x02\x77\xfc\xe1\x14\x14\x04\xe2\x14\x02\x0a\xfc\xd5\x03\x2b\x0a\
-\x02\x14\x00\x00\x01\x00\x89\x00\x00\x03\xdb\x05\x0a\x00\x17\x00\
-\x00\x25\x14\x2b\x01\x27\x01\x13\x14\x2b\x01\x22\x35\x11\x34\x3b\
-\x01\x17\x01\x03\x34\x3b\x01\x32\x15\x03\xdb\x15\xaa\x12\xfe\x5c\
-\x04\x0e\xbf\x14\x14\xad\x12\x01\xa2\x04\x10\xbc\x15\x14\x14\x0a\
-\x03\x38\xfc\xd2\x14\x14\x04\xe2\x14\x0a\xfc\xc1\x03\x35\x14\x14\
-\x00\x00\x00\x00\x02\x00\x6c\xff\xec\x03\xca\x05\x1f\x00\x0f\x00\
-\x1f\x00\x00\x01\x14\x06\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\
-\x32\x16\x15\x03\x11\x34\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\
-\x01\x32\x36\x03\xca\xd1\xac\x64\xac\xd1\xd1\xac\x64\xac\xd1\xeb\
-\x54\x3e\x64\x3e\x56\x56\x3e\x64\x3e\x54\x01\x56\xa4\xc6\xc6\xa4\
-\x02\x5e\xa4\xc7\xc7\xa4\xfd\xa2\x02\x5e\x40\x54\x56\x3e\xfd\xa2\
-\x3d\x56\x54\x00\x02\x00\x89\x00\x00\x03\xbe\x05\x0a\x00\x12\x00\
-\x20\x00\x00\x01\x32\x16\x15\x14\x06\x2b\x01\x22\x15\x11\x14\x2b\
-\x01\x22\x35\x11\x34\x33\x01\x35\x34\x26\x2b\x01\x22\x15\x11\x14\
-\x3b\x01\x32\x36\x02\x41\xae\xcf\xd3\xaa\xb8\x14\x15\xc3\x14\x14\
-\x02\x38\x56\x3e\xb8\x14\x14\xb8\x3e\x56\x05\x0a\xcf\xae\x9f\xcb\
-\x15\xfe\x06\x14\x14\x04\xe2\x14\xfe\x83\x13\x3b\x58\x14\xfe\xef\
-\x14\x56\x00\x00\x02\x00\x6c\xff\x50\x03\xca\x05\x1f\x00\x1c\x00\
-\x36\x00\x00\x01\x14\x06\x07\x06\x07\x06\x1d\x01\x14\x2b\x01\x22\
-\x3d\x01\x34\x27\x26\x27\x26\x35\x11\x34\x36\x3b\x01\x32\x16\x15\
-\x03\x11\x34\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x33\x32\x3f\x01\
-\x36\x3b\x01\x32\x1f\x01\x16\x33\x32\x36\x03\xca\x64\x50\x1d\x49\
-\x29\x15\xae\x14\x2d\x44\x23\xb0\xd1\xac\x64\xac\xd1\xeb\x54\x3e\
-\x64\x3e\x56\x38\x1a\x0b\x06\x1a\x04\x11\x68\x13\x02\x1a\x05\x0c\
-\x16\x3a\x01\x56\x6d\xac\x22\x0d\x12\x0a\x14\x79\x15\x15\x79\x10\
-\x0a\x0e\x15\x62\xd9\x02\x5e\xa4\xc7\xc7\xa4\xfd\xa2\x02\x5e\x40\
-\x54\x56\x3e\xfd\xa2\x2f\x4e\x10\x52\x0f\x0f\x56\x10\x50\x00\x00\
-\x02\x00\x89\x00\x00\x03\xfe\x05\x0a\x00\x21\x00\x2f\x00\x00\x25\
-\x16\x15\x14\x2b\x01\x22\x27\x03\x27\x23\x22\x15\x11\x14\x2b\x01\
-\x22\x35\x11\x34\x33\x21\x32\x16\x1d\x01\x14\x07\x06\x07\x06\x1d\
-\x01\x03\x35\x34\x26\x2b\x01\x22\x15\x11\x14\x3b\x01\x32\x36\x03\
-\xfc\x02\x15\xd3\x0a\x08\xb4\x11\xb6\x14\x15\xc3\x14\x14\x01\xcd\
-\xb0\xcd\x5a\x0e\x29\x1d\x3b\x58\x3c\xe1\x14\x14\xe1\x3c\x58\x1b\
-\x04\x07\x10\x0e\x02\x09\x0c\x15\xfe\x06\x14\x14\x04\xe2\x14\xcd\
-\xb0\x14\x7f\x5c\x0f\x1e\x17\x0a\x02\x01\x3f\x13\x3b\x58\x14\xfe\
-\xef\x14\x56\x00\x01\x00\x26\xff\xec\x03\x5d\x05\x1f\x00\x3a\x00\
-\x00\x01\x22\x06\x15\x14\x17\x16\x17\x16\x17\x16\x15\x14\x06\x2b\
-\x01\x22\x26\x35\x34\x3f\x01\x36\x33\x32\x17\x16\x3b\x01\x32\x36\
-\x35\x34\x27\x26\x27\x26\x27\x26\x35\x34\x36\x3b\x01\x32\x17\x16\
-\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\x26\x23\x01\xc2\x3e\x56\
-\x42\x16\x96\xaa\x49\x4e\xd1\xac\x52\xac\xbc\x0c\xb2\x05\x06\x08\
-\x1f\x24\x54\x52\x3c\x58\x3c\x22\x7d\xb7\x47\x56\xd1\xac\x1e\x8c\
-\x5e\x35\x2b\x23\x0c\xb3\x04\x06\x08\x12\x3e\x4c\x04\x48\x56\x3e\
-\x3f\x2b\x11\x43\x4e\x5c\x63\x93\xa4\xc6\xc0\x35\x08\x07\x58\x02\
-\x3e\x49\x56\x3d\x46\x2f\x1a\x3c\x58\x4e\x5e\x8f\xa4\xc7\x44\x27\
-\x3d\x33\x17\x0a\x06\x58\x02\x1e\x67\x00\x00\x00\x01\x00\x1e\x00\
-\x00\x03\x18\x05\x0a\x00\x17\x00\x00\x01\x14\x2b\x01\x22\x15\x11\
-\x14\x2b\x01\x22\x35\x11\x34\x2b\x01\x22\x3d\x01\x34\x33\x21\x32\
-\x15\x03\x18\x15\xdf\x14\x15\xc0\x15\x14\xe0\x14\x14\x02\xd1\x15\
-\x04\x48\x15\x14\xfb\xf5\x14\x14\x04\x0b\x14\x15\xae\x14\x14\x00\
-\x01\x00\x6c\xff\xec\x03\xca\x05\x0a\x00\x1b\x00\x00\x01\x14\x06\
-\x2b\x01\x22\x26\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x16\x3b\x01\
-\x32\x36\x35\x11\x34\x3b\x01\x32\x15\x03\xca\xd1\xac\x64\xac\xd1\
-\x14\xc1\x14\x56\x3e\x64\x3e\x54\x14\xc3\x14\x01\x56\xa4\xc6\xc6\
-\xa4\x03\xa0\x14\x14\xfc\x60\x3d\x56\x54\x3f\x03\xa0\x14\x14\x00\
-\x01\xff\xf0\x00\x00\x03\xaa\x05\x0a\x00\x1a\x00\x00\x09\x01\x06\
-\x2b\x01\x22\x27\x01\x34\x27\x34\x35\x34\x3b\x01\x32\x17\x1b\x01\
-\x36\x3b\x01\x32\x15\x14\x15\x06\x03\xa8\xfe\x83\x02\x12\x94\x10\
-\x04\xfe\x84\x03\x17\xcc\x11\x04\xe9\xe0\x04\x10\xcf\x16\x02\x04\
-\xf0\xfb\x1e\x0e\x0e\x04\xe2\x02\x02\x02\x02\x12\x0e\xfc\xc0\x03\
-\x40\x0e\x12\x02\x02\x02\x00\x00\x01\x00\x04\x00\x00\x05\x3d\x05\
-\x0e\x00\x28\x00\x00\x09\x01\x06\x2b\x01\x22\x27\x0b\x01\x06\x2b\
-\x01\x22\x27\x01\x34\x35\x26\x35\x34\x3b\x01\x32\x17\x1b\x01\x36\
-\x3b\x01\x32\x17\x1b\x01\x36\x3b\x01\x32\x15\x14\x15\x06\x05\x3b\
-\xfe\xf2\x04\x11\x95\x10\x05\xce\xcd\x04\x11\x95\x11\x04\xfe\xf2\
-\x02\x17\xd0\x13\x02\x95\xc3\x04\x10\x67\x10\x04\xc3\x97\x02\x13\
-\xd1\x16\x02\x04\xf2\xfb\x1e\x10\x0e\x03\x2b\xfc\xd5\x0e\x10\x04\
-\xe2\x02\x02\x02\x02\x10\x10\xfc\xbe\x03\x48\x0e\x0e\xfc\xb8\x03\
-\x42\x10\x10\x02\x02\x02\x00\x00\x01\x00\x02\x00\x00\x03\xaa\x05\
-\x0a\x00\x2c\x00\x00\x25\x16\x15\x14\x2b\x01\x22\x27\x03\x26\x23\
-\x22\x07\x03\x07\x23\x22\x35\x34\x37\x01\x35\x01\x26\x35\x34\x3b\
-\x01\x32\x17\x13\x16\x33\x32\x37\x13\x36\x37\x33\x32\x15\x14\x07\
-\x01\x15\x03\xa6\x04\x17\xe9\x0c\x06\xaf\x06\x0c\x0c\x06\xb5\x12\
-\xe5\x17\x04\x01\x33\xfe\xcd\x04\x17\xe3\x06\x0c\xb7\x06\x0c\x0c\
-\x06\xb1\x02\x10\xe7\x17\x04\xfe\xcf\x1d\x09\x04\x10\x0c\x01\x73\
-\x0e\x0e\xfe\x8d\x0c\x10\x02\x0d\x02\x5e\x12\x02\x5d\x0c\x02\x10\
-\x0c\xfe\x87\x0e\x0e\x01\x79\x06\x06\x10\x04\x08\xfd\x9f\x10\x00\
-\x01\xff\xec\x00\x00\x03\xad\x05\x0a\x00\x1a\x00\x00\x09\x01\x11\
-\x14\x2b\x01\x22\x35\x11\x01\x26\x35\x34\x3b\x01\x17\x13\x16\x33\
-\x32\x37\x13\x37\x33\x32\x15\x14\x03\xa8\xfe\x9a\x14\xc3\x15\xfe\
-\x9b\x05\x17\xe3\x12\xc3\x06\x0c\x0d\x06\xc2\x13\xe1\x17\x04\xec\
-\xfd\x60\xfd\xc8\x14\x14\x02\x38\x02\xa0\x0c\x02\x10\x0c\xfe\x6f\
-\x0f\x0f\x01\x91\x0c\x10\x02\x00\x01\x00\x14\x00\x00\x03\x47\x05\
-\x0a\x00\x1f\x00\x00\x09\x01\x06\x15\x14\x33\x21\x32\x1d\x01\x14\
-\x23\x21\x22\x35\x34\x37\x01\x36\x35\x34\x23\x21\x22\x3d\x01\x34\
-\x33\x21\x32\x15\x14\x03\x43\xfe\x35\x04\x17\x01\xa0\x14\x14\xfd\
-\x00\x17\x04\x01\xc9\x04\x17\xfe\x8c\x15\x15\x02\xd7\x16\x04\xee\
-\xfc\x06\x08\x05\x10\x14\xaf\x14\x10\x04\x09\x03\xfa\x08\x04\x10\
-\x15\xae\x14\x10\x04\x00\x00\x00\x01\x00\xa7\xfe\xa0\x02\x41\x05\
-\xcd\x00\x17\x00\x00\x01\x14\x23\x21\x22\x35\x11\x34\x33\x21\x32\
-\x1d\x01\x14\x2b\x01\x22\x15\x11\x14\x3b\x01\x32\x15\x02\x41\x15\
-\xfe\x8f\x14\x14\x01\x71\x15\x15\x87\x15\x15\x87\x15\xfe\xb5\x15\
-\x15\x07\x03\x15\x15\xae\x14\x15\xfa\xab\x15\x14\x00\x00\x00\x00\
-\x01\xff\xf0\x00\x00\x02\xb5\x05\x0a\x00\x0f\x00\x00\x25\x16\x15\
-\x14\x2b\x01\x26\x27\x01\x26\x35\x34\x3b\x01\x16\x17\x02\xb1\x04\
-\x17\x81\x0e\x04\xfd\xea\x05\x17\x81\x10\x02\x1d\x0b\x02\x10\x02\
-\x0a\x04\xe2\x0a\x02\x10\x06\x06\x00\x00\x00\x00\x01\x00\xa7\xfe\
-\xa0\x02\x41\x05\xcd\x00\x17\x00\x00\x01\x14\x23\x21\x22\x3d\x01\
-\x34\x3b\x01\x32\x35\x11\x34\x2b\x01\x22\x3d\x01\x34\x33\x21\x32\
-\x15\x02\x41\x15\xfe\x8f\x14\x14\x86\x14\x14\x86\x14\x14\x01\x71\
-\x15\xfe\xb5\x15\x15\xae\x14\x15\x05\x55\x15\x14\xae\x15\x15\x00\
-\x04\x00\x3b\x00\x00\x05\xb8\x05\x1f\x00\x0b\x00\x17\x00\x54\x00\
-\x63\x00\x00\x01\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x03\
-\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x01\x14\x2b\x01\x22\
-\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x23\x21\x22\x15\x11\x14\x2b\
-\x01\x22\x35\x11\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x3d\x01\
-\x34\x36\x33\x32\x16\x23\x30\x36\x33\x32\x1d\x01\x14\x07\x0e\x02\
-\x1d\x01\x14\x3b\x01\x32\x15\x25\x27\x26\x23\x22\x06\x1d\x01\x14\
-\x33\x21\x32\x3d\x01\x34\x05\xb8\x50\x37\x3a\x4f\x4f\x3a\x37\x50\
-\x13\x14\xc3\x14\x14\xc3\x14\xfe\xa0\x14\x87\x15\x14\xc3\x14\x15\
-\xfe\xfe\x14\x15\xc2\x15\x14\x30\x14\x14\x30\x14\xe3\xae\x61\xb0\
-\x06\xa4\x4d\x25\x14\x1f\x46\x37\x15\x87\x14\xfe\x6f\x06\x44\x5a\
-\x3d\x54\x14\x01\x02\x15\x04\x96\x3a\x50\x50\x3a\x39\x50\x50\xfb\
-\x45\x14\x14\x03\x82\x14\x14\xfe\xf9\x14\x15\xfd\xae\x14\x14\x02\
-\x52\x15\x15\xfd\xae\x14\x14\x02\x52\x15\x14\xae\x15\x14\x3a\xa2\
-\xdd\x56\x56\x15\xb0\x10\x06\x07\x0e\x4c\x2f\x4e\x14\x15\xb9\x12\
-\x40\x54\x40\x4e\x14\x14\x3a\x2d\x00\x00\x00\x00\x01\xff\xee\xfe\
-\x48\x01\xea\xfe\xdc\x00\x0b\x00\x00\x01\x14\x23\x21\x22\x3d\x01\
-\x34\x33\x21\x32\x15\x01\xea\x15\xfe\x2d\x14\x14\x01\xd3\x15\xfe\
-\x5d\x15\x15\x6a\x15\x15\x00\x00\x01\x00\x91\x04\x1d\x02\x83\x05\
-\x73\x00\x0d\x00\x00\x01\x16\x15\x14\x2b\x01\x27\x01\x26\x35\x34\
-\x33\x21\x17\x02\x7f\x04\x15\x95\x0f\xfe\xcf\x08\x17\x01\x02\x10\
-\x04\x3b\x04\x0a\x10\x06\x01\x2d\x08\x0a\x11\x0b\x00\x00\x00\x00\
-\x02\x00\x6e\x00\x00\x03\x53\x03\xbe\x00\x2a\x00\x35\x00\x00\x25\
-\x14\x2b\x01\x22\x26\x23\x22\x06\x2b\x01\x22\x26\x3d\x01\x34\x36\
-\x3b\x01\x32\x3d\x01\x27\x26\x23\x22\x07\x06\x07\x06\x23\x22\x2f\
-\x01\x26\x35\x34\x37\x36\x33\x32\x16\x15\x07\x23\x22\x1d\x01\x14\
-\x3b\x01\x32\x37\x34\x03\x53\x14\xae\x11\x0a\x08\x04\x60\x2b\x4e\
-\x7f\xa2\xa2\x7f\xc4\x15\x02\x0c\x88\x3f\x31\x08\x17\x0c\x0a\x05\
-\x08\xa8\x0c\x62\x5a\xaa\xae\xd1\xe9\xd9\x37\x37\x4e\x60\x29\x14\
-\x14\x27\x27\x9c\x76\x0b\x79\x99\x13\x04\x18\x89\x3d\x0a\x25\x15\
-\x04\x59\x06\x08\x37\x5e\x58\xc4\xa4\xec\x39\x1f\x3b\x73\x06\x00\
-\x02\x00\x76\x00\x00\x03\x70\x05\x0a\x00\x1b\x00\x29\x00\x00\x01\
-\x14\x06\x23\x22\x26\x23\x22\x06\x2b\x01\x22\x35\x11\x34\x3b\x01\
-\x32\x15\x11\x14\x33\x32\x36\x33\x32\x16\x15\x07\x35\x34\x26\x23\
-\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x03\x70\xd1\xa0\x37\x69\x04\
-\x08\x0a\x10\xaf\x14\x14\xc1\x14\x0f\x04\x6c\x34\x93\xcb\xec\x52\
-\x3f\x40\x54\x54\x40\x3f\x52\x01\x6a\x9f\xcb\x29\x29\x14\x04\xe2\
-\x14\x14\xfe\xa2\x17\x29\xcf\x99\xd8\xd8\x3d\x54\x54\x3d\xd8\x3d\
-\x56\x54\x00\x00\x01\x00\x58\xff\xec\x03\x41\x03\xbe\x00\x29\x00\
-\x00\x25\x16\x15\x14\x07\x06\x23\x22\x26\x3d\x01\x34\x36\x33\x32\
-\x17\x16\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\x26\x23\x22\x06\
-\x1d\x01\x14\x16\x33\x32\x37\x36\x33\x32\x17\x03\x35\x0c\x64\x5a\
-\xac\xae\xd1\xd1\xae\x8f\x5a\x36\x29\x22\x0c\xb2\x04\x06\x0a\x13\
-\x35\x50\x40\x53\x53\x40\x50\x33\x15\x0a\x06\x04\xf2\x06\x0b\x2f\
-\x68\x5e\xc6\xa4\xfe\xa4\xc6\x43\x29\x3b\x34\x16\x0a\x07\x58\x02\
-\x23\x62\x56\x3d\xfe\x3d\x56\x62\x27\x02\x00\x00\x02\x00\x58\x00\
-\x00\x03\x54\x05\x0a\x00\x1b\x00\x29\x00\x00\x25\x14\x2b\x01\x22\
-\x26\x23\x22\x06\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x33\x32\
-\x35\x11\x34\x3b\x01\x32\x15\x03\x35\x34\x26\x23\x22\x06\x1d\x01\
-\x14\x16\x33\x32\x36\x03\x54\x15\xae\x10\x0a\x08\x05\x6a\x37\xa0\
-\xd1\xcb\x93\x35\x6d\x02\x0e\x15\xc2\x15\xec\x52\x3f\x40\x53\x53\
-\x40\x3f\x52\x14\x14\x29\x29\xcb\x9f\xd8\x99\xcf\x29\x17\x01\x5e\
-\x14\x14\xfc\x74\xd8\x3d\x54\x54\x3d\xd8\x3f\x54\x54\x00\x00\x00\
-\x02\x00\x58\xff\xec\x03\x54\x03\xbe\x00\x22\x00\x2d\x00\x00\x01\
-\x14\x23\x21\x22\x1d\x01\x14\x16\x33\x32\x37\x36\x33\x32\x1f\x01\
-\x16\x15\x14\x07\x06\x23\x22\x26\x3d\x01\x34\x37\x36\x33\x32\x17\
-\x16\x15\x25\x32\x35\x34\x26\x23\x22\x06\x15\x14\x33\x03\x54\x15\
-\xfe\x19\x14\x53\x40\x50\x33\x15\x0a\x06\x04\xb2\x0c\x64\x5a\xac\
-\xae\xd1\x39\x75\xd1\xd1\x73\x39\xfe\xfc\x14\x58\x35\x39\x56\x14\
-\x01\xae\x14\x15\x2f\x3d\x56\x62\x27\x02\x58\x06\x0b\x2f\x68\x5e\
-\xc6\xa4\xfe\x66\x56\xae\xae\x58\x64\x0a\x15\x2b\x49\x49\x2d\x13\
-\x00\x00\x00\x00\x01\x00\x3b\x00\x00\x02\xa3\x05\x1f\x00\x31\x00\
-\x00\x01\x07\x06\x23\x22\x26\x23\x22\x06\x1d\x01\x14\x3b\x01\x32\
-\x1d\x01\x14\x2b\x01\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x2b\
-\x01\x22\x3d\x01\x34\x3b\x01\x32\x3d\x01\x34\x37\x36\x33\x32\x15\
-\x14\x15\x06\x02\xa1\x3d\x04\x13\x06\x29\x0e\x3d\x54\x14\x85\x15\
-\x15\x85\x14\x15\xc2\x15\x14\x30\x14\x14\x30\x14\x71\x68\xa4\x93\
-\x02\x04\xf6\xac\x0f\x0d\x56\x3e\x4e\x14\x15\xae\x14\x15\xfd\xae\
-\x14\x14\x02\x52\x15\x14\xae\x15\x14\x3a\x95\x79\x71\x21\x02\x02\
-\x02\x00\x00\x00\x03\x00\x58\xfe\x48\x03\xac\x03\xaa\x00\x32\x00\
-\x40\x00\x4c\x00\x00\x05\x14\x06\x23\x21\x22\x26\x3d\x01\x34\x37\
-\x36\x35\x30\x26\x35\x34\x36\x35\x34\x27\x26\x27\x26\x3d\x01\x34\
-\x36\x33\x32\x16\x33\x32\x36\x3b\x01\x32\x15\x11\x14\x06\x2b\x01\
-\x06\x35\x14\x17\x33\x32\x16\x15\x01\x35\x34\x26\x23\x22\x06\x1d\
-\x01\x14\x16\x33\x32\x36\x13\x35\x34\x23\x21\x22\x1d\x01\x14\x33\
-\x21\x32\x03\xac\xa6\x81\xfe\xfa\x83\xa4\x4c\x23\x15\x1d\x06\x42\
-\x08\x27\xd5\x9c\x35\x6e\x05\x06\x0a\x10\xae\x15\xdd\xbb\x1e\x0f\
-\x11\xe5\x83\xa4\xfe\xbc\x52\x3f\x40\x53\x53\x40\x3d\x54\x58\x3b\
-\xfe\xfa\x3b\x3b\x01\x06\x3b\xa6\x77\x9b\x9b\x77\x27\x50\x57\x29\
-\x05\x41\x21\x0f\x4d\x03\x08\x06\x5a\x10\x48\x58\x13\x99\xcf\x29\
-\x29\x14\xfe\x99\xa4\xc6\x0f\x02\x11\x14\x9b\x77\x02\xae\x13\x3d\
-\x54\x54\x3d\x13\x3d\x56\x56\xfd\x68\x27\x3b\x3b\x27\x3b\x00\x00\
-\x01\x00\x76\x00\x00\x03\x70\x05\x0a\x00\x21\x00\x00\x25\x14\x2b\
-\x01\x22\x35\x11\x34\x26\x23\x22\x06\x15\x11\x14\x2b\x01\x22\x35\
-\x11\x34\x3b\x01\x32\x15\x11\x14\x33\x32\x36\x33\x32\x16\x15\x03\
-\x70\x15\xc2\x15\x52\x3f\x40\x54\x14\xc1\x14\x14\xc1\x14\x0f\x04\
-\x6c\x34\x91\xcd\x14\x14\x14\x02\x2e\x3d\x54\x54\x3d\xfd\xd2\x14\
-\x14\x04\xe2\x14\x14\xfe\xa2\x17\x29\xcd\x9b\x00\x02\x00\x62\x00\
-\x00\x01\x74\x05\x1f\x00\x0b\x00\x17\x00\x00\x01\x14\x06\x23\x22\
-\x26\x35\x34\x36\x33\x32\x16\x03\x14\x2b\x01\x22\x35\x11\x34\x3b\
-\x01\x32\x15\x01\x74\x51\x38\x39\x50\x50\x39\x38\x51\x14\x15\xc0\
-\x15\x15\xc0\x15\x04\x96\x38\x52\x50\x3a\x39\x50\x52\xfb\x47\x14\
-\x14\x03\x82\x14\x14\x00\x00\x00\x02\xff\xc7\xfe\x51\x01\x75\x05\
-\x1f\x00\x0b\x00\x1f\x00\x00\x01\x14\x06\x23\x22\x26\x35\x34\x36\
-\x33\x32\x16\x03\x14\x07\x06\x23\x22\x3d\x01\x34\x37\x36\x37\x36\
-\x35\x11\x34\x3b\x01\x32\x15\x01\x75\x52\x37\x39\x50\x50\x39\x37\
-\x52\x14\x98\x7b\x70\x17\x13\x1d\x1c\x64\x15\xc0\x15\x04\x96\x38\
-\x52\x50\x3a\x39\x50\x52\xfa\xff\xc2\x67\x52\x15\xae\x10\x04\x06\
-\x07\x18\x6d\x03\xdc\x14\x14\x00\x01\x00\x76\x00\x00\x03\xab\x05\
-\x0a\x00\x2a\x00\x00\x25\x16\x15\x14\x2b\x01\x27\x03\x26\x23\x22\
-\x0f\x02\x11\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\
-\x33\x32\x3f\x02\x33\x32\x15\x14\x07\x01\x06\x15\x14\x17\x03\xa7\
-\x04\x16\xf0\x12\xec\x08\x08\x08\x09\x20\x07\x14\xc1\x14\x14\xc1\
-\x14\x13\x08\x08\xd9\x0f\xf3\x17\x08\xfe\xe5\x08\x04\x1f\x08\x07\
-\x10\x0a\x01\x83\x0d\x09\x20\x0f\xfe\xb2\x14\x14\x04\xe2\x14\x14\
-\xfd\xcf\x17\x08\xee\x06\x10\x0b\x08\xfe\xdf\x0c\x02\x02\x08\x00\
-\x01\x00\x76\x00\x00\x01\x5f\x05\x0a\x00\x0b\x00\x00\x25\x14\x2b\
-\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x01\x5f\x14\xc1\x14\x14\xc1\
-\x14\x14\x14\x14\x04\xe2\x14\x14\x00\x00\x00\x00\x01\x00\x76\x00\
-\x00\x05\x32\x03\xaa\x00\x34\x00\x00\x25\x14\x2b\x01\x22\x35\x11\
-\x34\x26\x23\x22\x06\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x26\x23\
-\x22\x06\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x16\x33\
-\x32\x36\x33\x32\x17\x16\x33\x32\x37\x36\x33\x32\x16\x15\x05\x32\
-\x14\xc3\x14\x4c\x33\x31\x4e\x15\xc2\x15\x4b\x34\x2f\x50\x14\xc1\
-\x14\x14\xaf\x10\x0a\x08\x07\x6c\x33\x4a\x7b\x0a\x04\x06\x09\x62\
-\x83\x9e\xcc\x14\x14\x14\x02\x2e\x3b\x56\x58\x39\xfd\xd2\x14\x14\
-\x02\x2e\x3b\x56\x58\x39\xfd\xd2\x14\x14\x03\x82\x14\x2d\x2d\x4a\
-\x06\x06\x4a\xcb\x9d\x00\x00\x00\x01\x00\x76\x00\x00\x03\x70\x03\
-\xaa\x00\x1f\x00\x00\x25\x14\x2b\x01\x22\x35\x11\x34\x26\x23\x22\
-\x06\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x16\x33\x32\
-\x36\x33\x32\x16\x15\x03\x70\x15\xc2\x15\x52\x3f\x40\x54\x14\xc1\
-\x14\x14\xaf\x10\x0c\x06\x04\x6d\x37\x9e\xcf\x14\x14\x14\x02\x2e\
-\x3d\x54\x54\x3d\xfd\xd2\x14\x14\x03\x82\x14\x29\x29\xcb\x9d\x00\
-\x02\x00\x58\xff\xec\x03\x54\x03\xbe\x00\x0d\x00\x1b\x00\x00\x01\
-\x14\x06\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\
-\x26\x23\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x03\x54\xd1\xac\xae\
-\xd1\xd1\xae\xac\xd1\xec\x54\x3d\x40\x53\x53\x40\x3d\x54\x01\x56\
-\xa4\xc6\xc6\xa4\xfe\xa4\xc6\xc6\xa4\xfe\xfe\x3d\x56\x56\x3d\xfe\
-\x3d\x56\x56\x00\x02\x00\x76\xfe\x48\x03\x70\x03\xaa\x00\x1b\x00\
-\x29\x00\x00\x01\x14\x06\x23\x22\x26\x23\x22\x15\x11\x14\x2b\x01\
-\x22\x35\x11\x34\x3b\x01\x32\x16\x33\x32\x36\x33\x32\x16\x15\x07\
-\x35\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x03\x70\xcd\
-\x9e\x2b\x64\x08\x0f\x14\xc1\x14\x14\xaf\x10\x0a\x08\x02\x6f\x37\
-\x9e\xcf\xec\x52\x3f\x40\x54\x54\x40\x3f\x52\x01\x6a\x9d\xcd\x29\
-\x17\xfe\x4a\x14\x14\x05\x3a\x14\x29\x29\xc9\x9f\xd8\xd8\x3d\x54\
-\x54\x3d\xd8\x3d\x56\x54\x00\x00\x02\x00\x58\xfe\x48\x03\x54\x03\
-\xaa\x00\x1c\x00\x2a\x00\x00\x01\x14\x2b\x01\x22\x35\x11\x34\x23\
-\x22\x06\x23\x22\x27\x26\x3d\x01\x34\x36\x33\x32\x16\x33\x32\x36\
-\x3b\x01\x32\x15\x03\x35\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x33\
-\x32\x36\x03\x54\x15\xc2\x15\x0e\x06\x64\x2e\xa1\x5f\x6a\xd1\x9e\
-\x37\x6e\x05\x06\x0a\x10\xae\x15\xec\x52\x3f\x40\x53\x53\x40\x3f\
-\x52\xfe\x5c\x14\x14\x01\xb6\x17\x29\x64\x71\x95\xd8\x9f\xc9\x29\
-\x29\x14\xfd\xd4\xd8\x3d\x54\x54\x3d\xd8\x3f\x54\x54\x00\x00\x00\
-\x01\x00\x76\x00\x00\x02\x7a\x03\xaa\x00\x1c\x00\x00\x01\x14\x23\
-\x22\x26\x23\x22\x06\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\
-\x32\x1d\x01\x14\x17\x37\x36\x33\x32\x15\x02\x7a\x0e\x0a\x54\x21\
-\x3c\x52\x14\xc1\x14\x14\xaf\x14\x12\x0d\x50\x4b\x73\x02\xbe\x16\
-\x29\x54\x3b\xfd\xd2\x14\x14\x03\x82\x14\x12\x1d\x11\x04\x07\x3d\
-\x25\x00\x00\x00\x01\x00\x51\xff\xec\x03\x53\x03\xbe\x00\x39\x00\
-\x00\x01\x32\x17\x16\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\x26\
-\x27\x26\x2b\x01\x22\x15\x14\x17\x16\x17\x16\x15\x14\x06\x2b\x01\
-\x22\x27\x26\x35\x34\x3f\x01\x36\x33\x32\x17\x16\x17\x16\x3b\x01\
-\x32\x35\x34\x27\x26\x27\x26\x35\x34\x36\x33\x01\xef\x8d\x5e\x33\
-\x25\x21\x0c\xa8\x04\x06\x09\x08\x31\x0a\x23\x37\x3c\x70\x4d\x65\
-\x66\xf4\xc1\x9f\x3c\xaa\x60\x58\x0c\xa8\x04\x06\x07\x0a\x27\x14\
-\x23\x35\x3c\x76\x4d\x67\x66\xf0\xc1\x97\x03\xbe\x45\x25\x3b\x32\
-\x16\x0a\x06\x52\x02\x0c\x48\x0a\x23\x4e\x33\x13\x14\x15\x41\xbf\
-\x91\xb4\x64\x5c\x31\x08\x07\x51\x02\x0e\x41\x13\x21\x58\x34\x10\
-\x15\x12\x3d\xc5\x8b\xb2\x00\x00\x01\x00\x0a\xff\xec\x02\x37\x04\
-\x5a\x00\x26\x00\x00\x21\x14\x23\x22\x27\x26\x35\x11\x34\x2b\x01\
-\x22\x35\x37\x13\x37\x33\x32\x1d\x01\x14\x3b\x01\x32\x1d\x01\x14\
-\x2b\x01\x22\x15\x11\x14\x16\x17\x16\x17\x16\x15\x02\x37\x2b\x9a\
-\x72\x63\x14\x6b\x14\x04\xf2\x0e\x64\x15\x14\x88\x14\x14\x88\x14\
-\x39\x25\x1f\x21\x12\x14\x6e\x60\x9c\x01\x68\x15\x14\x6d\x01\x00\
-\x06\x14\x88\x14\x14\xaf\x14\x15\xfe\x98\x2f\x4c\x08\x06\x06\x06\
-\x11\x00\x00\x00\x01\x00\x62\x00\x00\x03\x5c\x03\xaa\x00\x1f\x00\
-\x00\x25\x14\x2b\x01\x22\x26\x23\x22\x06\x23\x22\x26\x35\x11\x34\
-\x3b\x01\x32\x15\x11\x14\x16\x33\x32\x36\x35\x11\x34\x3b\x01\x32\
-\x15\x03\x5c\x15\xae\x10\x0a\x09\x04\x6a\x37\xa0\xcf\x14\xc3\x15\
-\x51\x40\x3f\x54\x15\xc0\x15\x14\x14\x29\x29\xcb\x9f\x02\x2c\x14\
-\x14\xfd\xd4\x3f\x54\x56\x3d\x02\x2c\x14\x14\x00\x01\xff\xee\x00\
-\x00\x03\x86\x03\xaa\x00\x17\x00\x00\x09\x01\x06\x2b\x01\x26\x27\
-\x01\x26\x35\x34\x3b\x01\x16\x17\x13\x36\x13\x36\x3b\x01\x32\x15\
-\x14\x03\x81\xfe\x94\x04\x0f\x93\x08\x0a\xfe\x96\x05\x17\xce\x0b\
-\x08\xd7\x14\x81\x34\x18\xd1\x17\x03\x8d\xfc\x7f\x0c\x04\x08\x03\
-\x81\x0b\x02\x10\x02\x0a\xfd\xcc\x38\x01\x77\x91\x10\x02\x00\x00\
-\x01\x00\x04\x00\x00\x04\xc9\x03\xaa\x00\x26\x00\x00\x09\x01\x06\
-\x2b\x01\x22\x27\x0b\x01\x06\x2b\x01\x22\x27\x01\x14\x27\x34\x3b\
-\x01\x32\x17\x1b\x01\x36\x3b\x01\x32\x17\x1b\x01\x36\x3b\x01\x32\
-\x15\x14\x15\x06\x04\xc7\xfe\xed\x04\x10\x92\x10\x04\x92\x95\x04\
-\x11\x93\x13\x02\xfe\xf0\x02\x17\xcc\x11\x04\x81\x7b\x04\x10\xb4\
-\x11\x04\x7f\x7d\x04\x10\xcd\x17\x02\x03\x8f\xfc\x7f\x0e\x0e\x02\
-\x56\xfd\xaa\x0e\x0e\x03\x81\x04\x0d\x12\x0e\xfd\xca\x02\x36\x0e\
-\x0e\xfd\xca\x02\x36\x0e\x12\x02\x03\x02\x00\x00\x01\xff\xec\x00\
-\x00\x03\x5d\x03\xaa\x00\x2b\x00\x00\x25\x16\x15\x14\x2b\x01\x2f\
-\x01\x26\x23\x22\x0f\x02\x23\x22\x35\x34\x37\x13\x36\x3d\x01\x01\
-\x26\x35\x34\x3b\x01\x1f\x01\x16\x33\x32\x3f\x02\x33\x32\x15\x14\
-\x07\x01\x15\x03\x56\x05\x15\xe5\x13\x99\x0b\x08\x08\x0a\x9a\x12\
-\xc5\x16\x04\xf8\x02\xfe\xea\x05\x14\xe6\x10\x9c\x08\x08\x08\x07\
-\x9d\x11\xe7\x17\x07\xfe\xe8\x1f\x06\x09\x10\x0a\xf8\x0e\x0e\xf8\
-\x0a\x10\x02\x0d\x01\xaa\x08\x0a\x06\x01\xaa\x06\x09\x10\x0a\xfa\
-\x0c\x0c\xfa\x0a\x10\x07\x0a\xfe\x56\x12\x00\x00\x01\x00\x62\xfe\
-\x51\x03\x5c\x03\xaa\x00\x31\x00\x00\x05\x14\x06\x23\x22\x27\x26\
-\x27\x26\x35\x34\x3f\x01\x36\x37\x32\x17\x16\x33\x32\x36\x3d\x01\
-\x34\x23\x22\x06\x23\x22\x26\x35\x11\x34\x3b\x01\x32\x15\x11\x14\
-\x16\x33\x32\x36\x35\x11\x34\x3b\x01\x32\x15\x03\x5c\xcd\xb0\x8d\
-\x5d\x35\x29\x21\x0d\xb0\x04\x06\x0a\x13\x33\x52\x3d\x56\x0e\x0a\
-\x5a\x21\xac\xd1\x14\xc3\x15\x51\x40\x3f\x54\x15\xc0\x15\x32\xb0\
-\xcd\x42\x27\x3d\x33\x19\x08\x06\x58\x02\x02\x24\x61\x58\x3c\x4c\
-\x15\x1d\xc7\xa3\x02\x2c\x14\x14\xfd\xd4\x3f\x54\x56\x3d\x02\x2c\
-\x14\x14\x00\x00\x01\x00\x0e\x00\x00\x03\x3d\x03\xa8\x00\x1f\x00\
-\x00\x09\x01\x06\x15\x14\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x35\
-\x34\x37\x01\x36\x35\x34\x23\x21\x22\x3d\x01\x34\x33\x21\x32\x15\
-\x14\x03\x39\xfe\x73\x04\x16\x01\x60\x15\x15\xfd\x07\x17\x04\x01\
-\x8b\x04\x16\xfe\xc5\x15\x15\x02\xd7\x16\x03\x89\xfd\x6d\x04\x0b\
-\x10\x14\xaf\x14\x10\x09\x06\x02\x93\x06\x09\x10\x14\xae\x15\x10\
-\x09\x00\x00\x00\x01\x00\x14\xfe\xa0\x02\x5e\x05\xcd\x00\x38\x00\
-\x00\x01\x14\x23\x22\x26\x27\x26\x35\x11\x34\x26\x27\x26\x27\x26\
-\x3d\x01\x34\x37\x36\x37\x3e\x01\x35\x11\x34\x37\x3e\x01\x33\x32\
-\x1d\x01\x14\x07\x06\x07\x0e\x01\x15\x11\x14\x07\x06\x15\x34\x17\
-\x16\x15\x11\x14\x16\x17\x16\x17\x16\x15\x02\x5e\x2b\x42\x99\x32\
-\x62\x39\x29\x1f\x1d\x12\x12\x1d\x1f\x29\x39\x62\x32\x99\x42\x2b\
-\x13\x20\x1f\x25\x39\x2b\x4a\x41\x34\x39\x25\x1f\x20\x13\xfe\xb5\
-\x15\x42\x31\x64\xa6\x01\x1c\x2f\x4a\x0a\x07\x06\x04\x10\xb2\x11\
-\x04\x06\x06\x0a\x4a\x31\x01\x1b\xa8\x62\x31\x42\x15\xb0\x10\x06\
-\x06\x07\x08\x4a\x2f\xfe\xbd\x4e\x39\x63\x02\x02\x5e\x4a\x50\xfe\
-\xcb\x2e\x4c\x08\x06\x07\x06\x10\x00\x00\x00\x00\x02\x00\x3b\x00\
-\x00\x05\xac\x05\x1f\x00\x45\x00\x54\x00\x00\x25\x14\x2b\x01\x22\
-\x35\x11\x34\x2b\x01\x22\x06\x1d\x01\x14\x3b\x01\x32\x1d\x01\x14\
-\x2b\x01\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x23\x21\x22\x15\
-\x11\x14\x2b\x01\x22\x35\x11\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\
-\x32\x3d\x01\x34\x36\x33\x32\x17\x16\x33\x36\x37\x36\x33\x21\x32\
-\x15\x01\x27\x26\x23\x22\x06\x1d\x01\x14\x33\x21\x32\x3d\x01\x34\
-\x05\xac\x15\xc2\x15\x14\x85\x3e\x54\x15\x87\x14\x14\x87\x15\x14\
-\xc3\x14\x15\xfe\xfe\x14\x15\xc2\x15\x14\x30\x14\x14\x30\x14\xe7\
-\xa6\x85\x8a\x0a\x04\x06\x04\x65\x7b\x01\x70\x15\xfd\x0a\x04\x40\
-\x62\x3d\x54\x14\x01\x02\x15\x14\x14\x14\x04\x0b\x14\x54\x3f\x3a\
-\x14\x15\xae\x14\x15\xfd\xae\x14\x14\x02\x52\x15\x15\xfd\xae\x14\
-\x14\x02\x52\x15\x14\xae\x15\x14\x3a\xa4\xdb\x5a\x07\x03\x04\x45\
-\x14\xfe\xfa\x12\x46\x54\x40\x4e\x14\x14\x27\x36\x00\x00\x00\x00\
-\x01\x00\xa7\xfe\xa0\x02\xf1\x05\xcd\x00\x33\x00\x00\x01\x14\x07\
-\x0e\x02\x15\x11\x14\x07\x06\x23\x22\x3d\x01\x34\x37\x36\x37\x3e\
-\x01\x35\x11\x34\x37\x36\x31\x30\x27\x26\x35\x11\x34\x26\x27\x26\
-\x27\x26\x3d\x01\x34\x33\x32\x16\x15\x11\x14\x1e\x01\x17\x16\x15\
-\x02\xf1\x15\x1e\x46\x37\x63\x70\x9e\x29\x12\x1d\x1d\x29\x39\x29\
-\x4e\x21\x56\x37\x2b\x1d\x1d\x12\x29\x9a\xd7\x37\x46\x1e\x15\x01\
-\xdd\x10\x06\x06\x0f\x4c\x2d\xfe\xe4\xa6\x64\x73\x15\xb0\x10\x04\
-\x06\x07\x0a\x4a\x30\x01\x35\x50\x3a\x6c\x2d\x75\x4a\x01\x43\x32\
-\x47\x0a\x07\x06\x04\x10\xb0\x15\xd3\xaa\xfe\xe5\x2f\x4c\x0e\x06\
-\x06\x11\x00\x00\x02\x00\x3b\x00\x00\x04\xba\x05\x1f\x00\x42\x00\
-\x51\x00\x00\x01\x07\x06\x23\x22\x26\x23\x22\x06\x1d\x01\x14\x3b\
-\x01\x32\x1d\x01\x14\x2b\x01\x22\x15\x11\x14\x2b\x01\x22\x35\x11\
-\x34\x23\x21\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x2b\x01\x22\
-\x3d\x01\x34\x3b\x01\x32\x3d\x01\x34\x36\x33\x32\x16\x23\x22\x36\
-\x33\x32\x15\x14\x15\x06\x01\x27\x26\x23\x22\x06\x1d\x01\x14\x33\
-\x21\x32\x3d\x01\x34\x04\xb8\x3e\x04\x12\x06\x29\x0e\x3e\x54\x15\
-\x87\x14\x14\x87\x15\x14\xc3\x14\x15\xfe\xfe\x14\x15\xc2\x15\x14\
-\x30\x14\x14\x30\x14\xe3\xae\x61\xb0\x06\x06\xa3\x5b\x93\x02\xfd\
-\xfc\x06\x44\x5a\x3d\x54\x14\x01\x02\x15\x04\xf6\xac\x0f\x0d\x56\
-\x3e\x4e\x14\x15\xae\x14\x15\xfd\xae\x14\x14\x02\x52\x15\x15\xfd\
-\xae\x14\x14\x02\x52\x15\x14\xae\x15\x14\x3a\xa2\xdd\x56\x56\x21\
-\x02\x02\x02\xfe\xfe\x12\x40\x54\x40\x4e\x14\x14\x3a\x2d\x00\x00\
-\x04\xff\xf0\x00\x00\x03\xaa\x06\x98\x00\x1b\x00\x2f\x00\x3b\x00\
-\x47\x00\x00\x25\x34\x17\x14\x2b\x01\x22\x2f\x01\x26\x23\x21\x22\
-\x0f\x01\x06\x2b\x01\x22\x35\x36\x15\x01\x36\x3b\x01\x32\x17\x11\
-\x03\x26\x27\x23\x06\x07\x03\x14\x15\x06\x15\x14\x3b\x01\x32\x35\
-\x34\x35\x26\x13\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x05\
-\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x03\xa8\x02\x16\xcf\
-\x10\x04\x3e\x04\x10\xfe\xdb\x11\x04\x3d\x04\x11\xcc\x17\x03\x01\
-\x7c\x04\x10\x94\x10\x04\x43\x04\x13\x06\x08\x10\x46\x02\x16\x96\
-\x16\x02\xcf\x49\x36\x37\x48\x4a\x35\x36\x49\xfe\xa6\x4a\x35\x37\
-\x48\x4a\x35\x35\x4a\x1b\x04\x0d\x12\x0e\xd7\x0d\x0d\xd7\x0e\x12\
-\x0b\x02\x04\xe1\x0e\x0e\xfc\xe7\x01\x0f\x0c\x64\x25\x4b\xfe\xf1\
-\x02\x02\x02\x02\x12\x12\x02\x02\x02\x04\x38\x36\x49\x47\x38\x35\
-\x4a\x4a\x35\x36\x49\x47\x38\x35\x4a\x4a\x00\x00\x04\xff\xf0\x00\
-\x00\x03\xaa\x07\x2d\x00\x0d\x00\x19\x00\x35\x00\x49\x00\x00\x01\
-\x14\x06\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\
-\x26\x23\x22\x06\x1d\x01\x14\x33\x32\x01\x34\x17\x14\x2b\x01\x22\
-\x2f\x01\x26\x23\x21\x22\x0f\x01\x06\x2b\x01\x22\x35\x36\x15\x01\
-\x36\x3b\x01\x32\x17\x11\x03\x26\x27\x23\x06\x07\x03\x14\x15\x06\
-\x15\x14\x3b\x01\x32\x35\x34\x35\x26\x02\x9c\x6f\x5e\x5e\x6f\x6f\
-\x5e\x5e\x6f\x91\x23\x19\x18\x23\x3b\x3c\x01\x9d\x02\x16\xcf\x10\
-\x04\x3e\x04\x10\xfe\xdb\x11\x04\x3d\x04\x11\xcc\x17\x03\x01\x7c\
-\x04\x10\x94\x10\x04\x43\x04\x13\x06\x08\x10\x46\x02\x16\x96\x16\
-\x02\x06\x2f\x58\x6a\x6a\x58\x3b\x59\x6a\x6a\x59\x3b\x3b\x17\x25\
-\x25\x17\x3b\x39\xfa\x25\x04\x0d\x12\x0e\xd7\x0d\x0d\xd7\x0e\x12\
-\x0b\x02\x04\xe1\x0e\x0e\xfc\xe7\x01\x0f\x0c\x64\x25\x4b\xfe\xf1\
-\x02\x02\x02\x02\x12\x12\x02\x02\x02\x00\x00\x00\x01\x00\x6c\xfe\
-\x34\x03\xb8\x05\x1f\x00\x49\x00\x00\x05\x14\x06\x2b\x01\x22\x3d\
-\x01\x34\x3b\x01\x32\x3d\x01\x34\x2b\x01\x22\x35\x34\x3f\x01\x2e\
-\x01\x35\x11\x34\x36\x3b\x01\x32\x17\x16\x17\x16\x15\x14\x0f\x01\
-\x06\x23\x22\x27\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\x01\x32\
-\x37\x36\x33\x32\x1f\x01\x16\x15\x14\x07\x06\x0f\x01\x06\x15\x14\
-\x17\x16\x15\x02\xc2\x7f\x64\x79\x15\x15\x79\x25\x25\x52\x17\x04\
-\x44\xa0\xb2\xd1\xac\x64\x8c\x5c\x37\x29\x23\x0d\xb2\x04\x06\x0a\
-\x13\x35\x50\x64\x3e\x56\x56\x3e\x64\x50\x33\x15\x0a\x06\x04\xb2\
-\x0d\x73\x66\x58\x15\x04\x06\x4e\xf9\x5d\x76\x14\x87\x15\x23\x10\
-\x25\x10\x04\x09\x95\x10\xbe\x9a\x02\x5e\xa4\xc7\x44\x29\x3b\x33\
-\x17\x0a\x06\x58\x02\x22\x63\x56\x3e\xfd\xa2\x3d\x56\x62\x27\x02\
-\x58\x06\x0b\x52\x50\x45\x0c\x2b\x08\x04\x06\x07\x45\x4e\x00\x00\
-\x02\x00\x89\x00\x00\x03\x87\x06\xd1\x00\x23\x00\x31\x00\x00\x25\
-\x14\x23\x21\x22\x35\x11\x34\x33\x21\x32\x1d\x01\x14\x23\x21\x22\
-\x15\x11\x14\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x33\
-\x21\x32\x15\x03\x01\x07\x23\x22\x35\x34\x37\x13\x37\x21\x32\x15\
-\x14\x03\x85\x15\xfd\x2d\x14\x14\x02\xd3\x15\x15\xfe\x19\x14\x14\
-\x01\x8f\x15\x15\xfe\x71\x14\x14\x01\xe7\x15\x06\xfe\xcf\x0f\x97\
-\x17\x06\xc7\x10\x01\x02\x17\x14\x14\x14\x04\xe2\x14\x14\xae\x15\
-\x14\xfe\xef\x14\x15\xae\x14\x15\xfe\xde\x15\x14\x05\xeb\xfe\xd3\
-\x06\x10\x06\x0b\x01\x2d\x08\x13\x08\x00\x00\x00\x02\x00\x89\x00\
-\x00\x03\xdb\x06\xb0\x00\x17\x00\x39\x00\x00\x25\x14\x2b\x01\x27\
-\x01\x13\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x17\x01\x03\x34\x3b\
-\x01\x32\x15\x03\x06\x23\x22\x2f\x01\x26\x23\x22\x06\x23\x22\x2f\
-\x01\x26\x35\x34\x37\x36\x33\x32\x1f\x01\x16\x33\x32\x36\x33\x32\
-\x1f\x01\x16\x15\x14\x03\xdb\x15\xaa\x12\xfe\x5c\x04\x0e\xbf\x14\
-\x14\xad\x12\x01\xa2\x04\x10\xbc\x15\x62\x58\x77\x40\x50\x24\x17\
-\x1d\x20\x3e\x06\x04\x08\x56\x0b\x34\x47\x56\x40\x4c\x22\x21\x19\
-\x25\x3f\x04\x08\x07\x51\x09\x14\x14\x0a\x03\x38\xfc\xd2\x14\x14\
-\x04\xe2\x14\x0a\xfc\xc1\x03\x35\x14\x14\x01\x45\xac\x3e\x14\x15\
-\x4a\x04\x40\x08\x06\x16\x42\x5a\x35\x19\x16\x52\x06\x42\x06\x0a\
-\x04\x00\x00\x00\x04\x00\x6c\xff\xec\x03\xca\x06\x98\x00\x0f\x00\
-\x1f\x00\x2b\x00\x37\x00\x00\x01\x14\x06\x2b\x01\x22\x26\x35\x11\
-\x34\x36\x3b\x01\x32\x16\x15\x03\x11\x34\x26\x2b\x01\x22\x06\x15\
-\x11\x14\x16\x3b\x01\x32\x36\x13\x14\x06\x23\x22\x26\x35\x34\x36\
-\x33\x32\x16\x05\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x03\
-\xca\xd1\xac\x64\xac\xd1\xd1\xac\x64\xac\xd1\xeb\x54\x3e\x64\x3e\
-\x56\x56\x3e\x64\x3e\x54\x68\x4a\x35\x37\x48\x4a\x35\x35\x4a\xfe\
-\xa6\x4a\x35\x37\x48\x4a\x35\x35\x4a\x01\x56\xa4\xc6\xc6\xa4\x02\
-\x5e\xa4\xc7\xc7\xa4\xfd\xa2\x02\x5e\x40\x54\x56\x3e\xfd\xa2\x3d\
-\x56\x54\x05\x02\x36\x49\x47\x38\x35\x4a\x4a\x35\x36\x49\x47\x38\
-\x35\x4a\x4a\x00\x03\x00\x6c\xff\xec\x03\xca\x06\x98\x00\x1b\x00\
-\x27\x00\x33\x00\x00\x01\x14\x06\x2b\x01\x22\x26\x35\x11\x34\x3b\
-\x01\x32\x15\x11\x14\x16\x3b\x01\x32\x36\x35\x11\x34\x3b\x01\x32\
-\x15\x03\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x05\x14\x06\
-\x23\x22\x26\x35\x34\x36\x33\x32\x16\x03\xca\xd1\xac\x64\xac\xd1\
-\x14\xc1\x14\x56\x3e\x64\x3e\x54\x14\xc3\x14\x83\x4a\x35\x37\x48\
-\x4a\x35\x35\x4a\xfe\xa6\x4a\x35\x37\x48\x4a\x35\x35\x4a\x01\x56\
-\xa4\xc6\xc6\xa4\x03\xa0\x14\x14\xfc\x60\x3d\x56\x54\x3f\x03\xa0\
-\x14\x14\x01\x23\x36\x49\x47\x38\x35\x4a\x4a\x35\x36\x49\x47\x38\
-\x35\x4a\x4a\x00\x03\x00\x6e\x00\x00\x03\x5e\x05\x71\x00\x2a\x00\
-\x35\x00\x43\x00\x00\x25\x14\x2b\x01\x22\x26\x23\x22\x06\x2b\x01\
-\x22\x26\x3d\x01\x34\x36\x3b\x01\x32\x3d\x01\x27\x26\x23\x22\x07\
-\x06\x07\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\x33\x32\x16\x15\
-\x07\x23\x22\x1d\x01\x14\x3b\x01\x32\x37\x34\x13\x01\x07\x23\x22\
-\x35\x34\x37\x13\x37\x21\x32\x15\x14\x03\x53\x14\xae\x11\x0a\x08\
-\x04\x60\x2b\x4e\x7f\xa2\xa2\x7f\xc4\x15\x02\x0c\x88\x3f\x31\x08\
-\x17\x0c\x0a\x05\x08\xa8\x0c\x62\x5a\xaa\xae\xd1\xe9\xd9\x37\x37\
-\x4e\x60\x29\xed\xfe\xcf\x0e\x98\x16\x06\xc7\x10\x01\x02\x17\x14\
-\x14\x27\x27\x9c\x76\x0b\x79\x99\x13\x04\x18\x89\x3d\x0a\x25\x15\
-\x04\x59\x06\x08\x37\x5e\x58\xc4\xa4\xec\x39\x1f\x3b\x73\x06\x03\
-\xfe\xfe\xd3\x06\x10\x06\x0a\x01\x2d\x09\x13\x08\x00\x00\x00\x00\
-\x03\x00\x6e\x00\x00\x03\x53\x05\x73\x00\x2a\x00\x35\x00\x43\x00\
-\x00\x25\x14\x2b\x01\x22\x26\x23\x22\x06\x2b\x01\x22\x26\x3d\x01\
-\x34\x36\x3b\x01\x32\x3d\x01\x27\x26\x23\x22\x07\x06\x07\x06\x23\
-\x22\x2f\x01\x26\x35\x34\x37\x36\x33\x32\x16\x15\x07\x23\x22\x1d\
-\x01\x14\x3b\x01\x32\x37\x34\x03\x16\x15\x14\x2b\x01\x27\x01\x26\
-\x35\x34\x33\x21\x17\x03\x53\x14\xae\x11\x0a\x08\x04\x60\x2b\x4e\
-\x7f\xa2\xa2\x7f\xc4\x15\x02\x0c\x88\x3f\x31\x08\x17\x0c\x0a\x05\
-\x08\xa8\x0c\x62\x5a\xaa\xae\xd1\xe9\xd9\x37\x37\x4e\x60\x29\x06\
-\x04\x15\x95\x0f\xfe\xcf\x08\x17\x01\x02\x10\x14\x14\x27\x27\x9c\
-\x76\x0b\x79\x99\x13\x04\x18\x89\x3d\x0a\x25\x15\x04\x59\x06\x08\
-\x37\x5e\x58\xc4\xa4\xec\x39\x1f\x3b\x73\x06\x02\xeb\x04\x0a\x10\
-\x06\x01\x2d\x08\x0a\x11\x0b\x00\x03\x00\x6e\x00\x00\x03\x53\x05\
-\x71\x00\x2a\x00\x35\x00\x4c\x00\x00\x25\x14\x2b\x01\x22\x26\x23\
-\x22\x06\x2b\x01\x22\x26\x3d\x01\x34\x36\x3b\x01\x32\x3d\x01\x27\
-\x26\x23\x22\x07\x06\x07\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\
-\x33\x32\x16\x15\x07\x23\x22\x1d\x01\x14\x3b\x01\x32\x37\x34\x13\
-\x16\x15\x14\x2b\x01\x2f\x01\x26\x23\x22\x0f\x02\x23\x22\x35\x34\
-\x37\x13\x37\x33\x17\x03\x53\x14\xae\x11\x0a\x08\x04\x60\x2b\x4e\
-\x7f\xa2\xa2\x7f\xc4\x15\x02\x0c\x88\x3f\x31\x08\x17\x0c\x0a\x05\
-\x08\xa8\x0c\x62\x5a\xaa\xae\xd1\xe9\xd9\x37\x37\x4e\x60\x29\x95\
-\x07\x17\xa6\x10\x44\x06\x08\x08\x09\x41\x11\xa5\x17\x06\xd5\x11\
-\x64\x10\x14\x14\x27\x27\x9c\x76\x0b\x79\x99\x13\x04\x18\x89\x3d\
-\x0a\x25\x15\x04\x59\x06\x08\x37\x5e\x58\xc4\xa4\xec\x39\x1f\x3b\
-\x73\x06\x02\xeb\x08\x08\x10\x0a\x68\x0d\x0d\x68\x0a\x10\x08\x08\
-\x01\x2d\x09\x09\x00\x00\x00\x00\x04\x00\x6e\x00\x00\x03\x53\x05\
-\x37\x00\x2a\x00\x35\x00\x41\x00\x4d\x00\x00\x25\x14\x2b\x01\x22\
-\x26\x23\x22\x06\x2b\x01\x22\x26\x3d\x01\x34\x36\x3b\x01\x32\x3d\
-\x01\x27\x26\x23\x22\x07\x06\x07\x06\x23\x22\x2f\x01\x26\x35\x34\
-\x37\x36\x33\x32\x16\x15\x07\x23\x22\x1d\x01\x14\x3b\x01\x32\x37\
-\x34\x13\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x05\x14\x06\
-\x23\x22\x26\x35\x34\x36\x33\x32\x16\x03\x53\x14\xae\x11\x0a\x08\
-\x04\x60\x2b\x4e\x7f\xa2\xa2\x7f\xc4\x15\x02\x0c\x88\x3f\x31\x08\
-\x17\x0c\x0a\x05\x08\xa8\x0c\x62\x5a\xaa\xae\xd1\xe9\xd9\x37\x37\
-\x4e\x60\x29\xa6\x4a\x35\x38\x47\x4a\x35\x35\x4a\xfe\xa6\x4a\x35\
-\x38\x47\x49\x36\x35\x4a\x14\x14\x27\x27\x9c\x76\x0b\x79\x99\x13\
-\x04\x18\x89\x3d\x0a\x25\x15\x04\x59\x06\x08\x37\x5e\x58\xc4\xa4\
-\xec\x39\x1f\x3b\x73\x06\x03\x68\x35\x4a\x48\x37\x36\x49\x49\x36\
-\x35\x4a\x48\x37\x36\x49\x49\x00\x03\x00\x6e\x00\x00\x03\x53\x05\
-\x50\x00\x2a\x00\x35\x00\x57\x00\x00\x25\x14\x2b\x01\x22\x26\x23\
-\x22\x06\x2b\x01\x22\x26\x3d\x01\x34\x36\x3b\x01\x32\x3d\x01\x27\
-\x26\x23\x22\x07\x06\x07\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\
-\x33\x32\x16\x15\x07\x23\x22\x1d\x01\x14\x3b\x01\x32\x37\x34\x13\
-\x06\x23\x22\x2f\x01\x26\x23\x22\x06\x23\x22\x2f\x01\x26\x35\x34\
-\x37\x36\x33\x32\x1f\x01\x16\x33\x32\x36\x33\x32\x1f\x01\x16\x15\
-\x14\x03\x53\x14\xae\x11\x0a\x08\x04\x60\x2b\x4e\x7f\xa2\xa2\x7f\
-\xc4\x15\x02\x0c\x88\x3f\x31\x08\x17\x0c\x0a\x05\x08\xa8\x0c\x62\
-\x5a\xaa\xae\xd1\xe9\xd9\x37\x37\x4e\x60\x29\xbe\x58\x77\x3f\x50\
-\x25\x16\x1d\x21\x3d\x06\x04\x09\x56\x0a\x33\x48\x56\x40\x4b\x23\
-\x21\x18\x25\x40\x04\x08\x06\x52\x08\x14\x14\x27\x27\x9c\x76\x0b\
-\x79\x99\x13\x04\x18\x89\x3d\x0a\x25\x15\x04\x59\x06\x08\x37\x5e\
-\x58\xc4\xa4\xec\x39\x1f\x3b\x73\x06\x03\x8b\xac\x3e\x14\x15\x4a\
-\x04\x3f\x09\x06\x16\x42\x5a\x35\x19\x16\x51\x06\x41\x06\x0b\x04\
-\x00\x00\x00\x00\x04\x00\x6e\x00\x00\x03\x53\x05\xdd\x00\x2a\x00\
-\x35\x00\x43\x00\x50\x00\x00\x25\x14\x2b\x01\x22\x26\x23\x22\x06\
-\x2b\x01\x22\x26\x3d\x01\x34\x36\x3b\x01\x32\x3d\x01\x27\x26\x23\
-\x22\x07\x06\x07\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\x33\x32\
-\x16\x15\x07\x23\x22\x1d\x01\x14\x3b\x01\x32\x37\x34\x13\x14\x06\
-\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\x26\x23\
-\x22\x06\x1d\x01\x14\x33\x32\x36\x03\x53\x14\xae\x11\x0a\x08\x04\
-\x60\x2b\x4e\x7f\xa2\xa2\x7f\xc4\x15\x02\x0c\x88\x3f\x31\x08\x17\
-\x0c\x0a\x05\x08\xa8\x0c\x62\x5a\xaa\xae\xd1\xe9\xd9\x37\x37\x4e\
-\x60\x29\x48\x71\x5c\x5e\x6f\x6f\x5e\x5c\x71\x92\x25\x16\x19\x23\
-\x3c\x18\x23\x14\x14\x27\x27\x9c\x76\x0b\x79\x99\x13\x04\x18\x89\
-\x3d\x0a\x25\x15\x04\x59\x06\x08\x37\x5e\x58\xc4\xa4\xec\x39\x1f\
-\x3b\x73\x06\x03\x8f\x56\x6c\x6a\x58\x3c\x58\x6a\x6c\x56\x3c\x3c\
-\x16\x25\x25\x16\x3c\x39\x23\x00\x01\x00\x58\xfe\x34\x03\x41\x03\
-\xbe\x00\x45\x00\x00\x05\x14\x06\x2b\x01\x22\x3d\x01\x34\x3b\x01\
-\x32\x3d\x01\x34\x2b\x01\x22\x35\x34\x3f\x01\x24\x11\x35\x34\x36\
-\x33\x32\x17\x16\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\x26\x23\
-\x22\x06\x1d\x01\x14\x16\x33\x32\x37\x36\x33\x32\x1f\x01\x16\x15\
-\x14\x07\x06\x0f\x01\x06\x15\x14\x17\x16\x15\x02\x71\x7f\x65\x79\
-\x14\x14\x79\x25\x25\x52\x16\x04\x48\xfe\xe7\xd1\xae\x8f\x5a\x36\
-\x29\x22\x0c\xb2\x04\x06\x0a\x13\x35\x50\x40\x53\x53\x40\x50\x33\
-\x15\x0a\x06\x04\xb2\x0c\x2f\x52\x87\x18\x04\x06\x4e\xf9\x5d\x76\
-\x14\x87\x15\x23\x10\x25\x10\x04\x09\x9d\x43\x01\x1d\xfe\xa4\xc6\
-\x43\x29\x3b\x34\x16\x0a\x07\x58\x02\x23\x62\x56\x3d\xfe\x3d\x56\
-\x62\x27\x02\x58\x06\x0b\x14\x44\x77\x1e\x31\x08\x04\x06\x07\x45\
-\x4e\x00\x00\x00\x03\x00\x58\xff\xec\x03\x54\x05\x71\x00\x22\x00\
-\x2d\x00\x3b\x00\x00\x01\x14\x23\x21\x22\x1d\x01\x14\x16\x33\x32\
-\x37\x36\x33\x32\x1f\x01\x16\x15\x14\x07\x06\x23\x22\x26\x3d\x01\
-\x34\x37\x36\x33\x32\x17\x16\x15\x25\x32\x35\x34\x26\x23\x22\x06\
-\x15\x14\x33\x09\x01\x07\x23\x22\x35\x34\x37\x13\x37\x21\x32\x15\
-\x14\x03\x54\x15\xfe\x19\x14\x53\x40\x50\x33\x15\x0a\x06\x04\xb2\
-\x0c\x64\x5a\xac\xae\xd1\x39\x75\xd1\xd1\x73\x39\xfe\xfc\x14\x58\
-\x35\x39\x56\x14\x01\xec\xfe\xce\x0e\x97\x17\x06\xc7\x10\x01\x02\
-\x17\x01\xae\x14\x15\x2f\x3d\x56\x62\x27\x02\x58\x06\x0b\x2f\x68\
-\x5e\xc6\xa4\xfe\x66\x56\xae\xae\x58\x64\x0a\x15\x2b\x49\x49\x2d\
-\x13\x02\xf0\xfe\xd3\x06\x10\x06\x0a\x01\x2d\x09\x13\x08\x00\x00\
-\x03\x00\x58\xff\xec\x03\x54\x05\x73\x00\x22\x00\x2d\x00\x3b\x00\
-\x00\x01\x14\x23\x21\x22\x1d\x01\x14\x16\x33\x32\x37\x36\x33\x32\
-\x1f\x01\x16\x15\x14\x07\x06\x23\x22\x26\x3d\x01\x34\x37\x36\x33\
-\x32\x17\x16\x15\x25\x32\x35\x34\x26\x23\x22\x06\x15\x14\x33\x13\
-\x16\x15\x14\x2b\x01\x27\x01\x26\x35\x34\x33\x21\x17\x03\x54\x15\
-\xfe\x19\x14\x53\x40\x50\x33\x15\x0a\x06\x04\xb2\x0c\x64\x5a\xac\
-\xae\xd1\x39\x75\xd1\xd1\x73\x39\xfe\xfc\x14\x58\x35\x39\x56\x14\
-\xf8\x04\x14\x96\x0e\xfe\xcf\x09\x17\x01\x02\x10\x01\xae\x14\x15\
-\x2f\x3d\x56\x62\x27\x02\x58\x06\x0b\x2f\x68\x5e\xc6\xa4\xfe\x66\
-\x56\xae\xae\x58\x64\x0a\x15\x2b\x49\x49\x2d\x13\x01\xdd\x04\x0a\
-\x10\x06\x01\x2d\x08\x0a\x11\x0b\x00\x00\x00\x00\x03\x00\x58\xff\
-\xec\x03\x54\x05\x71\x00\x22\x00\x2d\x00\x44\x00\x00\x01\x14\x23\
-\x21\x22\x1d\x01\x14\x16\x33\x32\x37\x36\x33\x32\x1f\x01\x16\x15\
-\x14\x07\x06\x23\x22\x26\x3d\x01\x34\x37\x36\x33\x32\x17\x16\x15\
-\x25\x32\x35\x34\x26\x23\x22\x06\x15\x14\x33\x01\x16\x15\x14\x2b\
-\x01\x2f\x01\x26\x23\x22\x0f\x02\x23\x22\x35\x34\x37\x13\x37\x33\
-\x17\x03\x54\x15\xfe\x19\x14\x53\x40\x50\x33\x15\x0a\x06\x04\xb2\
-\x0c\x64\x5a\xac\xae\xd1\x39\x75\xd1\xd1\x73\x39\xfe\xfc\x14\x58\
-\x35\x39\x56\x14\x01\x94\x06\x17\xa6\x10\x44\x06\x08\x08\x08\x42\
-\x10\xa6\x17\x06\xd5\x11\x64\x11\x01\xae\x14\x15\x2f\x3d\x56\x62\
-\x27\x02\x58\x06\x0b\x2f\x68\x5e\xc6\xa4\xfe\x66\x56\xae\xae\x58\
-\x64\x0a\x15\x2b\x49\x49\x2d\x13\x01\xdd\x08\x08\x10\x0a\x68\x0d\
-\x0d\x68\x0a\x10\x08\x08\x01\x2d\x09\x09\x00\x00\x04\x00\x58\xff\
-\xec\x03\x54\x05\x37\x00\x22\x00\x2d\x00\x39\x00\x45\x00\x00\x01\
-\x14\x23\x21\x22\x1d\x01\x14\x16\x33\x32\x37\x36\x33\x32\x1f\x01\
-\x16\x15\x14\x07\x06\x23\x22\x26\x3d\x01\x34\x37\x36\x33\x32\x17\
-\x16\x15\x25\x32\x35\x34\x26\x23\x22\x06\x15\x14\x33\x01\x14\x06\
-\x23\x22\x26\x35\x34\x36\x33\x32\x16\x05\x14\x06\x23\x22\x26\x35\
-\x34\x36\x33\x32\x16\x03\x54\x15\xfe\x19\x14\x53\x40\x50\x33\x15\
-\x0a\x06\x04\xb2\x0c\x64\x5a\xac\xae\xd1\x39\x75\xd1\xd1\x73\x39\
-\xfe\xfc\x14\x58\x35\x39\x56\x14\x01\xa4\x4a\x35\x37\x48\x4a\x35\
-\x35\x4a\xfe\xa6\x4a\x35\x37\x48\x4a\x35\x35\x4a\x01\xae\x14\x15\
-\x2f\x3d\x56\x62\x27\x02\x58\x06\x0b\x2f\x68\x5e\xc6\xa4\xfe\x66\
-\x56\xae\xae\x58\x64\x0a\x15\x2b\x49\x49\x2d\x13\x02\x5a\x35\x4a\
-\x48\x37\x36\x49\x49\x36\x35\x4a\x48\x37\x36\x49\x49\x00\x00\x00\
-\x02\x00\x70\x00\x00\x02\x66\x05\x71\x00\x0b\x00\x19\x00\x00\x25\
-\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x13\x01\x07\x23\x22\
-\x35\x34\x37\x13\x37\x21\x32\x15\x14\x01\x60\x15\xc0\x15\x15\xc0\
-\x15\xfe\xfe\xce\x0e\x97\x17\x06\xc7\x10\x01\x02\x17\x14\x14\x14\
-\x03\x82\x14\x14\x01\xb8\xfe\xd3\x06\x10\x06\x0a\x01\x2d\x09\x13\
-\x08\x00\x00\x00\x02\xff\x7d\x00\x00\x01\x6f\x05\x73\x00\x0b\x00\
-\x19\x00\x00\x25\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x37\
-\x16\x15\x14\x2b\x01\x27\x01\x26\x35\x34\x33\x21\x17\x01\x60\x14\
-\xc1\x14\x14\xc1\x14\x0b\x04\x15\x95\x0f\xfe\xd0\x09\x17\x01\x02\
-\x10\x14\x14\x14\x03\x82\x14\x14\xa5\x04\x0a\x10\x06\x01\x2d\x08\
-\x0a\x11\x0b\x00\x02\xff\xcf\x00\x00\x02\x0c\x05\x71\x00\x0b\x00\
-\x22\x00\x00\x25\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x37\
-\x16\x15\x14\x2b\x01\x2f\x01\x26\x23\x22\x0f\x02\x23\x22\x35\x34\
-\x37\x13\x37\x33\x17\x01\x60\x14\xc1\x14\x14\xc1\x14\xa6\x06\x16\
-\xa6\x10\x44\x06\x08\x08\x09\x41\x11\xa5\x17\x07\xd4\x11\x64\x10\
-\x14\x14\x14\x03\x82\x14\x14\xa5\x08\x08\x10\x0a\x68\x0d\x0d\x68\
-\x0a\x10\x08\x08\x01\x2d\x09\x09\x00\x00\x00\x00\x03\xff\xbf\x00\
-\x00\x02\x17\x05\x37\x00\x0b\x00\x17\x00\x23\x00\x00\x25\x14\x2b\
-\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x13\x14\x06\x23\x22\x26\x35\
-\x34\x36\x33\x32\x16\x05\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\
-\x16\x01\x61\x15\xc0\x15\x15\xc0\x15\xb6\x4a\x35\x37\x48\x4a\x35\
-\x35\x4a\xfe\xa6\x4a\x35\x37\x48\x4a\x35\x35\x4a\x14\x14\x14\x03\
-\x82\x14\x14\x01\x22\x35\x4a\x48\x37\x36\x49\x49\x36\x35\x4a\x48\
-\x37\x36\x49\x49\x00\x00\x00\x00\x02\x00\x76\x00\x00\x03\x70\x05\
-\x50\x00\x1f\x00\x41\x00\x00\x25\x14\x2b\x01\x22\x35\x11\x34\x26\
-\x23\x22\x06\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x16\
-\x33\x32\x36\x33\x32\x16\x15\x03\x06\x23\x22\x2f\x01\x26\x23\x22\
-\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\x33\x32\x1f\x01\x16\x33\
-\x32\x36\x33\x32\x1f\x01\x16\x15\x14\x03\x70\x15\xc2\x15\x52\x3f\
-\x40\x54\x14\xc1\x14\x14\xaf\x10\x0c\x06\x04\x6d\x37\x9e\xcf\x39\
-\x59\x76\x40\x50\x25\x16\x1d\x21\x3d\x06\x04\x08\x56\x0b\x34\x47\
-\x56\x40\x4c\x22\x21\x19\x25\x3f\x04\x08\x06\x52\x09\x14\x14\x14\
-\x02\x2e\x3d\x54\x54\x3d\xfd\xd2\x14\x14\x03\x82\x14\x29\x29\xcb\
-\x9d\x02\x99\xac\x3e\x14\x15\x4a\x04\x3f\x09\x06\x16\x42\x5a\x35\
-\x19\x16\x51\x06\x41\x06\x0b\x04\x00\x00\x00\x00\x03\x00\x58\xff\
-\xec\x03\x54\x05\x71\x00\x0d\x00\x1b\x00\x29\x00\x00\x01\x14\x06\
-\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\x26\x23\
-\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x13\x01\x07\x23\x22\x35\x34\
-\x37\x13\x37\x21\x32\x15\x14\x03\x54\xd1\xac\xae\xd1\xd1\xae\xac\
-\xd1\xec\x54\x3d\x40\x53\x53\x40\x3d\x54\xe0\xfe\xce\x0e\x97\x17\
-\x06\xc7\x10\x01\x02\x17\x01\x56\xa4\xc6\xc6\xa4\xfe\xa4\xc6\xc6\
-\xa4\xfe\xfe\x3d\x56\x56\x3d\xfe\x3d\x56\x56\x04\x35\xfe\xd3\x06\
-\x10\x06\x0a\x01\x2d\x09\x13\x08\x00\x00\x00\x00\x03\x00\x58\xff\
-\xec\x03\x54\x05\x73\x00\x0d\x00\x1b\x00\x29\x00\x00\x01\x14\x06\
-\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\x26\x23\
-\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x03\x16\x15\x14\x2b\x01\x27\
-\x01\x26\x35\x34\x33\x21\x17\x03\x54\xd1\xac\xae\xd1\xd1\xae\xac\
-\xd1\xec\x54\x3d\x40\x53\x53\x40\x3d\x54\x14\x04\x14\x96\x0e\xfe\
-\xcf\x09\x17\x01\x02\x10\x01\x56\xa4\xc6\xc6\xa4\xfe\xa4\xc6\xc6\
-\xa4\xfe\xfe\x3d\x56\x56\x3d\xfe\x3d\x56\x56\x03\x22\x04\x0a\x10\
-\x06\x01\x2d\x08\x0a\x11\x0b\x00\x03\x00\x58\xff\xec\x03\x54\x05\
-\x71\x00\x0d\x00\x1b\x00\x32\x00\x00\x01\x14\x06\x23\x22\x26\x3d\
-\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\x26\x23\x22\x06\x1d\x01\
-\x14\x16\x33\x32\x36\x13\x16\x15\x14\x2b\x01\x2f\x01\x26\x23\x22\
-\x0f\x02\x23\x22\x35\x34\x37\x13\x37\x33\x17\x03\x54\xd1\xac\xae\
-\xd1\xd1\xae\xac\xd1\xec\x54\x3d\x40\x53\x53\x40\x3d\x54\x88\x06\
-\x17\xa6\x10\x44\x06\x08\x08\x08\x42\x10\xa6\x17\x06\xd5\x11\x64\
-\x11\x01\x56\xa4\xc6\xc6\xa4\xfe\xa4\xc6\xc6\xa4\xfe\xfe\x3d\x56\
-\x56\x3d\xfe\x3d\x56\x56\x03\x22\x08\x08\x10\x0a\x68\x0d\x0d\x68\
-\x0a\x10\x08\x08\x01\x2d\x09\x09\x00\x00\x00\x00\x04\x00\x58\xff\
-\xec\x03\x54\x05\x37\x00\x0d\x00\x1b\x00\x27\x00\x33\x00\x00\x01\
-\x14\x06\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\
-\x26\x23\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x13\x14\x06\x23\x22\
-\x26\x35\x34\x36\x33\x32\x16\x05\x14\x06\x23\x22\x26\x35\x34\x36\
-\x33\x32\x16\x03\x54\xd1\xac\xae\xd1\xd1\xae\xac\xd1\xec\x54\x3d\
-\x40\x53\x53\x40\x3d\x54\x98\x4a\x35\x37\x48\x4a\x35\x35\x4a\xfe\
-\xa6\x4a\x35\x37\x48\x4a\x35\x35\x4a\x01\x56\xa4\xc6\xc6\xa4\xfe\
-\xa4\xc6\xc6\xa4\xfe\xfe\x3d\x56\x56\x3d\xfe\x3d\x56\x56\x03\x9f\
-\x35\x4a\x48\x37\x36\x49\x49\x36\x35\x4a\x48\x37\x36\x49\x49\x00\
-\x03\x00\x58\xff\xec\x03\x54\x05\x50\x00\x0d\x00\x1b\x00\x3d\x00\
-\x00\x01\x14\x06\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x07\
-\x35\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x13\x06\x23\
-\x22\x2f\x01\x26\x23\x22\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\
-\x33\x32\x1f\x01\x16\x33\x32\x36\x33\x32\x1f\x01\x16\x15\x14\x03\
-\x54\xd1\xac\xae\xd1\xd1\xae\xac\xd1\xec\x54\x3d\x40\x53\x53\x40\
-\x3d\x54\xb1\x59\x76\x40\x50\x25\x16\x1d\x21\x3d\x06\x04\x08\x56\
-\x0b\x34\x47\x56\x40\x4c\x22\x21\x19\x25\x3f\x04\x08\x06\x52\x09\
-\x01\x56\xa4\xc6\xc6\xa4\xfe\xa4\xc6\xc6\xa4\xfe\xfe\x3d\x56\x56\
-\x3d\xfe\x3d\x56\x56\x03\xc2\xac\x3e\x14\x15\x4a\x04\x3f\x09\x06\
-\x16\x42\x5a\x35\x19\x16\x51\x06\x41\x06\x0b\x04\x00\x00\x00\x00\
-\x02\x00\x62\x00\x00\x03\x64\x05\x71\x00\x1f\x00\x2d\x00\x00\x25\
-\x14\x2b\x01\x22\x26\x23\x22\x06\x23\x22\x26\x35\x11\x34\x3b\x01\
-\x32\x15\x11\x14\x16\x33\x32\x36\x35\x11\x34\x3b\x01\x32\x15\x11\
-\x01\x07\x23\x22\x35\x34\x37\x13\x37\x21\x32\x15\x14\x03\x5c\x15\
-\xae\x10\x0a\x09\x04\x6a\x37\xa0\xcf\x14\xc3\x15\x51\x40\x3f\x54\
-\x15\xc0\x15\xfe\xcf\x0f\x97\x17\x06\xc7\x10\x01\x03\x16\x14\x14\
-\x29\x29\xcb\x9f\x02\x2c\x14\x14\xfd\xd4\x3f\x54\x56\x3d\x02\x2c\
-\x14\x14\x01\xb8\xfe\xd3\x06\x10\x06\x0a\x01\x2d\x09\x13\x08\x00\
-\x02\x00\x62\x00\x00\x03\x5c\x05\x73\x00\x1f\x00\x2d\x00\x00\x25\
-\x14\x2b\x01\x22\x26\x23\x22\x06\x23\x22\x26\x35\x11\x34\x3b\x01\
-\x32\x15\x11\x14\x16\x33\x32\x36\x35\x11\x34\x3b\x01\x32\x15\x27\
-\x16\x15\x14\x2b\x01\x27\x01\x26\x35\x34\x33\x21\x17\x03\x5c\x15\
-\xae\x10\x0a\x09\x04\x6a\x37\xa0\xcf\x14\xc3\x15\x51\x40\x3f\x54\
-\x15\xc0\x15\xf4\x04\x14\x96\x0e\xfe\xcf\x08\x16\x01\x02\x11\x14\
-\x14\x29\x29\xcb\x9f\x02\x2c\x14\x14\xfd\xd4\x3f\x54\x56\x3d\x02\
-\x2c\x14\x14\xa5\x04\x0a\x10\x06\x01\x2d\x08\x0a\x11\x0b\x00\x00\
-\x02\x00\x62\x00\x00\x03\x5c\x05\x71\x00\x1f\x00\x36\x00\x00\x25\
-\x14\x2b\x01\x22\x26\x23\x22\x06\x23\x22\x26\x35\x11\x34\x3b\x01\
-\x32\x15\x11\x14\x16\x33\x32\x36\x35\x11\x34\x3b\x01\x32\x15\x27\
-\x16\x15\x14\x2b\x01\x2f\x01\x26\x23\x22\x0f\x02\x23\x22\x35\x34\
-\x37\x13\x37\x33\x17\x03\x5c\x15\xae\x10\x0a\x09\x04\x6a\x37\xa0\
-\xcf\x14\xc3\x15\x51\x40\x3f\x54\x15\xc0\x15\x58\x06\x17\xa5\x11\
-\x43\x07\x08\x08\x08\x42\x10\xa6\x17\x07\xd5\x10\x64\x11\x14\x14\
-\x29\x29\xcb\x9f\x02\x2c\x14\x14\xfd\xd4\x3f\x54\x56\x3d\x02\x2c\
-\x14\x14\xa5\x08\x08\x10\x0a\x68\x0d\x0d\x68\x0a\x10\x08\x08\x01\
-\x2d\x09\x09\x00\x03\x00\x62\x00\x00\x03\x5c\x05\x37\x00\x1f\x00\
-\x2b\x00\x37\x00\x00\x25\x14\x2b\x01\x22\x26\x23\x22\x06\x23\x22\
-\x26\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x16\x33\x32\x36\x35\x11\
-\x34\x3b\x01\x32\x15\x03\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\
-\x16\x05\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x03\x5c\x15\
-\xae\x10\x0a\x09\x04\x6a\x37\xa0\xcf\x14\xc3\x15\x51\x40\x3f\x54\
-\x15\xc0\x15\x48\x4a\x35\x37\x48\x4a\x35\x35\x4a\xfe\xa6\x4a\x35\
-\x37\x48\x4a\x35\x35\x4a\x14\x14\x29\x29\xcb\x9f\x02\x2c\x14\x14\
-\xfd\xd4\x3f\x54\x56\x3d\x02\x2c\x14\x14\x01\x22\x35\x4a\x48\x37\
-\x36\x49\x49\x36\x35\x4a\x48\x37\x36\x49\x49\x00\x01\x00\x00\xfe\
-\x34\x03\x35\x05\x0a\x00\x2c\x00\x00\x01\x14\x2b\x01\x25\x22\x1d\
-\x01\x17\x03\x14\x2b\x01\x22\x35\x03\x37\x34\x2b\x01\x05\x22\x3d\
-\x01\x34\x3b\x01\x05\x32\x3d\x01\x03\x34\x3b\x01\x32\x1d\x01\x03\
-\x14\x3b\x01\x25\x32\x15\x03\x35\x12\x04\xfe\xe1\x12\x10\x27\x14\
-\x4e\x15\x27\x11\x13\x04\xfe\xdf\x12\x12\x05\x01\x26\x13\x19\x15\
-\xa0\x14\x19\x13\x04\x01\x25\x12\x03\x04\x14\x1a\x12\x04\x6d\xfb\
-\xc1\x14\x14\x04\x3f\x71\x12\x1a\x14\xac\x15\x19\x12\x05\x01\x35\
-\x12\x12\x04\xfe\xca\x12\x19\x15\x00\x00\x00\x00\x02\x00\x1e\x03\
-\x5c\x01\xb8\x05\x1f\x00\x0d\x00\x19\x00\x00\x01\x14\x06\x23\x22\
-\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\x26\x23\x22\x06\
-\x1d\x01\x14\x33\x32\x01\xb8\x71\x5c\x5e\x6f\x71\x5c\x5c\x71\x92\
-\x23\x18\x19\x23\x3c\x3b\x04\x1f\x56\x6d\x6b\x58\x3b\x58\x6d\x6d\
-\x58\x3b\x3b\x17\x25\x25\x17\x3b\x3a\x00\x00\x00\x02\x00\x76\x00\
-\x00\x03\xd4\x05\x0a\x00\x43\x00\x4f\x00\x00\x01\x16\x15\x14\x07\
-\x06\x07\x06\x07\x06\x1d\x01\x14\x2b\x01\x22\x3d\x01\x34\x27\x26\
-\x27\x26\x3d\x01\x34\x37\x36\x37\x36\x3d\x01\x34\x3b\x01\x32\x1d\
-\x01\x14\x17\x16\x17\x16\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\
-\x26\x27\x26\x23\x22\x15\x11\x14\x33\x32\x37\x36\x33\x32\x17\x05\
-\x11\x34\x23\x22\x06\x1d\x01\x14\x16\x33\x32\x03\xc8\x0c\x2f\x35\
-\x42\x33\x50\x37\x15\x6a\x15\x31\x49\x29\xc7\xc7\x27\x4b\x31\x15\
-\x6a\x15\x23\x4e\x1a\x3e\x35\x62\x0c\xb2\x04\x06\x09\x08\x2f\x0a\
-\x1d\x21\x10\x0c\x2f\x1b\x39\x09\x06\x04\xfe\xca\x14\x29\x41\x43\
-\x2d\x0e\x01\xa0\x06\x0d\x1c\x3e\x45\x25\x1d\x0a\x06\x15\x73\x14\
-\x14\x75\x13\x06\x0a\x15\x64\xe1\xfe\xe5\x5f\x12\x0c\x09\x12\x75\
-\x14\x14\x73\x12\x07\x0c\x08\x12\x36\x64\x2b\x0a\x06\x58\x03\x0d\
-\x47\x0d\x21\x17\xfe\x0c\x14\x29\x5a\x02\x6b\x01\xf0\x16\x56\x39\
-\xfe\x3b\x54\x00\x01\xff\xf8\x00\x00\x03\xe8\x05\x1f\x00\x43\x00\
-\x00\x01\x34\x37\x36\x33\x32\x17\x16\x17\x16\x15\x14\x0f\x01\x06\
-\x23\x22\x27\x26\x23\x22\x06\x1d\x01\x14\x3b\x01\x32\x1d\x01\x14\
-\x2b\x01\x22\x1d\x01\x14\x06\x15\x14\x33\x21\x32\x1d\x01\x14\x23\
-\x21\x22\x3d\x01\x34\x3b\x01\x36\x3d\x01\x34\x2b\x01\x22\x3d\x01\
-\x34\x3b\x01\x32\x35\x01\x00\x71\x68\xb2\x7d\x5d\x37\x29\x23\x0d\
-\xb2\x04\x06\x0a\x13\x35\x50\x3d\x56\x14\x87\x15\x15\x87\x14\x17\
-\x15\x01\xa6\x14\x14\xfc\x7e\x14\x14\x73\x81\x14\x2f\x15\x15\x2f\
-\x14\x03\xa0\x95\x79\x71\x44\x29\x3b\x33\x17\x0a\x06\x58\x02\x22\
-\x63\x56\x3e\xa6\x14\x15\xae\x14\x15\xb8\x1d\x4b\x09\x0e\x14\xaf\
-\x14\x14\xaf\x14\x23\x70\xa4\x15\x14\xae\x15\x14\x00\x00\x00\x00\
-\x02\x00\x6c\xfe\x1f\x03\xa3\x05\x1f\x00\x44\x00\x56\x00\x00\x25\
-\x16\x15\x14\x06\x2b\x01\x22\x26\x35\x34\x3f\x01\x36\x37\x32\x17\
-\x16\x3b\x01\x32\x36\x35\x34\x27\x26\x27\x2e\x01\x3d\x01\x34\x37\
-\x27\x26\x35\x34\x36\x3b\x01\x32\x17\x16\x17\x16\x15\x14\x0f\x01\
-\x06\x23\x22\x27\x26\x2b\x01\x22\x06\x15\x14\x17\x16\x17\x1e\x01\
-\x1d\x01\x14\x07\x27\x35\x34\x27\x26\x27\x26\x23\x22\x1d\x01\x14\
-\x17\x16\x17\x16\x33\x32\x03\x6c\x37\xd1\xac\x52\xac\xbc\x0c\xb0\
-\x05\x06\x0a\x14\x32\x51\x52\x3e\x54\x4e\x23\xa8\x93\x83\x37\x02\
-\x35\xcf\xae\x20\x8c\x5c\x37\x29\x23\x0c\xb3\x04\x06\x0a\x13\x35\
-\x50\x20\x3e\x54\x4e\x12\xb9\x91\x85\x37\xb4\x5c\x17\x48\x68\x0e\
-\x13\x2d\x48\x58\x48\x20\x0f\x58\x66\x68\xa4\xc7\xbd\x35\x08\x06\
-\x58\x02\x02\x27\x5e\x54\x40\x54\x39\x1a\x52\x48\x9d\x7f\x29\x6d\
-\x5c\x15\x56\x68\xaa\xc9\x44\x29\x3b\x33\x17\x0a\x06\x58\x02\x22\
-\x63\x54\x40\x4c\x35\x0a\x5a\x46\xae\x85\x29\x60\x60\xb2\x37\x54\
-\x3d\x0f\x21\x2f\x36\x29\x3d\x25\x39\x25\x1d\x00\x01\x00\x7c\x01\
-\x42\x03\x07\x03\xc7\x00\x0f\x00\x00\x01\x14\x06\x2b\x01\x22\x26\
-\x3d\x01\x34\x36\x3b\x01\x32\x16\x15\x03\x07\xb0\x91\x08\x92\xb0\
-\xb0\x92\x08\x91\xb0\x02\x71\x88\xa7\xa7\x88\x29\x87\xa6\xa6\x87\
-\x00\x00\x00\x00\x01\x00\x6c\xfe\x34\x04\x8f\x05\x0a\x00\x1f\x00\
-\x00\x01\x14\x2b\x01\x22\x35\x11\x34\x2b\x01\x22\x15\x11\x14\x2b\
-\x01\x22\x35\x11\x34\x2b\x01\x22\x26\x35\x11\x34\x36\x33\x21\x32\
-\x15\x04\x8f\x15\xc2\x15\x14\x89\x15\x14\xc3\x14\x15\x08\xaa\xd3\
-\xcf\xae\x02\x91\x15\xfe\x48\x14\x14\x05\xd7\x14\x14\xfa\x29\x14\
-\x14\x02\x54\x14\xc9\xa0\x01\x74\xae\xcf\x14\x00\x01\x00\x3b\xff\
-\xec\x03\x8d\x05\x1f\x00\x47\x00\x00\x01\x14\x06\x23\x22\x3d\x01\
-\x34\x37\x36\x37\x3e\x01\x3d\x01\x34\x26\x27\x26\x27\x26\x3d\x01\
-\x34\x37\x36\x37\x3e\x01\x3d\x01\x34\x26\x23\x22\x06\x15\x11\x14\
-\x2b\x01\x22\x35\x11\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x3d\
-\x01\x34\x37\x36\x33\x32\x16\x1d\x01\x14\x07\x06\x31\x34\x17\x16\
-\x15\x03\x8d\xd7\x9a\x2b\x13\x1c\x1f\x29\x39\x39\x29\x1f\x1c\x13\
-\x13\x1c\x1d\x2b\x39\x54\x3d\x3f\x54\x15\xc0\x15\x14\x30\x14\x14\
-\x30\x14\x71\x68\xb0\xa2\xcf\x2f\x46\x42\x33\x01\x66\xa8\xd2\x14\
-\xb0\x11\x04\x06\x06\x0a\x4a\x31\x3b\x30\x49\x0a\x07\x06\x04\x10\
-\xb2\x11\x04\x06\x06\x0a\x4a\x31\x27\x3e\x56\x54\x40\xfc\x60\x14\
-\x14\x02\x52\x15\x14\xae\x15\x14\x3a\x95\x79\x71\xd3\xac\x27\x4e\
-\x3f\x5f\x04\x5e\x4a\x51\x00\x00\x04\x00\x62\x02\x29\x03\x4b\x05\
-\x0a\x00\x0f\x00\x1f\x00\x40\x00\x4c\x00\x00\x01\x14\x06\x2b\x01\
-\x22\x26\x3d\x01\x34\x36\x3b\x01\x32\x16\x15\x07\x35\x34\x26\x2b\
-\x01\x22\x06\x1d\x01\x14\x16\x3b\x01\x32\x36\x27\x14\x06\x15\x14\
-\x1f\x01\x16\x15\x14\x2b\x01\x26\x2f\x01\x26\x27\x23\x22\x1d\x01\
-\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x16\x15\x23\x35\x34\x2b\
-\x01\x22\x1d\x01\x14\x3b\x01\x32\x03\x4b\xc8\xa8\x08\xa8\xc9\xc9\
-\xa8\x08\xa8\xc8\x3d\xa8\x8b\x08\x8c\xa8\xa8\x8c\x08\x8b\xa8\xa0\
-\x3d\x02\x33\x04\x16\x21\x0e\x05\x2f\x02\x10\x33\x15\x14\x17\x14\
-\x14\x81\x3c\x45\x41\x40\x41\x15\x15\x41\x40\x03\x85\x9e\xbe\xbe\
-\x9e\x29\x9e\xbe\xbe\x9e\x29\x29\x81\x9e\x9e\x81\x29\x81\x9e\x9e\
-\xd5\x21\x45\x09\x02\x04\x66\x08\x04\x11\x02\x0b\x6c\x06\x06\x14\
-\x5c\x15\x15\x01\x58\x14\x45\x3c\x06\x42\x15\x60\x14\x00\x00\x00\
-\x03\x00\xa7\x00\x00\x05\x01\x05\x0a\x00\x0f\x00\x1f\x00\x4b\x00\
-\x00\x01\x14\x06\x23\x21\x22\x26\x35\x11\x34\x36\x33\x21\x32\x16\
-\x15\x03\x11\x34\x26\x23\x21\x22\x06\x15\x11\x14\x16\x33\x21\x32\
-\x36\x27\x16\x15\x14\x07\x06\x23\x22\x26\x3d\x01\x34\x36\x33\x32\
-\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\x26\x27\x26\x23\x22\x06\
-\x1d\x01\x14\x16\x33\x32\x37\x36\x37\x36\x33\x32\x17\x05\x01\xd1\
-\xac\xfe\xa0\xae\xcf\xd1\xac\x01\x60\xac\xd1\x93\x81\x69\xfe\xa0\
-\x6d\x7f\x7f\x6d\x01\x60\x6b\x7f\xa4\x0c\x46\x51\x6d\x7d\x9a\x98\
-\x7f\x6d\x54\x45\x0e\x6b\x04\x04\x06\x0a\x2d\x09\x1c\x23\x33\x42\
-\x42\x33\x23\x1c\x05\x31\x0a\x06\x02\x06\x01\x6a\xa3\xc7\xc7\xa3\
-\x02\x36\xa4\xc6\xc6\xa4\xfd\xca\x02\x36\x60\x77\x77\x60\xfd\xca\
-\x60\x77\x77\xd9\x06\x0a\x31\x38\x41\x91\x77\xc1\x74\x90\x42\x37\
-\x2d\x08\x06\x36\x02\x0a\x32\x06\x18\x41\x31\xc1\x31\x42\x19\x04\
-\x35\x0b\x02\x00\x02\x00\x51\x02\xe1\x03\x05\x04\x62\x00\x28\x00\
-\x40\x00\x00\x01\x14\x2b\x01\x22\x3d\x01\x34\x23\x22\x0f\x02\x23\
-\x2f\x01\x26\x23\x22\x1d\x01\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\
-\x1f\x01\x16\x33\x32\x3f\x02\x33\x32\x15\x05\x14\x2b\x01\x22\x15\
-\x11\x14\x2b\x01\x22\x35\x11\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\
-\x32\x15\x03\x05\x14\x19\x14\x15\x08\x0a\x33\x13\x08\x10\x38\x08\
-\x0c\x11\x14\x19\x14\x14\x19\x12\x61\x0a\x08\x08\x0a\x61\x12\x19\
-\x14\xfe\x4e\x14\x38\x14\x15\x18\x15\x14\x38\x14\x14\xda\x14\x02\
-\xf6\x15\x15\x93\x19\x0f\x54\x0a\x0a\x54\x0d\x17\x93\x15\x15\x01\
-\x58\x14\x0a\xa6\x0e\x0e\xa6\x0a\x14\x17\x14\x15\xfe\xe8\x15\x15\
-\x01\x18\x15\x14\x17\x14\x14\x00\x01\x01\x85\x04\x1b\x03\x7b\x05\
-\x71\x00\x0d\x00\x00\x09\x01\x07\x23\x22\x35\x34\x37\x13\x37\x21\
-\x32\x15\x14\x03\x73\xfe\xce\x0e\x97\x17\x06\xc7\x10\x01\x02\x17\
-\x05\x4e\xfe\xd3\x06\x10\x06\x0a\x01\x2d\x09\x13\x08\x00\x00\x00\
-\x02\x00\xd2\x04\x39\x03\x2a\x05\x37\x00\x0b\x00\x17\x00\x00\x01\
-\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x05\x14\x06\x23\x22\
-\x26\x35\x34\x36\x33\x32\x16\x03\x2a\x4a\x35\x37\x48\x4a\x35\x35\
-\x4a\xfe\xa6\x4a\x35\x37\x48\x4a\x35\x35\x4a\x04\xb8\x35\x4a\x48\
-\x37\x36\x49\x49\x36\x35\x4a\x48\x37\x36\x49\x49\x00\x00\x00\x00\
-\x01\x00\x62\x00\x2d\x04\x02\x03\x9a\x00\x13\x00\x00\x01\x07\x27\
-\x37\x23\x35\x21\x37\x21\x35\x21\x37\x17\x07\x33\x15\x21\x07\x21\
-\x15\x01\xc6\xef\x50\x9e\xc3\x01\x2f\xa2\xfe\x2f\x02\x3b\xf0\x52\
-\xa0\xc3\xfe\xd3\xa2\x01\xcf\x01\x1d\xf0\x52\x9e\x76\xa0\x77\xf0\
-\x52\x9e\x77\xa0\x76\x00\x00\x00\x02\xff\x6d\x00\x00\x05\x30\x05\
-\x0a\x00\x2d\x00\x3b\x00\x00\x25\x14\x23\x21\x22\x3d\x01\x34\x23\
-\x21\x07\x03\x07\x23\x22\x35\x34\x37\x01\x21\x32\x1d\x01\x14\x23\
-\x21\x22\x15\x11\x14\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x15\x11\
-\x14\x33\x21\x32\x15\x01\x27\x06\x0f\x01\x06\x15\x14\x3b\x01\x32\
-\x3d\x01\x34\x05\x30\x15\xfd\x2d\x14\x15\xfe\xf0\x15\x93\x13\xd0\
-\x17\x05\x02\xf3\x02\xb6\x15\x15\xfe\x19\x15\x15\x01\x8f\x14\x14\
-\xfe\x71\x15\x15\x01\xe7\x15\xfd\x10\x08\x23\x0c\x79\x04\x16\x7d\
-\x15\x14\x14\x14\xf2\x15\x09\xfe\xf8\x0a\x10\x02\x0d\x04\xeb\x14\
-\xae\x15\x14\xfe\xef\x14\x15\xae\x14\x15\xfe\xde\x15\x14\x02\x91\
-\x02\x50\x18\xde\x0c\x02\x10\x14\x52\x75\x00\x00\x03\x00\x6c\xff\
-\xec\x03\xca\x05\x1f\x00\x0f\x00\x1d\x00\x2b\x00\x00\x01\x14\x06\
-\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\x32\x16\x15\x25\x36\x15\
-\x34\x2b\x01\x22\x06\x15\x11\x14\x33\x32\x37\x05\x11\x34\x23\x22\
-\x07\x01\x06\x15\x14\x3b\x01\x32\x36\x03\xca\xd1\xac\x64\xac\xd1\
-\xd1\xac\x64\xac\xd1\xfe\xcb\x02\x4a\x64\x3e\x56\x13\x0c\x08\x01\
-\x63\x0d\x0a\x0a\xfe\xdb\x04\x54\x64\x3e\x54\x01\x56\xa4\xc6\xc6\
-\xa4\x02\x5e\xa4\xc7\xc7\xa4\x6d\x0a\x02\x1f\x56\x3e\xfe\x48\x19\
-\x11\x9e\x01\xfa\x0c\x14\xfd\xb4\x0c\x04\x29\x54\x00\x00\x00\x00\
-\x03\x00\x6c\x00\xe9\x05\x45\x03\xdf\x00\x13\x00\x1f\x00\x29\x00\
-\x00\x01\x06\x23\x22\x26\x35\x34\x36\x33\x32\x17\x36\x33\x32\x16\
-\x15\x14\x06\x23\x22\x03\x26\x23\x22\x06\x15\x14\x16\x33\x32\x37\
-\x36\x37\x16\x33\x32\x36\x35\x34\x26\x23\x22\x02\xed\x85\xbd\x83\
-\xbc\xa6\x85\xba\x75\x81\xc1\x83\xba\xa4\x85\xbe\xae\x61\xc0\x69\
-\x87\x7b\x5e\x5a\x4c\x42\xa2\x5e\xc4\x69\x87\x7b\x66\x9e\x01\xe7\
-\xfe\xd5\xa4\xaa\xd3\xfe\xfe\xd5\xa4\xaa\xd3\x01\xc3\xb0\x8f\x71\
-\x70\x8c\x56\x4c\x1b\xb0\x8f\x71\x72\x89\x00\x00\x02\x00\xfd\xff\
-\xfe\x05\xab\x04\xc7\x00\x0b\x00\x0f\x00\x00\x01\x33\x11\x21\x15\
-\x21\x11\x23\x11\x21\x35\x21\x01\x21\x15\x21\x02\xef\xca\x01\xf2\
-\xfe\x0e\xca\xfe\x0e\x01\xf2\xfe\x0e\x04\xae\xfb\x52\x04\xc7\xfe\
-\xba\xc7\xfe\xbb\x01\x45\xc7\xfd\x44\xc7\x00\x00\x02\x00\x5e\x00\
-\x00\x04\x06\x03\xcb\x00\x06\x00\x0a\x00\x00\x13\x35\x01\x15\x0d\
-\x01\x15\x01\x35\x21\x15\x60\x03\xa6\xfd\x31\x02\xcf\xfc\x58\x03\
-\xa8\x02\x29\x7d\x01\x25\x83\xe2\xdf\x83\xfe\xfc\x7f\x7f\x00\x00\
-\x02\x00\x5e\x00\x00\x04\x06\x03\xcb\x00\x06\x00\x0a\x00\x00\x13\
-\x35\x2d\x01\x35\x01\x15\x01\x35\x21\x15\x5e\x02\xcf\xfd\x31\x03\
-\xa8\xfc\x58\x03\xa8\x01\x04\x83\xdf\xe2\x83\xfe\xdb\x7d\xfd\xd7\
-\x7f\x7f\x00\x00\x01\x00\x26\x00\x00\x03\xe7\x05\x0a\x00\x4c\x00\
-\x00\x09\x01\x06\x15\x14\x3b\x01\x32\x1d\x01\x14\x23\x21\x22\x1d\
-\x01\x14\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x1d\x01\x14\x2b\x01\
-\x22\x3d\x01\x34\x23\x21\x22\x3d\x01\x34\x33\x21\x32\x3d\x01\x34\
-\x23\x21\x22\x3d\x01\x34\x3b\x01\x32\x35\x34\x27\x01\x26\x35\x34\
-\x3b\x01\x17\x13\x16\x33\x32\x37\x13\x37\x33\x32\x15\x14\x03\xe2\
-\xfe\xe8\x04\x16\xd7\x15\x15\xfe\xdd\x14\x14\x01\x23\x15\x15\xfe\
-\xdd\x14\x14\xc3\x15\x14\xfe\xdd\x14\x14\x01\x23\x14\x14\xfe\xdd\
-\x14\x14\xd7\x17\x04\xfe\xe7\x04\x17\xe1\x12\xc3\x06\x0c\x0d\x06\
-\xc2\x13\xe3\x17\x04\xec\xfd\xf3\x06\x0a\x0e\x15\x9c\x14\x15\x5e\
-\x14\x15\x9b\x15\x14\x88\x14\x14\x88\x14\x15\x9b\x15\x14\x5e\x15\
-\x14\x9c\x15\x10\x02\x0c\x02\x0d\x06\x0a\x0e\x0c\xfe\x6f\x0f\x0f\
-\x01\x91\x0c\x10\x02\x00\x00\x00\x01\xff\xc1\xfe\x4a\x04\xa0\x04\
-\x44\x00\x15\x00\x00\x13\x21\x03\x06\x15\x14\x33\x32\x37\x36\x37\
-\x13\x21\x03\x21\x37\x06\x23\x22\x27\x03\x21\xcd\x01\x21\x4c\x1e\
-\xaa\x68\x39\x34\x22\x5a\x01\x21\xc0\xfe\xf3\x13\x50\x87\x83\x52\
-\x5a\xfe\xe1\x04\x44\xfe\x4d\xb0\x5c\xb8\x5a\x54\xc7\x02\x02\xfb\
-\xbc\x75\x95\x78\xfd\xf2\x00\x00\x02\x00\x7e\xff\xe6\x03\x7c\x05\
-\x14\x00\x1c\x00\x27\x00\x00\x01\x36\x35\x10\x23\x22\x06\x23\x22\
-\x35\x34\x36\x33\x32\x17\x16\x11\x10\x07\x06\x23\x22\x27\x26\x35\
-\x34\x36\x33\x32\x07\x22\x07\x06\x15\x14\x33\x32\x36\x35\x10\x02\
-\xdc\x19\x81\x29\x7d\x33\x4c\x77\x5a\x9d\x5f\x60\x87\x83\xbd\x89\
-\x54\x5a\xd9\x94\xb2\x92\x6a\x44\x47\xac\x6a\x8d\x02\x4c\x5c\xd3\
-\x01\x56\x8f\x41\x39\x58\x8d\x95\xfe\xfe\xfe\xac\xe0\xd6\x64\x68\
-\xb4\xac\xf8\x3f\x77\x7d\xd1\xf4\xfc\xbd\x01\x00\x00\x00\x00\x00\
-\x01\x00\x49\xfe\x46\x05\x49\x05\xf4\x00\x13\x00\x00\x01\x23\x2e\
-\x01\x23\x21\x09\x01\x21\x32\x37\x36\x37\x33\x06\x03\x21\x09\x01\
-\x21\x05\x10\x46\x44\xf1\xe8\xfe\xde\x02\x99\xfd\x21\x01\xb2\xea\
-\x66\x73\x47\x48\x14\x59\xfb\x6d\x03\x2f\xfc\xee\x04\x66\x04\x1d\
-\xdd\xb8\xfc\x6f\xfc\xd9\x38\x3d\xba\x58\xfe\x75\x03\x7d\x04\x31\
-\x00\x00\x00\x00\x01\x00\x3d\xfe\x46\x06\x60\x05\xf4\x00\x13\x00\
-\x00\x13\x11\x23\x35\x21\x15\x23\x11\x33\x15\x21\x35\x33\x11\x21\
-\x11\x33\x15\x21\x35\xf1\xb4\x06\x23\xb4\xb4\xfd\xe3\xac\xfc\xbf\
-\xac\xfd\xe3\xfe\x88\x07\x2a\x42\x42\xf8\xd6\x42\x42\x07\x2a\xf8\
-\xd6\x42\x42\x00\x01\x00\x22\xff\xec\x04\x34\x03\xc7\x00\x35\x00\
-\x00\x01\x02\x15\x14\x17\x16\x33\x32\x36\x35\x33\x10\x23\x22\x27\
-\x26\x35\x14\x13\x22\x23\x10\x07\x06\x23\x22\x27\x26\x35\x33\x16\
-\x33\x32\x37\x36\x13\x23\x22\x07\x23\x36\x37\x36\x33\x21\x32\x3d\
-\x01\x33\x15\x14\x06\x23\x06\x03\x3b\x09\x11\x0e\x31\x42\x35\x33\
-\xd9\x85\x2d\x21\x08\x4d\xcb\x1b\x27\x7d\x5e\x1f\x12\x31\x02\x4a\
-\x5c\x23\x1d\x04\x2d\x9e\x15\x2f\x09\x4b\x46\xac\x02\x08\x87\x2f\
-\x5c\x6c\x21\x03\x06\xfe\xf2\x83\xcb\x37\x2f\x6e\x83\xfe\xb7\x6c\
-\x54\xe1\x0c\x01\x85\xfe\x35\x8f\xc0\x62\x37\x79\x6b\x9a\x81\x01\
-\x58\x6a\x8f\x39\x34\x2d\x02\x06\x67\x54\x02\x00\x01\xff\x48\xfe\
-\x8e\x02\xea\x06\x0e\x00\x1f\x00\x00\x01\x32\x16\x15\x14\x23\x22\
-\x26\x23\x22\x07\x06\x03\x02\x07\x06\x23\x22\x26\x35\x34\x33\x32\
-\x16\x33\x32\x37\x36\x13\x12\x37\x36\x02\x44\x48\x5e\x65\x3b\x3b\
-\x1f\x4e\x14\x07\x12\x12\x4e\x67\xc0\x47\x5f\x65\x3b\x3d\x1f\x4a\
-\x16\x08\x11\x10\x50\x64\x06\x0e\x4b\x3e\x62\x97\xdf\x41\xfd\xc8\
-\xfd\xd3\xb8\xef\x4c\x3d\x60\x95\xdf\x5a\x02\x1e\x02\x27\xbf\xef\
-\x00\x00\x00\x00\x02\x00\x43\x02\x6a\x02\x5e\x05\x1f\x00\x25\x00\
-\x2f\x00\x00\x01\x14\x2b\x01\x22\x35\x27\x06\x2b\x01\x22\x26\x3d\
-\x01\x34\x36\x3b\x01\x37\x35\x34\x23\x22\x07\x06\x23\x22\x2f\x01\
-\x26\x35\x34\x37\x36\x33\x32\x16\x15\x07\x23\x22\x1d\x01\x14\x3b\
-\x01\x32\x37\x02\x5e\x19\x79\x18\x09\x2d\x2f\x37\x5e\x77\x77\x5e\
-\x89\x04\x5e\x35\x2b\x08\x0b\x06\x08\x77\x0c\x46\x50\x6e\x7d\x9a\
-\xb9\x8d\x1d\x1d\x37\x3e\x18\x02\x83\x19\x17\x04\x1b\x73\x58\x06\
-\x5b\x70\x06\x11\x56\x4c\x0e\x04\x3d\x0a\x0b\x35\x39\x42\x92\x76\
-\xaf\x1e\x15\x21\x4a\x00\x00\x00\x02\x00\x33\x02\x5c\x02\x5e\x05\
-\x1f\x00\x0d\x00\x1b\x00\x00\x01\x14\x06\x23\x22\x26\x3d\x01\x34\
-\x36\x33\x32\x16\x15\x07\x35\x34\x26\x23\x22\x06\x1d\x01\x14\x16\
-\x33\x32\x36\x02\x5e\x98\x7c\x7f\x98\x9a\x7d\x7a\x9a\xb8\x36\x26\
-\x27\x36\x36\x27\x26\x36\x03\x64\x76\x92\x90\x78\xb3\x76\x92\x94\
-\x74\xb3\xb3\x26\x36\x36\x26\xb3\x29\x35\x37\x00\x01\x00\x66\x00\
-\x00\x05\xbe\x05\x66\x00\x2b\x00\x00\x25\x32\x36\x37\x33\x03\x21\
-\x11\x36\x37\x36\x35\x34\x02\x23\x22\x02\x15\x14\x17\x16\x17\x11\
-\x21\x03\x33\x1e\x01\x3b\x01\x35\x26\x00\x35\x34\x00\x21\x20\x00\
-\x15\x14\x00\x07\x15\x04\xbe\x62\x4a\x08\x2f\x14\xfd\xfc\x99\x56\
-\x54\xf1\xc9\xc9\xf1\x52\x56\x9b\xfd\xfc\x14\x2f\x06\x4c\x62\xfc\
-\xf4\xfe\xf8\x01\x77\x01\x35\x01\x35\x01\x77\xfe\xf8\xf4\xb8\x44\
-\x6c\xfe\x98\x01\x5c\x1f\x87\x81\xc1\xd9\x01\x14\xfe\xee\xdb\xc1\
-\x81\x87\x1f\xfe\xa4\x01\x68\x6a\x46\x79\x2d\x01\x15\xd1\xf5\x01\
-\x2d\xfe\xd3\xf5\xcf\xfe\xe9\x2d\x79\x00\x00\x00\x03\x00\x58\xff\
-\xec\x05\x62\x03\xbe\x00\x44\x00\x4f\x00\x5c\x00\x00\x01\x14\x23\
-\x21\x22\x1d\x01\x14\x16\x33\x32\x37\x36\x33\x32\x1f\x01\x16\x15\
-\x14\x06\x23\x22\x27\x26\x33\x32\x07\x06\x2b\x01\x22\x26\x3d\x01\
-\x34\x36\x3b\x01\x32\x3d\x01\x34\x26\x23\x22\x07\x06\x07\x06\x23\
-\x22\x2f\x01\x26\x35\x34\x36\x33\x32\x16\x23\x22\x36\x33\x32\x17\
-\x16\x15\x25\x32\x35\x34\x26\x23\x22\x06\x15\x14\x33\x01\x35\x26\
-\x2b\x01\x22\x1d\x01\x14\x3b\x01\x32\x37\x05\x62\x14\xfe\x1a\x14\
-\x54\x3d\x50\x35\x17\x0a\x04\x06\xb3\x0c\xc1\xae\x79\x4f\x61\x09\
-\x06\x61\x43\x48\x60\x83\xa4\xa6\x81\xd5\x14\x54\x3d\x4a\x2b\x04\
-\x14\x0b\x0a\x04\x06\xb0\x0c\xc2\xa6\x66\xb1\x0b\x08\xa6\x64\xd1\
-\x73\x39\xfe\xfe\x15\x56\x3a\x39\x54\x14\xfe\xfc\x02\x12\xd5\x3b\
-\x3b\x60\x54\x31\x01\xae\x14\x15\x2f\x3d\x56\x62\x29\x04\x5a\x07\
-\x08\x31\xc4\x31\x3b\x3f\x2d\x9b\x77\x27\x77\x9b\x15\x04\x3d\x5a\
-\x43\x08\x29\x13\x02\x58\x07\x0a\x31\xc2\x5c\x5c\xae\x58\x64\x0a\
-\x13\x2d\x49\x49\x2d\x13\xfe\xee\x1a\x0f\x3c\x3b\x3b\x6e\x00\x00\
-\x03\x00\x58\xff\xec\x03\x54\x03\xbe\x00\x0d\x00\x1b\x00\x29\x00\
-\x00\x01\x14\x06\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x25\
-\x36\x35\x34\x2b\x01\x22\x06\x1d\x01\x14\x33\x32\x37\x17\x35\x34\
-\x23\x22\x07\x03\x06\x15\x14\x3b\x01\x32\x36\x03\x54\xd1\xac\xae\
-\xd1\xd1\xae\xac\xd1\xfe\x9a\x04\x17\x04\x40\x53\x12\x0c\x08\xfe\
-\x0c\x08\x04\x9a\x04\x17\x0e\x3d\x54\x01\x56\xa4\xc6\xc6\xa4\xfe\
-\xa4\xc6\xc6\xa4\x77\x0a\x02\x10\x54\x3f\xac\x19\x11\x4a\xfe\x08\
-\x08\xfe\x8b\x0a\x02\x10\x54\x00\x02\x00\x74\xfe\x8e\x03\xa9\x03\
-\xbe\x00\x0b\x00\x34\x00\x00\x01\x14\x06\x23\x22\x26\x35\x34\x36\
-\x33\x32\x16\x13\x16\x15\x14\x06\x2b\x01\x22\x26\x35\x34\x36\x37\
-\x36\x37\x36\x35\x34\x26\x35\x34\x3b\x01\x32\x15\x14\x07\x06\x07\
-\x06\x15\x14\x16\x3b\x01\x32\x37\x36\x33\x32\x17\x02\xca\x50\x39\
-\x3a\x4f\x52\x37\x37\x52\xd3\x0c\xc4\xaa\x4a\xae\xcf\x5c\x71\x3b\
-\x3c\x35\x0f\x15\xc5\x20\xa8\x7d\x1c\x3a\x54\x40\x4a\x4b\x38\x16\
-\x0a\x05\x08\x03\x35\x37\x52\x50\x39\x3a\x4f\x51\xfc\x1f\x06\x09\
-\x2f\xc0\xc4\xa4\x7b\x93\x3b\x1f\x1f\x23\x3b\x11\x3d\x0e\x13\x89\
-\xad\x56\x3f\x17\x2d\x45\x3f\x52\x5e\x27\x04\x00\x02\x00\x76\xfe\
-\xa0\x01\x86\x03\xbe\x00\x0b\x00\x19\x00\x00\x01\x14\x06\x23\x22\
-\x26\x35\x34\x36\x33\x32\x16\x03\x14\x2b\x01\x22\x35\x11\x13\x36\
-\x3b\x01\x32\x17\x13\x01\x86\x4f\x38\x39\x50\x52\x37\x38\x4f\x12\
-\x15\xc2\x15\x2d\x03\x12\x66\x13\x02\x2f\x03\x35\x39\x50\x50\x39\
-\x3a\x4f\x4f\xfb\x46\x15\x15\x02\x1c\x01\x66\x13\x13\xfe\x9a\x00\
-\x01\x00\xfd\x01\x6a\x05\xab\x03\x60\x00\x05\x00\x00\x13\x21\x11\
-\x23\x11\x21\xfd\x04\xae\xc7\xfc\x19\x03\x60\xfe\x0a\x01\x32\x00\
-\x01\xff\xe4\xff\xd8\x04\xc1\x06\x7d\x00\x0a\x00\x00\x01\x23\x01\
-\x23\x01\x07\x27\x25\x09\x01\x33\x04\xc1\x75\xfd\xaf\x42\xfe\xc1\
-\x7d\x19\x01\x1b\x01\x00\x02\x04\xbe\x06\x1d\xf9\xbb\x03\x72\x2d\
-\x50\x62\xfd\x3b\x05\x73\x00\x00\x01\x00\x4d\xfe\x1f\x03\x7e\x05\
-\x1f\x00\x3f\x00\x00\x01\x07\x06\x23\x22\x26\x23\x22\x06\x1d\x01\
-\x14\x3b\x01\x32\x1d\x01\x14\x2b\x01\x22\x15\x11\x14\x07\x06\x23\
-\x22\x35\x34\x37\x34\x35\x37\x36\x33\x32\x16\x33\x32\x36\x35\x11\
-\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x3d\x01\x34\x37\x36\x33\
-\x32\x15\x14\x15\x06\x03\x7c\x3d\x04\x13\x06\x29\x0e\x3e\x56\x15\
-\x87\x14\x14\x87\x15\x6e\x67\xa8\x8d\x02\x3b\x07\x08\x0a\x2b\x0c\
-\x3e\x56\x15\x2f\x14\x14\x2f\x15\x70\x69\xa4\x93\x02\x04\xf6\xac\
-\x0f\x0d\x56\x3e\xa6\x14\x15\xae\x14\x15\xfd\x8e\x97\x77\x6f\x21\
-\x02\x02\x02\x02\xac\x11\x0f\x56\x3e\x02\x84\x15\x14\xae\x15\x14\
-\x92\x95\x79\x71\x21\x02\x02\x02\x00\x00\x00\x00\x02\x00\x24\x00\
-\xd9\x04\x3f\x02\xee\x00\x12\x00\x25\x00\x00\x01\x22\x24\x23\x22\
-\x07\x35\x36\x33\x32\x17\x16\x17\x16\x33\x32\x37\x15\x06\x07\x22\
-\x24\x23\x22\x07\x35\x36\x33\x32\x17\x16\x17\x16\x33\x32\x37\x15\
-\x06\x03\x14\x44\xfe\xdf\x54\x7b\xbc\xb0\x92\x49\x63\x54\x54\x39\
-\x2b\x6e\xb3\xa6\x85\x42\xfe\xdd\x5e\x71\xbc\xb6\x8e\x49\x63\x52\
-\x54\x39\x2b\x6c\xb5\xa2\x01\xf2\x60\x85\x8d\x73\x1d\x1a\x1b\x0e\
-\x81\x8e\x6e\xf4\x60\x85\x8d\x75\x1f\x18\x1b\x10\x83\x8f\x6f\x00\
-\x02\x00\x2b\x00\x00\x04\xc3\x05\x60\x00\x03\x00\x06\x00\x00\x29\
-\x01\x01\x33\x01\x21\x01\x04\xc3\xfb\x68\x02\x35\x2d\xfe\x06\x03\
-\x32\xfe\x6a\x05\x60\xfa\xe2\x03\xed\x00\x00\x00\x02\x00\x62\x00\
-\xa6\x04\x1e\x03\xd9\x00\x16\x00\x2d\x00\x00\x25\x14\x23\x22\x27\
-\x01\x27\x35\x37\x01\x36\x33\x32\x1d\x01\x0f\x01\x06\x15\x14\x1f\
-\x02\x05\x14\x23\x22\x27\x01\x27\x35\x37\x01\x36\x33\x32\x1d\x01\
-\x0f\x01\x06\x15\x14\x1f\x02\x04\x1e\x0e\x0a\x08\xfe\x43\x08\x08\
-\x01\xbd\x08\x08\x10\x08\xf1\x0b\x0b\xf1\x08\xfe\x27\x10\x08\x08\
-\xfe\x45\x08\x08\x01\xbb\x08\x08\x10\x08\xf2\x0a\x0a\xf2\x08\xbc\
-\x16\x06\x01\x39\x11\x91\x11\x01\x3b\x06\x16\xb7\x10\xac\x08\x09\
-\x08\x08\xae\x10\xb5\x16\x06\x01\x39\x11\x91\x11\x01\x3b\x06\x16\
-\xb7\x10\xac\x08\x09\x08\x08\xae\x10\x00\x00\x00\x02\x00\x78\x00\
-\xa6\x04\x34\x03\xd9\x00\x16\x00\x2d\x00\x00\x01\x07\x01\x06\x23\
-\x22\x3d\x01\x3f\x01\x36\x35\x34\x2f\x02\x35\x34\x33\x32\x17\x01\
-\x17\x05\x07\x01\x06\x23\x22\x3d\x01\x3f\x01\x36\x35\x34\x2f\x02\
-\x35\x34\x33\x32\x17\x01\x17\x04\x34\x08\xfe\x46\x08\x09\x10\x08\
-\xf2\x0a\x0a\xf2\x08\x10\x09\x08\x01\xba\x08\xfe\x27\x08\xfe\x46\
-\x08\x09\x10\x08\xf0\x0a\x0a\xf0\x08\x10\x09\x08\x01\xba\x08\x01\
-\xf6\x11\xfe\xc7\x06\x16\xb5\x10\xae\x08\x08\x09\x08\xac\x10\xb7\
-\x16\x06\xfe\xc5\x11\x91\x11\xfe\xc7\x06\x16\xb5\x10\xae\x08\x08\
-\x09\x08\xac\x10\xb7\x16\x06\xfe\xc5\x11\x00\x00\x01\x00\x76\xff\
-\xec\x03\x99\x05\x1f\x00\x42\x00\x00\x25\x16\x15\x14\x06\x2b\x01\
-\x22\x26\x3d\x01\x34\x37\x36\x31\x34\x27\x26\x27\x26\x3d\x01\x34\
-\x36\x3b\x01\x32\x16\x15\x14\x0f\x01\x06\x31\x22\x27\x26\x2b\x01\
-\x22\x06\x1d\x01\x14\x16\x3b\x01\x32\x1d\x01\x14\x2b\x01\x22\x06\
-\x1d\x01\x14\x16\x3b\x01\x32\x37\x36\x33\x32\x17\x03\x8a\x0d\xbd\
-\xac\x39\xb0\xcf\x2b\x4c\x08\x48\x04\x23\xd1\xae\x39\xae\xbd\x0c\
-\xb1\x0c\x08\x13\x37\x50\x39\x3d\x56\x56\x3d\xb8\x15\x15\xb8\x40\
-\x53\x56\x3d\x39\x61\x2f\x02\x0e\x02\x08\xf0\x07\x0a\x33\xc0\xcc\
-\xae\x3c\x50\x3b\x6b\x04\x0a\x62\x04\x3c\x3b\x1d\xb0\xcf\xc1\x31\
-\x08\x06\x5a\x04\x20\x67\x56\x3e\x1c\x3e\x56\x14\xae\x15\x54\x3d\
-\x46\x3d\x56\x78\x0f\x02\x00\x00\x03\xff\xf0\x00\x00\x03\xaa\x06\
-\xd3\x00\x1b\x00\x2f\x00\x3d\x00\x00\x25\x34\x17\x14\x2b\x01\x22\
-\x2f\x01\x26\x23\x21\x22\x0f\x01\x06\x2b\x01\x22\x35\x36\x15\x01\
-\x36\x3b\x01\x32\x17\x11\x03\x26\x27\x23\x06\x07\x03\x14\x15\x06\
-\x15\x14\x3b\x01\x32\x35\x34\x35\x26\x13\x16\x15\x14\x2b\x01\x27\
-\x01\x26\x35\x34\x33\x21\x17\x03\xa8\x02\x16\xcf\x10\x04\x3e\x04\
-\x10\xfe\xdb\x11\x04\x3d\x04\x11\xcc\x17\x03\x01\x7c\x04\x10\x94\
-\x10\x04\x43\x04\x13\x06\x08\x10\x46\x02\x16\x96\x16\x02\x23\x04\
-\x14\x96\x0e\xfe\xcf\x08\x16\x01\x02\x11\x1b\x04\x0d\x12\x0e\xd7\
-\x0d\x0d\xd7\x0e\x12\x0b\x02\x04\xe1\x0e\x0e\xfc\xe7\x01\x0f\x0c\
-\x64\x25\x4b\xfe\xf1\x02\x02\x02\x02\x12\x12\x02\x02\x02\x03\xbb\
-\x04\x0b\x10\x06\x01\x2d\x08\x0b\x10\x0a\x00\x00\x03\xff\xf0\x00\
-\x00\x03\xaa\x06\xb0\x00\x1b\x00\x2f\x00\x51\x00\x00\x25\x34\x17\
-\x14\x2b\x01\x22\x2f\x01\x26\x23\x21\x22\x0f\x01\x06\x2b\x01\x22\
-\x35\x36\x15\x01\x36\x3b\x01\x32\x17\x11\x03\x26\x27\x23\x06\x07\
-\x03\x14\x15\x06\x15\x14\x3b\x01\x32\x35\x34\x35\x26\x13\x06\x23\
-\x22\x2f\x01\x26\x23\x22\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\
-\x33\x32\x1f\x01\x16\x33\x32\x36\x33\x32\x1f\x01\x16\x15\x14\x03\
-\xa8\x02\x16\xcf\x10\x04\x3e\x04\x10\xfe\xdb\x11\x04\x3d\x04\x11\
-\xcc\x17\x03\x01\x7c\x04\x10\x94\x10\x04\x43\x04\x13\x06\x08\x10\
-\x46\x02\x16\x96\x16\x02\xe8\x58\x77\x40\x4f\x25\x17\x1c\x21\x3e\
-\x06\x04\x08\x56\x0a\x33\x48\x56\x3f\x4c\x23\x20\x19\x25\x3f\x04\
-\x09\x06\x52\x08\x1b\x04\x0d\x12\x0e\xd7\x0d\x0d\xd7\x0e\x12\x0b\
-\x02\x04\xe1\x0e\x0e\xfc\xe7\x01\x0f\x0c\x64\x25\x4b\xfe\xf1\x02\
-\x02\x02\x02\x12\x12\x02\x02\x02\x04\x5a\xac\x3e\x14\x15\x4a\x04\
-\x40\x08\x06\x16\x42\x5a\x35\x19\x16\x52\x06\x42\x06\x0a\x04\x00\
-\x03\x00\x6c\xff\xec\x03\xca\x06\xb0\x00\x0f\x00\x1f\x00\x41\x00\
-\x00\x01\x14\x06\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\x32\x16\
-\x15\x03\x11\x34\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\x01\x32\
-\x36\x13\x06\x23\x22\x2f\x01\x26\x23\x22\x06\x23\x22\x2f\x01\x26\
-\x35\x34\x37\x36\x33\x32\x1f\x01\x16\x33\x32\x36\x33\x32\x1f\x01\
-\x16\x15\x14\x03\xca\xd1\xac\x64\xac\xd1\xd1\xac\x64\xac\xd1\xeb\
-\x54\x3e\x64\x3e\x56\x56\x3e\x64\x3e\x54\x81\x58\x77\x40\x4f\x25\
-\x17\x1d\x20\x3e\x06\x04\x08\x56\x0a\x33\x47\x56\x40\x4c\x23\x20\
-\x19\x25\x3f\x04\x09\x06\x52\x08\x01\x56\xa4\xc6\xc6\xa4\x02\x5e\
-\xa4\xc7\xc7\xa4\xfd\xa2\x02\x5e\x40\x54\x56\x3e\xfd\xa2\x3d\x56\
-\x54\x05\x24\xac\x3e\x14\x15\x4a\x04\x40\x08\x06\x16\x42\x5a\x35\
-\x19\x16\x52\x06\x42\x06\x0a\x04\x00\x00\x00\x00\x02\x00\x6c\xff\
-\xec\x05\xb2\x05\x1f\x00\x31\x00\x41\x00\x00\x25\x14\x23\x21\x06\
-\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\x32\x17\x21\x32\x1d\x01\
-\x14\x23\x21\x22\x15\x14\x16\x1d\x01\x14\x33\x21\x32\x1d\x01\x14\
-\x23\x21\x22\x1d\x01\x14\x06\x15\x14\x33\x21\x32\x15\x25\x11\x34\
-\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\x01\x32\x36\x05\xb2\x15\
-\xfd\x06\x3b\x44\x3b\xac\xd1\xd1\xac\x3b\x44\x3b\x02\xfa\x15\x15\
-\xfe\x0c\x14\x0c\x15\x01\x8f\x15\x15\xfe\x71\x15\x0c\x14\x01\xf4\
-\x15\xfd\x04\x54\x3e\x3b\x3e\x56\x56\x3e\x3b\x3e\x54\x14\x14\x14\
-\xc6\xa4\x02\x5e\xa4\xc7\x15\x14\xae\x15\x14\x04\x46\x21\xa6\x14\
-\x15\xae\x14\x15\xb8\x21\x45\x04\x15\x14\x93\x02\x5e\x40\x54\x56\
-\x3e\xfd\xa2\x3d\x56\x54\x00\x00\x03\x00\x58\xff\xec\x05\x62\x03\
-\xbe\x00\x2c\x00\x37\x00\x45\x00\x00\x01\x14\x23\x21\x22\x1d\x01\
-\x14\x16\x33\x32\x37\x36\x33\x32\x1f\x01\x16\x15\x14\x06\x23\x22\
-\x26\x33\x32\x06\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x23\x22\
-\x36\x33\x32\x17\x16\x15\x25\x32\x35\x34\x26\x23\x22\x07\x15\x14\
-\x33\x03\x35\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x05\
-\x62\x14\xfe\x1a\x14\x56\x3b\x50\x35\x17\x0a\x04\x06\xb3\x0c\xc1\
-\xae\x68\xaa\x0a\x0a\xac\x64\xae\xd1\xd1\xae\x6a\xb1\x0d\x06\xa8\
-\x5e\xd3\x71\x39\xfe\xfe\x15\x58\x38\x60\x33\x14\xfe\x54\x3d\x40\
-\x53\x53\x40\x3d\x54\x01\xae\x14\x15\x33\x39\x56\x62\x29\x04\x5a\
-\x07\x08\x31\xc4\x51\x51\xc6\xa4\xfe\xa4\xc6\x5a\x5a\xae\x58\x64\
-\x0a\x13\x2b\x4b\x6a\x0a\x15\xfe\xf8\xfe\x3d\x56\x56\x3d\xfe\x3d\
-\x56\x56\x00\x00\x01\x00\x1e\x01\x9a\x03\xef\x02\x4a\x00\x0b\x00\
-\x00\x01\x14\x23\x21\x22\x3d\x01\x34\x33\x21\x32\x15\x03\xef\x15\
-\xfc\x58\x14\x14\x03\xa8\x15\x01\xae\x14\x14\x87\x15\x15\x00\x00\
-\x01\x00\x1e\x01\x9a\x05\xff\x02\x4a\x00\x0b\x00\x00\x01\x14\x23\
-\x21\x22\x3d\x01\x34\x33\x21\x32\x15\x05\xff\x14\xfa\x47\x14\x14\
-\x05\xb9\x14\x01\xae\x14\x14\x87\x15\x15\x00\x00\x02\x00\x45\x03\
-\x68\x02\x9b\x05\x66\x00\x1a\x00\x31\x00\x00\x01\x16\x15\x14\x07\
-\x06\x07\x06\x15\x14\x3b\x01\x32\x1d\x01\x14\x2b\x01\x22\x3d\x01\
-\x34\x37\x36\x33\x32\x17\x05\x16\x15\x14\x06\x15\x14\x3b\x01\x32\
-\x1d\x01\x14\x2b\x01\x22\x3d\x01\x34\x36\x33\x32\x17\x02\x99\x02\
-\x0c\x31\x07\x18\x14\x13\x14\x14\xcb\x14\x4b\x54\x2d\x0b\x06\xfe\
-\xf3\x05\x5d\x15\x10\x15\x15\xcb\x14\x9c\x31\x0a\x06\x04\xf2\x04\
-\x07\x08\x0a\x25\x06\x1b\x2b\x18\x15\xba\x15\x15\x8d\xa8\x56\x5e\
-\x0c\x68\x06\x07\x04\x49\x34\x18\x15\xba\x15\x15\x8d\xa8\xb4\x0c\
-\x00\x00\x00\x00\x02\x00\x2b\x03\x10\x02\x7f\x05\x0a\x00\x18\x00\
-\x2f\x00\x00\x01\x14\x07\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\
-\x35\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x15\x05\x14\x06\x23\
-\x22\x2f\x01\x26\x35\x34\x36\x35\x34\x2b\x01\x22\x3d\x01\x34\x3b\
-\x01\x32\x15\x02\x7f\x4a\x4e\x31\x08\x06\x39\x05\x0f\x4c\x15\x12\
-\x15\x15\xcc\x15\xfe\xbe\x99\x31\x09\x06\x35\x04\x58\x14\x11\x14\
-\x14\xcb\x14\x04\x68\xa5\x56\x5d\x0d\x68\x08\x02\x09\x0a\x39\x33\
-\x17\x14\xbd\x14\x14\x8e\xa5\xb3\x0d\x66\x08\x04\x02\x4c\x31\x17\
-\x14\xbd\x14\x14\x00\x00\x00\x00\x01\x00\x45\x03\x68\x01\x5c\x05\
-\x66\x00\x16\x00\x00\x01\x16\x15\x14\x06\x15\x14\x3b\x01\x32\x1d\
-\x01\x14\x2b\x01\x22\x3d\x01\x34\x36\x33\x32\x17\x01\x57\x05\x5d\
-\x15\x10\x15\x15\xcb\x14\x9c\x31\x0a\x06\x04\xf2\x06\x07\x04\x49\
-\x34\x18\x15\xba\x15\x15\x8d\xa8\xb4\x0c\x00\x00\x01\x00\x2b\x03\
-\x10\x01\x3d\x05\x0a\x00\x16\x00\x00\x01\x14\x06\x23\x22\x2f\x01\
-\x26\x35\x34\x36\x35\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x15\
-\x01\x3d\x99\x31\x09\x06\x35\x04\x58\x14\x11\x14\x14\xcb\x14\x04\
-\x68\xa5\xb3\x0d\x66\x08\x04\x02\x4c\x31\x17\x14\xbd\x14\x14\x00\
-\x03\x00\xfd\x00\x44\x05\xab\x04\x83\x00\x0b\x00\x0f\x00\x1b\x00\
-\x00\x01\x32\x16\x15\x14\x06\x23\x22\x26\x35\x34\x36\x01\x21\x15\
-\x21\x05\x32\x16\x15\x14\x06\x23\x22\x26\x35\x34\x36\x03\x55\x3e\
-\x5a\x58\x40\x3f\x58\x5a\xfd\xe5\x04\xae\xfb\x52\x02\x58\x3e\x5a\
-\x58\x40\x3f\x58\x5a\x04\x83\x58\x3f\x3e\x5a\x58\x40\x3f\x58\xfe\
-\x44\xc7\x8f\x58\x40\x3b\x5a\x56\x3f\x40\x58\x00\x02\x00\x06\xfe\
-\x23\x03\xed\x06\x75\x00\x03\x00\x07\x00\x00\x09\x07\x01\xfa\x01\
-\xf3\xfe\x0d\xfe\x0c\x01\xf4\xfe\x7f\x01\x81\x01\x81\x06\x75\xfb\
-\xdb\xfb\xd3\x04\x2d\x03\x31\xfc\xcf\xfc\xc7\x03\x39\x00\x00\x00\
-\x03\x00\x62\xfe\x1f\x03\x5c\x05\x37\x00\x31\x00\x3d\x00\x49\x00\
-\x00\x05\x14\x06\x23\x22\x27\x26\x27\x26\x35\x34\x3f\x01\x36\x37\
-\x32\x17\x16\x33\x32\x36\x3d\x01\x34\x23\x22\x06\x23\x22\x26\x35\
-\x11\x34\x3b\x01\x32\x15\x11\x14\x16\x33\x32\x36\x35\x11\x34\x3b\
-\x01\x32\x15\x03\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x05\
-\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x03\x5c\xcd\xb0\x8d\
-\x5d\x35\x29\x21\x0d\xb0\x04\x06\x0a\x13\x33\x52\x3d\x56\x0e\x0a\
-\x5a\x21\xac\xd1\x14\xc3\x15\x51\x40\x3f\x54\x15\xc0\x15\x48\x4a\
-\x35\x37\x48\x4a\x35\x35\x4a\xfe\xa6\x4a\x35\x37\x48\x4a\x35\x35\
-\x4a\x64\xb0\xcd\x42\x27\x3d\x33\x19\x08\x06\x58\x02\x02\x24\x61\
-\x58\x3c\x7e\x15\x1d\xc7\xa3\x02\x2c\x14\x14\xfd\xd4\x3f\x54\x56\
-\x3d\x02\x2c\x14\x14\x01\x22\x35\x4a\x48\x37\x36\x49\x49\x36\x35\
-\x4a\x48\x37\x36\x49\x49\x00\x00\x03\xff\xec\x00\x00\x03\xad\x06\
-\x98\x00\x1a\x00\x26\x00\x32\x00\x00\x09\x01\x11\x14\x2b\x01\x22\
-\x35\x11\x01\x26\x35\x34\x3b\x01\x17\x13\x16\x33\x32\x37\x13\x37\
-\x33\x32\x15\x14\x03\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\
-\x05\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x03\xa8\xfe\x9a\
-\x14\xc3\x15\xfe\x9b\x05\x17\xe3\x12\xc3\x06\x0c\x0d\x06\xc2\x13\
-\xe1\x17\xb3\x49\x36\x37\x48\x4a\x35\x36\x49\xfe\xa6\x4a\x35\x37\
-\x48\x4a\x35\x35\x4a\x04\xec\xfd\x60\xfd\xc8\x14\x14\x02\x38\x02\
-\xa0\x0c\x02\x10\x0c\xfe\x6f\x0f\x0f\x01\x91\x0c\x10\x02\x01\x21\
-\x36\x49\x47\x38\x35\x4a\x4a\x35\x36\x49\x47\x38\x35\x4a\x4a\x00\
-\x01\xff\xec\x00\x00\x02\x9e\x05\x0a\x00\x0f\x00\x00\x09\x01\x06\
-\x07\x23\x22\x35\x34\x37\x01\x36\x37\x33\x32\x15\x14\x02\x9a\xfd\
-\xea\x05\x0e\x6e\x17\x05\x02\x16\x02\x10\x6f\x16\x04\xee\xfb\x1e\
-\x0a\x02\x10\x02\x0b\x04\xe1\x06\x06\x10\x02\x00\x01\x00\x62\x00\
-\xa6\x02\x45\x03\xd9\x00\x16\x00\x00\x25\x14\x23\x22\x27\x01\x27\
-\x35\x37\x01\x36\x33\x32\x1d\x01\x0f\x01\x06\x15\x14\x1f\x02\x02\
-\x45\x10\x08\x08\xfe\x45\x08\x08\x01\xbb\x08\x08\x10\x08\xf2\x0a\
-\x0a\xf2\x08\xbc\x16\x06\x01\x39\x11\x91\x11\x01\x3b\x06\x16\xb7\
-\x10\xac\x08\x09\x08\x08\xae\x10\x00\x00\x00\x00\x01\x00\x78\x00\
-\xa6\x02\x5b\x03\xd9\x00\x16\x00\x00\x01\x07\x01\x06\x23\x22\x3d\
-\x01\x3f\x01\x36\x35\x34\x2f\x02\x35\x34\x33\x32\x17\x01\x17\x02\
-\x5b\x08\xfe\x46\x08\x09\x10\x08\xf0\x0a\x0a\xf0\x08\x10\x09\x08\
-\x01\xba\x08\x01\xf6\x11\xfe\xc7\x06\x16\xb5\x10\xae\x08\x08\x09\
-\x08\xac\x10\xb7\x16\x06\xfe\xc5\x11\x00\x00\x00\x01\x00\x00\xfe\
-\x34\x03\x35\x05\x0a\x00\x48\x00\x00\x01\x14\x2b\x01\x25\x22\x15\
-\x03\x14\x2b\x01\x22\x35\x03\x34\x2b\x01\x05\x22\x3d\x01\x34\x3b\
-\x01\x05\x32\x2f\x01\x37\x34\x2b\x01\x05\x22\x3d\x01\x34\x3b\x01\
-\x05\x32\x3d\x01\x03\x34\x3b\x01\x32\x1d\x01\x03\x14\x3b\x01\x25\
-\x32\x1d\x01\x14\x2b\x01\x25\x22\x1d\x01\x17\x07\x06\x3b\x01\x25\
-\x32\x15\x03\x35\x12\x04\xfe\xe3\x12\x19\x14\x4e\x15\x18\x13\x04\
-\xfe\xe1\x12\x12\x05\x01\x16\x15\x03\x06\x11\x13\x04\xfe\xdf\x12\
-\x12\x05\x01\x26\x13\x19\x15\xa0\x14\x19\x13\x04\x01\x25\x12\x12\
-\x04\xfe\xe1\x12\x10\x06\x02\x14\x04\x01\x15\x12\x01\x5c\x14\x18\
-\x14\xfc\xfc\x14\x14\x03\x04\x14\x18\x14\xac\x15\x19\x17\x6e\x6f\
-\x12\x1a\x14\xac\x15\x19\x12\x05\x01\x35\x12\x12\x04\xfe\xca\x12\
-\x19\x15\xac\x14\x1a\x12\x04\x69\x70\x17\x19\x15\x00\x00\x00\x00\
-\x01\x00\x62\x01\xfe\x01\x74\x03\x10\x00\x0b\x00\x00\x01\x14\x06\
-\x23\x22\x26\x35\x34\x36\x33\x32\x16\x01\x74\x51\x38\x39\x50\x50\
-\x39\x38\x51\x02\x87\x37\x52\x50\x39\x3a\x4f\x52\x00\x00\x00\x00\
-\x01\x00\x2b\xff\x17\x01\x3d\x01\x12\x00\x16\x00\x00\x25\x14\x06\
-\x23\x22\x2f\x01\x26\x35\x34\x36\x35\x34\x2b\x01\x22\x3d\x01\x34\
-\x3b\x01\x32\x15\x01\x3d\x97\x33\x09\x06\x35\x04\x58\x14\x11\x14\
-\x14\xcb\x14\x6f\xa8\xb0\x0a\x69\x08\x04\x02\x50\x2f\x16\x15\xbc\
-\x14\x14\x00\x00\x02\x00\x2b\xff\x17\x02\x7f\x01\x12\x00\x17\x00\
-\x2e\x00\x00\x25\x14\x07\x06\x23\x22\x2f\x01\x26\x35\x34\x36\x35\
-\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x15\x05\x14\x06\x23\x22\
-\x2f\x01\x26\x35\x34\x36\x35\x34\x2b\x01\x22\x3d\x01\x34\x3b\x01\
-\x32\x15\x02\x7f\x4a\x4e\x31\x08\x06\x39\x05\x5b\x15\x12\x15\x15\
-\xcc\x15\xfe\xbe\x97\x33\x09\x06\x35\x04\x58\x14\x11\x14\x14\xcb\
-\x14\x6f\xa6\x56\x5c\x0a\x69\x08\x04\x02\x50\x2f\x16\x15\xbc\x14\
-\x14\x8f\xa8\xb0\x0a\x69\x08\x04\x02\x50\x2f\x16\x15\xbc\x14\x14\
-\x00\x00\x00\x00\x07\x00\x5e\x00\x00\x05\xf1\x05\x0a\x00\x0d\x00\
-\x1b\x00\x2b\x00\x39\x00\x43\x00\x4d\x00\x57\x00\x00\x25\x14\x06\
-\x23\x22\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x01\x14\x06\x23\x22\
-\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x25\x01\x06\x2b\x01\x22\x35\
-\x34\x37\x01\x36\x37\x33\x32\x15\x14\x13\x14\x06\x23\x22\x26\x3d\
-\x01\x34\x36\x33\x32\x16\x15\x05\x35\x34\x23\x22\x1d\x01\x14\x33\
-\x32\x01\x35\x34\x23\x22\x1d\x01\x14\x33\x32\x01\x35\x34\x23\x22\
-\x1d\x01\x14\x33\x32\x05\xf1\x70\x5c\x5f\x70\x72\x5d\x5c\x70\xfc\
-\x09\x71\x5e\x5e\x6f\x6f\x5e\x5e\x71\x01\x8b\xfd\xe9\x06\x0c\x6d\
-\x16\x04\x02\x17\x02\x10\x6c\x17\x79\x6f\x5e\x5e\x6f\x6f\x5e\x5e\
-\x6f\x01\x4a\x27\x27\x27\x27\xfc\x08\x29\x27\x27\x29\x02\x08\x27\
-\x27\x27\x27\xc3\x56\x6d\x6d\x56\xc4\x56\x6d\x6d\x56\x01\xfc\x58\
-\x6a\x6a\x58\xc5\x58\x6a\x6a\x58\xa6\xfb\x1e\x0c\x10\x02\x0b\x04\
-\xe1\x06\x06\x10\x02\xfb\xcb\x59\x6a\x6a\x59\xc4\x58\x6b\x6b\x58\
-\xc4\xc4\x27\x27\xc4\x27\x02\xe7\xc5\x27\x27\xc5\x27\xfd\x67\xc4\
-\x27\x27\xc4\x27\x00\x00\x00\x00\x03\xff\xf0\x00\x00\x03\xaa\x06\
-\xd1\x00\x1b\x00\x2f\x00\x46\x00\x00\x25\x34\x17\x14\x2b\x01\x22\
-\x2f\x01\x26\x23\x21\x22\x0f\x01\x06\x2b\x01\x22\x35\x36\x15\x01\
-\x36\x3b\x01\x32\x17\x11\x03\x26\x27\x23\x06\x07\x03\x14\x15\x06\
-\x15\x14\x3b\x01\x32\x35\x34\x35\x26\x13\x16\x15\x14\x2b\x01\x2f\
-\x01\x26\x23\x22\x0f\x02\x23\x22\x35\x34\x37\x13\x37\x33\x17\x03\
-\xa8\x02\x16\xcf\x10\x04\x3e\x04\x10\xfe\xdb\x11\x04\x3d\x04\x11\
-\xcc\x17\x03\x01\x7c\x04\x10\x94\x10\x04\x43\x04\x13\x06\x08\x10\
-\x46\x02\x16\x96\x16\x02\xbf\x06\x17\xa5\x11\x43\x07\x08\x08\x08\
-\x42\x10\xa6\x16\x06\xd5\x10\x64\x11\x1b\x04\x0d\x12\x0e\xd7\x0d\
-\x0d\xd7\x0e\x12\x0b\x02\x04\xe1\x0e\x0e\xfc\xe7\x01\x0f\x0c\x64\
-\x25\x4b\xfe\xf1\x02\x02\x02\x02\x12\x12\x02\x02\x02\x03\xbb\x09\
-\x08\x10\x0a\x69\x0c\x0c\x69\x0a\x10\x08\x09\x01\x2d\x08\x08\x00\
-\x02\x00\x89\x00\x00\x03\x85\x06\xd1\x00\x23\x00\x3a\x00\x00\x25\
-\x14\x23\x21\x22\x35\x11\x34\x33\x21\x32\x1d\x01\x14\x23\x21\x22\
-\x15\x11\x14\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x33\
-\x21\x32\x15\x03\x16\x15\x14\x2b\x01\x2f\x01\x26\x23\x22\x0f\x02\
-\x23\x22\x35\x34\x37\x13\x37\x33\x17\x03\x85\x15\xfd\x2d\x14\x14\
-\x02\xd3\x15\x15\xfe\x19\x14\x14\x01\x8f\x15\x15\xfe\x71\x14\x14\
-\x01\xe7\x15\x5e\x06\x17\xa6\x10\x44\x06\x08\x08\x08\x42\x10\xa6\
-\x17\x07\xd5\x10\x64\x11\x14\x14\x14\x04\xe2\x14\x14\xae\x15\x14\
-\xfe\xef\x14\x15\xae\x14\x15\xfe\xde\x15\x14\x04\xd9\x09\x08\x10\
-\x0a\x69\x0c\x0c\x69\x0a\x10\x08\x09\x01\x2d\x08\x08\x00\x00\x00\
-\x03\xff\xf0\x00\x00\x03\xaa\x06\xd1\x00\x1b\x00\x2f\x00\x3d\x00\
-\x00\x25\x34\x17\x14\x2b\x01\x22\x2f\x01\x26\x23\x21\x22\x0f\x01\
-\x06\x2b\x01\x22\x35\x36\x15\x01\x36\x3b\x01\x32\x17\x11\x03\x26\
-\x27\x23\x06\x07\x03\x14\x15\x06\x15\x14\x3b\x01\x32\x35\x34\x35\
-\x26\x09\x01\x07\x23\x22\x35\x34\x37\x13\x37\x21\x32\x15\x14\x03\
-\xa8\x02\x16\xcf\x10\x04\x3e\x04\x10\xfe\xdb\x11\x04\x3d\x04\x11\
-\xcc\x17\x03\x01\x7c\x04\x10\x94\x10\x04\x43\x04\x13\x06\x08\x10\
-\x46\x02\x16\x96\x16\x02\x01\x17\xfe\xcf\x0f\x97\x17\x06\xc7\x11\
-\x01\x02\x16\x1b\x04\x0d\x12\x0e\xd7\x0d\x0d\xd7\x0e\x12\x0b\x02\
-\x04\xe1\x0e\x0e\xfc\xe7\x01\x0f\x0c\x64\x25\x4b\xfe\xf1\x02\x02\
-\x02\x02\x12\x12\x02\x02\x02\x04\xcd\xfe\xd3\x06\x10\x06\x0b\x01\
-\x2d\x08\x13\x08\x00\x00\x00\x00\x03\x00\x89\x00\x00\x03\x85\x06\
-\x98\x00\x23\x00\x2f\x00\x3b\x00\x00\x25\x14\x23\x21\x22\x35\x11\
-\x34\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x33\x21\x32\
-\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x33\x21\x32\x15\x03\x14\x06\
-\x23\x22\x26\x35\x34\x36\x33\x32\x16\x05\x14\x06\x23\x22\x26\x35\
-\x34\x36\x33\x32\x16\x03\x85\x15\xfd\x2d\x14\x14\x02\xd3\x15\x15\
-\xfe\x19\x14\x14\x01\x8f\x15\x15\xfe\x71\x14\x14\x01\xe7\x15\x4e\
-\x4a\x35\x37\x48\x4a\x35\x35\x4a\xfe\xa6\x4a\x35\x37\x48\x4a\x35\
-\x35\x4a\x14\x14\x14\x04\xe2\x14\x14\xae\x15\x14\xfe\xef\x14\x15\
-\xae\x14\x15\xfe\xde\x15\x14\x05\x56\x36\x49\x47\x38\x35\x4a\x4a\
-\x35\x36\x49\x47\x38\x35\x4a\x4a\x00\x00\x00\x00\x02\x00\x89\x00\
-\x00\x03\x85\x06\xd3\x00\x23\x00\x31\x00\x00\x25\x14\x23\x21\x22\
-\x35\x11\x34\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x33\
-\x21\x32\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x33\x21\x32\x15\x03\
-\x16\x15\x14\x2b\x01\x27\x01\x26\x35\x34\x33\x21\x17\x03\x85\x15\
-\xfd\x2d\x14\x14\x02\xd3\x15\x15\xfe\x19\x14\x14\x01\x8f\x15\x15\
-\xfe\x71\x14\x14\x01\xe7\x15\xfa\x04\x14\x96\x0e\xfe\xcf\x09\x17\
-\x01\x02\x10\x14\x14\x14\x04\xe2\x14\x14\xae\x15\x14\xfe\xef\x14\
-\x15\xae\x14\x15\xfe\xde\x15\x14\x04\xd9\x04\x0b\x10\x06\x01\x2d\
-\x08\x0b\x10\x0a\x00\x00\x00\x00\x02\x00\x85\x00\x00\x02\x7b\x06\
-\xd1\x00\x0b\x00\x19\x00\x00\x25\x14\x2b\x01\x22\x35\x11\x34\x3b\
-\x01\x32\x15\x13\x01\x07\x23\x22\x35\x34\x37\x13\x37\x21\x32\x15\
-\x14\x01\x75\x15\xc2\x15\x15\xc2\x15\xfe\xfe\xce\x0e\x97\x17\x06\
-\xc7\x10\x01\x02\x17\x14\x14\x14\x04\xe2\x14\x14\x01\xb8\xfe\xd3\
-\x06\x10\x06\x0b\x01\x2d\x08\x13\x08\x00\x00\x00\x02\xff\xe4\x00\
-\x00\x02\x21\x06\xd1\x00\x0b\x00\x22\x00\x00\x25\x14\x2b\x01\x22\
-\x35\x11\x34\x3b\x01\x32\x15\x37\x16\x15\x14\x2b\x01\x2f\x01\x26\
-\x23\x22\x0f\x02\x23\x22\x35\x34\x37\x13\x37\x33\x17\x01\x75\x14\
-\xc3\x14\x14\xc3\x14\xa6\x06\x16\xa6\x10\x44\x06\x08\x08\x09\x41\
-\x11\xa5\x17\x07\xd4\x11\x64\x10\x14\x14\x14\x04\xe2\x14\x14\xa6\
-\x09\x08\x10\x0a\x69\x0c\x0c\x69\x0a\x10\x08\x09\x01\x2d\x08\x08\
-\x00\x00\x00\x00\x03\xff\xd3\x00\x00\x02\x2b\x06\x98\x00\x0b\x00\
-\x17\x00\x23\x00\x00\x25\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\
-\x15\x13\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x05\x14\x06\
-\x23\x22\x26\x35\x34\x36\x33\x32\x16\x01\x75\x15\xc2\x15\x15\xc2\
-\x15\xb6\x4a\x35\x37\x48\x4a\x35\x35\x4a\xfe\xa6\x4a\x35\x37\x48\
-\x4a\x35\x35\x4a\x14\x14\x14\x04\xe2\x14\x14\x01\x23\x36\x49\x47\
-\x38\x35\x4a\x4a\x35\x36\x49\x47\x38\x35\x4a\x4a\x00\x00\x00\x00\
-\x02\xff\x92\x00\x00\x01\x84\x06\xd3\x00\x0b\x00\x19\x00\x00\x25\
-\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x37\x16\x15\x14\x2b\
-\x01\x27\x01\x26\x35\x34\x33\x21\x17\x01\x75\x14\xc3\x14\x14\xc3\
-\x14\x0b\x04\x15\x95\x0f\xfe\xd0\x09\x17\x01\x02\x10\x14\x14\x14\
-\x04\xe2\x14\x14\xa6\x04\x0b\x10\x06\x01\x2d\x08\x0b\x10\x0a\x00\
-\x03\x00\x6c\xff\xec\x03\xca\x06\xd1\x00\x0f\x00\x1f\x00\x2d\x00\
-\x00\x01\x14\x06\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\x32\x16\
-\x15\x03\x11\x34\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\x01\x32\
-\x36\x13\x01\x07\x23\x22\x35\x34\x37\x13\x37\x21\x32\x15\x14\x03\
-\xca\xd1\xac\x64\xac\xd1\xd1\xac\x64\xac\xd1\xeb\x54\x3e\x64\x3e\
-\x56\x56\x3e\x64\x3e\x54\xb0\xfe\xcf\x0f\x97\x17\x06\xc7\x10\x01\
-\x02\x17\x01\x56\xa4\xc6\xc6\xa4\x02\x5e\xa4\xc7\xc7\xa4\xfd\xa2\
-\x02\x5e\x40\x54\x56\x3e\xfd\xa2\x3d\x56\x54\x05\x97\xfe\xd3\x06\
-\x10\x06\x0b\x01\x2d\x08\x13\x08\x00\x00\x00\x00\x03\x00\x6c\xff\
-\xec\x03\xca\x06\xd1\x00\x0f\x00\x1f\x00\x36\x00\x00\x01\x14\x06\
-\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\x32\x16\x15\x03\x11\x34\
-\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\x01\x32\x36\x13\x16\x15\
-\x14\x2b\x01\x2f\x01\x26\x23\x22\x0f\x02\x23\x22\x35\x34\x37\x13\
-\x37\x33\x17\x03\xca\xd1\xac\x64\xac\xd1\xd1\xac\x64\xac\xd1\xeb\
-\x54\x3e\x64\x3e\x56\x56\x3e\x64\x3e\x54\x58\x06\x17\xa6\x10\x43\
-\x07\x08\x08\x08\x42\x10\xa6\x17\x07\xd5\x10\x64\x11\x01\x56\xa4\
-\xc6\xc6\xa4\x02\x5e\xa4\xc7\xc7\xa4\xfd\xa2\x02\x5e\x40\x54\x56\
-\x3e\xfd\xa2\x3d\x56\x54\x04\x85\x09\x08\x10\x0a\x69\x0c\x0c\x69\
-\x0a\x10\x08\x09\x01\x2d\x08\x08\x00\x00\x00\x00\x03\x00\x6c\xff\
-\xec\x03\xca\x06\xd3\x00\x0f\x00\x1f\x00\x2d\x00\x00\x01\x14\x06\
-\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\x32\x16\x15\x03\x11\x34\
-\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\x01\x32\x36\x03\x16\x15\
-\x14\x2b\x01\x27\x01\x26\x35\x34\x33\x21\x17\x03\xca\xd1\xac\x64\
-\xac\xd1\xd1\xac\x64\xac\xd1\xeb\x54\x3e\x64\x3e\x56\x56\x3e\x64\
-\x3e\x54\x44\x04\x14\x96\x0e\xfe\xcf\x08\x16\x01\x02\x10\x01\x56\
-\xa4\xc6\xc6\xa4\x02\x5e\xa4\xc7\xc7\xa4\xfd\xa2\x02\x5e\x40\x54\
-\x56\x3e\xfd\xa2\x3d\x56\x54\x04\x85\x04\x0b\x10\x06\x01\x2d\x08\
-\x0b\x10\x0a\x00\x02\x00\x6c\xff\xec\x03\xca\x06\xd1\x00\x1b\x00\
-\x29\x00\x00\x01\x14\x06\x2b\x01\x22\x26\x35\x11\x34\x3b\x01\x32\
-\x15\x11\x14\x16\x3b\x01\x32\x36\x35\x11\x34\x3b\x01\x32\x15\x03\
-\x01\x07\x23\x22\x35\x34\x37\x13\x37\x21\x32\x15\x14\x03\xca\xd1\
-\xac\x64\xac\xd1\x14\xc1\x14\x56\x3e\x64\x3e\x54\x14\xc3\x14\x3b\
-\xfe\xcf\x0f\x97\x17\x06\xc7\x10\x01\x02\x17\x01\x56\xa4\xc6\xc6\
-\xa4\x03\xa0\x14\x14\xfc\x60\x3d\x56\x54\x3f\x03\xa0\x14\x14\x01\
-\xb8\xfe\xd3\x06\x10\x06\x0b\x01\x2d\x08\x13\x08\x00\x00\x00\x00\
-\x02\x00\x6c\xff\xec\x03\xca\x06\xd1\x00\x1b\x00\x32\x00\x00\x01\
-\x14\x06\x2b\x01\x22\x26\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x16\
-\x3b\x01\x32\x36\x35\x11\x34\x3b\x01\x32\x15\x27\x16\x15\x14\x2b\
-\x01\x2f\x01\x26\x23\x22\x0f\x02\x23\x22\x35\x34\x37\x13\x37\x33\
-\x17\x03\xca\xd1\xac\x64\xac\xd1\x14\xc1\x14\x56\x3e\x64\x3e\x54\
-\x14\xc3\x14\x93\x06\x17\xa6\x10\x43\x07\x08\x08\x08\x42\x10\xa6\
-\x17\x07\xd5\x10\x64\x11\x01\x56\xa4\xc6\xc6\xa4\x03\xa0\x14\x14\
-\xfc\x60\x3d\x56\x54\x3f\x03\xa0\x14\x14\xa6\x09\x08\x10\x0a\x69\
-\x0c\x0c\x69\x0a\x10\x08\x09\x01\x2d\x08\x08\x00\x02\x00\x6c\xff\
-\xec\x03\xca\x06\xd3\x00\x1b\x00\x29\x00\x00\x01\x14\x06\x2b\x01\
-\x22\x26\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x16\x3b\x01\x32\x36\
-\x35\x11\x34\x3b\x01\x32\x15\x25\x16\x15\x14\x2b\x01\x27\x01\x26\
-\x35\x34\x33\x21\x17\x03\xca\xd1\xac\x64\xac\xd1\x14\xc1\x14\x56\
-\x3e\x64\x3e\x54\x14\xc3\x14\xfe\xd1\x04\x14\x96\x0e\xfe\xcf\x08\
-\x16\x01\x02\x10\x01\x56\xa4\xc6\xc6\xa4\x03\xa0\x14\x14\xfc\x60\
-\x3d\x56\x54\x3f\x03\xa0\x14\x14\xa6\x04\x0b\x10\x06\x01\x2d\x08\
-\x0b\x10\x0a\x00\x01\x00\x76\x00\x00\x01\x5f\x03\xaa\x00\x0b\x00\
-\x00\x25\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x01\x5f\x14\
-\xc1\x14\x14\xc1\x14\x14\x14\x14\x03\x82\x14\x14\x00\x00\x00\x00\
-\x01\x00\xe3\x04\x1b\x03\x20\x05\x71\x00\x16\x00\x00\x01\x16\x15\
-\x14\x2b\x01\x2f\x01\x26\x23\x22\x0f\x02\x23\x22\x35\x34\x37\x13\
-\x37\x33\x17\x03\x1a\x06\x16\xa6\x10\x44\x06\x08\x08\x09\x41\x11\
-\xa5\x17\x06\xd5\x11\x64\x10\x04\x3b\x08\x08\x10\x0a\x68\x0d\x0d\
-\x68\x0a\x10\x08\x08\x01\x2d\x09\x09\x00\x00\x00\x01\x00\xbc\x04\
-\x2f\x03\x45\x05\x50\x00\x21\x00\x00\x01\x06\x23\x22\x2f\x01\x26\
-\x23\x22\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\x33\x32\x1f\x01\
-\x16\x33\x32\x36\x33\x32\x1f\x01\x16\x15\x14\x03\x43\x58\x77\x3f\
-\x50\x25\x16\x1d\x21\x3d\x06\x05\x08\x56\x0a\x33\x48\x56\x3f\x4c\
-\x23\x21\x18\x25\x40\x04\x08\x06\x52\x08\x04\xdb\xac\x3e\x14\x15\
-\x4a\x04\x3f\x09\x06\x16\x42\x5a\x35\x19\x16\x51\x06\x41\x06\x0b\
-\x04\x00\x00\x00\x01\x01\x06\x04\x5e\x03\x02\x05\x35\x00\x0b\x00\
-\x00\x01\x14\x23\x21\x22\x3d\x01\x34\x33\x21\x32\x15\x03\x02\x15\
-\xfe\x2d\x14\x14\x01\xd3\x15\x04\x73\x15\x15\xae\x14\x14\x00\x00\
-\x01\x01\x06\x04\x19\x02\xf8\x05\x6f\x00\x19\x00\x00\x01\x14\x06\
-\x2b\x01\x22\x26\x3d\x01\x34\x3b\x01\x32\x1d\x01\x14\x3b\x01\x32\
-\x3d\x01\x34\x3b\x01\x32\x15\x02\xf8\x71\x5c\x58\x5e\x6f\x14\x69\
-\x14\x3c\x58\x39\x15\x6a\x15\x04\xdb\x56\x6c\x6a\x58\x7f\x15\x15\
-\x58\x39\x39\x58\x15\x15\x00\x00\x01\x01\x6e\x04\x1d\x02\x93\x05\
-\x68\x00\x0d\x00\x00\x01\x14\x06\x23\x22\x26\x3d\x01\x34\x36\x33\
-\x32\x16\x15\x02\x93\x4e\x44\x43\x50\x50\x43\x44\x4e\x04\xa6\x3e\
-\x4b\x4b\x3e\x39\x3e\x4b\x4b\x3e\x00\x00\x00\x00\x02\x01\x33\x04\
-\x1d\x02\xcd\x05\xdd\x00\x0d\x00\x19\x00\x00\x01\x14\x06\x23\x22\
-\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\x26\x23\x22\x06\
-\x1d\x01\x14\x33\x32\x02\xcd\x6f\x5e\x5e\x6f\x6f\x5e\x5e\x6f\x92\
-\x23\x18\x19\x23\x3c\x3b\x04\xdf\x58\x6a\x6a\x58\x3c\x58\x6a\x6a\
-\x58\x3c\x3c\x16\x25\x25\x16\x3c\x39\x00\x00\x00\x02\x01\x49\x04\
-\x1d\x03\x84\x05\x73\x00\x10\x00\x1f\x00\x00\x01\x03\x07\x23\x22\
-\x35\x34\x37\x34\x35\x13\x36\x37\x33\x32\x15\x14\x05\x03\x07\x23\
-\x22\x35\x34\x37\x13\x36\x3b\x01\x32\x15\x14\x03\x80\xbe\x11\x51\
-\x15\x02\x66\x0d\x06\xaa\x14\xfe\xfc\xae\x12\x63\x14\x02\x66\x05\
-\x0e\xaa\x16\x05\x54\xfe\xd3\x0a\x10\x02\x04\x02\x02\x01\x2d\x0d\
-\x02\x11\x08\x06\xfe\xd3\x0a\x10\x04\x06\x01\x2d\x0f\x11\x02\x00\
-\x01\x01\xa1\xfe\x4a\x02\xe3\x00\x0e\x00\x0c\x00\x00\x01\x14\x23\
-\x22\x26\x3d\x01\x33\x15\x14\x17\x16\x15\x02\xe3\x17\x77\xb4\xbe\
-\x61\x23\xfe\x5f\x15\xae\x75\xa1\xad\x48\x1b\x0a\x0e\x00\x00\x00\
-\x01\x00\xe1\x04\x1d\x03\x1e\x05\x73\x00\x16\x00\x00\x01\x03\x07\
-\x23\x27\x03\x26\x35\x34\x3b\x01\x1f\x01\x16\x33\x32\x3f\x02\x33\
-\x32\x15\x14\x03\x18\xd7\x10\x64\x11\xd5\x06\x17\xa5\x11\x41\x09\
-\x06\x08\x08\x44\x10\xa6\x16\x05\x52\xfe\xd3\x08\x08\x01\x2d\x08\
-\x08\x11\x0b\x68\x0c\x0c\x68\x0b\x11\x08\x00\x00\x01\xff\xe0\x00\
-\x00\x03\x86\x05\x0a\x00\x2f\x00\x00\x25\x14\x23\x21\x22\x35\x11\
-\x34\x23\x22\x06\x23\x22\x2f\x01\x26\x35\x34\x3f\x02\x11\x34\x3b\
-\x01\x32\x15\x11\x14\x33\x32\x36\x33\x32\x1f\x01\x16\x15\x14\x0f\
-\x02\x11\x14\x33\x21\x32\x15\x03\x86\x15\xfd\x2d\x14\x0e\x06\x15\
-\x04\x06\x08\x66\x09\x09\x9b\x06\x14\xc3\x15\x10\x06\x17\x06\x08\
-\x06\x64\x09\x09\x9f\x06\x14\x01\xe7\x15\x14\x14\x14\x01\x69\x16\
-\x0c\x08\x5f\x08\x06\x06\x08\x9a\x0e\x02\x44\x14\x14\xfe\xcf\x17\
-\x10\x06\x5e\x08\x06\x06\x09\x9d\x0f\xfe\x5b\x15\x14\x00\x00\x00\
-\x01\xff\xcd\x00\x00\x02\x0a\x05\x0a\x00\x2b\x00\x00\x01\x0f\x01\
-\x11\x14\x2b\x01\x22\x35\x11\x34\x23\x22\x06\x23\x22\x2f\x01\x26\
-\x35\x34\x3f\x02\x11\x34\x3b\x01\x32\x15\x11\x14\x33\x32\x3f\x01\
-\x36\x33\x32\x1f\x01\x16\x15\x14\x02\x02\x9b\x07\x14\xc1\x14\x0e\
-\x0b\x12\x02\x02\x0c\x66\x09\x09\x9b\x06\x14\xc1\x14\x13\x0a\x0a\
-\x07\x04\x06\x06\x06\x5e\x08\x03\x3b\x9b\x0f\xfd\x83\x14\x14\x01\
-\x69\x16\x0c\x08\x5f\x08\x06\x06\x08\x9a\x0e\x02\x44\x14\x14\xfe\
-\xcf\x13\x08\x02\x02\x06\x60\x0c\x02\x06\x00\x00\x02\x00\x26\xff\
-\xec\x03\x5d\x06\xd3\x00\x3a\x00\x51\x00\x00\x01\x22\x06\x15\x14\
-\x17\x16\x17\x16\x17\x16\x15\x14\x06\x2b\x01\x22\x26\x35\x34\x3f\
-\x01\x36\x33\x32\x17\x16\x3b\x01\x32\x36\x35\x34\x27\x26\x27\x26\
-\x27\x26\x35\x34\x36\x3b\x01\x32\x17\x16\x17\x16\x15\x14\x0f\x01\
-\x06\x23\x22\x27\x26\x23\x01\x03\x07\x23\x27\x03\x26\x35\x34\x3b\
-\x01\x1f\x01\x16\x33\x32\x3f\x02\x33\x32\x15\x14\x01\xc2\x3e\x56\
-\x42\x16\x96\xaa\x49\x4e\xd1\xac\x52\xac\xbc\x0c\xb2\x05\x06\x08\
-\x1f\x24\x54\x52\x3c\x58\x3c\x22\x7d\xb7\x47\x56\xd1\xac\x1e\x8c\
-\x5e\x35\x2b\x23\x0c\xb3\x04\x06\x08\x12\x3e\x4c\x01\x0b\xd7\x11\
-\x64\x11\xd5\x06\x17\xa6\x10\x42\x08\x06\x08\x08\x44\x10\xa6\x17\
-\x04\x48\x56\x3e\x3f\x2b\x11\x43\x4e\x5c\x63\x93\xa4\xc6\xc0\x35\
-\x08\x07\x58\x02\x3e\x49\x56\x3d\x46\x2f\x1a\x3c\x58\x4e\x5e\x8f\
-\xa4\xc7\x44\x27\x3d\x33\x17\x0a\x06\x58\x02\x1e\x67\x02\x6a\xfe\
-\xd3\x08\x08\x01\x2d\x08\x09\x10\x0a\x69\x0c\x0c\x69\x0a\x10\x09\
-\x00\x00\x00\x00\x02\x00\x51\xff\xec\x03\x53\x05\x73\x00\x39\x00\
-\x50\x00\x00\x01\x32\x17\x16\x17\x16\x15\x14\x0f\x01\x06\x23\x22\
-\x27\x26\x27\x26\x2b\x01\x22\x15\x14\x17\x16\x17\x16\x15\x14\x06\
-\x2b\x01\x22\x27\x26\x35\x34\x3f\x01\x36\x33\x32\x17\x16\x17\x16\
-\x3b\x01\x32\x35\x34\x27\x26\x27\x26\x35\x34\x36\x33\x01\x03\x07\
-\x23\x27\x03\x26\x35\x34\x3b\x01\x1f\x01\x16\x33\x32\x3f\x02\x33\
-\x32\x15\x14\x01\xef\x8d\x5e\x33\x25\x21\x0c\xa8\x04\x06\x09\x08\
-\x31\x0a\x23\x37\x3c\x70\x4d\x65\x66\xf4\xc1\x9f\x3c\xaa\x60\x58\
-\x0c\xa8\x04\x06\x07\x0a\x27\x14\x23\x35\x3c\x76\x4d\x67\x66\xf0\
-\xc1\x97\x01\x3a\xd7\x11\x64\x11\xd5\x06\x17\xa6\x10\x42\x08\x06\
-\x08\x08\x44\x10\xa6\x17\x03\xbe\x45\x25\x3b\x32\x16\x0a\x06\x52\
-\x02\x0c\x48\x0a\x23\x4e\x33\x13\x14\x15\x41\xbf\x91\xb4\x64\x5c\
-\x31\x08\x07\x51\x02\x0e\x41\x13\x21\x58\x34\x10\x15\x12\x3d\xc5\
-\x8b\xb2\x01\x94\xfe\xd3\x08\x08\x01\x2d\x08\x08\x11\x0b\x68\x0c\
-\x0c\x68\x0b\x11\x08\x00\x00\x00\x02\x00\x14\x00\x00\x03\x47\x06\
-\xd3\x00\x1f\x00\x36\x00\x00\x09\x01\x06\x15\x14\x33\x21\x32\x1d\
-\x01\x14\x23\x21\x22\x35\x34\x37\x01\x36\x35\x34\x23\x21\x22\x3d\
-\x01\x34\x33\x21\x32\x15\x14\x0b\x01\x07\x23\x27\x03\x26\x35\x34\
-\x3b\x01\x1f\x01\x16\x33\x32\x3f\x02\x33\x32\x15\x14\x03\x43\xfe\
-\x35\x04\x17\x01\xa0\x14\x14\xfd\x00\x17\x04\x01\xc9\x04\x17\xfe\
-\x8c\x15\x15\x02\xd7\x16\x6a\xd7\x11\x64\x10\xd5\x07\x17\xa6\x10\
-\x42\x08\x06\x08\x08\x44\x10\xa6\x17\x04\xee\xfc\x06\x08\x05\x10\
-\x14\xaf\x14\x10\x04\x09\x03\xfa\x08\x04\x10\x15\xae\x14\x10\x04\
-\x01\xbc\xfe\xd3\x08\x08\x01\x2d\x08\x09\x10\x0a\x69\x0c\x0c\x69\
-\x0a\x10\x09\x00\x02\x00\x0e\x00\x00\x03\x3d\x05\x73\x00\x1f\x00\
-\x36\x00\x00\x09\x01\x06\x15\x14\x33\x21\x32\x1d\x01\x14\x23\x21\
-\x22\x35\x34\x37\x01\x36\x35\x34\x23\x21\x22\x3d\x01\x34\x33\x21\
-\x32\x15\x14\x0b\x01\x07\x23\x27\x03\x26\x35\x34\x3b\x01\x1f\x01\
-\x16\x33\x32\x3f\x02\x33\x32\x15\x14\x03\x39\xfe\x73\x04\x16\x01\
-\x60\x15\x15\xfd\x07\x17\x04\x01\x8b\x04\x16\xfe\xc5\x15\x15\x02\
-\xd7\x16\x6c\xd7\x11\x64\x11\xd5\x06\x17\xa6\x10\x42\x08\x06\x08\
-\x08\x44\x10\xa6\x17\x03\x89\xfd\x6d\x04\x0b\x10\x14\xaf\x14\x10\
-\x09\x06\x02\x93\x06\x09\x10\x14\xae\x15\x10\x09\x01\xc3\xfe\xd3\
-\x08\x08\x01\x2d\x08\x08\x11\x0b\x68\x0c\x0c\x68\x0b\x11\x08\x00\
-\x02\x01\x99\xfe\xa2\x02\x68\x05\x98\x00\x03\x00\x07\x00\x00\x01\
-\x33\x11\x23\x11\x33\x11\x23\x01\x99\xcf\xcf\xcf\xcf\x05\x98\xfd\
-\x0a\xfe\xf6\xfd\x0a\x00\x00\x00\x02\x00\x24\x00\x00\x03\xbe\x05\
-\x0a\x00\x19\x00\x33\x00\x00\x01\x14\x06\x23\x21\x22\x35\x11\x34\
-\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x35\x11\x34\x33\x21\x32\x16\
-\x15\x03\x11\x34\x26\x2b\x01\x22\x15\x11\x14\x3b\x01\x32\x1d\x01\
-\x14\x2b\x01\x22\x15\x11\x14\x3b\x01\x32\x36\x03\xbe\xcd\xb0\xfe\
-\x5c\x15\x14\x3c\x14\x14\x3c\x14\x15\x01\xa4\xb0\xcd\xea\x56\x3d\
-\xb9\x14\x14\xa4\x15\x15\xa4\x14\x14\xb9\x3d\x56\x01\x7d\xb0\xcd\
-\x14\x01\xe8\x14\x15\xc0\x15\x14\x01\xe8\x14\xcd\xb0\xfd\xdd\x02\
-\x36\x3b\x58\x14\xfe\xef\x14\x15\xc0\x15\x14\xfe\xf0\x15\x54\x00\
-\x02\x00\x89\xff\xec\x03\xfe\x05\x1f\x00\x45\x00\x53\x00\x00\x01\
-\x16\x15\x14\x0f\x01\x06\x15\x34\x16\x15\x11\x14\x06\x23\x22\x26\
-\x3d\x01\x34\x36\x33\x32\x16\x33\x32\x3d\x01\x34\x23\x22\x0f\x01\
-\x06\x23\x22\x2f\x01\x26\x35\x34\x3f\x01\x36\x35\x34\x23\x22\x07\
-\x06\x23\x22\x2f\x01\x26\x35\x34\x36\x33\x32\x17\x16\x31\x32\x3f\
-\x01\x36\x33\x32\x17\x01\x35\x34\x26\x23\x22\x06\x1d\x01\x14\x16\
-\x33\x32\x36\x03\xfa\x04\x08\x71\x08\x08\xd3\xac\xac\xd1\xcb\x91\
-\x35\x6d\x04\x0e\x10\x08\x08\x27\x04\x0b\x08\x06\x4e\x04\x08\x63\
-\x0c\x54\x56\x2f\x13\x08\x04\x06\xb0\x0c\xba\xac\x7f\x62\x42\x06\
-\x08\x5c\x08\x09\x06\x06\xfe\xe9\x56\x3d\x3e\x53\x53\x3e\x3d\x56\
-\x04\x87\x04\x08\x0a\x07\x4f\x09\x0e\x02\x33\x1f\xfd\xa2\xa2\xc8\
-\xc6\xa4\x4e\x93\xd7\x2b\x17\x52\x16\x06\x1a\x05\x09\x6e\x04\x09\
-\x0a\x06\x43\x09\x0a\x21\x61\x24\x04\x58\x06\x08\x33\xbf\x42\x2b\
-\x04\x40\x06\x0a\xfc\x64\x4e\x3b\x58\x56\x3d\x4e\x3d\x56\x58\x00\
-\x02\xff\xec\x00\x00\x03\xad\x06\xd1\x00\x1a\x00\x28\x00\x00\x09\
-\x01\x11\x14\x2b\x01\x22\x35\x11\x01\x26\x35\x34\x3b\x01\x17\x13\
-\x16\x33\x32\x37\x13\x37\x33\x32\x15\x14\x03\x01\x07\x23\x22\x35\
-\x34\x37\x13\x37\x21\x32\x15\x14\x03\xa8\xfe\x9a\x14\xc3\x15\xfe\
-\x9b\x05\x17\xe3\x12\xc3\x06\x0c\x0d\x06\xc2\x13\xe1\x17\x6b\xfe\
-\xcf\x0e\x98\x17\x07\xc6\x11\x01\x02\x16\x04\xec\xfd\x60\xfd\xc8\
-\x14\x14\x02\x38\x02\xa0\x0c\x02\x10\x0c\xfe\x6f\x0f\x0f\x01\x91\
-\x0c\x10\x02\x01\xb6\xfe\xd3\x06\x10\x06\x0b\x01\x2d\x08\x13\x08\
-\x00\x00\x00\x00\x02\x00\x62\xfe\x1f\x03\x64\x05\x71\x00\x31\x00\
-\x3f\x00\x00\x05\x14\x06\x23\x22\x27\x26\x27\x26\x35\x34\x3f\x01\
-\x36\x37\x32\x17\x16\x33\x32\x36\x3d\x01\x34\x23\x22\x06\x23\x22\
-\x26\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x16\x33\x32\x36\x35\x11\
-\x34\x3b\x01\x32\x15\x11\x01\x07\x23\x22\x35\x34\x37\x13\x37\x21\
-\x32\x15\x14\x03\x5c\xcd\xb0\x8d\x5d\x35\x29\x21\x0d\xb0\x04\x06\
-\x0a\x13\x33\x52\x3d\x56\x0e\x0a\x5a\x21\xac\xd1\x14\xc3\x15\x51\
-\x40\x3f\x54\x15\xc0\x15\xfe\xcf\x0f\x97\x17\x06\xc7\x10\x01\x03\
-\x16\x64\xb0\xcd\x42\x27\x3d\x33\x19\x08\x06\x58\x02\x02\x24\x61\
-\x58\x3c\x7e\x15\x1d\xc7\xa3\x02\x2c\x14\x14\xfd\xd4\x3f\x54\x56\
-\x3d\x02\x2c\x14\x14\x01\xb8\xfe\xd3\x06\x10\x06\x0a\x01\x2d\x09\
-\x13\x08\x00\x00\x02\x00\x89\x00\x00\x03\xbe\x05\x0a\x00\x18\x00\
-\x26\x00\x00\x01\x32\x16\x15\x14\x06\x2b\x01\x22\x15\x11\x14\x2b\
-\x01\x22\x35\x11\x34\x3b\x01\x32\x1d\x01\x14\x33\x01\x35\x34\x26\
-\x2b\x01\x22\x15\x11\x14\x3b\x01\x32\x36\x02\x41\xae\xcf\xd3\xaa\
-\xb8\x14\x15\xc3\x14\x14\xc3\x15\x14\x01\x4c\x56\x3e\xb8\x14\x14\
-\xb8\x3e\x56\x04\x5a\xcf\xae\xa0\xca\x15\xfe\xb6\x14\x14\x04\xe2\
-\x14\x14\x87\x15\xfe\x85\x13\x3b\x58\x14\xfe\xef\x14\x56\x00\x00\
-\x02\x00\x76\xfe\x34\x03\x70\x05\x0a\x00\x1d\x00\x2b\x00\x00\x01\
-\x14\x06\x23\x22\x26\x23\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\
-\x3b\x01\x32\x15\x11\x14\x33\x32\x36\x33\x32\x16\x15\x07\x35\x34\
-\x26\x23\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x03\x70\xcd\x9e\x2b\
-\x64\x08\x0f\x14\xc1\x14\x14\xc1\x14\x0f\x02\x66\x38\x97\xcb\xec\
-\x52\x3f\x40\x54\x54\x40\x3f\x52\x01\x6a\x9d\xcd\x29\x17\xfe\x36\
-\x14\x14\x06\xae\x14\x14\xfe\xa2\x17\x29\xcb\x9d\xd8\xd8\x3d\x54\
-\x54\x3d\xd8\x3d\x56\x54\x00\x00\x01\x00\xfd\x01\xfe\x05\xab\x02\
-\xc9\x00\x03\x00\x00\x13\x21\x15\x21\xfd\x04\xae\xfb\x52\x02\xc9\
-\xcb\x00\x00\x00\x01\x01\x14\x00\x14\x05\xb2\x04\xb2\x00\x0b\x00\
-\x00\x09\x02\x17\x09\x01\x07\x09\x01\x27\x09\x01\x01\x9f\x01\xc3\
-\x01\xc2\x8e\xfe\x3d\x01\xc3\x8e\xfe\x3e\xfe\x3d\x8b\x01\xc3\xfe\
-\x3d\x04\xb2\xfe\x3e\x01\xc2\x8b\xfe\x3b\xfe\x3e\x8c\x01\xc3\xfe\
-\x3d\x8c\x01\xc2\x01\xc5\x00\x00\x01\x00\x74\x02\x04\x02\x55\x05\
-\x0a\x00\x24\x00\x00\x01\x14\x23\x21\x22\x3d\x01\x34\x3b\x01\x32\
-\x35\x11\x34\x23\x22\x0f\x01\x06\x23\x22\x2f\x01\x26\x35\x34\x3f\
-\x01\x33\x32\x15\x11\x14\x3b\x01\x32\x15\x02\x55\x0e\xfe\x4c\x0f\
-\x0f\x7f\x0e\x0c\x08\x05\x26\x09\x02\x04\x06\x54\x04\x04\xec\x49\
-\x0d\x0e\x7f\x0e\x02\x10\x0c\x0c\x69\x0c\x0c\x01\x69\x0c\x04\x27\
-\x04\x04\x4c\x04\x04\x04\x04\xd3\x0c\xfd\x93\x0c\x0c\x00\x00\x00\
-\x01\x00\x41\x02\x04\x02\x5c\x05\x17\x00\x2b\x00\x00\x01\x32\x16\
-\x15\x14\x07\x06\x07\x06\x07\x06\x1d\x01\x14\x33\x21\x32\x1d\x01\
-\x14\x23\x21\x22\x3d\x01\x34\x37\x3e\x01\x35\x34\x26\x2b\x01\x22\
-\x06\x23\x2f\x01\x26\x35\x34\x36\x33\x01\x60\x72\x8a\x3a\x2b\x74\
-\x4e\x19\x27\x0f\x01\x41\x0c\x0c\xfe\x23\x0e\x3b\x35\xf8\x39\x29\
-\x2f\x32\x39\x02\x08\x73\x08\x7d\x73\x05\x17\x77\x63\x58\x3d\x2d\
-\x44\x2d\x18\x25\x2f\x0d\x0c\x0c\x69\x0c\x0c\x8e\x5e\x43\x3e\x85\
-\x3b\x25\x34\x52\x04\x35\x02\x06\x21\x71\x00\x00\x01\x00\x41\x01\
-\xf8\x02\x51\x05\x17\x00\x3e\x00\x00\x01\x14\x06\x2b\x01\x22\x26\
-\x35\x36\x3f\x01\x36\x33\x32\x17\x16\x3b\x01\x32\x36\x3d\x01\x34\
-\x26\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x36\x3d\x01\x34\x26\x2b\
-\x01\x22\x06\x23\x2f\x01\x26\x35\x34\x36\x3b\x01\x32\x16\x1d\x01\
-\x14\x07\x06\x35\x34\x17\x16\x15\x02\x51\x87\x75\x24\x75\x7b\x02\
-\x06\x77\x02\x04\x08\x13\x16\x3a\x24\x29\x3a\x3a\x29\x78\x0f\x0f\
-\x78\x29\x3a\x3a\x29\x24\x32\x39\x02\x08\x73\x08\x7d\x73\x24\x73\
-\x89\x1e\x2f\x2b\x22\x02\xdb\x68\x7b\x72\x21\x06\x02\x36\x02\x25\
-\x2d\x33\x25\x2b\x25\x31\x0c\x69\x0c\x33\x25\x12\x25\x34\x52\x04\
-\x35\x02\x06\x21\x71\x7d\x69\x12\x31\x25\x3a\x02\x05\x38\x2d\x33\
-\x00\x00\x00\x00\x03\x00\x6e\x00\x00\x07\x57\x05\x0a\x00\x24\x00\
-\x34\x00\x61\x00\x00\x01\x14\x23\x21\x22\x3d\x01\x34\x3b\x01\x32\
-\x35\x11\x34\x23\x22\x0f\x01\x06\x23\x22\x2f\x01\x26\x35\x34\x3f\
-\x01\x33\x32\x15\x11\x14\x3b\x01\x32\x15\x09\x01\x06\x07\x23\x22\
-\x35\x34\x37\x01\x36\x37\x33\x32\x15\x14\x01\x32\x16\x15\x14\x07\
-\x06\x07\x06\x07\x06\x1d\x01\x14\x33\x21\x32\x1d\x01\x14\x23\x21\
-\x22\x3d\x01\x34\x37\x3e\x01\x35\x34\x26\x2b\x01\x22\x06\x33\x22\
-\x2f\x01\x26\x35\x34\x36\x33\x02\x39\x0d\xfe\x61\x0f\x0f\x79\x0c\
-\x0a\x07\x06\x25\x04\x06\x04\x04\x50\x06\x06\xdf\x46\x0e\x0d\x78\
-\x0d\x02\xed\xfd\xea\x04\x0f\x6e\x17\x04\x02\x17\x02\x10\x6f\x16\
-\x01\x3c\x6e\x83\x37\x29\x6e\x4a\x19\x25\x0d\x01\x33\x0c\x0c\xfe\
-\x39\x0e\x39\x33\xec\x37\x27\x2d\x2d\x3c\x02\x04\x04\x6e\x09\x79\
-\x6d\x02\x44\x0d\x0d\x60\x0c\x0a\x01\x50\x0f\x07\x22\x04\x04\x45\
-\x06\x02\x05\x04\xc4\x0c\xfd\xbc\x0a\x0c\x02\x4a\xfb\x1e\x0a\x02\
-\x10\x02\x0b\x04\xe1\x06\x06\x10\x02\xfd\xe5\x6e\x5d\x4f\x3c\x2b\
-\x3d\x29\x19\x21\x2d\x0c\x0a\x0c\x61\x0c\x0c\x83\x56\x42\x39\x7b\
-\x37\x23\x31\x4b\x02\x31\x06\x02\x1f\x68\x00\x00\x04\x00\x6e\x00\
-\x00\x07\x85\x05\x0a\x00\x24\x00\x34\x00\x52\x00\x5f\x00\x00\x01\
-\x14\x23\x21\x22\x3d\x01\x34\x3b\x01\x32\x35\x11\x34\x23\x22\x0f\
-\x01\x06\x23\x22\x2f\x01\x26\x35\x34\x3f\x01\x33\x32\x15\x11\x14\
-\x3b\x01\x32\x15\x09\x01\x06\x07\x23\x22\x35\x34\x37\x01\x36\x37\
-\x33\x32\x15\x14\x01\x14\x2b\x01\x22\x1d\x01\x14\x2b\x01\x22\x3d\
-\x01\x34\x23\x21\x22\x3d\x01\x01\x37\x33\x32\x15\x11\x14\x3b\x01\
-\x32\x15\x25\x35\x34\x23\x22\x0f\x01\x06\x15\x14\x3b\x01\x32\x02\
-\x39\x0d\xfe\x61\x0f\x0f\x79\x0c\x0a\x07\x06\x25\x04\x06\x04\x04\
-\x50\x06\x06\xdf\x46\x0e\x0d\x78\x0d\x02\xed\xfd\xea\x04\x0f\x6e\
-\x17\x04\x02\x17\x02\x10\x6f\x16\x02\x5b\x0f\x54\x0c\x0c\x7b\x0d\
-\x0e\xfe\xd1\x0e\x01\x52\x0a\x77\x0c\x0c\x54\x0f\xfe\xfd\x0c\x06\
-\x06\x85\x02\x0c\x85\x0e\x02\x44\x0d\x0d\x60\x0c\x0a\x01\x50\x0f\
-\x07\x22\x04\x04\x45\x06\x02\x05\x04\xc4\x0c\xfd\xbc\x0a\x0c\x02\
-\x4a\xfb\x1e\x0a\x02\x10\x02\x0b\x04\xe1\x06\x06\x10\x02\xfb\xb2\
-\x0c\x0b\x87\x0c\x0c\x87\x0b\x0c\x60\x01\xc5\x04\x0c\xfe\x5c\x0c\
-\x0d\x19\xb0\x0e\x06\xb2\x04\x04\x0a\x00\x00\x00\x04\x00\x3d\x00\
-\x00\x07\x85\x05\x14\x00\x3e\x00\x4e\x00\x6c\x00\x79\x00\x00\x01\
-\x14\x06\x2b\x01\x22\x26\x35\x34\x3f\x01\x33\x32\x17\x16\x3b\x01\
-\x32\x36\x3d\x01\x34\x26\x2b\x01\x22\x3d\x01\x34\x3b\x01\x32\x36\
-\x3d\x01\x34\x26\x2b\x01\x22\x06\x33\x22\x2f\x01\x26\x35\x34\x36\
-\x3b\x01\x32\x16\x1d\x01\x14\x07\x06\x15\x30\x17\x16\x15\x09\x01\
-\x06\x07\x23\x22\x35\x34\x37\x01\x36\x37\x33\x32\x15\x14\x01\x14\
-\x2b\x01\x22\x1d\x01\x14\x2b\x01\x22\x3d\x01\x34\x23\x21\x22\x3d\
-\x01\x01\x37\x33\x32\x15\x11\x14\x3b\x01\x32\x15\x25\x35\x34\x23\
-\x22\x0f\x01\x06\x15\x14\x3b\x01\x32\x02\x37\x81\x71\x23\x6c\x77\
-\x08\x6f\x08\x06\x13\x16\x35\x23\x27\x37\x37\x27\x72\x0f\x0f\x72\
-\x27\x37\x37\x27\x23\x2d\x3b\x02\x04\x04\x6f\x08\x79\x6c\x23\x6f\
-\x83\x1f\x2b\x29\x21\x02\xef\xfd\xea\x04\x0e\x6f\x17\x04\x02\x17\
-\x02\x10\x6f\x17\x02\x5a\x0f\x54\x0c\x0c\x7b\x0c\x0f\xfe\xd1\x0e\
-\x01\x52\x0a\x77\x0c\x0c\x54\x0f\xfe\xfe\x0d\x06\x06\x85\x02\x0c\
-\x85\x0f\x03\x00\x62\x73\x6b\x20\x04\x04\x32\x23\x29\x31\x23\x27\
-\x23\x2d\x0c\x62\x0a\x32\x20\x11\x23\x31\x4c\x02\x31\x06\x02\x1f\
-\x68\x72\x63\x10\x2d\x23\x31\x04\x31\x27\x31\x01\xcd\xfb\x1e\x0a\
-\x02\x10\x02\x0b\x04\xe1\x06\x06\x10\x02\xfb\xb2\x0c\x0b\x87\x0c\
-\x0c\x87\x0b\x0c\x60\x01\xc5\x04\x0c\xfe\x5c\x0c\x0d\x19\xb0\x0e\
-\x06\xb2\x04\x04\x0a\x00\x00\x00\x02\x00\x43\x01\x4e\x04\x97\x05\
-\x9e\x00\x1b\x00\x27\x00\x00\x13\x17\x36\x33\x32\x17\x37\x17\x07\
-\x16\x15\x14\x07\x17\x07\x27\x06\x23\x22\x27\x07\x27\x37\x26\x35\
-\x34\x37\x27\x05\x22\x06\x15\x14\x16\x33\x32\x36\x35\x34\x26\xab\
-\xcd\x6b\x89\x8b\x6d\xcb\x68\xcb\x4c\x4c\xcb\x68\xcb\x6b\x8b\x8d\
-\x69\xcd\x68\xcb\x4c\x4c\xcb\x02\x2b\x71\xa3\xa1\x73\x73\xa1\xa3\
-\x05\x9e\xcb\x4e\x4e\xcb\x6b\xcd\x6a\x87\x85\x6d\xcd\x68\xcb\x4e\
-\x4e\xcb\x68\xcd\x6b\x87\x87\x6a\xcd\xaa\xa4\x70\x73\xa0\xa2\x71\
-\x70\xa4\x00\x00\x03\x00\x89\x00\x00\x03\x85\x06\x98\x00\x23\x00\
-\x2f\x00\x3b\x00\x00\x25\x14\x23\x21\x22\x35\x11\x34\x33\x21\x32\
-\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x33\x21\x32\x1d\x01\x14\x23\
-\x21\x22\x15\x11\x14\x33\x21\x32\x15\x03\x14\x06\x23\x22\x26\x35\
-\x34\x36\x33\x32\x16\x05\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\
-\x16\x03\x85\x15\xfd\x2d\x14\x14\x02\xd3\x15\x15\xfe\x19\x14\x14\
-\x01\x8f\x15\x15\xfe\x71\x14\x14\x01\xe7\x15\x4e\x4a\x35\x37\x48\
-\x4a\x35\x35\x4a\xfe\xa6\x4a\x35\x37\x48\x4a\x35\x35\x4a\x14\x14\
-\x14\x04\xe2\x14\x14\xae\x15\x14\xfe\xef\x14\x15\xae\x14\x15\xfe\
-\xde\x15\x14\x05\x56\x36\x49\x47\x38\x35\x4a\x4a\x35\x36\x49\x47\
-\x38\x35\x4a\x4a\x00\x00\x00\x00\x02\xff\xf0\x00\x00\x03\xaa\x05\
-\x0a\x00\x1b\x00\x2f\x00\x00\x25\x34\x17\x14\x2b\x01\x22\x2f\x01\
-\x26\x23\x21\x22\x0f\x01\x06\x2b\x01\x22\x35\x36\x15\x01\x36\x3b\
-\x01\x32\x17\x11\x03\x26\x27\x23\x06\x07\x03\x14\x15\x06\x15\x14\
-\x3b\x01\x32\x35\x34\x35\x26\x03\xa8\x02\x16\xcf\x10\x04\x3e\x04\
-\x10\xfe\xdb\x11\x04\x3d\x04\x11\xcc\x17\x03\x01\x7c\x04\x10\x94\
-\x10\x04\x43\x04\x13\x06\x08\x10\x46\x02\x16\x96\x16\x02\x1b\x04\
-\x0d\x12\x0e\xd7\x0d\x0d\xd7\x0e\x12\x0b\x02\x04\xe1\x0e\x0e\xfc\
-\xe7\x01\x0f\x0c\x64\x25\x4b\xfe\xf1\x02\x02\x02\x02\x12\x12\x02\
-\x02\x02\x00\x00\x03\x00\x89\x00\x00\x03\xe6\x05\x0a\x00\x12\x00\
-\x20\x00\x32\x00\x00\x33\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\
-\x3b\x01\x32\x16\x15\x14\x06\x23\x12\x26\x2b\x01\x22\x15\x11\x14\
-\x3b\x01\x32\x36\x3d\x01\x13\x14\x23\x21\x22\x15\x11\x14\x2b\x01\
-\x22\x35\x11\x34\x33\x21\x32\x15\x9e\x15\x15\xc2\x15\x14\xe1\xaa\
-\xd2\xce\xae\x93\x56\x3d\xe1\x14\x14\xe1\x3d\x56\xe4\x15\xfd\xbd\
-\x14\x15\xc3\x14\x14\x03\x2f\x15\x14\x04\xe2\x14\x14\xfe\x06\x15\
-\xca\xa0\xae\xcf\x01\xba\x56\x14\xfe\xf0\x15\x58\x3b\x13\x02\xcb\
-\x15\x14\xfb\xf5\x14\x14\x04\xe2\x14\x14\x00\x00\x03\x00\x89\x00\
-\x00\x03\xe7\x05\x0a\x00\x16\x00\x24\x00\x32\x00\x00\x01\x14\x06\
-\x23\x21\x22\x35\x11\x34\x33\x21\x32\x16\x1d\x01\x14\x07\x06\x31\
-\x34\x17\x16\x15\x03\x35\x34\x26\x2b\x01\x22\x15\x11\x14\x3b\x01\
-\x32\x36\x11\x35\x34\x26\x2b\x01\x22\x15\x11\x14\x3b\x01\x32\x36\
-\x03\xe7\xcd\xb0\xfe\x33\x14\x14\x01\xcd\xb0\xcd\x2d\x48\x44\x31\
-\xe9\x58\x3c\xe1\x14\x14\xe1\x3c\x58\x54\x40\xe1\x14\x14\xe1\x3e\
-\x56\x01\x79\xae\xcb\x14\x04\xe2\x14\xcd\xb0\x14\x4e\x3d\x61\x06\
-\x62\x48\x51\x01\xf5\x13\x3b\x58\x14\xfe\xef\x14\x56\xfe\x1a\x27\
-\x3e\x54\x15\xfe\xde\x15\x56\x00\x01\x00\x89\x00\x00\x03\x85\x05\
-\x0a\x00\x11\x00\x00\x01\x14\x23\x21\x22\x15\x11\x14\x2b\x01\x22\
-\x35\x11\x34\x33\x21\x32\x15\x03\x85\x15\xfe\x19\x14\x15\xc3\x14\
-\x14\x02\xd3\x15\x04\x48\x15\x14\xfb\xf5\x14\x14\x04\xe2\x14\x14\
-\x00\x00\x00\x00\x03\x00\x84\xff\x49\x05\x93\x05\x22\x00\x11\x00\
-\x23\x00\x3f\x00\x00\x17\x22\x35\x11\x34\x33\x21\x32\x1d\x01\x14\
-\x23\x21\x22\x1d\x01\x14\x23\x05\x22\x3d\x01\x34\x23\x21\x22\x3d\
-\x01\x34\x33\x21\x32\x15\x11\x14\x23\x27\x14\x2b\x01\x22\x35\x11\
-\x34\x26\x2b\x01\x22\x06\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x36\
-\x3b\x01\x32\x16\x15\x98\x14\x14\x03\x80\x14\x14\xfd\x57\x15\x14\
-\x03\x8c\x15\x14\xfd\x56\x14\x14\x03\x80\x14\x14\xc5\x15\xc2\x15\
-\x54\x3d\x65\x3d\x56\x14\xc1\x14\xd0\xac\x65\xac\xd1\xb6\x12\x01\
-\x63\x12\x12\xaf\x12\x12\x90\x12\x01\x12\x90\x12\x12\xaf\x12\x12\
-\xfe\x9d\x12\xcf\x14\x14\x03\xa0\x3f\x54\x56\x3d\xfc\x60\x14\x14\
-\x03\xa0\xa4\xc6\xc6\xa4\x00\x00\x01\x00\x89\x00\x00\x03\x85\x05\
-\x0a\x00\x23\x00\x00\x25\x14\x23\x21\x22\x35\x11\x34\x33\x21\x32\
-\x1d\x01\x14\x23\x21\x22\x15\x11\x14\x33\x21\x32\x1d\x01\x14\x23\
-\x21\x22\x15\x11\x14\x33\x21\x32\x15\x03\x85\x15\xfd\x2d\x14\x14\
-\x02\xd3\x15\x15\xfe\x19\x14\x14\x01\x8f\x15\x15\xfe\x71\x14\x14\
-\x01\xe7\x15\x14\x14\x14\x04\xe2\x14\x14\xae\x15\x14\xfe\xef\x14\
-\x15\xae\x14\x15\xfe\xde\x15\x14\x00\x00\x00\x00\x02\x00\x89\x00\
-\x00\x07\x0e\x05\x0a\x00\x29\x00\x53\x00\x00\x01\x36\x35\x34\x27\
-\x01\x26\x35\x34\x3b\x01\x17\x01\x16\x33\x32\x35\x11\x34\x3b\x01\
-\x32\x15\x11\x14\x2b\x01\x22\x35\x11\x27\x26\x23\x22\x07\x01\x07\
-\x23\x22\x35\x34\x37\x21\x16\x15\x14\x2b\x01\x27\x01\x26\x23\x22\
-\x0f\x01\x11\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\
-\x33\x32\x37\x01\x37\x33\x32\x15\x14\x07\x01\x06\x15\x14\x17\x02\
-\x45\x05\x05\xfe\x73\x06\x16\xec\x10\x01\x6d\x0a\x08\x13\x14\xc3\
-\x14\x14\xc3\x14\x52\x06\x0d\x08\x08\xfe\xbf\x11\xef\x17\x04\x06\
-\x7d\x04\x16\xf0\x10\xfe\xbe\x08\x08\x0c\x07\x51\x15\xc3\x14\x14\
-\xc3\x15\x12\x08\x0a\x01\x6d\x10\xec\x16\x06\xfe\x73\x04\x04\x02\
-\xe7\x09\x04\x02\x08\x01\xeb\x0b\x06\x10\x08\xfe\x21\x0c\x18\x01\
-\xc7\x14\x14\xfb\x1e\x14\x14\x01\x90\x6c\x09\x0d\xfd\xfe\x0a\x10\
-\x07\x08\x08\x07\x10\x0a\x02\x02\x0d\x09\x6c\xfe\x70\x14\x14\x04\
-\xe2\x14\x14\xfe\x39\x18\x0c\x01\xdf\x08\x10\x06\x0b\xfe\x15\x08\
-\x02\x04\x09\x00\x01\x00\x62\xff\xec\x03\x85\x05\x1f\x00\x3c\x00\
-\x00\x01\x14\x06\x2b\x01\x22\x26\x35\x34\x3f\x01\x36\x33\x32\x17\
-\x16\x3b\x01\x32\x36\x3d\x01\x34\x26\x23\x35\x32\x36\x3d\x01\x34\
-\x26\x2b\x01\x22\x07\x06\x07\x06\x23\x30\x2f\x01\x26\x35\x34\x36\
-\x3b\x01\x32\x16\x1d\x01\x14\x07\x06\x35\x34\x17\x16\x15\x03\x85\
-\xcf\xb0\x3a\xae\xba\x0c\xb3\x04\x06\x0a\x1f\x25\x51\x3a\x3b\x58\
-\x54\x3f\x3b\x58\x58\x3b\x3a\x47\x2b\x06\x17\x0a\x08\x0d\xb0\x0c\
-\xbc\xae\x3a\xb0\xcf\x31\x46\x42\x35\x01\x66\xae\xcc\xbe\x37\x08\
-\x07\x58\x02\x3e\x49\x56\x3d\x46\x3d\x54\xd7\x56\x3e\x1c\x3e\x56\
-\x42\x0a\x27\x14\x04\x5a\x06\x08\x31\xc1\xcf\xb0\x1d\x4e\x41\x5e\
-\x02\x06\x5f\x4b\x52\x00\x00\x00\x01\x00\x89\x00\x00\x03\xdb\x05\
-\x0a\x00\x17\x00\x00\x13\x34\x3b\x01\x32\x15\x03\x01\x37\x33\x32\
-\x15\x11\x14\x2b\x01\x22\x35\x13\x01\x07\x23\x22\x35\x89\x14\xbd\
-\x10\x04\x01\xa2\x12\xac\x15\x15\xbe\x0e\x04\xfe\x5c\x13\xaa\x14\
-\x04\xf6\x14\x14\xfc\xcb\x03\x3f\x0a\x14\xfb\x1e\x14\x14\x03\x2e\
-\xfc\xc8\x0a\x14\x00\x00\x00\x00\x02\x00\x89\x00\x00\x03\xdb\x06\
-\xff\x00\x17\x00\x31\x00\x00\x13\x34\x3b\x01\x32\x15\x03\x01\x37\
-\x33\x32\x15\x11\x14\x2b\x01\x22\x35\x13\x01\x07\x23\x22\x35\x01\
-\x14\x06\x2b\x01\x22\x26\x3d\x01\x34\x3b\x01\x32\x1d\x01\x14\x3b\
-\x01\x32\x3d\x01\x34\x3b\x01\x32\x15\x89\x14\xbd\x10\x04\x01\xa2\
-\x12\xac\x15\x15\xbe\x0e\x04\xfe\x5c\x13\xaa\x14\x02\xaa\x70\x5c\
-\x58\x5f\x6e\x14\x69\x14\x3c\x58\x39\x14\x6b\x14\x04\xf6\x14\x14\
-\xfc\xcb\x03\x3f\x0a\x14\xfb\x1e\x14\x14\x03\x2e\xfc\xc8\x0a\x14\
-\x06\x57\x56\x6c\x6a\x58\x7f\x15\x15\x58\x39\x39\x58\x15\x15\x00\
-\x01\x00\x89\x00\x00\x04\x41\x05\x0a\x00\x29\x00\x00\x25\x16\x15\
-\x14\x2b\x01\x27\x01\x26\x23\x22\x0f\x01\x11\x14\x2b\x01\x22\x35\
-\x11\x34\x3b\x01\x32\x15\x11\x14\x33\x32\x37\x01\x37\x33\x32\x15\
-\x14\x07\x01\x06\x15\x14\x17\x04\x3d\x04\x16\xf0\x10\xfe\xbe\x08\
-\x08\x0c\x07\x51\x15\xc3\x14\x14\xc3\x15\x12\x08\x0a\x01\x6d\x10\
-\xec\x16\x06\xfe\x73\x04\x04\x1f\x08\x07\x10\x0a\x02\x02\x0d\x09\
-\x6c\xfe\x70\x14\x14\x04\xe2\x14\x14\xfe\x39\x18\x0c\x01\xdf\x08\
-\x10\x06\x0b\xfe\x15\x08\x02\x04\x09\x00\x00\x00\x02\x00\x77\xff\
-\xf9\x04\x25\x05\x0c\x00\x13\x00\x25\x00\x00\x01\x14\x07\x06\x23\
-\x22\x3d\x01\x34\x37\x36\x37\x36\x35\x11\x34\x3b\x01\x32\x15\x07\
-\x34\x33\x21\x32\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x23\x21\x22\
-\x35\x02\x11\x98\x7b\x70\x17\x12\x1d\x1d\x64\x15\xc0\x15\xe8\x14\
-\x02\xd3\x15\x15\xc2\x15\x14\xfe\x18\x14\x01\x74\xc3\x66\x52\x14\
-\xae\x11\x04\x06\x06\x19\x6c\x03\x97\x14\x14\x02\x14\x14\xfb\x1e\
-\x14\x14\x04\x0b\x14\x15\x00\x00\x01\x00\x89\x00\x00\x04\x8d\x05\
-\x0a\x00\x20\x00\x00\x25\x14\x2b\x01\x22\x35\x13\x03\x06\x2b\x01\
-\x22\x27\x03\x13\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x16\x17\x09\
-\x01\x36\x37\x33\x32\x15\x04\x8d\x14\xbd\x14\x12\xe7\x0d\x06\x68\
-\x0c\x07\xe7\x12\x14\xbf\x14\x14\xb1\x0a\x08\x01\x2b\x01\x2b\x0a\
-\x08\xb1\x14\x14\x14\x14\x03\x1f\xfd\x89\x0c\x0c\x02\x77\xfc\xe1\
-\x14\x14\x04\xe2\x14\x02\x0a\xfc\xd5\x03\x2b\x0a\x02\x14\x00\x00\
-\x01\x00\x89\x00\x00\x04\x04\x05\x0a\x00\x23\x00\x00\x25\x14\x2b\
-\x01\x22\x35\x11\x34\x23\x21\x22\x15\x11\x14\x2b\x01\x22\x35\x11\
-\x34\x3b\x01\x32\x15\x11\x14\x33\x21\x32\x35\x11\x34\x3b\x01\x32\
-\x15\x04\x04\x15\xc0\x15\x14\xfe\x83\x14\x15\xc3\x14\x14\xc3\x15\
-\x14\x01\x7d\x14\x15\xc0\x15\x14\x14\x14\x01\xfa\x15\x15\xfe\x06\
-\x14\x14\x04\xe2\x14\x14\xfe\x18\x14\x14\x01\xe8\x14\x14\x00\x00\
-\x02\x00\x6c\xff\xec\x03\xca\x05\x1f\x00\x0f\x00\x1f\x00\x00\x01\
-\x14\x06\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\x32\x16\x15\x03\
-\x11\x34\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\x01\x32\x36\x03\
-\xca\xd1\xac\x64\xac\xd1\xd1\xac\x64\xac\xd1\xeb\x54\x3e\x64\x3e\
-\x56\x56\x3e\x64\x3e\x54\x01\x56\xa4\xc6\xc6\xa4\x02\x5e\xa4\xc7\
-\xc7\xa4\xfd\xa2\x02\x5e\x40\x54\x56\x3e\xfd\xa2\x3d\x56\x54\x00\
-\x02\x00\x89\x00\x00\x03\x85\x05\x0a\x00\x11\x00\x23\x00\x00\x01\
-\x14\x23\x21\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x33\x21\x32\
-\x15\x21\x34\x33\x21\x32\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x23\
-\x21\x22\x35\x03\x85\x15\xfe\x19\x14\x15\xc3\x14\x14\x02\xd3\x15\
-\xfd\x04\x14\x02\xd3\x15\x15\xc2\x15\x14\xfe\x18\x14\x04\x48\x15\
-\x14\xfb\xf5\x14\x14\x04\xe2\x14\x14\x14\x14\xfb\x1e\x14\x14\x04\
-\x0b\x14\x15\x00\x02\x00\x89\x00\x00\x03\xbe\x05\x0a\x00\x12\x00\
-\x20\x00\x00\x01\x32\x16\x15\x14\x06\x2b\x01\x22\x15\x11\x14\x2b\
-\x01\x22\x35\x11\x34\x33\x01\x35\x34\x26\x2b\x01\x22\x15\x11\x14\
-\x3b\x01\x32\x36\x02\x41\xae\xcf\xd3\xaa\xb8\x14\x15\xc3\x14\x14\
-\x02\x38\x56\x3e\xb8\x14\x14\xb8\x3e\x56\x05\x0a\xcf\xae\x9f\xcb\
-\x15\xfe\x06\x14\x14\x04\xe2\x14\xfe\x83\x13\x3b\x58\x14\xfe\xef\
-\x14\x56\x00\x00\x01\x00\x6c\xff\xec\x03\xb8\x05\x1f\x00\x2d\x00\
-\x00\x25\x16\x15\x14\x07\x06\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\
-\x01\x32\x17\x16\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\x26\x2b\
-\x01\x22\x06\x15\x11\x14\x16\x3b\x01\x32\x37\x36\x33\x32\x17\x03\
-\xab\x0d\x63\x5c\xac\x64\xac\xd1\xd1\xac\x64\x8c\x5c\x37\x29\x23\
-\x0d\xb2\x04\x06\x0a\x13\x35\x50\x64\x3e\x56\x56\x3e\x64\x50\x33\
-\x15\x0a\x06\x04\xf2\x06\x0b\x31\x66\x5e\xc6\xa4\x02\x5e\xa4\xc7\
-\x44\x29\x3b\x33\x17\x0a\x06\x58\x02\x22\x63\x56\x3e\xfd\xa2\x3d\
-\x56\x62\x27\x02\x00\x00\x00\x00\x01\x00\x1e\x00\x00\x03\x18\x05\
-\x0a\x00\x17\x00\x00\x01\x14\x2b\x01\x22\x15\x11\x14\x2b\x01\x22\
-\x35\x11\x34\x2b\x01\x22\x3d\x01\x34\x33\x21\x32\x15\x03\x18\x15\
-\xdf\x14\x15\xc0\x15\x14\xe0\x14\x14\x02\xd1\x15\x04\x48\x15\x14\
-\xfb\xf5\x14\x14\x04\x0b\x14\x15\xae\x14\x14\x00\x01\xff\xec\x00\
-\x00\x03\xad\x05\x0a\x00\x1a\x00\x00\x09\x02\x14\x2b\x01\x22\x35\
-\x09\x01\x26\x35\x34\x3b\x01\x17\x13\x16\x33\x32\x37\x13\x37\x33\
-\x32\x15\x14\x03\xa8\xfe\x9a\xfe\xde\x14\xc3\x15\x01\x22\xfe\x9b\
-\x05\x17\xe3\x12\xc3\x06\x0c\x0d\x06\xc2\x13\xe1\x17\x04\xec\xfd\
-\x60\xfd\xc8\x14\x14\x02\x38\x02\xa0\x0c\x02\x10\x0c\xfe\x6f\x0f\
-\x0f\x01\x91\x0c\x10\x02\x00\x00\x03\x00\x6c\xff\x31\x04\x6a\x05\
-\xbb\x00\x0f\x00\x1f\x00\x2b\x00\x00\x01\x14\x06\x23\x21\x22\x26\
-\x35\x11\x34\x36\x33\x21\x32\x16\x15\x03\x11\x34\x26\x23\x21\x22\
-\x06\x15\x11\x14\x16\x33\x21\x32\x36\x03\x14\x2b\x01\x22\x35\x11\
-\x34\x3b\x01\x32\x15\x04\x6a\xd1\xac\xfe\xfc\xac\xd1\xd1\xac\x01\
-\x04\xac\xd1\xeb\x54\x3e\xfe\xfc\x3e\x56\x56\x3e\x01\x04\x3e\x54\
-\x9c\x15\xc2\x15\x15\xc2\x15\x01\x56\xa4\xc6\xc6\xa4\x02\x5e\xa4\
-\xc7\xc7\xa4\xfd\xa2\x02\x5e\x40\x54\x56\x3e\xfd\xa2\x3d\x56\x54\
-\xfe\x35\x1b\x1b\x06\x55\x1a\x1a\x00\x00\x00\x00\x01\x00\x02\x00\
-\x00\x03\xaa\x05\x0a\x00\x2c\x00\x00\x25\x16\x15\x14\x2b\x01\x22\
-\x27\x03\x26\x23\x22\x07\x03\x07\x23\x22\x35\x34\x37\x01\x35\x01\
-\x26\x35\x34\x3b\x01\x32\x17\x13\x16\x33\x32\x37\x13\x36\x37\x33\
-\x32\x15\x14\x07\x01\x15\x03\xa6\x04\x17\xe9\x0c\x06\xaf\x06\x0c\
-\x0c\x06\xb5\x12\xe5\x17\x04\x01\x33\xfe\xcd\x04\x17\xe3\x06\x0c\
-\xb7\x06\x0c\x0c\x06\xb1\x02\x10\xe7\x17\x04\xfe\xcf\x1d\x09\x04\
-\x10\x0c\x01\x73\x0e\x0e\xfe\x8d\x0c\x10\x02\x0d\x02\x5e\x12\x02\
-\x5d\x0c\x02\x10\x0c\xfe\x87\x0e\x0e\x01\x79\x06\x06\x10\x04\x08\
-\xfd\x9f\x10\x00\x03\x00\x93\xff\x50\x04\x76\x05\x0a\x00\x11\x00\
-\x23\x00\x35\x00\x00\x25\x14\x23\x21\x22\x35\x11\x34\x3b\x01\x32\
-\x15\x11\x14\x33\x21\x32\x15\x21\x34\x33\x21\x32\x35\x11\x34\x3b\
-\x01\x32\x15\x11\x14\x23\x21\x22\x35\x05\x22\x3d\x01\x34\x23\x21\
-\x22\x3d\x01\x34\x33\x21\x32\x15\x11\x14\x23\x03\x8f\x15\xfd\x2d\
-\x14\x14\xc3\x15\x14\x01\xe7\x15\xfd\x04\x14\x01\xe8\x14\x15\xc2\
-\x15\x15\xfd\x2d\x14\x03\x21\x15\x14\xfd\x53\x14\x14\x03\x84\x14\
-\x14\x14\x14\x14\x04\xe2\x14\x14\xfb\xf6\x15\x14\x14\x15\x04\x0a\
-\x14\x14\xfb\x1e\x14\x14\xc4\x12\x90\x12\x12\xaf\x12\x12\xfe\x9d\
-\x12\x00\x00\x00\x01\x00\x62\x00\x00\x03\x5c\x05\x1c\x00\x1d\x00\
-\x00\x25\x07\x11\x34\x23\x22\x06\x23\x22\x26\x35\x11\x34\x3b\x01\
-\x32\x15\x11\x14\x16\x33\x32\x36\x35\x11\x34\x3b\x01\x32\x15\x03\
-\x5c\xea\x0e\x0a\x5a\x21\xac\xd1\x14\xc3\x15\x51\x40\x3f\x54\x15\
-\xc0\x15\x03\x03\x02\x06\x15\x1d\xc7\xa3\x01\xa0\x14\x14\xfe\x60\
-\x3f\x54\x56\x3d\x01\xa0\x14\x14\x00\x00\x00\x00\x04\x00\x89\x00\
-\x00\x05\x97\x05\x0a\x00\x11\x00\x23\x00\x35\x00\x47\x00\x00\x25\
-\x14\x23\x21\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x33\x21\x32\
-\x15\x21\x34\x33\x21\x32\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x23\
-\x21\x22\x35\x21\x14\x23\x21\x22\x35\x11\x34\x3b\x01\x32\x15\x11\
-\x14\x33\x21\x32\x15\x21\x34\x33\x21\x32\x35\x11\x34\x3b\x01\x32\
-\x15\x11\x14\x23\x21\x22\x35\x03\x85\x15\xfd\x2d\x14\x14\xc3\x15\
-\x14\x01\xe7\x15\xfd\x04\x14\x01\xe8\x14\x15\xc2\x15\x15\xfd\x2d\
-\x14\x05\x0e\x15\xfd\x2d\x14\x14\xc3\x15\x14\x01\xe7\x15\xfd\x04\
-\x14\x01\xe8\x14\x15\xc2\x15\x15\xfd\x2d\x14\x14\x14\x14\x04\xe2\
-\x14\x14\xfb\xf6\x15\x14\x14\x15\x04\x0a\x14\x14\xfb\x1e\x14\x14\
-\x14\x14\x04\xe2\x14\x14\xfb\xf6\x15\x14\x14\x15\x04\x0a\x14\x14\
-\xfb\x1e\x14\x14\x00\x00\x00\x00\x05\x00\x89\xff\x50\x06\x7a\x05\
-\x0a\x00\x11\x00\x23\x00\x35\x00\x47\x00\x59\x00\x00\x25\x14\x23\
-\x21\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x33\x21\x32\x15\x21\
-\x34\x33\x21\x32\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x23\x21\x22\
-\x35\x21\x14\x23\x21\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x33\
-\x21\x32\x15\x21\x34\x33\x21\x32\x35\x11\x34\x3b\x01\x32\x15\x11\
-\x14\x23\x21\x22\x35\x05\x22\x3d\x01\x34\x23\x21\x22\x3d\x01\x34\
-\x33\x21\x32\x15\x11\x14\x23\x03\x85\x15\xfd\x2d\x14\x14\xc3\x15\
-\x14\x01\xe7\x15\xfd\x04\x14\x01\xe8\x14\x15\xc2\x15\x15\xfd\x2d\
-\x14\x05\x0e\x15\xfd\x2d\x14\x14\xc3\x15\x14\x01\xe7\x15\xfd\x04\
-\x14\x01\xe8\x14\x15\xc2\x15\x15\xfd\x2d\x14\x03\x1d\x14\x14\xfd\
-\x56\x14\x14\x03\x80\x14\x14\x14\x14\x14\x04\xe2\x14\x14\xfb\xf6\
-\x15\x14\x14\x15\x04\x0a\x14\x14\xfb\x1e\x14\x14\x14\x14\x04\xe2\
-\x14\x14\xfb\xf6\x15\x14\x14\x15\x04\x0a\x14\x14\xfb\x1e\x14\x14\
-\xc4\x12\x90\x12\x12\xaf\x12\x12\xfe\x9d\x12\x00\x03\x00\x57\x00\
-\x00\x04\x2c\x05\x0a\x00\x11\x00\x24\x00\x32\x00\x00\x13\x34\x33\
-\x21\x32\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x2b\x01\x22\x35\x01\
-\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x3b\x01\x32\x16\x15\x14\
-\x06\x23\x12\x26\x2b\x01\x22\x15\x11\x14\x3b\x01\x32\x36\x3d\x01\
-\x57\x14\x01\xc5\x15\x15\xc2\x15\x14\xda\x14\x01\x18\x14\x14\xc3\
-\x15\x14\x54\xaa\xd3\xcf\xae\x94\x56\x3e\x54\x14\x14\x54\x3e\x56\
-\x04\xf6\x14\x14\xfb\x1e\x14\x14\x04\x0b\x14\x15\xfb\xb8\x14\x04\
-\xe2\x14\x14\xfe\x06\x15\xca\xa0\xae\xcf\x01\xba\x56\x14\xfe\xf0\
-\x15\x58\x3b\x13\x00\x00\x00\x00\x03\x00\x89\x00\x00\x05\x03\x05\
-\x0a\x00\x12\x00\x20\x00\x2c\x00\x00\x33\x22\x35\x11\x34\x3b\x01\
-\x32\x15\x11\x14\x3b\x01\x32\x16\x15\x14\x06\x23\x12\x26\x2b\x01\
-\x22\x15\x11\x14\x3b\x01\x32\x36\x3d\x01\x01\x14\x2b\x01\x22\x35\
-\x11\x34\x3b\x01\x32\x15\x9d\x14\x14\xc3\x15\x14\x90\xaa\xd3\xcf\
-\xae\x94\x56\x3e\x90\x14\x14\x90\x3e\x56\x02\x56\x15\xc2\x15\x15\
-\xc2\x15\x14\x04\xe2\x14\x14\xfe\x06\x15\xca\xa0\xae\xcf\x01\xba\
-\x56\x14\xfe\xf0\x15\x58\x3b\x13\xfe\x97\x14\x14\x04\xe2\x14\x14\
-\x00\x00\x00\x00\x02\x00\x89\x00\x00\x03\x82\x05\x0a\x00\x12\x00\
-\x20\x00\x00\x33\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x3b\x01\
-\x32\x16\x15\x14\x06\x23\x12\x26\x2b\x01\x22\x15\x11\x14\x3b\x01\
-\x32\x36\x3d\x01\x9d\x14\x14\xc3\x15\x14\x7c\xaa\xd3\xcf\xae\x94\
-\x56\x3e\x7c\x14\x14\x7c\x3e\x56\x14\x04\xe2\x14\x14\xfe\x06\x15\
-\xca\xa0\xae\xcf\x01\xba\x56\x14\xfe\xf0\x15\x58\x3b\x13\x00\x00\
-\x02\x00\x6c\xff\xec\x03\xb8\x05\x1f\x00\x2d\x00\x39\x00\x00\x01\
-\x36\x33\x32\x17\x16\x3b\x01\x32\x36\x35\x11\x34\x26\x2b\x01\x22\
-\x07\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\x37\x36\x3b\x01\x32\
-\x16\x15\x11\x14\x06\x2b\x01\x22\x27\x26\x35\x34\x37\x01\x14\x23\
-\x21\x22\x3d\x01\x34\x33\x21\x32\x15\x01\x2a\x05\x06\x0a\x14\x34\
-\x4f\x65\x3d\x56\x56\x3d\x65\x4f\x36\x12\x0a\x06\x05\xb2\x0c\x23\
-\x29\x37\x5c\x8b\x65\xac\xd1\xd1\xac\x65\xac\x5c\x62\x0c\x03\x39\
-\x16\xfe\x75\x16\x16\x01\x8b\x16\x01\x4a\x02\x27\x62\x56\x3d\x02\
-\x5e\x3e\x56\x63\x22\x02\x58\x06\x0a\x17\x33\x3b\x29\x44\xc7\xa4\
-\xfd\xa2\xa4\xc6\x5e\x66\x31\x0b\x06\x01\x23\x15\x15\xc0\x15\x15\
-\x00\x00\x00\x00\x03\x00\x7a\xff\xfa\x05\x24\x05\x2d\x00\x17\x00\
-\x27\x00\x37\x00\x00\x01\x32\x15\x11\x14\x3b\x01\x32\x1d\x01\x14\
-\x2b\x01\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x33\x01\x14\x06\
-\x2b\x01\x22\x26\x35\x11\x34\x36\x3b\x01\x32\x16\x15\x03\x11\x34\
-\x26\x2b\x01\x22\x06\x15\x11\x14\x16\x3b\x01\x32\x36\x01\x3d\x14\
-\x15\x5e\x14\x14\x5e\x15\x14\xaf\x14\x14\x04\x96\xd0\xad\x64\xac\
-\xd1\xd1\xac\x64\xad\xd0\xeb\x54\x3e\x64\x3d\x56\x56\x3d\x64\x3e\
-\x54\x05\x1f\x14\xfe\x08\x14\x15\xc0\x15\x14\xfe\x13\x14\x14\x04\
-\xf7\x14\xfc\x45\xa4\xc6\xc6\xa4\x02\x5e\xa4\xc7\xc7\xa4\xfd\xa2\
-\x02\x5e\x40\x54\x56\x3e\xfd\xa2\x3d\x56\x54\x00\x02\x00\x89\x00\
-\x00\x03\xfe\x05\x0a\x00\x21\x00\x2f\x00\x00\x01\x35\x34\x27\x26\
-\x27\x26\x3d\x01\x34\x36\x33\x21\x32\x15\x11\x14\x2b\x01\x22\x35\
-\x11\x34\x2b\x01\x07\x03\x06\x2b\x01\x22\x35\x34\x37\x12\x16\x3b\
-\x01\x32\x35\x11\x34\x2b\x01\x22\x06\x1d\x01\x01\x4e\x1d\x29\x0e\
-\x5a\xcc\xb0\x01\xcd\x15\x15\xc2\x15\x14\xb7\x10\xb4\x08\x0b\xd3\
-\x14\x02\xfe\x58\x3b\xe2\x14\x14\xe2\x3b\x58\x02\x4e\x02\x0a\x17\
-\x1e\x0f\x5c\x7f\x14\xb0\xcd\x14\xfb\x1e\x14\x14\x01\xfa\x15\x0c\
-\xfd\xf7\x0e\x10\x07\x04\x03\x35\x56\x14\x01\x11\x14\x58\x3b\x13\
-\x00\x00\x00\x00\x02\x00\x6e\x00\x00\x03\x53\x03\xbe\x00\x2a\x00\
-\x35\x00\x00\x25\x14\x2b\x01\x22\x26\x23\x22\x06\x2b\x01\x22\x26\
-\x3d\x01\x34\x36\x3b\x01\x32\x3d\x01\x27\x26\x23\x22\x07\x06\x07\
-\x06\x23\x22\x2f\x01\x26\x35\x34\x37\x36\x33\x32\x16\x15\x07\x23\
-\x22\x1d\x01\x14\x3b\x01\x32\x37\x34\x03\x53\x14\xae\x11\x0a\x08\
-\x04\x60\x2b\x4e\x7f\xa2\xa2\x7f\xc4\x15\x02\x0c\x88\x3f\x31\x08\
-\x17\x0c\x0a\x05\x08\xa8\x0c\x62\x5a\xaa\xae\xd1\xe9\xd9\x37\x37\
-\x4e\x60\x29\x14\x14\x27\x27\x9c\x76\x0b\x79\x99\x13\x04\x18\x89\
-\x3d\x0a\x25\x15\x04\x59\x06\x08\x37\x5e\x58\xc4\xa4\xec\x39\x1f\
-\x3b\x73\x06\x00\x03\x00\x89\x00\x00\x03\x5f\x03\xa2\x00\x12\x00\
-\x20\x00\x32\x00\x00\x33\x22\x35\x11\x34\x3b\x01\x32\x1d\x01\x14\
-\x3b\x01\x32\x16\x17\x0e\x01\x23\x12\x26\x2b\x01\x22\x1d\x01\x14\
-\x3b\x01\x32\x36\x37\x35\x13\x14\x23\x21\x22\x15\x11\x14\x2b\x01\
-\x22\x35\x11\x34\x33\x21\x32\x15\x9d\x14\x14\xc3\x15\x14\x68\xaa\
-\xbf\x05\x05\xbb\xae\x94\x56\x3e\x68\x14\x14\x68\x3e\x4e\x0b\xc1\
-\x15\xfe\x55\x14\x15\xc3\x14\x14\x02\x97\x15\x14\x03\x7a\x14\x14\
-\xd8\x5b\xca\x7b\x5b\xbb\x01\x4c\x38\x14\x98\x15\x34\x1c\x13\x01\
-\xb7\x15\x15\xfd\x62\x15\x15\x03\x78\x14\x14\x00\x04\x00\x89\xff\
-\xfb\x03\x33\x03\xb7\x00\x12\x00\x20\x00\x33\x00\x41\x00\x00\x01\
-\x32\x16\x17\x0e\x01\x2b\x01\x22\x15\x11\x14\x2b\x01\x22\x35\x11\
-\x34\x33\x01\x37\x2e\x01\x2b\x01\x22\x1d\x01\x14\x3b\x01\x32\x36\
-\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x3b\x01\x32\x16\x17\
-\x0e\x01\x27\x12\x26\x2b\x01\x22\x1d\x01\x14\x3b\x01\x32\x36\x37\
-\x27\x01\xf1\x82\xbd\x03\x03\xc1\x7e\x7c\x14\x15\xaf\x14\x14\x01\
-\xb8\x02\x02\x26\x3e\x7c\x14\x14\x7c\x3e\x23\xfe\x4b\x14\x14\xaf\
-\x15\x14\x7c\x7e\xc1\x03\x13\xcd\x62\x61\x23\x3e\x7c\x14\x14\x7c\
-\x3e\x26\x02\x02\x03\xb7\xad\x5d\x85\xb7\x15\xfe\xb9\x14\x14\x03\
-\x8e\x14\xfe\xd8\x12\x10\x2f\x15\x6f\x14\x2f\xfd\x8a\x14\x03\x8e\
-\x14\x14\xfe\xb9\x15\xb8\x84\x8d\x83\x06\x01\x40\x2f\x14\x70\x14\
-\x2f\x10\x12\x00\x01\x00\x89\x00\x00\x02\xe5\x03\xac\x00\x11\x00\
-\x00\x01\x14\x23\x21\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x33\
-\x21\x32\x15\x02\xe5\x15\xfe\xb9\x14\x15\xc3\x14\x14\x02\x33\x15\
-\x02\xea\x15\x14\xfd\x53\x14\x14\x03\x84\x14\x14\x00\x00\x00\x00\
-\x03\x00\x84\xff\x49\x05\x2c\x03\xad\x00\x11\x00\x23\x00\x3f\x00\
-\x00\x17\x22\x35\x11\x34\x33\x21\x32\x1d\x01\x14\x23\x21\x22\x1d\
-\x01\x14\x23\x05\x22\x3d\x01\x34\x23\x21\x22\x3d\x01\x34\x33\x21\
-\x32\x15\x11\x14\x23\x27\x14\x2b\x01\x22\x35\x11\x34\x26\x2b\x01\
-\x22\x06\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x36\x3b\x01\x32\x16\
-\x15\x98\x14\x14\x02\xcc\x14\x14\xfe\x0b\x15\x14\x03\x25\x15\x14\
-\xfe\x0a\x14\x14\x02\xcc\x14\x14\xca\x15\xc2\x15\x54\x3d\x01\x3d\
-\x56\x14\xc1\x14\xd0\xac\x01\xac\xd1\xb6\x12\x01\x63\x12\x12\xaf\
-\x12\x12\x90\x12\x01\x12\x90\x12\x12\xaf\x12\x12\xfe\x9d\x12\xfe\
-\x14\x14\x01\xfc\x3f\x54\x56\x3d\xfe\x04\x14\x14\x01\xfc\xa4\xc6\
-\xc6\xa4\x00\x00\x02\x00\x58\xff\xec\x03\x54\x03\xbe\x00\x22\x00\
-\x2d\x00\x00\x01\x14\x23\x21\x22\x1d\x01\x14\x16\x33\x32\x37\x36\
-\x33\x32\x1f\x01\x16\x15\x14\x07\x06\x23\x22\x26\x3d\x01\x34\x37\
-\x36\x33\x32\x17\x16\x15\x25\x32\x35\x34\x26\x23\x22\x06\x15\x14\
-\x33\x03\x54\x15\xfe\x19\x14\x53\x40\x50\x33\x15\x0a\x06\x04\xb2\
-\x0c\x64\x5a\xac\xae\xd1\x39\x75\xd1\xd1\x73\x39\xfe\xfc\x14\x58\
-\x35\x39\x56\x14\x01\xae\x14\x15\x2f\x3d\x56\x62\x27\x02\x58\x06\
-\x0b\x2f\x68\x5e\xc6\xa4\xfe\x66\x56\xae\xae\x58\x64\x0a\x15\x2b\
-\x49\x49\x2d\x13\x00\x00\x00\x00\x02\x00\x76\x00\x00\x05\xf9\x03\
-\xac\x00\x2a\x00\x55\x00\x00\x01\x36\x35\x34\x27\x01\x26\x35\x34\
-\x3b\x01\x1f\x01\x16\x33\x32\x3d\x01\x34\x3b\x01\x32\x15\x11\x14\
-\x2b\x01\x22\x35\x11\x2f\x01\x26\x23\x22\x07\x03\x07\x23\x22\x35\
-\x34\x37\x21\x16\x15\x14\x2b\x01\x27\x03\x26\x23\x22\x0f\x02\x11\
-\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\x1d\x01\x14\x33\x32\x3f\
-\x02\x33\x32\x15\x14\x07\x01\x06\x15\x14\x17\x01\xd4\x04\x08\xfe\
-\xe5\x08\x17\xf4\x0e\xd9\x08\x08\x13\x14\xc1\x14\x14\xc1\x14\x06\
-\x21\x08\x09\x08\x08\xeb\x13\xef\x17\x04\x05\x7b\x04\x16\xf0\x12\
-\xec\x08\x08\x08\x09\x20\x07\x14\xc1\x14\x14\xc1\x14\x13\x08\x08\
-\xd9\x0f\xf3\x17\x08\xfe\xe5\x08\x04\x02\x4e\x08\x02\x02\x0c\x01\
-\x17\x08\x0b\x10\x06\xe4\x08\x17\xd3\x14\x14\xfc\x7c\x14\x14\x01\
-\x4e\x0f\x20\x09\x0d\xfe\x7d\x0a\x10\x07\x08\x08\x07\x10\x0a\x01\
-\x83\x0d\x09\x20\x0f\xfe\xb2\x14\x14\x03\x84\x14\x14\xd3\x17\x08\
-\xe4\x06\x10\x0b\x08\xfe\xe9\x0c\x02\x02\x08\x00\x01\x00\x64\x00\
-\x02\x03\x21\x03\xbd\x00\x38\x00\x00\x01\x14\x06\x2b\x01\x22\x26\
-\x35\x36\x3f\x01\x36\x33\x32\x17\x16\x3b\x01\x32\x36\x3d\x01\x34\
-\x26\x23\x35\x32\x36\x35\x15\x34\x26\x2b\x01\x22\x06\x23\x2f\x01\
-\x26\x35\x34\x36\x3b\x01\x32\x16\x1d\x01\x14\x07\x06\x35\x34\x17\
-\x16\x15\x03\x21\xb3\x9c\x2f\x9c\xa3\x03\x08\x9e\x02\x06\x0a\x19\
-\x1e\x4d\x2f\x37\x4d\x4d\x37\x37\x4d\x4d\x37\x2f\x43\x4b\x03\x0b\
-\x98\x0b\xa6\x99\x2f\x99\xb6\x28\x3e\x39\x2d\x01\x11\x7c\x93\x88\
-\x28\x07\x02\x60\x02\x2c\x36\x3d\x2c\x15\x2c\x3b\xae\x3d\x2d\x0a\
-\x18\x3e\x62\x05\x5e\x02\x07\x28\x87\x95\x7e\x15\x3b\x2c\x46\x03\
-\x06\x43\x36\x3d\x00\x00\x00\x00\x01\x00\x89\x00\x00\x03\x8b\x03\
-\xad\x00\x17\x00\x00\x13\x34\x3b\x01\x32\x15\x03\x01\x37\x33\x32\
-\x15\x11\x14\x2b\x01\x22\x35\x13\x01\x07\x23\x22\x35\x89\x14\xbd\
-\x10\x04\x01\x52\x12\xac\x15\x15\xbe\x0e\x04\xfe\xac\x13\xaa\x14\
-\x03\x9e\x0f\x0f\xfd\xdc\x02\x2c\x07\x0f\xfc\x71\x0f\x0f\x02\x1e\
-\xfd\xda\x07\x0f\x00\x00\x00\x00\x02\x00\x89\x00\x00\x03\x8b\x05\
-\x83\x00\x17\x00\x31\x00\x00\x13\x34\x3b\x01\x32\x15\x03\x01\x37\
-\x33\x32\x15\x11\x14\x2b\x01\x22\x35\x13\x01\x07\x23\x22\x35\x01\
-\x14\x06\x2b\x01\x22\x26\x3d\x01\x34\x3b\x01\x32\x1d\x01\x14\x3b\
-\x01\x32\x3d\x01\x34\x3b\x01\x32\x15\x89\x14\xbd\x10\x04\x01\x52\
-\x12\xac\x15\x15\xbe\x0e\x04\xfe\xac\x13\xaa\x14\x02\x8c\x70\x5c\
-\x58\x5f\x6e\x14\x69\x14\x3c\x58\x39\x14\x6b\x14\x03\x9e\x0f\x0f\
-\xfd\xdc\x02\x2c\x07\x0f\xfc\x71\x0f\x0f\x02\x1e\xfd\xda\x07\x0f\
-\x04\xe0\x56\x6c\x6a\x58\x7f\x15\x15\x58\x39\x39\x58\x15\x15\x00\
-\x01\x00\x8b\x00\x00\x03\xc0\x03\xb6\x00\x2a\x00\x00\x25\x16\x15\
-\x14\x2b\x01\x27\x03\x26\x23\x22\x0f\x02\x11\x14\x2b\x01\x22\x35\
-\x11\x34\x3b\x01\x32\x1d\x01\x14\x33\x32\x3f\x02\x33\x32\x15\x14\
-\x07\x01\x06\x15\x14\x17\x03\xbc\x04\x16\xf0\x12\xec\x08\x08\x08\
-\x09\x20\x07\x14\xc1\x14\x14\xc1\x14\x13\x08\x08\xd9\x0f\xf3\x17\
-\x08\xfe\xe5\x08\x04\x1f\x08\x07\x10\x0a\x01\x83\x0d\x09\x20\x0f\
-\xfe\xb2\x14\x14\x03\x8e\x14\x14\xdd\x17\x08\xee\x06\x10\x0b\x08\
-\xfe\xdf\x0c\x02\x02\x08\x00\x00\x02\x00\x77\xff\xf9\x03\xc1\x03\
-\xae\x00\x13\x00\x25\x00\x00\x01\x14\x07\x06\x23\x22\x3d\x01\x34\
-\x37\x36\x37\x36\x35\x11\x34\x3b\x01\x32\x15\x07\x34\x33\x21\x32\
-\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x23\x21\x22\x35\x02\x11\x98\
-\x7b\x70\x17\x12\x1d\x1d\x64\x15\xc0\x15\xe8\x14\x02\x6f\x15\x15\
-\xc2\x15\x14\xfe\x7c\x14\x01\x74\xc3\x66\x52\x14\xae\x11\x04\x06\
-\x06\x19\x6c\x02\x39\x14\x14\x02\x14\x14\xfc\x7c\x14\x14\x02\xad\
-\x14\x15\x00\x00\x01\x00\x89\x00\x00\x04\x8d\x03\xa5\x00\x20\x00\
-\x00\x25\x14\x2b\x01\x22\x35\x0b\x01\x06\x2b\x01\x22\x27\x0b\x01\
-\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x16\x17\x09\x01\x36\x37\x33\
-\x32\x15\x04\x8d\x14\xbd\x14\x02\xd3\x0d\x06\x68\x0c\x07\xd3\x02\
-\x14\xbf\x14\x14\xb1\x0a\x08\x01\x2b\x01\x2b\x0a\x08\xb1\x14\x0f\
-\x0f\x0f\x02\x19\xfe\x60\x09\x09\x01\xb4\xfd\xd3\x0f\x0f\x03\x87\
-\x0f\x01\x08\xfd\xb6\x02\x4a\x08\x01\x0f\x00\x00\x01\x00\x89\x00\
-\x00\x03\xaa\x03\xac\x00\x23\x00\x00\x25\x14\x2b\x01\x22\x35\x11\
-\x34\x23\x21\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x3b\x01\x32\
-\x15\x11\x14\x33\x21\x32\x35\x11\x34\x3b\x01\x32\x15\x03\xaa\x15\
-\xc0\x15\x14\xfe\xdd\x14\x15\xc3\x14\x14\xc3\x15\x14\x01\x23\x14\
-\x15\xc0\x15\x14\x14\x14\x01\x32\x15\x15\xfe\xce\x14\x14\x03\x84\
-\x14\x14\xfe\xae\x14\x14\x01\x52\x14\x14\x00\x00\x02\x00\x58\xff\
-\xec\x03\x54\x03\xbe\x00\x0d\x00\x1b\x00\x00\x01\x14\x06\x23\x22\
-\x26\x3d\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\x26\x23\x22\x06\
-\x1d\x01\x14\x16\x33\x32\x36\x03\x54\xd1\xac\xae\xd1\xd1\xae\xac\
-\xd1\xec\x54\x3d\x40\x53\x53\x40\x3d\x54\x01\x56\xa4\xc6\xc6\xa4\
-\xfe\xa4\xc6\xc6\xa4\xfe\xfe\x3d\x56\x56\x3d\xfe\x3d\x56\x56\x00\
-\x02\x00\x89\x00\x00\x03\x85\x03\xb6\x00\x11\x00\x23\x00\x00\x01\
-\x14\x23\x21\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x33\x21\x32\
-\x15\x21\x34\x33\x21\x32\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x23\
-\x21\x22\x35\x03\x85\x15\xfe\x19\x14\x15\xc3\x14\x14\x02\xd3\x15\
-\xfd\x04\x14\x02\xd3\x15\x15\xc2\x15\x14\xfe\x18\x14\x02\xf4\x15\
-\x14\xfd\x49\x14\x14\x03\x8e\x14\x14\x14\x14\xfc\x72\x14\x14\x02\
-\xb7\x14\x15\x00\x02\x00\x76\xfe\x52\x03\x70\x03\xaa\x00\x1b\x00\
-\x29\x00\x00\x01\x14\x06\x23\x22\x26\x23\x22\x15\x11\x14\x2b\x01\
-\x22\x35\x11\x34\x3b\x01\x32\x16\x33\x32\x36\x33\x32\x16\x15\x07\
-\x35\x34\x26\x23\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x03\x70\xcd\
-\x9e\x2b\x64\x08\x0f\x14\xc1\x14\x14\xaf\x10\x0a\x08\x02\x6f\x37\
-\x9e\xcf\xec\x52\x3f\x40\x54\x54\x40\x3f\x52\x01\x6a\x9d\xcd\x29\
-\x17\xfe\x54\x14\x14\x05\x30\x14\x29\x29\xc9\x9f\xd8\xd8\x3d\x54\
-\x54\x3d\xd8\x3d\x56\x54\x00\x00\x01\x00\x58\xff\xec\x03\x41\x03\
-\xbe\x00\x29\x00\x00\x25\x16\x15\x14\x07\x06\x23\x22\x26\x3d\x01\
-\x34\x36\x33\x32\x17\x16\x17\x16\x15\x14\x0f\x01\x06\x23\x22\x27\
-\x26\x23\x22\x06\x1d\x01\x14\x16\x33\x32\x37\x36\x33\x32\x17\x03\
-\x35\x0c\x64\x5a\xac\xae\xd1\xd1\xae\x8f\x5a\x36\x29\x22\x0c\xb2\
-\x04\x06\x0a\x13\x35\x50\x40\x53\x53\x40\x50\x33\x15\x0a\x06\x04\
-\xf2\x06\x0b\x2f\x68\x5e\xc6\xa4\xfe\xa4\xc6\x43\x29\x3b\x34\x16\
-\x0a\x07\x58\x02\x23\x62\x56\x3d\xfe\x3d\x56\x62\x27\x02\x00\x00\
-\x01\x00\x1e\x00\x00\x03\x18\x03\xb6\x00\x17\x00\x00\x01\x14\x2b\
-\x01\x22\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x2b\x01\x22\x3d\x01\
-\x34\x33\x21\x32\x15\x03\x18\x15\xdf\x14\x15\xc0\x15\x14\xe0\x14\
-\x14\x02\xd1\x15\x02\xf4\x15\x14\xfd\x49\x14\x14\x02\xb7\x14\x15\
-\xae\x14\x14\x00\x01\x00\x62\xfe\x51\x03\x5c\x03\xaa\x00\x31\x00\
-\x00\x05\x14\x06\x23\x22\x27\x26\x27\x26\x35\x34\x3f\x01\x36\x37\
-\x32\x17\x16\x33\x32\x36\x3d\x01\x34\x23\x22\x06\x23\x22\x26\x35\
-\x11\x34\x3b\x01\x32\x15\x11\x14\x16\x33\x32\x36\x35\x11\x34\x3b\
-\x01\x32\x15\x03\x5c\xcd\xb0\x8d\x5d\x35\x29\x21\x0d\xb0\x04\x06\
-\x0a\x13\x33\x52\x3d\x56\x0e\x0a\x5a\x21\xac\xd1\x14\xc3\x15\x51\
-\x40\x3f\x54\x15\xc0\x15\x32\xb0\xcd\x42\x27\x3d\x33\x19\x08\x06\
-\x58\x02\x02\x24\x61\x58\x3c\x4c\x15\x1d\xc7\xa3\x02\x2c\x14\x14\
-\xfd\xd4\x3f\x54\x56\x3d\x02\x2c\x14\x14\x00\x00\x03\x00\x58\xff\
-\x51\x04\x44\x04\x5b\x00\x0d\x00\x1b\x00\x27\x00\x00\x01\x14\x06\
-\x21\x20\x26\x3d\x01\x34\x36\x21\x20\x16\x15\x07\x35\x34\x26\x23\
-\x22\x06\x1d\x01\x14\x16\x33\x32\x36\x03\x14\x2b\x01\x22\x35\x11\
-\x34\x3b\x01\x32\x15\x04\x44\xd1\xfe\xdc\xfe\xda\xd1\xd1\x01\x26\
-\x01\x24\xd1\xec\x54\xb5\xb8\x53\x53\xb8\xb5\x54\x93\x15\xc2\x15\
-\x15\xc2\x15\x01\x56\xa4\xc6\xc6\xa4\xfe\xa4\xc6\xc6\xa4\xfe\xfe\
-\x3d\x56\x56\x3d\xfe\x3d\x56\x56\xfe\x4d\x15\x15\x04\xe1\x14\x14\
-\x00\x00\x00\x00\x01\xff\xec\x00\x00\x03\x5d\x03\xaa\x00\x2b\x00\
-\x00\x25\x16\x15\x14\x2b\x01\x2f\x01\x26\x23\x22\x0f\x02\x23\x22\
-\x35\x34\x37\x13\x36\x3d\x01\x01\x26\x35\x34\x3b\x01\x1f\x01\x16\
-\x33\x32\x3f\x02\x33\x32\x15\x14\x07\x01\x15\x03\x56\x05\x15\xe5\
-\x13\x99\x0b\x08\x08\x0a\x9a\x12\xc5\x16\x04\xf8\x02\xfe\xea\x05\
-\x14\xe6\x10\x9c\x08\x08\x08\x07\x9d\x11\xe7\x17\x07\xfe\xe8\x1f\
-\x06\x09\x10\x0a\xf8\x0e\x0e\xf8\x0a\x10\x02\x0d\x01\xaa\x08\x0a\
-\x06\x01\xaa\x06\x09\x10\x0a\xfa\x0c\x0c\xfa\x0a\x10\x07\x0a\xfe\
-\x56\x12\x00\x00\x03\x00\x9d\xff\x52\x04\x0c\x03\xac\x00\x11\x00\
-\x23\x00\x35\x00\x00\x25\x14\x23\x21\x22\x35\x11\x34\x3b\x01\x32\
-\x15\x11\x14\x33\x21\x32\x15\x21\x34\x33\x21\x32\x35\x11\x34\x3b\
-\x01\x32\x15\x11\x14\x23\x21\x22\x35\x05\x22\x3d\x01\x34\x23\x21\
-\x22\x3d\x01\x34\x33\x21\x32\x15\x11\x14\x23\x03\x35\x14\xfd\x91\
-\x15\x15\xc2\x15\x14\x01\x84\x14\xfd\x68\x15\x01\x83\x15\x14\xc3\
-\x14\x14\xfd\x91\x15\x02\xb1\x14\x14\xfd\x8b\x14\x14\x03\x47\x14\
-\x14\x14\x14\x14\x03\x84\x14\x14\xfd\x54\x15\x14\x14\x15\x02\xac\
-\x14\x14\xfc\x7c\x14\x14\xc2\x12\x8a\x12\x13\xb0\x13\x13\xfe\xa1\
-\x12\x00\x00\x00\x01\x00\x62\x00\x00\x03\x5c\x03\xaa\x00\x1d\x00\
-\x00\x25\x07\x11\x34\x23\x22\x06\x23\x22\x26\x35\x11\x34\x3b\x01\
-\x32\x15\x11\x14\x16\x33\x32\x36\x35\x11\x34\x3b\x01\x32\x15\x03\
-\x5c\xea\x0e\x0a\x5a\x21\xac\xd1\x14\xc3\x15\x51\x40\x3f\x54\x15\
-\xc0\x15\x03\x03\x01\x2a\x15\x1d\xc7\xa3\x01\x0a\x14\x14\xfe\xf6\
-\x3f\x54\x56\x3d\x01\x0a\x14\x14\x00\x00\x00\x00\x04\x00\x89\x00\
-\x00\x04\xcf\x03\xac\x00\x11\x00\x23\x00\x35\x00\x47\x00\x00\x25\
-\x14\x23\x21\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x33\x21\x32\
-\x15\x21\x34\x33\x21\x32\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x23\
-\x21\x22\x35\x21\x14\x23\x21\x22\x35\x11\x34\x3b\x01\x32\x15\x11\
-\x14\x33\x21\x32\x15\x21\x34\x33\x21\x32\x35\x11\x34\x3b\x01\x32\
-\x15\x11\x14\x23\x21\x22\x35\x03\x21\x15\xfd\x91\x14\x14\xc3\x15\
-\x14\x01\x83\x15\xfd\x68\x14\x01\x84\x14\x15\xc2\x15\x15\xfd\x91\
-\x14\x04\x46\x15\xfd\x91\x14\x14\xc3\x15\x14\x01\x83\x15\xfd\x68\
-\x14\x01\x84\x14\x15\xc2\x15\x15\xfd\x91\x14\x14\x14\x14\x03\x84\
-\x14\x14\xfd\x54\x15\x14\x14\x15\x02\xac\x14\x14\xfc\x7c\x14\x14\
-\x14\x14\x03\x84\x14\x14\xfd\x54\x15\x14\x14\x15\x02\xac\x14\x14\
-\xfc\x7c\x14\x14\x00\x00\x00\x00\x05\x00\x89\xff\x52\x05\xbb\x03\
-\xac\x00\x11\x00\x23\x00\x35\x00\x47\x00\x59\x00\x00\x25\x14\x23\
-\x21\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x33\x21\x32\x15\x21\
-\x34\x33\x21\x32\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x23\x21\x22\
-\x35\x21\x14\x23\x21\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x33\
-\x21\x32\x15\x21\x34\x33\x21\x32\x35\x11\x34\x3b\x01\x32\x15\x11\
-\x14\x23\x21\x22\x35\x05\x22\x3d\x01\x34\x23\x21\x22\x3d\x01\x34\
-\x33\x21\x32\x15\x11\x14\x23\x03\x21\x15\xfd\x91\x14\x14\xc3\x15\
-\x14\x01\x83\x15\xfd\x68\x14\x01\x84\x14\x15\xc2\x15\x15\xfd\x91\
-\x14\x04\x46\x15\xfd\x91\x14\x14\xc3\x15\x14\x01\x83\x15\xfd\x68\
-\x14\x01\x84\x14\x15\xc2\x15\x15\xfd\x91\x14\x02\xc2\x15\x14\xfd\
-\x53\x14\x14\x03\x84\x14\x14\x14\x14\x14\x03\x84\x14\x14\xfd\x54\
-\x15\x14\x14\x15\x02\xac\x14\x14\xfc\x7c\x14\x14\x14\x14\x03\x84\
-\x14\x14\xfd\x54\x15\x14\x14\x15\x02\xac\x14\x14\xfc\x7c\x14\x14\
-\xc2\x12\x8a\x12\x13\xb0\x13\x13\xfe\xa1\x12\x00\x03\x00\x4d\x00\
-\x00\x03\xdf\x03\xb6\x00\x11\x00\x24\x00\x32\x00\x00\x13\x34\x33\
-\x21\x32\x15\x11\x14\x2b\x01\x22\x35\x11\x34\x2b\x01\x22\x35\x13\
-\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\x3b\x01\x32\x16\x17\x0e\
-\x01\x23\x12\x26\x2b\x01\x22\x1d\x01\x14\x3b\x01\x32\x36\x37\x27\
-\x4d\x14\x01\xa7\x15\x15\xc2\x15\x14\xbc\x14\xfc\x14\x14\xc3\x15\
-\x14\x68\x7e\xc1\x03\x03\xbd\x82\x61\x23\x3e\x68\x14\x14\x68\x3e\
-\x26\x02\x02\x03\xa2\x14\x14\xfc\x7c\x14\x14\x02\xad\x14\x15\xfd\
-\x0c\x14\x03\x8e\x14\x14\xfe\xb9\x15\xb7\x85\x5d\xad\x01\x40\x2f\
-\x14\x6f\x15\x2f\x10\x12\x00\x00\x03\x00\x89\x00\x00\x04\xbc\x03\
-\xb6\x00\x0b\x00\x1e\x00\x2c\x00\x00\x25\x14\x2b\x01\x22\x35\x11\
-\x34\x3b\x01\x32\x15\x01\x22\x35\x11\x34\x3b\x01\x32\x15\x11\x14\
-\x3b\x01\x32\x16\x17\x0e\x01\x23\x12\x26\x2b\x01\x22\x1d\x01\x14\
-\x3b\x01\x32\x36\x37\x27\x04\xbc\x14\xc1\x14\x14\xc1\x14\xfb\xe1\
-\x14\x14\xc3\x15\x14\x68\x7e\xc1\x03\x03\xbd\x82\x61\x23\x3e\x68\
-\x14\x14\x68\x3e\x26\x02\x02\x14\x14\x14\x03\x8c\x14\x14\xfc\x60\
-\x14\x03\x8e\x14\x14\xfe\xb9\x15\xb7\x85\x5d\xad\x01\x40\x2f\x14\
-\x6f\x15\x2f\x10\x12\x00\x00\x00\x02\x00\x89\x00\x00\x03\x33\x03\
-\xb6\x00\x12\x00\x20\x00\x00\x33\x22\x35\x11\x34\x3b\x01\x32\x15\
-\x11\x14\x3b\x01\x32\x16\x17\x0e\x01\x23\x12\x26\x2b\x01\x22\x1d\
-\x01\x14\x3b\x01\x32\x36\x37\x27\x9d\x14\x14\xc3\x15\x14\x68\x7e\
-\xc1\x03\x03\xbd\x82\x61\x23\x3e\x68\x14\x14\x68\x3e\x26\x02\x02\
-\x14\x03\x8e\x14\x14\xfe\xb9\x15\xb7\x85\x5d\xad\x01\x40\x2f\x14\
-\x6f\x15\x2f\x10\x12\x00\x00\x00\x02\x00\x58\xff\xec\x03\x41\x03\
-\xbe\x00\x29\x00\x35\x00\x00\x01\x36\x33\x32\x17\x16\x33\x32\x36\
-\x3d\x01\x34\x26\x23\x22\x07\x06\x23\x22\x2f\x01\x26\x35\x34\x37\
-\x36\x37\x36\x33\x32\x16\x1d\x01\x14\x06\x23\x22\x27\x26\x35\x34\
-\x37\x25\x14\x23\x21\x22\x3d\x01\x34\x33\x21\x32\x15\x01\x16\x05\
-\x06\x0a\x14\x34\x4f\x40\x54\x54\x40\x4f\x36\x12\x0a\x06\x05\xb2\
-\x0c\x23\x29\x35\x5a\x8f\xaf\xd0\xd0\xaf\xac\x5a\x64\x0c\x02\xd9\
-\x15\xfe\x7c\x15\x15\x01\x84\x15\x01\x4a\x02\x27\x62\x56\x3d\xfe\
-\x3d\x56\x62\x23\x02\x58\x07\x0a\x16\x34\x3b\x29\x43\xc6\xa4\xfe\
-\xa4\xc6\x5e\x68\x2f\x0b\x06\x83\x15\x15\xc0\x15\x15\x00\x00\x00\
-\x03\x00\x7a\xff\xfc\x04\xb5\x03\xce\x00\x17\x00\x25\x00\x33\x00\
-\x00\x01\x32\x15\x11\x14\x3b\x01\x32\x1d\x01\x14\x2b\x01\x22\x15\
-\x11\x14\x2b\x01\x22\x35\x11\x34\x33\x01\x14\x06\x23\x22\x26\x3d\
-\x01\x34\x36\x33\x32\x16\x15\x07\x35\x34\x26\x23\x22\x06\x1d\x01\
-\x14\x16\x33\x32\x36\x01\x3d\x14\x15\x54\x14\x14\x54\x15\x14\xaf\
-\x14\x14\x04\x27\xd1\xac\xae\xd1\xd1\xae\xac\xd1\xeb\x54\x3e\x3f\
-\x54\x54\x3f\x3e\x54\x03\xa3\x14\xfe\xd0\x14\x15\xc0\x15\x14\xfe\
-\xc7\x14\x14\x03\x7b\x14\xfd\xc3\xa4\xc6\xc6\xa4\xfe\xa4\xc6\xc6\
-\xa4\xfe\xfe\x3d\x56\x56\x3d\xfe\x3d\x56\x56\x00\x02\x00\x89\x00\
-\x00\x03\x86\x03\xc0\x00\x21\x00\x2f\x00\x00\x01\x35\x34\x27\x26\
-\x27\x26\x3d\x01\x34\x36\x33\x21\x32\x15\x11\x14\x2b\x01\x22\x3d\
-\x01\x34\x2b\x01\x0f\x01\x06\x2b\x01\x22\x35\x34\x37\x12\x16\x3b\
-\x01\x32\x3d\x01\x34\x2b\x01\x0e\x01\x35\x15\x01\x4e\x1d\x29\x0e\
-\x5a\xb8\xc4\x01\x55\x15\x15\xc2\x15\x14\x3f\x10\xb4\x08\x0b\xd3\
-\x14\x02\xfe\x58\x3b\x6a\x14\x14\x6a\x5b\x38\x01\x40\x02\x0a\x17\
-\x1e\x0f\x5c\x7f\x14\x74\xcd\x14\xfc\x68\x14\x14\xec\x15\x0c\xfb\
-\x0e\x10\x07\x04\x02\x1d\x4c\x14\xd5\x14\x10\x52\x01\x13\x00\x00\
-\x04\x00\x58\xff\xec\x03\x54\x05\x37\x00\x22\x00\x2d\x00\x39\x00\
-\x45\x00\x00\x01\x14\x23\x21\x22\x1d\x01\x14\x16\x33\x32\x37\x36\
-\x33\x32\x1f\x01\x16\x15\x14\x07\x06\x23\x22\x26\x3d\x01\x34\x37\
-\x36\x33\x32\x17\x16\x15\x25\x32\x35\x34\x26\x23\x22\x06\x15\x14\
-\x33\x01\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x05\x14\x06\
-\x23\x22\x26\x35\x34\x36\x33\x32\x16\x03\x54\x15\xfe\x19\x14\x53\
-\x40\x50\x33\x15\x0a\x06\x04\xb2\x0c\x64\x5a\xac\xae\xd1\x39\x75\
-\xd1\xd1\x73\x39\xfe\xfc\x14\x58\x35\x39\x56\x14\x01\xa4\x4a\x35\
-\x37\x48\x4a\x35\x35\x4a\xfe\xa6\x4a\x35\x37\x48\x4a\x35\x35\x4a\
-\x01\xae\x14\x15\x2f\x3d\x56\x62\x27\x02\x58\x06\x0b\x2f\x68\x5e\
-\xc6\xa4\xfe\x66\x56\xae\xae\x58\x64\x0a\x15\x2b\x49\x49\x2d\x13\
-\x02\x5a\x35\x4a\x48\x37\x36\x49\x49\x36\x35\x4a\x48\x37\x36\x49\
-\x49\x00\x00\x00\x00\x00\x28\x01\xe6\x00\x01\x00\x00\x00\x00\x00\
-\x00\x00\x34\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x00\x14\x00\
-\x3b\x00\x01\x00\x00\x00\x00\x00\x02\x00\x07\x00\x34\x00\x01\x00\
-\x00\x00\x00\x00\x03\x00\x21\x00\x3b\x00\x01\x00\x00\x00\x00\x00\
-\x04\x00\x14\x00\x3b\x00\x01\x00\x00\x00\x00\x00\x05\x00\x2a\x00\
-\x5c\x00\x01\x00\x00\x00\x00\x00\x06\x00\x12\x00\x86\x00\x01\x00\
-\x00\x00\x00\x00\x0a\x00\x40\x00\x98\x00\x03\x00\x01\x04\x03\x00\
-\x02\x00\x0c\x02\xf4\x00\x03\x00\x01\x04\x05\x00\x02\x00\x10\x00\
-\xd8\x00\x03\x00\x01\x04\x06\x00\x02\x00\x0c\x00\xe8\x00\x03\x00\
-\x01\x04\x07\x00\x02\x00\x10\x00\xf4\x00\x03\x00\x01\x04\x08\x00\
-\x02\x00\x10\x01\x04\x00\x03\x00\x01\x04\x09\x00\x00\x00\x68\x01\
-\x14\x00\x03\x00\x01\x04\x09\x00\x01\x00\x28\x01\x8a\x00\x03\x00\
-\x01\x04\x09\x00\x02\x00\x0e\x01\x7c\x00\x03\x00\x01\x04\x09\x00\
-\x03\x00\x42\x01\x8a\x00\x03\x00\x01\x04\x09\x00\x04\x00\x28\x01\
-\x8a\x00\x03\x00\x01\x04\x09\x00\x05\x00\x54\x01\xcc\x00\x03\x00\
-\x01\x04\x09\x00\x06\x00\x24\x02\x20\x00\x03\x00\x01\x04\x09\x00\
-\x0a\x00\x80\x02\x44\x00\x03\x00\x01\x04\x0a\x00\x02\x00\x0c\x02\
-\xf4\x00\x03\x00\x01\x04\x0b\x00\x02\x00\x10\x02\xc4\x00\x03\x00\
-\x01\x04\x0c\x00\x02\x00\x0c\x02\xf4\x00\x03\x00\x01\x04\x0e\x00\
-\x02\x00\x0c\x03\x12\x00\x03\x00\x01\x04\x10\x00\x02\x00\x0e\x02\
-\xd4\x00\x03\x00\x01\x04\x13\x00\x02\x00\x12\x02\xe2\x00\x03\x00\
-\x01\x04\x14\x00\x02\x00\x0c\x02\xf4\x00\x03\x00\x01\x04\x15\x00\
-\x02\x00\x10\x02\xf4\x00\x03\x00\x01\x04\x16\x00\x02\x00\x0c\x02\
-\xf4\x00\x03\x00\x01\x04\x19\x00\x02\x00\x0e\x03\x04\x00\x03\x00\
-\x01\x04\x1b\x00\x02\x00\x10\x03\x12\x00\x03\x00\x01\x04\x1d\x00\
-\x02\x00\x0c\x02\xf4\x00\x03\x00\x01\x04\x1f\x00\x02\x00\x0c\x02\
-\xf4\x00\x03\x00\x01\x04\x24\x00\x02\x00\x0e\x03\x22\x00\x03\x00\
-\x01\x04\x2d\x00\x02\x00\x0e\x03\x30\x00\x03\x00\x01\x08\x0a\x00\
-\x02\x00\x0c\x02\xf4\x00\x03\x00\x01\x08\x16\x00\x02\x00\x0c\x02\
-\xf4\x00\x03\x00\x01\x0c\x0a\x00\x02\x00\x0c\x02\xf4\x00\x03\x00\
-\x01\x0c\x0c\x00\x02\x00\x0c\x02\xf4\x54\x79\x70\x65\x66\x61\x63\
-\x65\x20\xa9\x20\x28\x79\x6f\x75\x72\x20\x63\x6f\x6d\x70\x61\x6e\
-\x79\x29\x2e\x20\x32\x30\x31\x33\x2e\x20\x41\x6c\x6c\x20\x52\x69\
-\x67\x68\x74\x73\x20\x52\x65\x73\x65\x72\x76\x65\x64\x52\x65\x67\
-\x75\x6c\x61\x72\x49\x54\x43\x20\x43\x6f\x6e\x64\x75\x69\x74\x20\
-\x43\x79\x72\x69\x6c\x6c\x69\x63\x3a\x56\x65\x72\x73\x69\x6f\x6e\
-\x20\x31\x2e\x30\x30\x56\x65\x72\x73\x69\x6f\x6e\x20\x31\x2e\x30\
-\x30\x20\x4a\x75\x6c\x79\x20\x38\x2c\x20\x32\x30\x31\x33\x2c\x20\
-\x69\x6e\x69\x74\x69\x61\x6c\x20\x72\x65\x6c\x65\x61\x73\x65\x49\
-\x54\x43\x43\x6f\x6e\x64\x75\x69\x74\x43\x79\x72\x69\x6c\x6c\x69\
-\x63\x54\x68\x69\x73\x20\x66\x6f\x6e\x74\x20\x77\x61\x73\x20\x63\
-\x72\x65\x61\x74\x65\x64\x20\x75\x73\x69\x6e\x67\x20\x46\x6f\x6e\
-\x74\x20\x43\x72\x65\x61\x74\x6f\x72\x20\x35\x2e\x30\x20\x66\x72\
-\x6f\x6d\x20\x48\x69\x67\x68\x2d\x4c\x6f\x67\x69\x63\x2e\x63\x6f\
-\x6d\x00\x6f\x00\x62\x00\x79\x01\x0d\x00\x65\x00\x6a\x00\x6e\x00\
-\xe9\x00\x6e\x00\x6f\x00\x72\x00\x6d\x00\x61\x00\x6c\x00\x53\x00\
-\x74\x00\x61\x00\x6e\x00\x64\x00\x61\x00\x72\x00\x64\x03\x9a\x03\
-\xb1\x03\xbd\x03\xbf\x03\xbd\x03\xb9\x03\xba\x03\xac\x00\x54\x00\
-\x79\x00\x70\x00\x65\x00\x66\x00\x61\x00\x63\x00\x65\x00\x20\x00\
-\xa9\x00\x20\x00\x28\x00\x79\x00\x6f\x00\x75\x00\x72\x00\x20\x00\
-\x63\x00\x6f\x00\x6d\x00\x70\x00\x61\x00\x6e\x00\x79\x00\x29\x00\
-\x2e\x00\x20\x00\x32\x00\x30\x00\x31\x00\x33\x00\x2e\x00\x20\x00\
-\x41\x00\x6c\x00\x6c\x00\x20\x00\x52\x00\x69\x00\x67\x00\x68\x00\
-\x74\x00\x73\x00\x20\x00\x52\x00\x65\x00\x73\x00\x65\x00\x72\x00\
-\x76\x00\x65\x00\x64\x00\x52\x00\x65\x00\x67\x00\x75\x00\x6c\x00\
-\x61\x00\x72\x00\x49\x00\x54\x00\x43\x00\x20\x00\x43\x00\x6f\x00\
-\x6e\x00\x64\x00\x75\x00\x69\x00\x74\x00\x20\x00\x43\x00\x79\x00\
-\x72\x00\x69\x00\x6c\x00\x6c\x00\x69\x00\x63\x00\x3a\x00\x56\x00\
-\x65\x00\x72\x00\x73\x00\x69\x00\x6f\x00\x6e\x00\x20\x00\x31\x00\
-\x2e\x00\x30\x00\x30\x00\x56\x00\x65\x00\x72\x00\x73\x00\x69\x00\
-\x6f\x00\x6e\x00\x20\x00\x31\x00\x2e\x00\x30\x00\x30\x00\x20\x00\
-\x4a\x00\x75\x00\x6c\x00\x79\x00\x20\x00\x38\x00\x2c\x00\x20\x00\
-\x32\x00\x30\x00\x31\x00\x33\x00\x2c\x00\x20\x00\x69\x00\x6e\x00\
-\x69\x00\x74\x00\x69\x00\x61\x00\x6c\x00\x20\x00\x72\x00\x65\x00\
-\x6c\x00\x65\x00\x61\x00\x73\x00\x65\x00\x49\x00\x54\x00\x43\x00\
-\x43\x00\x6f\x00\x6e\x00\x64\x00\x75\x00\x69\x00\x74\x00\x43\x00\
-\x79\x00\x72\x00\x69\x00\x6c\x00\x6c\x00\x69\x00\x63\x00\x54\x00\
-\x68\x00\x69\x00\x73\x00\x20\x00\x66\x00\x6f\x00\x6e\x00\x74\x00\
-\x20\x00\x77\x00\x61\x00\x73\x00\x20\x00\x63\x00\x72\x00\x65\x00\
-\x61\x00\x74\x00\x65\x00\x64\x00\x20\x00\x75\x00\x73\x00\x69\x00\
-\x6e\x00\x67\x00\x20\x00\x46\x00\x6f\x00\x6e\x00\x74\x00\x20\x00\
-\x43\x00\x72\x00\x65\x00\x61\x00\x74\x00\x6f\x00\x72\x00\x20\x00\
-\x35\x00\x2e\x00\x30\x00\x20\x00\x66\x00\x72\x00\x6f\x00\x6d\x00\
-\x20\x00\x48\x00\x69\x00\x67\x00\x68\x00\x2d\x00\x4c\x00\x6f\x00\
-\x67\x00\x69\x00\x63\x00\x2e\x00\x63\x00\x6f\x00\x6d\x00\x4e\x00\
-\x6f\x00\x72\x00\x6d\x00\x61\x00\x61\x00\x6c\x00\x69\x00\x4e\x00\
-\x6f\x00\x72\x00\x6d\x00\x61\x00\x6c\x00\x65\x00\x53\x00\x74\x00\
-\x61\x00\x6e\x00\x64\x00\x61\x00\x61\x00\x72\x00\x64\x00\x4e\x00\
-\x6f\x00\x72\x00\x6d\x00\x61\x00\x6c\x00\x6e\x00\x79\x04\x1e\x04\
-\x31\x04\x4b\x04\x47\x04\x3d\x04\x4b\x04\x39\x00\x4e\x00\x6f\x00\
-\x72\x00\x6d\x00\xe1\x00\x6c\x00\x6e\x00\x65\x00\x4e\x00\x61\x00\
-\x76\x00\x61\x00\x64\x00\x6e\x00\x6f\x00\x41\x00\x72\x00\x72\x00\
-\x75\x00\x6e\x00\x74\x00\x61\x00\x02\x00\x00\x00\x00\x00\x00\xff\
-\x27\x00\x96\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x01\x39\x00\x00\x01\x02\x01\x03\x00\
-\x03\x00\x04\x00\x05\x00\x06\x00\x07\x00\x08\x00\x09\x00\x0a\x00\
-\x0b\x00\x0c\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\
-\x13\x00\x14\x00\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\
-\x1b\x00\x1c\x00\x1d\x00\x1e\x00\x1f\x00\x20\x00\x21\x00\x22\x00\
-\x23\x00\x24\x00\x25\x00\x26\x00\x27\x00\x28\x00\x29\x00\x2a\x00\
-\x2b\x00\x2c\x00\x2d\x00\x2e\x00\x2f\x00\x30\x00\x31\x00\x32\x00\
-\x33\x00\x34\x00\x35\x00\x36\x00\x37\x00\x38\x00\x39\x00\x3a\x00\
-\x3b\x00\x3c\x00\x3d\x00\x3e\x00\x3f\x00\x40\x00\x41\x00\x42\x00\
-\x43\x00\x44\x00\x45\x00\x46\x00\x47\x00\x48\x00\x49\x00\x4a\x00\
-\x4b\x00\x4c\x00\x4d\x00\x4e\x00\x4f\x00\x50\x00\x51\x00\x52\x00\
-\x53\x00\x54\x00\x55\x00\x56\x00\x57\x00\x58\x00\x59\x00\x5a\x00\
-\x5b\x00\x5c\x00\x5d\x00\x5e\x00\x5f\x00\x60\x00\x61\x00\x62\x00\
-\x63\x00\x64\x00\x65\x00\x66\x00\x67\x00\x68\x00\x69\x00\x6a\x00\
-\x6b\x00\x6c\x00\x6d\x00\x6e\x00\x6f\x00\x70\x00\x71\x00\x72\x00\
-\x73\x00\x74\x00\x75\x00\x76\x00\x77\x00\x78\x00\x79\x00\x7a\x00\
-\x7b\x00\x7c\x00\x7d\x00\x7e\x00\x7f\x00\x80\x00\x81\x00\x82\x00\
-\x83\x00\x84\x00\x85\x00\x86\x00\x87\x00\x88\x00\x89\x00\x8a\x00\
-\x8b\x00\x8c\x00\x8d\x00\x8e\x00\x8f\x00\x90\x00\x91\x00\x92\x00\
-\x93\x00\x94\x00\x95\x00\x96\x00\x97\x00\x98\x00\x99\x00\x9a\x01\
-\x04\x00\x9c\x00\x9d\x00\x9e\x00\x9f\x00\xa0\x00\xa1\x00\xa2\x00\
-\xa3\x00\xa4\x00\xa5\x00\xa6\x00\xa7\x00\xa8\x00\xa9\x00\xaa\x00\
-\xab\x00\xad\x00\xae\x00\xaf\x00\xb0\x00\xb1\x00\xb2\x00\xb3\x00\
-\xb4\x00\xb5\x00\xb6\x00\xb7\x00\xb8\x00\xb9\x00\xba\x00\xbb\x00\
-\xbc\x01\x05\x00\xbe\x00\xbf\x01\x06\x01\x07\x00\xc2\x00\xc3\x00\
-\xc4\x00\xc5\x00\xc6\x00\xc7\x00\xc8\x00\xc9\x00\xca\x00\xcb\x00\
-\xcc\x00\xcd\x00\xce\x00\xcf\x00\xd0\x00\xd1\x00\xd3\x00\xd4\x00\
-\xd5\x00\xd6\x00\xd7\x00\xd8\x00\xd9\x01\x08\x00\xdb\x00\xdc\x00\
-\xdd\x00\xdf\x00\xe0\x00\xe1\x00\xe2\x00\xe3\x00\xe4\x00\xe5\x00\
-\xe6\x00\xe7\x00\xe8\x00\xe9\x00\xea\x00\xeb\x00\xec\x00\xed\x00\
-\xee\x00\xef\x00\xf0\x01\x09\x01\x0a\x01\x0b\x00\xf4\x00\xf5\x00\
-\xf6\x00\xbd\x01\x0c\x01\x0d\x01\x0e\x01\x0f\x01\x10\x01\x11\x01\
-\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\
-\x1a\x01\x1b\x01\x1c\x01\x1d\x01\x1e\x01\x1f\x01\x20\x01\x21\x01\
-\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\
-\x2a\x01\x2b\x01\x2c\x01\x2d\x01\x2e\x01\x2f\x01\x30\x01\x31\x01\
-\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\
-\x3a\x01\x3b\x01\x3c\x01\x3d\x01\x3e\x01\x3f\x01\x40\x01\x41\x01\
-\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\x49\x01\
-\x4a\x01\x4b\x01\x4c\x01\x4d\x01\x4e\x01\x4f\x05\x2e\x6e\x75\x6c\
-\x6c\x10\x6e\x6f\x6e\x6d\x61\x72\x6b\x69\x6e\x67\x72\x65\x74\x75\
-\x72\x6e\x00\x04\x45\x75\x72\x6f\x07\x75\x6e\x69\x46\x30\x30\x31\
-\x07\x75\x6e\x69\x46\x30\x30\x32\x07\x75\x6e\x69\x30\x32\x43\x39\
-\x07\x75\x6e\x69\x30\x30\x42\x39\x07\x75\x6e\x69\x30\x30\x42\x32\
-\x07\x75\x6e\x69\x30\x30\x42\x33\x09\x61\x66\x69\x69\x31\x30\x30\
-\x32\x33\x09\x61\x66\x69\x69\x31\x30\x30\x31\x37\x09\x61\x66\x69\
-\x69\x31\x30\x30\x31\x38\x09\x61\x66\x69\x69\x31\x30\x30\x31\x39\
-\x09\x61\x66\x69\x69\x31\x30\x30\x32\x30\x09\x61\x66\x69\x69\x31\
-\x30\x30\x32\x31\x09\x61\x66\x69\x69\x31\x30\x30\x32\x32\x09\x61\
-\x66\x69\x69\x31\x30\x30\x32\x34\x09\x61\x66\x69\x69\x31\x30\x30\
-\x32\x35\x09\x61\x66\x69\x69\x31\x30\x30\x32\x36\x09\x61\x66\x69\
-\x69\x31\x30\x30\x32\x37\x09\x61\x66\x69\x69\x31\x30\x30\x32\x38\
-\x09\x61\x66\x69\x69\x31\x30\x30\x32\x39\x09\x61\x66\x69\x69\x31\
-\x30\x30\x33\x30\x09\x61\x66\x69\x69\x31\x30\x30\x33\x31\x09\x61\
-\x66\x69\x69\x31\x30\x30\x33\x32\x09\x61\x66\x69\x69\x31\x30\x30\
-\x33\x33\x09\x61\x66\x69\x69\x31\x30\x30\x33\x34\x09\x61\x66\x69\
-\x69\x31\x30\x30\x33\x35\x09\x61\x66\x69\x69\x31\x30\x30\x33\x36\
-\x09\x61\x66\x69\x69\x31\x30\x30\x33\x37\x09\x61\x66\x69\x69\x31\
-\x30\x30\x33\x38\x09\x61\x66\x69\x69\x31\x30\x30\x33\x39\x09\x61\
-\x66\x69\x69\x31\x30\x30\x34\x30\x09\x61\x66\x69\x69\x31\x30\x30\
-\x34\x31\x09\x61\x66\x69\x69\x31\x30\x30\x34\x32\x09\x61\x66\x69\
-\x69\x31\x30\x30\x34\x33\x09\x61\x66\x69\x69\x31\x30\x30\x34\x34\
-\x09\x61\x66\x69\x69\x31\x30\x30\x34\x35\x09\x61\x66\x69\x69\x31\
-\x30\x30\x34\x36\x09\x61\x66\x69\x69\x31\x30\x30\x34\x37\x09\x61\
-\x66\x69\x69\x31\x30\x30\x34\x38\x09\x61\x66\x69\x69\x31\x30\x30\
-\x34\x39\x09\x61\x66\x69\x69\x31\x30\x30\x36\x35\x09\x61\x66\x69\
-\x69\x31\x30\x30\x36\x36\x09\x61\x66\x69\x69\x31\x30\x30\x36\x37\
-\x09\x61\x66\x69\x69\x31\x30\x30\x36\x38\x09\x61\x66\x69\x69\x31\
-\x30\x30\x36\x39\x09\x61\x66\x69\x69\x31\x30\x30\x37\x30\x09\x61\
-\x66\x69\x69\x31\x30\x30\x37\x32\x09\x61\x66\x69\x69\x31\x30\x30\
-\x37\x33\x09\x61\x66\x69\x69\x31\x30\x30\x37\x34\x09\x61\x66\x69\
-\x69\x31\x30\x30\x37\x35\x09\x61\x66\x69\x69\x31\x30\x30\x37\x36\
-\x09\x61\x66\x69\x69\x31\x30\x30\x37\x37\x09\x61\x66\x69\x69\x31\
-\x30\x30\x37\x38\x09\x61\x66\x69\x69\x31\x30\x30\x37\x39\x09\x61\
-\x66\x69\x69\x31\x30\x30\x38\x30\x09\x61\x66\x69\x69\x31\x30\x30\
-\x38\x31\x09\x61\x66\x69\x69\x31\x30\x30\x38\x32\x09\x61\x66\x69\
-\x69\x31\x30\x30\x38\x33\x09\x61\x66\x69\x69\x31\x30\x30\x38\x34\
-\x09\x61\x66\x69\x69\x31\x30\x30\x38\x35\x09\x61\x66\x69\x69\x31\
-\x30\x30\x38\x36\x09\x61\x66\x69\x69\x31\x30\x30\x38\x37\x09\x61\
-\x66\x69\x69\x31\x30\x30\x38\x38\x09\x61\x66\x69\x69\x31\x30\x30\
-\x38\x39\x09\x61\x66\x69\x69\x31\x30\x30\x39\x30\x09\x61\x66\x69\
-\x69\x31\x30\x30\x39\x31\x09\x61\x66\x69\x69\x31\x30\x30\x39\x32\
-\x09\x61\x66\x69\x69\x31\x30\x30\x39\x33\x09\x61\x66\x69\x69\x31\
-\x30\x30\x39\x34\x09\x61\x66\x69\x69\x31\x30\x30\x39\x35\x09\x61\
-\x66\x69\x69\x31\x30\x30\x39\x36\x09\x61\x66\x69\x69\x31\x30\x30\
-\x39\x37\x09\x61\x66\x69\x69\x31\x30\x30\x37\x31\x07\x75\x6e\x69\
-\x46\x30\x30\x34\x07\x75\x6e\x69\x46\x30\x30\x35\x00\x00\x00\x00\
-\x00\x00\x01\xff\xff\x00\x02\
-'
-
-qt_resource_name = b'\
-\x00\x0f\
-\x0a\xb2\xd0\x66\
-\x00\x69\
-\x00\x74\x00\x63\x00\x5f\x00\x63\x00\x6f\x00\x6e\x00\x64\x00\x75\x00\x69\x00\x74\x00\x2e\x00\x74\x00\x74\x00\x66\
-'
-
-qt_resource_struct_v1 = b'\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-'
-
-qt_resource_struct_v2 = b'\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x79\x61\xb3\x1b\xdd\
-'
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-
-qInitResources()
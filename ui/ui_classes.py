@@ -1,23 +1,42 @@
+from collections import OrderedDict
 from datetime import datetime  # год в копирайте в «О приложении»
+from functools import lru_cache
 from random import randint
 from typing import TYPE_CHECKING
 
 from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtCore import QEasingCurve, QPropertyAnimation, QVariant, QVariantAnimation, Qt, pyqtSlot
-from PyQt5.QtGui import QColor, QFontDatabase, QPalette
-from PyQt5.QtWidgets import QGraphicsOpacityEffect, QLabel
-
-import ui.font_resources as font_resources  # noqa: F401 | ресурсы шрифтов
-from core.constants import MONEY_TREE_AMOUNTS, SAFETY_NETS
-from core.tools import convert_amount_to_str
+from PyQt5.QtCore import (
+    QEasingCurve,
+    QObject,
+    QPropertyAnimation,
+    QRect,
+    QRectF,
+    QVariant,
+    QVariantAnimation,
+    Qt,
+    pyqtProperty,
+    pyqtSlot,
+)
+from PyQt5.QtGui import QColor, QFontDatabase, QImage, QMovie, QPainter, QPalette, QPixmap
+from PyQt5.QtWidgets import QGraphicsOpacityEffect, QLabel, QWidget
+
+from core.assets import load_pixmap
+from core.constants import GAME_FONT, MONEY_TREE_AMOUNTS, SAFETY_NETS, SCENE_SCALED_LIMIT
+from core.formatting import convert_amount_to_str
 
 
 class AnimationLabel(QLabel):
+    # эффекты прозрачности всех меток: сколько создано и сколько ещё не удалено — для проверки, что они не копятся
+    opacity_effects = {'created': 0, 'alive': 0}
+
     def __init__(self, *args, **kwargs):
         QLabel.__init__(self, *args, **kwargs)
         self.animation = QVariantAnimation()
         # noinspection PyUnresolvedReferences
         self.animation.valueChanged.connect(self.changeColor)
+        # эффект прозрачности и его анимация создаются при первом фейде изображения и дальше переиспользуются
+        self.effect = None
+        self.opacity_animation = None
 
     @pyqtSlot(QVariant)
     def changeColor(self, color):
@@ -41,25 +60,206 @@ class AnimationLabel(QLabel):
         self.animation.setEasingCurve(QEasingCurve.OutBack)
         self.animation.start()
 
-    def startFadeInImage(self, duration: int = 200):
-        self.effect = QGraphicsOpacityEffect()
-        self.setGraphicsEffect(self.effect)
+    @staticmethod
+    def _effect_destroyed():
+        AnimationLabel.opacity_effects['alive'] -= 1
+
+    def fadeImage(self, start: float, end: float, duration: int):
+        """Анимирует прозрачность метки от start до end, перезапуская единственную анимацию метки"""
+        if self.effect is None:
+            self.effect = QGraphicsOpacityEffect(self)
+            self.opacity_effects['created'] += 1
+            self.opacity_effects['alive'] += 1
+            # noinspection PyUnresolvedReferences
+            self.effect.destroyed.connect(AnimationLabel._effect_destroyed)
+            self.setGraphicsEffect(self.effect)
+            self.opacity_animation = QPropertyAnimation(self.effect, b'opacity', self)
+
+        self.opacity_animation.stop()
+        self.opacity_animation.setDuration(duration)
+        self.opacity_animation.setStartValue(start)
+        self.opacity_animation.setEndValue(end)
+        self.opacity_animation.start()
 
-        self.animation = QPropertyAnimation(self.effect, b'opacity')
-        self.animation.setDuration(duration)
-        self.animation.setStartValue(0)
-        self.animation.setEndValue(1)
-        self.animation.start()
+    def startFadeInImage(self, duration: int = 200):
+        self.fadeImage(0, 1, duration)
 
     def startFadeOutImage(self, duration: int = 200):
-        self.effect = QGraphicsOpacityEffect()
-        self.setGraphicsEffect(self.effect)
+        self.fadeImage(1, 0, duration)
+
+
+class SceneLayer(QObject):
+    """Слой сцены: изображение, растянутое на прямоугольник rect и обрезанное по clip, которое рисует
+    `SceneCompositor`.
+
+    Повторяет ту часть интерфейса `AnimationLabel`, которой пользуются окно игры и таймлайны: изображение,
+    анимация, показ и скрытие, фейды. Поэтому к слою обращаются так же, как раньше к метке"""
+
+    def __init__(self, compositor: 'SceneCompositor', name: str, rect: QRect, clip: QRect):
+        super().__init__(compositor)
+        self.setObjectName(name)
+        self.rect = rect
+        self.clip = clip
+        self._compositor = compositor
+        self._pixmap = QPixmap()
+        self._movie: QMovie | None = None
+        self._scaled = QPixmap()  # изображение, уменьшенное под rect
+        self._content = QRect()  # непрозрачная часть изображения в координатах сцены, обрезанная по clip
+        self._opacity = 1.0
+        self._visible = True
+        self.opacity_animation: QPropertyAnimation | None = None  # создаётся при первом фейде
+
+    def _invalidate(self):
+        """Перерисовывает видимую часть слоя"""
+        if self._visible and self._opacity > 0:
+            self._compositor.update(self._content)
+
+    def _set_image(self, pixmap: QPixmap, cached: bool = True):
+        self._invalidate()
+        self._scaled, content = self._compositor.scaled(pixmap, self.rect.size(), cached)
+        self._content = content.translated(self.rect.topLeft()) & self.clip
+        self._invalidate()
+
+    def setPixmap(self, pixmap: QPixmap):
+        if self._movie is not None:
+            # noinspection PyUnresolvedReferences
+            self._movie.frameChanged.disconnect(self._show_frame)
+            self._movie = None
+        self._pixmap = pixmap
+        self._set_image(pixmap)
+
+    def pixmap(self) -> QPixmap:
+        return self._pixmap
+
+    def setMovie(self, movie: QMovie):
+        """Показывает кадры анимации movie, пока не будет задано изображение"""
+        self.setPixmap(QPixmap())
+        self._movie = movie
+        # noinspection PyUnresolvedReferences
+        movie.frameChanged.connect(self._show_frame)
+        self._show_frame()
 
-        self.animation = QPropertyAnimation(self.effect, b'opacity')
-        self.animation.setDuration(duration)
-        self.animation.setStartValue(1)
-        self.animation.setEndValue(0)
-        self.animation.start()
+    def _show_frame(self, *_):
+        self._set_image(self._movie.currentPixmap(), cached=False)  # кадры не повторяются, кэшировать их незачем
+
+    def show(self):
+        if not self._visible:
+            self._visible = True
+            self._invalidate()
+
+    def hide(self):
+        self._invalidate()
+        self._visible = False
+
+    def isVisible(self) -> bool:
+        return self._visible
+
+    def getOpacity(self) -> float:
+        return self._opacity
+
+    def setOpacity(self, opacity: float):
+        if opacity != self._opacity:
+            self._invalidate()
+            self._opacity = opacity
+            self._invalidate()
+
+    opacity = pyqtProperty(float, getOpacity, setOpacity)
+
+    def fadeImage(self, start: float, end: float, duration: int):
+        """Анимирует прозрачность слоя от start до end, перезапуская единственную анимацию слоя"""
+        if self.opacity_animation is None:
+            self.opacity_animation = QPropertyAnimation(self, b'opacity', self)
+        self.opacity_animation.stop()
+        self.opacity_animation.setDuration(duration)
+        self.opacity_animation.setStartValue(float(start))
+        self.opacity_animation.setEndValue(float(end))
+        self.opacity_animation.start()
+
+    def startFadeInImage(self, duration: int = 200):
+        self.fadeImage(0, 1, duration)
+
+    def startFadeOutImage(self, duration: int = 200):
+        self.fadeImage(1, 0, duration)
+
+
+class SceneCompositor(QWidget):
+    """Виджет, рисующий слои сцены снизу вверх в одном paintEvent с прозрачностью каждого слоя.
+
+    Изменение слоя перерисовывает только непрозрачную часть его изображений, поэтому фейд подсказки или ответа
+    не затрагивает остальную сцену, а слоям не нужны собственные виджеты и графические эффекты"""
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.layers: list[SceneLayer] = []
+        # уменьшенные копии изображений и их непрозрачные части по (cacheKey, ширина, высота)
+        self._scaled: OrderedDict[tuple[int, int, int], tuple[QPixmap, QRect]] = OrderedDict()
+        self.paint_stats = {'paints': 0, 'area': 0, 'layers': 0}  # перерисовки, их площадь и нарисованные слои
+
+    def add_layer(self, name: str, rect: QRect, clip: QRect | None = None) -> SceneLayer:
+        """Добавляет слой поверх остальных"""
+        layer = SceneLayer(self, name, rect, clip if clip is not None else rect)
+        self.layers.append(layer)
+        return layer
+
+    def scaled(self, pixmap: QPixmap, size, cached: bool = True) -> tuple[QPixmap, QRect]:
+        """Возвращает изображение, растянутое на size так же, как в QLabel с setScaledContents, и его
+        непрозрачную часть"""
+        if pixmap.isNull():
+            return pixmap, QRect()
+        key = (pixmap.cacheKey(), size.width(), size.height())
+        if key in self._scaled:
+            self._scaled.move_to_end(key)
+            return self._scaled[key]
+
+        ratio = self.devicePixelRatioF()
+        image = pixmap.toImage()
+        if image.size() != size * ratio:
+            image = image.scaled(size * ratio, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        scaled = QPixmap.fromImage(image)
+        scaled.setDevicePixelRatio(ratio)
+        content = QRect(QtCore.QPoint(0, 0), size)
+        if cached and image.hasAlphaChannel():
+            opaque = QRectF(self._opaque_rect(image))
+            content = QRectF(opaque.topLeft() / ratio, opaque.size() / ratio).toAlignedRect()
+
+        if cached:
+            self._scaled[key] = scaled, content
+            if len(self._scaled) > SCENE_SCALED_LIMIT:
+                self._scaled.popitem(last=False)
+        return scaled, content
+
+    @staticmethod
+    def _opaque_rect(image: QImage) -> QRect:
+        """Наименьший прямоугольник, вне которого все пиксели изображения полностью прозрачны"""
+        alpha = image.convertToFormat(QImage.Format_Alpha8)
+        width, line = alpha.width(), alpha.bytesPerLine()
+        data = alpha.constBits().asstring(line * alpha.height())
+        left, right, rows = width, 0, []
+        for y in range(alpha.height()):
+            row = data[y * line : y * line + width]
+            stripped = row.lstrip(b'\0')
+            if stripped:
+                left = min(left, width - len(stripped))
+                right = max(right, len(row.rstrip(b'\0')))
+                rows.append(y)
+        if not rows:
+            return QRect()
+        return QRect(left, rows[0], right - left, rows[-1] - rows[0] + 1)
+
+    def paintEvent(self, event):
+        area = event.rect()
+        self.paint_stats['paints'] += 1
+        self.paint_stats['area'] += area.width() * area.height()
+        painter = QPainter(self)
+        for layer in self.layers:
+            target = layer._content & area
+            if not layer._visible or layer._opacity <= 0 or target.isEmpty():
+                continue
+            self.paint_stats['layers'] += 1
+            painter.setOpacity(layer._opacity)
+            painter.setClipRect(target)
+            painter.drawPixmap(layer.rect.topLeft(), layer._scaled)
+        painter.end()
 
 
 font = QtGui.QFont()
@@ -73,6 +273,13 @@ bold_font.setBold(True)
 bold_font.setWeight(75)
 
 
+@lru_cache(maxsize=None)
+def game_font_family() -> str:
+    """Регистрирует шрифт игрового окна при первом обращении и возвращает имя его семейства"""
+    font_id = QFontDatabase.addApplicationFont(GAME_FONT)
+    return QFontDatabase.applicationFontFamilies(font_id)[0]
+
+
 class Ui_StartDialog(object):
     def add_buttons(self, btn_group, horizontal_layout, *buttons):
         for button in buttons:
@@ -225,6 +432,7 @@ class Ui_Rules(object):
         sizePolicy.setHeightForWidth(self.text_mt.sizePolicy().hasHeightForWidth())
         self.text_mt.setSizePolicy(sizePolicy)
         self.text_mt.setMaximumSize(QtCore.QSize(420, 266))
+
         length_tree = len(MONEY_TREE_AMOUNTS) - 1
         max_prize = convert_amount_to_str(MONEY_TREE_AMOUNTS[-1])
         safety_nets = list(set(SAFETY_NETS))[1:]
@@ -247,7 +455,7 @@ class Ui_Rules(object):
         self.picture_mt = QtWidgets.QLabel(self.scrollAreaWidgetContents)
         self.picture_mt.setSizePolicy(sizePolicy)
         self.picture_mt.setMaximumSize(QtCore.QSize(172, 266))
-        self.picture_mt.setPixmap(QtGui.QPixmap('images/rules/money_tree.png'))
+        self.picture_mt.setPixmap(load_pixmap('images/rules/money_tree.png'))
         self.picture_mt.setScaledContents(True)
         self.picture_mt.setObjectName('picture_mt')
         self.aboutMoneyTree.addWidget(self.picture_mt)
@@ -284,7 +492,7 @@ class Ui_Rules(object):
         self.picture_ll = QtWidgets.QLabel(self.scrollAreaWidgetContents)
         self.picture_ll.setSizePolicy(sizePolicy)
         self.picture_ll.setMaximumSize(QtCore.QSize(602, 119))
-        self.picture_ll.setPixmap(QtGui.QPixmap('images/rules/lifelines.png'))
+        self.picture_ll.setPixmap(load_pixmap('images/rules/lifelines.png'))
         self.picture_ll.setScaledContents(True)
         self.picture_ll.setAlignment(Qt.AlignCenter)
         self.picture_ll.setObjectName('picture_ll')
@@ -311,7 +519,7 @@ class Ui_Rules(object):
         self.picture_ans = QtWidgets.QLabel(self.scrollAreaWidgetContents)
         self.picture_ans.setSizePolicy(sizePolicy)
         self.picture_ans.setMaximumSize(QtCore.QSize(602, 103))
-        self.picture_ans.setPixmap(QtGui.QPixmap('images/rules/question_field.png'))
+        self.picture_ans.setPixmap(load_pixmap('images/rules/question_field.png'))
         self.picture_ans.setScaledContents(True)
         self.picture_ans.setAlignment(Qt.AlignCenter)
         self.picture_ans.setObjectName('picture_ans')
@@ -327,8 +535,7 @@ class Ui_Rules(object):
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
-        fontId = QFontDatabase.addApplicationFont(':itc_conduit.ttf')
-        fontName = QFontDatabase.applicationFontFamilies(fontId)[0]
+        fontName = game_font_family()
 
         MainWindow.setObjectName('MainWindow')
         MainWindow.setFixedSize(1100, 703)
@@ -392,10 +599,96 @@ class Ui_MainWindow(object):
         self.menubar.addAction(self.table_menu.menuAction())
         self.menubar.addAction(self.help_menu.menuAction())
 
+        # изображения сцены рисуют три виджета, каждый снизу вверх: фон и подложка вопроса — под текстом вопроса,
+        # подсветка ответов — между суммой и текстом вопроса, остальное — поверх поля вопроса; так сохраняется
+        # порядок, в котором раньше лежали метки
+        scene_position = QtCore.QRect(0, 0, 1100, 703)
+        question_field_position = QtCore.QRect(0, 477, 1100, 201)
+        question_layout_position = QtCore.QRect(-20, 449, 1142, 226)
+        tree_field_position = QtCore.QRect(736, 0, 365, 491)  # правая треть окна
+        tree_position = QtCore.QRect(736, 0, 376, 480)
+
+        self.scene = SceneCompositor(self.central_widget)
+        self.scene.setGeometry(scene_position)
+        self.scene.setObjectName('scene')
+
+        self.bg_num = randint(1, 10)
+        bg_pixmap = load_pixmap(f'images/backgrounds/{self.bg_num}/1-5.jpg')
+        self.background_1 = self.scene.add_layer('background_1', scene_position)
+        self.background_1.setPixmap(bg_pixmap)
+        self.background_2 = self.scene.add_layer('background_2', scene_position)
+        self.background_2.setPixmap(bg_pixmap)
+
+        self.layout_q = self.scene.add_layer('layout_q', question_layout_position, question_field_position)
+        self.layout_q.setPixmap(load_pixmap('animations/question field/0.png'))
+
         self.questionField = QtWidgets.QWidget(self.central_widget)
-        self.questionField.setGeometry(QtCore.QRect(0, 477, 1100, 201))
+        self.questionField.setGeometry(question_field_position)
         self.questionField.setObjectName('questionField')
 
+        self.question_scene = SceneCompositor(self.questionField)
+        self.question_scene.setGeometry(QtCore.QRect(QtCore.QPoint(0, 0), question_field_position.size()))
+        self.question_scene.setObjectName('question_scene')
+        state_q_position = question_layout_position.translated(-question_field_position.topLeft())
+        self.state_q_1 = self.question_scene.add_layer('state_q_1', state_q_position, self.question_scene.rect())
+        self.state_q_2 = self.question_scene.add_layer('state_q_2', state_q_position, self.question_scene.rect())
+        self.state_q_3 = self.question_scene.add_layer('state_q_3', state_q_position, self.question_scene.rect())
+        self.state_q_4 = self.question_scene.add_layer('state_q_4', state_q_position, self.question_scene.rect())
+
+        self.overlay_scene = SceneCompositor(self.central_widget)
+        self.overlay_scene.setGeometry(scene_position)
+        self.overlay_scene.setObjectName('overlay_scene')
+
+        self.central_q = self.overlay_scene.add_layer(
+            'central_q', QtCore.QRect(521, 603, 62, 40), question_field_position
+        )
+        self.central_q.setPixmap(load_pixmap('images/question field/double-dip.png'))
+
+        self.layout_t = self.overlay_scene.add_layer('layout_t', tree_position, tree_field_position)
+        self.layout_t.setPixmap(load_pixmap('images/money tree/layout.png'))
+        self.state_t = self.overlay_scene.add_layer('state_t', tree_position, tree_field_position)
+        self.state_ll = self.overlay_scene.add_layer('state_ll', tree_position, tree_field_position)
+
+        if TYPE_CHECKING:
+            self.lost_5050 = SceneLayer()
+            self.lost_ata = SceneLayer()
+            self.lost_x2 = SceneLayer()
+            self.lost_change = SceneLayer()
+            self.lost_revival = SceneLayer()
+            self.lost_immunity = SceneLayer()
+            self.lost_ftc = SceneLayer()
+
+            self.gray_5050 = SceneLayer()
+            self.gray_ata = SceneLayer()
+            self.gray_x2 = SceneLayer()
+            self.gray_change = SceneLayer()
+            self.gray_revival = SceneLayer()
+            self.gray_immunity = SceneLayer()
+            self.gray_ftc = SceneLayer()
+            self.gray_home = SceneLayer()
+
+        # подсказки: серые поверх подсветки, потерянные поверх серых
+        lost_names = ('5050', 'ata', 'x2', 'change', 'revival', 'immunity', 'ftc')
+        gray_names = (*lost_names, 'home')
+        for prefix, names in (('gray', gray_names), ('lost', lost_names)):
+            for name in names:
+                ll_layer = self.overlay_scene.add_layer(f'{prefix}_{name}', tree_position, tree_field_position)
+                ll_layer.setPixmap(load_pixmap(f'images/money tree/{name}/{prefix}.png'))
+                setattr(self, f'{prefix}_{name}', ll_layer)
+
+        self.timer_view = self.overlay_scene.add_layer('timer', QtCore.QRect(215, 419, 678, 64))
+
+        big_logo_position = QtCore.QRect(251, 98, 300, 300)
+        self.big_logo_1 = self.overlay_scene.add_layer('big_logo_1', big_logo_position)
+        self.big_logo_1.setPixmap(load_pixmap('images/logo/intro.png'))
+        self.big_logo_1.hide()
+        self.big_logo_2 = self.overlay_scene.add_layer('big_logo_2', big_logo_position)
+        self.big_logo_2.hide()
+
+        self.ata_layout = self.overlay_scene.add_layer('ata_layout', QtCore.QRect(568, 15, 226, 331))
+        self.ata_layout.setPixmap(load_pixmap('images/ata.png'))
+        self.ata_layout.hide()
+
         palette = QtGui.QPalette()
         brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
         brush.setStyle(Qt.BrushStyle.SolidPattern)
@@ -437,25 +730,6 @@ class Ui_MainWindow(object):
         self.question.setWordWrap(True)
         self.question.setObjectName('question')
 
-        question_layout_position = QtCore.QRect(-20, -28, 1142, 226)
-        self.layout_q = QtWidgets.QLabel(self.questionField)
-        self.layout_q.setGeometry(question_layout_position)
-        self.layout_q.setText('')
-        self.layout_q.setPixmap(QtGui.QPixmap('animations/question field/0.png'))
-        self.layout_q.setScaledContents(True)
-        self.layout_q.setObjectName('layout_q')
-
-        self.state_q_1 = AnimationLabel(self.questionField)
-        self.state_q_2 = AnimationLabel(self.questionField)
-        self.state_q_3 = AnimationLabel(self.questionField)
-        self.state_q_4 = AnimationLabel(self.questionField)
-        for i in range(1, 5):
-            label = self.__getattribute__(f'state_q_{i}')
-            label.setGeometry(question_layout_position)
-            label.setText('')
-            label.setScaledContents(True)
-            label.setObjectName(f'state_q_{i}')
-
         brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
         brush.setStyle(Qt.BrushStyle.SolidPattern)
         palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, brush)
@@ -469,107 +743,6 @@ class Ui_MainWindow(object):
         self.amount_q.setAlignment(Qt.AlignCenter)
         self.amount_q.setObjectName('amount_q')
 
-        self.central_q = AnimationLabel(self.questionField)
-        self.central_q.setGeometry(QtCore.QRect(521, 126, 62, 40))
-        self.central_q.setText('')
-        self.central_q.setPixmap(QtGui.QPixmap('images/question field/double-dip.png'))
-        self.central_q.setScaledContents(True)
-        self.central_q.setObjectName('central_q')
-
-        self.layoutWidget = QtWidgets.QWidget(self.central_widget)
-        self.layoutWidget.setGeometry(QtCore.QRect(0, 0, 1101, 491))
-        self.layoutWidget.setObjectName('layoutWidget')
-
-        self.moneyTree = QtWidgets.QWidget(self.layoutWidget)
-        self.moneyTree.setObjectName('moneyTree')
-
-        self.horizontalLayout = QtWidgets.QHBoxLayout(self.layoutWidget)
-        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
-        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout.addItem(spacerItem)
-        self.horizontalLayout.addWidget(self.moneyTree)
-        self.horizontalLayout.setStretch(0, 101)
-        self.horizontalLayout.setStretch(1, 50)
-        self.horizontalLayout.setObjectName('horizontalLayout')
-
-        tree_position = QtCore.QRect(0, 0, 376, 480)
-        self.layout_t = QtWidgets.QLabel(self.moneyTree)
-        self.layout_t.setGeometry(tree_position)
-        self.layout_t.setText('')
-        self.layout_t.setPixmap(QtGui.QPixmap('images/money tree/layout.png'))
-        self.layout_t.setScaledContents(True)
-        self.layout_t.setObjectName('layout_t')
-
-        self.state_t = QtWidgets.QLabel(self.moneyTree)
-        self.state_t.setGeometry(tree_position)
-        self.state_t.setText('')
-        self.state_t.setScaledContents(True)
-        self.state_t.setObjectName('state_t')
-
-        if TYPE_CHECKING:
-            self.lost_5050 = AnimationLabel()
-            self.lost_ata = AnimationLabel()
-            self.lost_x2 = AnimationLabel()
-            self.lost_change = AnimationLabel()
-            self.lost_revival = AnimationLabel()
-            self.lost_immunity = AnimationLabel()
-            self.lost_ftc = AnimationLabel()
-
-            self.gray_5050 = AnimationLabel()
-            self.gray_ata = AnimationLabel()
-            self.gray_x2 = AnimationLabel()
-            self.gray_change = AnimationLabel()
-            self.gray_revival = AnimationLabel()
-            self.gray_immunity = AnimationLabel()
-            self.gray_ftc = AnimationLabel()
-            self.gray_home = AnimationLabel()
-
-        def _create_ll_labels(prefix: str, names: tuple[str, ...]) -> None:
-            for name in names:
-                setattr(self, f'{prefix}_{name}', AnimationLabel(self.moneyTree))
-                ll_label = self.__getattribute__(f'{prefix}_{name}')
-                ll_label.setGeometry(tree_position)
-                ll_label.setText('')
-                ll_label.setPixmap(QtGui.QPixmap(f'images/money tree/{name}/{prefix}.png'))
-                ll_label.setScaledContents(True)
-                ll_label.setObjectName(f'{prefix}_{name}')
-
-        # Create lost and gray lifeline labels
-        lost_names = ('5050', 'ata', 'x2', 'change', 'revival', 'immunity', 'ftc')
-        gray_names = (*lost_names, 'home')
-        _create_ll_labels('lost', lost_names)
-        _create_ll_labels('gray', gray_names)
-
-        self.state_ll = AnimationLabel(self.moneyTree)
-        self.state_ll.setGeometry(tree_position)
-        self.state_ll.setText('')
-        self.state_ll.setScaledContents(True)
-        self.state_ll.setObjectName('state_ll')
-
-        self.bg_num = randint(1, 10)
-        bg_pixmap = QtGui.QPixmap(f'images/backgrounds/{self.bg_num}/1-5.jpg')
-
-        self.background_1 = QtWidgets.QLabel(self.central_widget)
-        self.background_1.setGeometry(QtCore.QRect(0, 0, 1100, 703))
-        self.background_1.setText('')
-        self.background_1.setScaledContents(True)
-        self.background_1.setObjectName('background_1')
-        self.background_1.setPixmap(bg_pixmap)
-
-        self.background_2 = AnimationLabel(self.central_widget)
-        self.background_2.setGeometry(QtCore.QRect(0, 0, 1100, 703))
-        self.background_2.setText('')
-        self.background_2.setScaledContents(True)
-        self.background_2.setObjectName('background_2')
-        self.background_2.setPixmap(bg_pixmap)
-
-        self.timer_view = QtWidgets.QLabel(self.central_widget)
-        self.timer_view.setGeometry(QtCore.QRect(215, 419, 678, 64))
-        self.timer_view.setText('')
-        self.timer_view.setScaledContents(True)
-        self.timer_view.setAlignment(Qt.AlignCenter)
-        self.timer_view.setObjectName('timer')
-
         self.timer_text = AnimationLabel(self.central_widget)
         self.timer_text.setGeometry(QtCore.QRect(509, 443, 89, 40))
         self.timer_text.setPalette(palette)
@@ -587,13 +760,6 @@ class Ui_MainWindow(object):
         verdana_font.setBold(True)
         verdana_font.setWeight(75)
 
-        self.ata_layout = AnimationLabel(self.central_widget)
-        self.ata_layout.setObjectName('ata_layout')
-        self.ata_layout.setGeometry(QtCore.QRect(568, 15, 226, 331))
-        self.ata_layout.setPixmap(QtGui.QPixmap('images/ata.png'))
-        self.ata_layout.setScaledContents(True)
-        self.ata_layout.hide()
-
         self.ata_a_percents = AnimationLabel(self.central_widget)
         self.ata_b_percents = AnimationLabel(self.central_widget)
         self.ata_c_percents = AnimationLabel(self.central_widget)
@@ -606,7 +772,7 @@ class Ui_MainWindow(object):
             percent_label.setAlignment(Qt.AlignCenter)
             percent_label.setObjectName(f'ata_{answer_letter}_percents')
 
-        score_column = QtGui.QPixmap('images/ata_score.png')
+        score_column = load_pixmap('images/ata_score.png')
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -645,58 +811,17 @@ class Ui_MainWindow(object):
             column_label.hide()
             extending_label.addWidget(column_label)
 
-        big_logo_position = QtCore.QRect(251, 98, 300, 300)
-        self.big_logo_1 = AnimationLabel(self.central_widget)
-        self.big_logo_1.setObjectName('big_logo_1')
-        self.big_logo_1.setGeometry(big_logo_position)
-        self.big_logo_1.setPixmap(QtGui.QPixmap('images/logo/intro.png'))
-        self.big_logo_1.setScaledContents(True)
-        self.big_logo_1.hide()
-
-        self.big_logo_2 = AnimationLabel(self.central_widget)
-        self.big_logo_2.setObjectName('big_logo_2')
-        self.big_logo_2.setGeometry(big_logo_position)
-        self.big_logo_2.setScaledContents(True)
-        self.big_logo_2.hide()
-
-        # noinspection PyUnresolvedReferences
         for label in (
-            self.layout_q,
             self.amount_q,
-            self.state_q_1,
-            self.state_q_2,
-            self.state_q_3,
-            self.state_q_4,
+            self.question_scene,
             self.question,
             self.answer_A,
             self.answer_B,
             self.answer_C,
             self.answer_D,
-            self.central_q,
-            self.gray_5050,
-            self.gray_ata,
-            self.gray_x2,
-            self.gray_change,
-            self.gray_revival,
-            self.gray_immunity,
-            self.gray_ftc,
-            self.gray_home,
-            self.lost_5050,
-            self.lost_ata,
-            self.lost_x2,
-            self.lost_change,
-            self.lost_revival,
-            self.lost_immunity,
-            self.lost_ftc,
-            self.background_1,
-            self.background_2,
             self.questionField,
-            self.layoutWidget,
-            self.timer_view,
+            self.overlay_scene,
             self.timer_text,
-            self.big_logo_1,
-            self.big_logo_2,
-            self.ata_layout,
             self.ata_a_percents,
             self.ata_b_percents,
             self.ata_c_percents,